@@ -0,0 +1,178 @@
+package perldoop;
+
+import java.io.IOException;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * Agregacion local de la salida de un mapper, guarda los pares en una tabla acotada combinando los valores de cada
+ * clave y los escribe cuando se llena o al terminar
+ *
+ * @author César Pomar
+ * @param <K> Tipo de la clave
+ * @param <V> Tipo del valor
+ */
+public final class LocalCombiner<K, V> {
+
+    /**
+     * Numero de valores guardados por defecto antes de escribir la tabla
+     */
+    public static final int LIMIT = 100000;
+
+    /**
+     * Valores de una misma clave que se combinan sin esperar a llenar la tabla
+     */
+    private static final int COMBINE_VALUES = 16;
+
+    /**
+     * Destino de los pares
+     *
+     * @param <K> Tipo de la clave
+     * @param <V> Tipo del valor
+     */
+    public interface Output<K, V> {
+
+        /**
+         * Escribe un par
+         *
+         * @param key Clave
+         * @param value Valor
+         * @throws IOException Error de escritura
+         * @throws InterruptedException Tarea interrumpida
+         */
+        void write(K key, V value) throws IOException, InterruptedException;
+    }
+
+    /**
+     * Combinacion de los valores de una clave
+     *
+     * @param <K> Tipo de la clave
+     * @param <V> Tipo del valor
+     */
+    public interface Function<K, V> {
+
+        /**
+         * Combina los valores de una clave y escribe el resultado
+         *
+         * @param key Clave
+         * @param values Valores de la clave
+         * @param out Salida de la combinacion
+         * @throws IOException Error de escritura
+         * @throws InterruptedException Tarea interrumpida
+         */
+        void combine(K key, Iterable<V> values, Output<K, V> out) throws IOException, InterruptedException;
+    }
+
+    private final Function<K, V> function;//Combinacion de los valores
+    private final Output<K, V> out;//Salida final de los pares
+    private final Output<K, V> table;//Salida de las combinaciones parciales, que vuelven a la tabla
+    private final Map<K, List<V>> values;//Valores guardados de cada clave
+    private final int limit;//Maximo de valores guardados
+    private int size;//Valores guardados
+
+    /**
+     * Crea una agregacion local
+     *
+     * @param function Combinacion de los valores
+     * @param limit Maximo de valores guardados
+     * @param out Salida final de los pares
+     */
+    public LocalCombiner(Function<K, V> function, int limit, Output<K, V> out) {
+        this.function = function;
+        this.limit = Math.max(limit, 1);
+        this.out = out;
+        this.table = this::add;
+        this.values = new HashMap<>();
+    }
+
+    /**
+     * Crea una agregacion local con la combinacion de una clase, normalmente el combiner del trabajo
+     *
+     * @param <K> Tipo de la clave
+     * @param <V> Tipo del valor
+     * @param type Clase que implementa la combinacion
+     * @param limit Maximo de valores guardados
+     * @param out Salida final de los pares
+     * @return Agregacion local o null si la clase no es una combinacion
+     */
+    @SuppressWarnings("unchecked")
+    public static <K, V> LocalCombiner<K, V> create(Class<?> type, int limit, Output<K, V> out) {
+        if (type == null || !Function.class.isAssignableFrom(type)) {
+            return null;
+        }
+        try {
+            return new LocalCombiner<>((Function<K, V>) type.newInstance(), limit, out);
+        } catch (InstantiationException | IllegalAccessException ex) {
+            return null;
+        }
+    }
+
+    /**
+     * Guarda un par, combinando la clave si acumula muchos valores y escribiendo la tabla si se llena
+     *
+     * @param key Clave
+     * @param value Valor
+     * @throws IOException Error de escritura
+     * @throws InterruptedException Tarea interrumpida
+     */
+    public void write(K key, V value) throws IOException, InterruptedException {
+        List<V> list = add(key, value);
+        if (list.size() >= COMBINE_VALUES) {
+            values.remove(key);
+            size -= list.size();
+            function.combine(key, list, table);
+        }
+        if (size >= limit) {
+            flush();
+        }
+    }
+
+    /**
+     * Escribe en la salida final todos los pares guardados y vacia la tabla
+     *
+     * @throws IOException Error de escritura
+     * @throws InterruptedException Tarea interrumpida
+     */
+    public void flush() throws IOException, InterruptedException {
+        for (Map.Entry<K, List<V>> entry : values.entrySet()) {
+            List<V> list = entry.getValue();
+            if (list.size() == 1) {
+                out.write(entry.getKey(), list.get(0));
+            } else {
+                function.combine(entry.getKey(), list, out);
+            }
+        }
+        values.clear();
+        size = 0;
+    }
+
+    /**
+     * Numero de valores guardados
+     *
+     * @return Valores guardados
+     */
+    public int size() {
+        return size;
+    }
+
+    /**
+     * Añade un valor a la tabla
+     *
+     * @param key Clave
+     * @param value Valor
+     * @return Valores de la clave
+     */
+    private List<V> add(K key, V value) {
+        List<V> list = values.get(key);
+        if (list == null) {
+            list = new ArrayList<>(2);
+            values.put(key, list);
+        }
+        list.add(value);
+        size++;
+        return list;
+    }
+
+}
@@ -151,6 +151,56 @@ public class Pd {
         return exp != null && exp != 0;
     }
 
+    /**
+     * Evalua una expresion primitiva, nunca es null
+     *
+     * @param exp Expresion
+     * @return True si es cierto, False en otro caso
+     */
+    public static boolean eval(boolean exp) {
+        return exp;
+    }
+
+    /**
+     * Evalua una expresion primitiva, nunca es null
+     *
+     * @param exp Expresion
+     * @return True si es cierto, False en otro caso
+     */
+    public static boolean eval(int exp) {
+        return exp != 0;
+    }
+
+    /**
+     * Evalua una expresion primitiva, nunca es null
+     *
+     * @param exp Expresion
+     * @return True si es cierto, False en otro caso
+     */
+    public static boolean eval(long exp) {
+        return exp != 0;
+    }
+
+    /**
+     * Evalua una expresion primitiva, nunca es null
+     *
+     * @param exp Expresion
+     * @return True si es cierto, False en otro caso
+     */
+    public static boolean eval(float exp) {
+        return exp != 0;
+    }
+
+    /**
+     * Evalua una expresion primitiva, nunca es null
+     *
+     * @param exp Expresion
+     * @return True si es cierto, False en otro caso
+     */
+    public static boolean eval(double exp) {
+        return exp != 0;
+    }
+
     /**
      * Evalua una expresion
      *
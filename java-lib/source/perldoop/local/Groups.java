@@ -0,0 +1,96 @@
+package perldoop.local;
+
+import java.io.IOException;
+import java.io.UncheckedIOException;
+import java.util.Iterator;
+import java.util.NoSuchElementException;
+
+/**
+ * Agrupa los valores de una entrada ordenada por clave, cada valor se lee una sola vez como en los reducers de hadoop
+ *
+ * @author César Pomar
+ */
+final class Groups implements LocalJob.Input<Object, Iterable<Object>> {
+
+    private final LocalJob.Input<Object, Object> in;
+    private boolean started;//Ya se ha devuelto alguna clave
+    private boolean pending;//La entrada tiene un par sin leer
+    private Object key;
+    private long count;
+    private final Iterable<Object> values;//Valores de la clave actual
+
+    /**
+     * Crea los grupos de una entrada
+     *
+     * @param in Entrada ordenada por clave
+     */
+    Groups(LocalJob.Input<Object, Object> in) {
+        this.in = in;
+        this.values = () -> new Iterator<Object>() {
+
+            @Override
+            public boolean hasNext() {
+                return pending && Spill.compare(in.key(), key) == 0;
+            }
+
+            @Override
+            public Object next() {
+                if (!hasNext()) {
+                    throw new NoSuchElementException();
+                }
+                Object value = in.value();
+                advance();
+                return value;
+            }
+        };
+    }
+
+    @Override
+    public boolean next() throws IOException {
+        if (!started) {
+            started = true;
+            pending = in.next();
+        }
+        // Se saltan los valores que la tarea no ha leido
+        while (pending && count > 0 && Spill.compare(in.key(), key) == 0) {
+            pending = in.next();
+        }
+        if (!pending) {
+            return false;
+        }
+        key = in.key();
+        count++;
+        return true;
+    }
+
+    /**
+     * Lee el siguiente par de la entrada
+     */
+    private void advance() {
+        try {
+            pending = in.next();
+        } catch (IOException ex) {
+            throw new UncheckedIOException(ex);
+        }
+    }
+
+    @Override
+    public Object key() {
+        return key;
+    }
+
+    @Override
+    public Iterable<Object> value() {
+        return values;
+    }
+
+    /**
+     * Claves devueltas
+     *
+     * @return Claves
+     */
+    long count() {
+        return count;
+    }
+
+}
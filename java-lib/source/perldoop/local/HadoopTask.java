@@ -0,0 +1,355 @@
+package perldoop.local;
+
+import java.io.IOException;
+import java.lang.reflect.InvocationHandler;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.lang.reflect.ParameterizedType;
+import java.lang.reflect.Proxy;
+import java.lang.reflect.Type;
+import java.util.Iterator;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.function.Supplier;
+import perldoop.LocalCombiner;
+
+/**
+ * Ejecuta un Mapper o un Reducer de hadoop, como los generados por Perldoop, como tarea de LocalJob. El Context se
+ * sustituye por un proxy de MapContext o ReduceContext envuelto con WrappedMapper o WrappedReducer, las clases de
+ * hadoop se cargan por reflexion y solo son necesarias al ejecutar.
+ *
+ * @author César Pomar
+ * @param <K> Tipo de la clave de entrada
+ * @param <V> Tipo del valor de entrada
+ */
+public final class HadoopTask<K, V> implements LocalJob.Task<K, V> {
+
+    private static final String MAPPER = "org.apache.hadoop.mapreduce.Mapper";
+    private static final String REDUCER = "org.apache.hadoop.mapreduce.Reducer";
+    private static final String MAP_CONTEXT = "org.apache.hadoop.mapreduce.MapContext";
+    private static final String REDUCE_CONTEXT = "org.apache.hadoop.mapreduce.ReduceContext";
+    private static final String WRAPPED_MAPPER = "org.apache.hadoop.mapreduce.lib.map.WrappedMapper";
+    private static final String WRAPPED_REDUCER = "org.apache.hadoop.mapreduce.lib.reduce.WrappedReducer";
+    private static final String CONFIGURATION = "org.apache.hadoop.conf.Configuration";
+    private static final String LONG_WRITABLE = "org.apache.hadoop.io.LongWritable";
+    private static final String TEXT = "org.apache.hadoop.io.Text";
+    private static final String NULL_WRITABLE = "org.apache.hadoop.io.NullWritable";
+
+    // Metodos get y set de cada Writable
+    private static final Map<Class<?>, Method> GETTERS = new ConcurrentHashMap<>();
+    private static final Map<Class<?>, Method> SETTERS = new ConcurrentHashMap<>();
+
+    private final Object task;//Mapper o Reducer
+    private final boolean reduce;
+    private final Object conf;
+    private final Class<?> combiner;
+    private final Class<?> keyType;//Writable de la clave de entrada
+    private final Class<?> valueType;//Writable del valor de entrada
+
+    /**
+     * Crea la tarea
+     *
+     * @param type Clase del Mapper o Reducer
+     * @param reduce Si es un Reducer
+     * @param conf Configuracion de hadoop
+     * @param combiner Combiner del trabajo o null
+     */
+    private HadoopTask(Class<?> type, boolean reduce, Object conf, Class<?> combiner) {
+        this.reduce = reduce;
+        this.conf = conf;
+        this.combiner = combiner;
+        Class<?> base = load(reduce ? REDUCER : MAPPER);
+        if (!base.isAssignableFrom(type)) {
+            throw new IllegalArgumentException(type.getName() + " no es un " + base.getSimpleName() + " de hadoop");
+        }
+        Class<?>[] types = inputTypes(type, base);
+        // La clave de los mappers es el desplazamiento de la linea
+        keyType = types[0] == Object.class && !reduce ? load(LONG_WRITABLE) : types[0];
+        valueType = types[1];
+        try {
+            task = type.newInstance();
+        } catch (InstantiationException | IllegalAccessException ex) {
+            throw new IllegalArgumentException("No se puede crear " + type.getName(), ex);
+        }
+    }
+
+    /**
+     * Crea los mappers de un trabajo
+     *
+     * @param type Clase del Mapper
+     * @param conf Configuracion de hadoop
+     * @param combiner Combiner del trabajo o null, lo usan los mappers con agregacion local
+     * @return Mappers
+     */
+    public static Supplier<LocalJob.Task<Long, String>> mapper(Class<?> type, Object conf, Class<?> combiner) {
+        return () -> new HadoopTask<>(type, false, conf, combiner);
+    }
+
+    /**
+     * Crea los reducers o combiners de un trabajo
+     *
+     * @param type Clase del Reducer
+     * @param conf Configuracion de hadoop
+     * @return Reducers
+     */
+    public static Supplier<LocalJob.Task<Object, Iterable<Object>>> reducer(Class<?> type, Object conf) {
+        return () -> new HadoopTask<>(type, true, conf, null);
+    }
+
+    /**
+     * Crea una configuracion de hadoop
+     *
+     * @param properties Propiedades de la configuracion
+     * @return Configuracion
+     */
+    public static Object configuration(Map<String, String> properties) {
+        try {
+            Class<?> type = load(CONFIGURATION);
+            Object conf = type.newInstance();
+            Method set = type.getMethod("set", String.class, String.class);
+            for (Map.Entry<String, String> property : properties.entrySet()) {
+                set.invoke(conf, property.getKey(), property.getValue());
+            }
+            return conf;
+        } catch (ReflectiveOperationException ex) {
+            throw new IllegalStateException("No se puede crear la configuracion de hadoop", ex);
+        }
+    }
+
+    @Override
+    public void run(LocalJob.Input<K, V> in, LocalCombiner.Output<Object, Object> out) throws IOException, InterruptedException {
+        Object context;
+        Method run;
+        try {
+            Class<?> contextType = load(reduce ? REDUCE_CONTEXT : MAP_CONTEXT);
+            Object local = Proxy.newProxyInstance(contextType.getClassLoader(), new Class<?>[]{contextType}, new Context(in, out));
+            // Las clases Wrapped convierten el MapContext o ReduceContext en el Context de la tarea
+            Object wrapper = load(reduce ? WRAPPED_REDUCER : WRAPPED_MAPPER).newInstance();
+            context = wrapper.getClass().getMethod(reduce ? "getReducerContext" : "getMapContext", contextType).invoke(wrapper, local);
+            String base = reduce ? REDUCER : MAPPER;
+            run = load(base).getMethod("run", load(base + "$Context"));
+        } catch (ReflectiveOperationException ex) {
+            throw new IllegalStateException("No se puede crear el contexto de hadoop", ex);
+        }
+        // setup, map o reduce de cada entrada y cleanup
+        invoke(run, task, context);
+    }
+
+    /**
+     * Sustituto del MapContext o ReduceContext de hadoop
+     */
+    private final class Context implements InvocationHandler {
+
+        private final LocalJob.Input<K, V> in;
+        private final LocalCombiner.Output<Object, Object> out;
+        private Object key;//Writable de la clave actual
+        private Object value;//Writable del valor actual
+
+        private Context(LocalJob.Input<K, V> in, LocalCombiner.Output<Object, Object> out) {
+            this.in = in;
+            this.out = out;
+        }
+
+        @Override
+        public Object invoke(Object proxy, Method method, Object[] args) throws Throwable {
+            switch (method.getName()) {
+                case "nextKeyValue":
+                case "nextKey":
+                    if (!in.next()) {
+                        return false;
+                    }
+                    // Los Writable se reutilizan como en hadoop
+                    key = toWritable(keyType, key, in.key());
+                    if (!reduce) {
+                        value = toWritable(valueType, value, in.value());
+                    }
+                    return true;
+                case "getCurrentKey":
+                    return key;
+                case "getCurrentValue":
+                    return value;
+                case "getValues":
+                    return values((Iterable<?>) in.value());
+                case "write":
+                    out.write(toJava(args[0]), toJava(args[1]));
+                    return null;
+                case "getConfiguration":
+                    return conf;
+                case "getCombinerClass":
+                    return combiner;
+                case "progress":
+                case "setStatus":
+                    return null;
+                case "getStatus":
+                    return "";
+                case "toString":
+                    return "LocalJob[" + task.getClass().getName() + "]";
+                case "hashCode":
+                    return System.identityHashCode(proxy);
+                case "equals":
+                    return proxy == args[0];
+                default:
+                    throw new UnsupportedOperationException("LocalJob no soporta " + method.getName() + " del Context");
+            }
+        }
+
+        /**
+         * Valores de la clave actual convertidos a Writable
+         *
+         * @param values Valores
+         * @return Valores Writable
+         */
+        private Iterable<Object> values(Iterable<?> values) {
+            return () -> new Iterator<Object>() {
+                private final Iterator<?> it = values.iterator();
+
+                @Override
+                public boolean hasNext() {
+                    return it.hasNext();
+                }
+
+                @Override
+                public Object next() {
+                    value = toWritable(valueType, value, it.next());
+                    return value;
+                }
+            };
+        }
+    }
+
+    /**
+     * Clases Writable de la entrada de una tarea, segun los parametros genericos de su clase
+     *
+     * @param type Clase de la tarea
+     * @param base Mapper o Reducer
+     * @return Clase de la clave y del valor
+     */
+    private static Class<?>[] inputTypes(Class<?> type, Class<?> base) {
+        for (Class<?> c = type; c != null && c != base; c = c.getSuperclass()) {
+            Type parent = c.getGenericSuperclass();
+            if (parent instanceof ParameterizedType && ((ParameterizedType) parent).getRawType() == base) {
+                Type[] args = ((ParameterizedType) parent).getActualTypeArguments();
+                return new Class<?>[]{raw(args[0]), raw(args[1])};
+            }
+        }
+        throw new IllegalArgumentException(type.getName() + " no declara los tipos de " + base.getSimpleName());
+    }
+
+    private static Class<?> raw(Type type) {
+        if (type instanceof Class) {
+            return (Class<?>) type;
+        } else if (type instanceof ParameterizedType) {
+            return (Class<?>) ((ParameterizedType) type).getRawType();
+        }
+        return Object.class;
+    }
+
+    /**
+     * Convierte un Writable en su valor java, Text en String y el resto con su metodo get
+     *
+     * @param writable Writable
+     * @return Valor
+     */
+    private static Object toJava(Object writable) {
+        if (writable == null) {
+            return null;
+        }
+        Class<?> type = writable.getClass();
+        if (type.getName().equals(TEXT)) {
+            return writable.toString();
+        } else if (type.getName().equals(NULL_WRITABLE)) {
+            return null;
+        }
+        Method get = GETTERS.computeIfAbsent(type, c -> {
+            try {
+                return c.getMethod("get");
+            } catch (NoSuchMethodException ex) {
+                return null;
+            }
+        });
+        if (get == null) {
+            return writable.toString();
+        }
+        try {
+            return get.invoke(writable);
+        } catch (ReflectiveOperationException ex) {
+            throw new IllegalStateException(ex);
+        }
+    }
+
+    /**
+     * Asigna un valor java a un Writable, creandolo si es necesario
+     *
+     * @param type Clase del Writable
+     * @param writable Writable a reutilizar o null
+     * @param value Valor
+     * @return Writable
+     */
+    private static Object toWritable(Class<?> type, Object writable, Object value) {
+        try {
+            if (writable == null) {
+                writable = type.newInstance();
+            }
+            // El set de un parametro que recibe una cadena o un primitivo
+            Method set = SETTERS.computeIfAbsent(type, c -> {
+                for (Method method : c.getMethods()) {
+                    if (method.getName().equals("set") && method.getParameterCount() == 1) {
+                        Class<?> param = method.getParameterTypes()[0];
+                        if (param == String.class || param.isPrimitive()) {
+                            return method;
+                        }
+                    }
+                }
+                throw new IllegalArgumentException(c.getName() + " no tiene un metodo set para valores basicos");
+            });
+            set.invoke(writable, value);
+            return writable;
+        } catch (ReflectiveOperationException ex) {
+            throw new IllegalStateException("No se puede asignar " + value + " a " + type.getName(), ex);
+        }
+    }
+
+    /**
+     * Invoca un metodo de hadoop propagando sus excepciones
+     *
+     * @param method Metodo
+     * @param target Objeto
+     * @param args Argumentos
+     * @throws IOException Error de entrada o salida
+     * @throws InterruptedException Tarea interrumpida
+     */
+    private static void invoke(Method method, Object target, Object... args) throws IOException, InterruptedException {
+        try {
+            method.invoke(target, args);
+        } catch (InvocationTargetException ex) {
+            Throwable cause = ex.getCause();
+            if (cause instanceof IOException) {
+                throw (IOException) cause;
+            } else if (cause instanceof InterruptedException) {
+                throw (InterruptedException) cause;
+            } else if (cause instanceof RuntimeException) {
+                throw (RuntimeException) cause;
+            } else if (cause instanceof Error) {
+                throw (Error) cause;
+            }
+            throw new IOException(cause);
+        } catch (IllegalAccessException ex) {
+            throw new IllegalStateException(ex);
+        }
+    }
+
+    /**
+     * Carga una clase de hadoop
+     *
+     * @param name Nombre de la clase
+     * @return Clase
+     */
+    private static Class<?> load(String name) {
+        try {
+            return Class.forName(name);
+        } catch (ClassNotFoundException ex) {
+            throw new IllegalStateException("No se encuentra " + name + ", hadoop debe estar en el classpath", ex);
+        }
+    }
+
+}
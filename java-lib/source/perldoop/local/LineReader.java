@@ -0,0 +1,124 @@
+package perldoop.local;
+
+import java.io.BufferedInputStream;
+import java.io.Closeable;
+import java.io.EOFException;
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.nio.charset.StandardCharsets;
+import java.util.Arrays;
+
+/**
+ * Lectura de las lineas de un trozo de fichero como TextInputFormat. Cada trozo lee las lineas que empiezan en el,
+ * incluida la que empieza justo en su final, y salta la primera si no empieza en el principio del fichero.
+ *
+ * @author César Pomar
+ */
+final class LineReader implements LocalJob.Input<Long, String>, Closeable {
+
+    private final InputStream in;
+    private final long end;
+    private long pos;//Posicion en el fichero
+    private byte[] buffer = new byte[256];
+    private long key;
+    private String value;
+    private long records;
+
+    /**
+     * Abre un trozo de fichero
+     *
+     * @param file Fichero
+     * @param start Inicio del trozo
+     * @param end Final del trozo
+     * @throws IOException Error de lectura
+     */
+    LineReader(File file, long start, long end) throws IOException {
+        in = new BufferedInputStream(new FileInputStream(file), 1 << 16);
+        this.end = end;
+        try {
+            while (pos < start) {
+                long skip = in.skip(start - pos);
+                if (skip <= 0) {
+                    throw new EOFException("No se ha podido llegar a la posicion " + start + " de " + file);
+                }
+                pos += skip;
+            }
+            // La linea partida pertenece al trozo anterior
+            if (start != 0) {
+                readLine();
+            }
+        } catch (IOException ex) {
+            in.close();
+            throw ex;
+        }
+    }
+
+    @Override
+    public boolean next() throws IOException {
+        if (pos > end) {
+            return false;
+        }
+        key = pos;
+        if (!readLine()) {
+            return false;
+        }
+        records++;
+        return true;
+    }
+
+    /**
+     * Lee una linea sin el salto de linea
+     *
+     * @return Falso si se ha llegado al final del fichero
+     * @throws IOException Error de lectura
+     */
+    private boolean readLine() throws IOException {
+        int length = 0;
+        int c;
+        while ((c = in.read()) != -1) {
+            pos++;
+            if (c == '\n') {
+                break;
+            }
+            if (length == buffer.length) {
+                buffer = Arrays.copyOf(buffer, length * 2);
+            }
+            buffer[length++] = (byte) c;
+        }
+        if (c == -1 && length == 0) {
+            return false;
+        }
+        if (length > 0 && buffer[length - 1] == '\r') {
+            length--;
+        }
+        value = new String(buffer, 0, length, StandardCharsets.UTF_8);
+        return true;
+    }
+
+    @Override
+    public Long key() {
+        return key;
+    }
+
+    @Override
+    public String value() {
+        return value;
+    }
+
+    /**
+     * Lineas leidas
+     *
+     * @return Lineas
+     */
+    long records() {
+        return records;
+    }
+
+    @Override
+    public void close() throws IOException {
+        in.close();
+    }
+
+}
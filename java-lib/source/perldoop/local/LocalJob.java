@@ -0,0 +1,682 @@
+package perldoop.local;
+
+import java.io.BufferedWriter;
+import java.io.File;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.OutputStreamWriter;
+import java.io.UncheckedIOException;
+import java.io.Writer;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.List;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.concurrent.atomic.LongAdder;
+import java.util.function.Supplier;
+import perldoop.LocalCombiner;
+
+/**
+ * Ejecucion local de un trabajo MapReduce sin cluster. Los mappers se ejecutan en paralelo sobre trozos de los
+ * ficheros de entrada, su salida se ordena en memoria y se vuelca a disco por particiones, y cada particion se mezcla
+ * y se reduce en paralelo escribiendo un fichero part-r-N como TextOutputFormat.
+ *
+ * @author César Pomar
+ */
+public final class LocalJob {
+
+    /**
+     * Hilos por defecto, uno por procesador
+     */
+    public static final int THREADS = Runtime.getRuntime().availableProcessors();
+
+    /**
+     * Tamaño por defecto de los trozos de entrada en bytes
+     */
+    public static final long SPLIT_SIZE = 32L << 20;
+
+    /**
+     * Pares guardados en memoria por cada mapper antes de volcarlos a disco
+     */
+    public static final int SORT_BUFFER = 1 << 20;
+
+    /**
+     * Ficheros mezclados a la vez, con mas ficheros se mezclan en varias pasadas
+     */
+    public static final int MERGE_FACTOR = 64;
+
+    /**
+     * Entrada de una tarea
+     *
+     * @param <K> Tipo de la clave
+     * @param <V> Tipo del valor
+     */
+    public interface Input<K, V> {
+
+        /**
+         * Avanza al siguiente par
+         *
+         * @return Falso si no hay mas pares
+         * @throws IOException Error de lectura
+         */
+        boolean next() throws IOException;
+
+        /**
+         * Clave actual
+         *
+         * @return Clave
+         */
+        K key();
+
+        /**
+         * Valor actual
+         *
+         * @return Valor
+         */
+        V value();
+    }
+
+    /**
+     * Tarea map, reduce o combine. Los mappers leen el desplazamiento y la linea y los reducers cada clave con sus
+     * valores.
+     *
+     * @param <K> Tipo de la clave de entrada
+     * @param <V> Tipo del valor de entrada
+     */
+    public interface Task<K, V> {
+
+        /**
+         * Procesa toda la entrada de la tarea
+         *
+         * @param in Entrada
+         * @param out Salida
+         * @throws IOException Error de entrada o salida
+         * @throws InterruptedException Tarea interrumpida
+         */
+        void run(Input<K, V> in, LocalCombiner.Output<Object, Object> out) throws IOException, InterruptedException;
+    }
+
+    /**
+     * Contadores de una ejecucion
+     */
+    public static final class Counters {
+
+        private final LongAdder mapInput = new LongAdder();
+        private final LongAdder mapOutput = new LongAdder();
+        private final LongAdder spilled = new LongAdder();
+        private final LongAdder reduceGroups = new LongAdder();
+        private final LongAdder output = new LongAdder();
+        private long nanos;
+
+        /**
+         * Lineas leidas por los mappers
+         *
+         * @return Lineas
+         */
+        public long getMapInput() {
+            return mapInput.sum();
+        }
+
+        /**
+         * Pares escritos por los mappers
+         *
+         * @return Pares
+         */
+        public long getMapOutput() {
+            return mapOutput.sum();
+        }
+
+        /**
+         * Pares volcados a disco, despues del combiner
+         *
+         * @return Pares
+         */
+        public long getSpilled() {
+            return spilled.sum();
+        }
+
+        /**
+         * Claves distintas reducidas
+         *
+         * @return Claves
+         */
+        public long getReduceGroups() {
+            return reduceGroups.sum();
+        }
+
+        /**
+         * Pares escritos en la salida final
+         *
+         * @return Pares
+         */
+        public long getOutput() {
+            return output.sum();
+        }
+
+        /**
+         * Tiempo de la ejecucion
+         *
+         * @return Nanosegundos
+         */
+        public long getNanos() {
+            return nanos;
+        }
+
+        /**
+         * Lineas de entrada procesadas por segundo
+         *
+         * @return Lineas por segundo
+         */
+        public double getRecordsPerSecond() {
+            return nanos == 0 ? 0 : getMapInput() * 1e9 / nanos;
+        }
+
+        @Override
+        public String toString() {
+            StringBuilder sb = new StringBuilder();
+            sb.append("Entrada de los mappers: ").append(getMapInput()).append('\n');
+            sb.append("Salida de los mappers: ").append(getMapOutput()).append('\n');
+            sb.append("Pares volcados: ").append(getSpilled()).append('\n');
+            sb.append("Claves reducidas: ").append(getReduceGroups()).append('\n');
+            sb.append("Salida final: ").append(getOutput()).append('\n');
+            sb.append(String.format("Tiempo: %.3f s%n", nanos / 1e9));
+            sb.append(String.format("Registros/s: %.0f%n", getRecordsPerSecond()));
+            return sb.toString();
+        }
+    }
+
+    /**
+     * Trozo de un fichero de entrada
+     */
+    private static final class Split {
+
+        private final File file;
+        private final long start;
+        private final long end;
+
+        private Split(File file, long start, long end) {
+            this.file = file;
+            this.start = start;
+            this.end = end;
+        }
+    }
+
+    /**
+     * Par de la salida de un mapper
+     */
+    private static final class Record {
+
+        private final int partition;
+        private final Object key;
+        private final Object value;
+
+        private Record(int partition, Object key, Object value) {
+            this.partition = partition;
+            this.key = key;
+            this.value = value;
+        }
+    }
+
+    private final Supplier<Task<Long, String>> mapper;//Crea los mappers
+    private Supplier<Task<Object, Iterable<Object>>> reducer;//Crea los reducers, sin ellos solo hay fase map
+    private Supplier<Task<Object, Iterable<Object>>> combiner;//Crea los combiners
+    private int threads = THREADS;
+    private int reducers = 1;
+    private long splitSize = SPLIT_SIZE;
+    private int sortBuffer = SORT_BUFFER;
+    private int mergeFactor = MERGE_FACTOR;
+    private File tempDir;
+    private Counters counters;
+
+    /**
+     * Crea un trabajo local
+     *
+     * @param mapper Crea un mapper por cada trozo de la entrada
+     */
+    public LocalJob(Supplier<Task<Long, String>> mapper) {
+        this.mapper = mapper;
+    }
+
+    /**
+     * Asigna el reducer, sin reducer la salida de los mappers es la final
+     *
+     * @param reducer Crea un reducer por cada particion
+     * @return Este trabajo
+     */
+    public LocalJob setReducer(Supplier<Task<Object, Iterable<Object>>> reducer) {
+        this.reducer = reducer;
+        return this;
+    }
+
+    /**
+     * Asigna el combiner que reduce la salida de los mappers antes de volcarla, debe mantener las claves
+     *
+     * @param combiner Crea un combiner por cada volcado
+     * @return Este trabajo
+     */
+    public LocalJob setCombiner(Supplier<Task<Object, Iterable<Object>>> combiner) {
+        this.combiner = combiner;
+        return this;
+    }
+
+    /**
+     * Asigna los hilos de las fases map y reduce
+     *
+     * @param threads Hilos
+     * @return Este trabajo
+     */
+    public LocalJob setThreads(int threads) {
+        this.threads = Math.max(threads, 1);
+        return this;
+    }
+
+    /**
+     * Asigna el numero de reducers, que es el de particiones y ficheros de salida
+     *
+     * @param reducers Reducers
+     * @return Este trabajo
+     */
+    public LocalJob setReducers(int reducers) {
+        this.reducers = Math.max(reducers, 1);
+        return this;
+    }
+
+    /**
+     * Asigna el tamaño de los trozos de la entrada
+     *
+     * @param splitSize Bytes
+     * @return Este trabajo
+     */
+    public LocalJob setSplitSize(long splitSize) {
+        this.splitSize = Math.max(splitSize, 1);
+        return this;
+    }
+
+    /**
+     * Asigna los pares guardados en memoria por cada mapper
+     *
+     * @param sortBuffer Pares
+     * @return Este trabajo
+     */
+    public LocalJob setSortBuffer(int sortBuffer) {
+        this.sortBuffer = Math.max(sortBuffer, 1);
+        return this;
+    }
+
+    /**
+     * Asigna los ficheros mezclados a la vez
+     *
+     * @param mergeFactor Ficheros
+     * @return Este trabajo
+     */
+    public LocalJob setMergeFactor(int mergeFactor) {
+        this.mergeFactor = Math.max(mergeFactor, 2);
+        return this;
+    }
+
+    /**
+     * Asigna el directorio de los volcados, por defecto el temporal del sistema
+     *
+     * @param tempDir Directorio
+     * @return Este trabajo
+     */
+    public LocalJob setTempDir(File tempDir) {
+        this.tempDir = tempDir;
+        return this;
+    }
+
+    /**
+     * Ejecuta el trabajo
+     *
+     * @param inputs Ficheros o directorios de entrada
+     * @param output Directorio de salida, no debe existir
+     * @return Contadores de la ejecucion
+     * @throws IOException Error de entrada o salida
+     * @throws InterruptedException Trabajo interrumpido
+     */
+    public Counters run(List<File> inputs, File output) throws IOException, InterruptedException {
+        if (output.exists()) {
+            throw new IOException("El directorio de salida " + output + " ya existe");
+        }
+        List<Split> splits = splits(inputs);
+        if (!output.mkdirs()) {
+            throw new IOException("No se ha podido crear el directorio de salida " + output);
+        }
+        counters = new Counters();
+        long start = System.nanoTime();
+        File temp = (tempDir == null ? Files.createTempDirectory("perldoop-") : Files.createTempDirectory(tempDir.toPath(), "perldoop-")).toFile();
+        ExecutorService pool = Executors.newFixedThreadPool(threads);
+        try {
+            // Volcados ordenados de cada particion
+            List<List<File>> runs = new ArrayList<>();
+            for (int p = 0; reducer != null && p < reducers; p++) {
+                runs.add(Collections.synchronizedList(new ArrayList<>()));
+            }
+            List<Callable<Void>> maps = new ArrayList<>();
+            for (int i = 0; i < splits.size(); i++) {
+                int id = i;
+                maps.add(() -> {
+                    map(splits.get(id), id, temp, output, runs);
+                    return null;
+                });
+            }
+            invokeAll(pool, maps);
+            if (reducer != null) {
+                List<Callable<Void>> reduces = new ArrayList<>();
+                for (int p = 0; p < reducers; p++) {
+                    int id = p;
+                    reduces.add(() -> {
+                        reduce(id, runs.get(id), temp, output);
+                        return null;
+                    });
+                }
+                invokeAll(pool, reduces);
+            }
+        } finally {
+            pool.shutdownNow();
+            delete(temp);
+        }
+        counters.nanos = System.nanoTime() - start;
+        return counters;
+    }
+
+    /**
+     * Divide las entradas en trozos
+     *
+     * @param inputs Ficheros o directorios de entrada
+     * @return Trozos
+     * @throws IOException Si no existe alguna entrada
+     */
+    private List<Split> splits(List<File> inputs) throws IOException {
+        List<Split> splits = new ArrayList<>();
+        for (File input : inputs) {
+            if (!input.exists()) {
+                throw new IOException("No se ha encontrado la entrada " + input);
+            }
+            File[] files = input.isDirectory() ? input.listFiles() : new File[]{input};
+            if (files == null) {
+                throw new IOException("No se ha podido leer el directorio " + input);
+            }
+            // Mismo orden en todas las ejecuciones
+            Arrays.sort(files);
+            for (File file : files) {
+                // Como en hadoop se ignoran los ficheros ocultos de los directorios
+                if (!file.isFile() || (file != input && (file.getName().startsWith(".") || file.getName().startsWith("_")))) {
+                    continue;
+                }
+                long length = file.length();
+                for (long start = 0; start < length; start += splitSize) {
+                    splits.add(new Split(file, start, Math.min(start + splitSize, length)));
+                }
+            }
+        }
+        return splits;
+    }
+
+    /**
+     * Ejecuta un mapper sobre un trozo de la entrada
+     *
+     * @param split Trozo
+     * @param id Numero del mapper
+     * @param temp Directorio de los volcados
+     * @param output Directorio de salida
+     * @param runs Volcados de cada particion
+     * @throws IOException Error de entrada o salida
+     * @throws InterruptedException Tarea interrumpida
+     */
+    private void map(Split split, int id, File temp, File output, List<List<File>> runs) throws IOException, InterruptedException {
+        Task<Long, String> task = mapper.get();
+        try (LineReader in = new LineReader(split.file, split.start, split.end)) {
+            if (reducer == null) {
+                try (Writer out = part(output, 'm', id)) {
+                    long[] writes = new long[1];
+                    task.run(in, (key, value) -> {
+                        write(out, key, value);
+                        writes[0]++;
+                    });
+                    counters.mapOutput.add(writes[0]);
+                    counters.output.add(writes[0]);
+                }
+            } else {
+                MapOutput out = new MapOutput(id, temp, runs);
+                task.run(in, out);
+                out.spill();
+                counters.mapOutput.add(out.writes);
+            }
+            counters.mapInput.add(in.records());
+        }
+    }
+
+    /**
+     * Mezcla los volcados de una particion y ejecuta el reducer
+     *
+     * @param partition Particion
+     * @param runs Volcados de la particion
+     * @param temp Directorio de los volcados
+     * @param output Directorio de salida
+     * @throws IOException Error de entrada o salida
+     * @throws InterruptedException Tarea interrumpida
+     */
+    private void reduce(int partition, List<File> runs, File temp, File output) throws IOException, InterruptedException {
+        List<File> files = new ArrayList<>(runs);
+        // Mezclas intermedias para no abrir demasiados ficheros a la vez
+        for (int pass = 0; files.size() > mergeFactor; pass++) {
+            List<File> group = new ArrayList<>(files.subList(0, mergeFactor));
+            files.subList(0, mergeFactor).clear();
+            File merged = new File(temp, "merge-" + partition + "-" + pass);
+            try (Merge in = new Merge(group); Spill.Writer out = new Spill.Writer(merged)) {
+                while (in.next()) {
+                    out.write(in.key(), in.value());
+                }
+            }
+            for (File file : group) {
+                file.delete();
+            }
+            files.add(merged);
+        }
+        Task<Object, Iterable<Object>> task = reducer.get();
+        try (Merge in = new Merge(files); Writer out = part(output, 'r', partition)) {
+            Groups groups = new Groups(in);
+            long[] writes = new long[1];
+            task.run(groups, (key, value) -> {
+                write(out, key, value);
+                writes[0]++;
+            });
+            counters.reduceGroups.add(groups.count());
+            counters.output.add(writes[0]);
+        }
+    }
+
+    /**
+     * Salida de un mapper, ordena los pares en memoria y los vuelca por particiones
+     */
+    private final class MapOutput implements LocalCombiner.Output<Object, Object> {
+
+        private final List<Record> records = new ArrayList<>();
+        private final int id;
+        private final File temp;
+        private final List<List<File>> runs;
+        private int spills;
+        private long writes;
+
+        private MapOutput(int id, File temp, List<List<File>> runs) {
+            this.id = id;
+            this.temp = temp;
+            this.runs = runs;
+        }
+
+        @Override
+        public void write(Object key, Object value) throws IOException, InterruptedException {
+            // Particion por el hashCode de la clave java, no del Writable, asi que no coincide con el HashPartitioner
+            int partition = key == null ? 0 : (key.hashCode() & Integer.MAX_VALUE) % reducers;
+            records.add(new Record(partition, key, value));
+            writes++;
+            if (records.size() >= sortBuffer) {
+                spill();
+            }
+        }
+
+        /**
+         * Ordena los pares guardados y los vuelca a un fichero por particion
+         *
+         * @throws IOException Error de escritura
+         * @throws InterruptedException Tarea interrumpida
+         */
+        private void spill() throws IOException, InterruptedException {
+            // La ordenacion es estable, los valores de una clave mantienen su orden
+            records.sort((a, b) -> a.partition != b.partition ? Integer.compare(a.partition, b.partition) : Spill.compare(a.key, b.key));
+            int start = 0;
+            while (start < records.size()) {
+                int partition = records.get(start).partition;
+                int end = start;
+                while (end < records.size() && records.get(end).partition == partition) {
+                    end++;
+                }
+                List<Record> range = records.subList(start, end);
+                if (combiner != null) {
+                    range = combine(range, partition);
+                }
+                File file = new File(temp, "map-" + id + "-" + spills + "-" + partition);
+                try (Spill.Writer out = new Spill.Writer(file)) {
+                    for (Record record : range) {
+                        out.write(record.key, record.value);
+                    }
+                }
+                counters.spilled.add(range.size());
+                runs.get(partition).add(file);
+                start = end;
+            }
+            records.clear();
+            spills++;
+        }
+
+        /**
+         * Ejecuta el combiner sobre los pares ordenados de una particion
+         *
+         * @param range Pares ordenados
+         * @param partition Particion
+         * @return Pares combinados y ordenados
+         * @throws IOException Error de entrada o salida
+         * @throws InterruptedException Tarea interrumpida
+         */
+        private List<Record> combine(List<Record> range, int partition) throws IOException, InterruptedException {
+            List<Record> combined = new ArrayList<>();
+            Input<Object, Object> in = new Input<Object, Object>() {
+                private int index = -1;
+
+                @Override
+                public boolean next() {
+                    return ++index < range.size();
+                }
+
+                @Override
+                public Object key() {
+                    return range.get(index).key;
+                }
+
+                @Override
+                public Object value() {
+                    return range.get(index).value;
+                }
+            };
+            combiner.get().run(new Groups(in), (key, value) -> combined.add(new Record(partition, key, value)));
+            // Por si el combiner no escribe las claves en orden
+            combined.sort((a, b) -> Spill.compare(a.key, b.key));
+            return combined;
+        }
+    }
+
+    /**
+     * Abre un fichero de la salida final
+     *
+     * @param output Directorio de salida
+     * @param type Tipo de tarea, 'm' o 'r'
+     * @param id Numero de la tarea
+     * @return Fichero de salida
+     * @throws IOException Error al crear el fichero
+     */
+    private static Writer part(File output, char type, int id) throws IOException {
+        File file = new File(output, String.format("part-%c-%05d", type, id));
+        return new BufferedWriter(new OutputStreamWriter(new FileOutputStream(file), StandardCharsets.UTF_8), 1 << 16);
+    }
+
+    /**
+     * Escribe un par como TextOutputFormat, clave y valor separados por un tabulador
+     *
+     * @param out Fichero de salida
+     * @param key Clave
+     * @param value Valor
+     * @throws IOException Error de escritura
+     */
+    private static void write(Writer out, Object key, Object value) throws IOException {
+        if (key != null) {
+            out.write(key.toString());
+        }
+        if (key != null && value != null) {
+            out.write('\t');
+        }
+        if (value != null) {
+            out.write(value.toString());
+        }
+        out.write('\n');
+    }
+
+    /**
+     * Ejecuta las tareas y espera a que terminen, el primer error cancela el resto
+     *
+     * @param pool Hilos
+     * @param tasks Tareas
+     * @throws IOException Error de entrada o salida de alguna tarea
+     * @throws InterruptedException Tarea interrumpida
+     */
+    private static void invokeAll(ExecutorService pool, List<Callable<Void>> tasks) throws IOException, InterruptedException {
+        List<Future<Void>> futures = new ArrayList<>();
+        for (Callable<Void> task : tasks) {
+            futures.add(pool.submit(task));
+        }
+        try {
+            for (Future<Void> future : futures) {
+                future.get();
+            }
+        } catch (ExecutionException ex) {
+            for (Future<Void> future : futures) {
+                future.cancel(true);
+            }
+            Throwable cause = ex.getCause();
+            if (cause instanceof UncheckedIOException) {
+                throw ((UncheckedIOException) cause).getCause();
+            } else if (cause instanceof IOException) {
+                throw (IOException) cause;
+            } else if (cause instanceof InterruptedException) {
+                throw (InterruptedException) cause;
+            } else if (cause instanceof RuntimeException) {
+                throw (RuntimeException) cause;
+            } else if (cause instanceof Error) {
+                throw (Error) cause;
+            }
+            throw new IOException(cause);
+        }
+    }
+
+    /**
+     * Borra un directorio con su contenido
+     *
+     * @param dir Directorio
+     */
+    private static void delete(File dir) {
+        File[] files = dir.listFiles();
+        if (files != null) {
+            for (File file : files) {
+                file.delete();
+            }
+        }
+        dir.delete();
+    }
+
+}
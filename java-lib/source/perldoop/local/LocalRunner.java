@@ -0,0 +1,101 @@
+package perldoop.local;
+
+import java.io.File;
+import java.util.ArrayList;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * Ejecuta en local un trabajo traducido por Perldoop y muestra sus contadores y registros por segundo. Las clases del
+ * trabajo y hadoop deben estar en el classpath.
+ *
+ * <pre>
+ * java perldoop.local.LocalRunner -mapper Clase [-reducer Clase] [-combiner Clase] [-threads n] [-reducers n]
+ *     [-split MB] [-buffer pares] [-tmp dir] [-D clave=valor]... entrada... salida
+ * </pre>
+ *
+ * @author César Pomar
+ */
+public final class LocalRunner {
+
+    private static final String USAGE = "Uso: LocalRunner -mapper Clase [-reducer Clase] [-combiner Clase] [-threads n] [-reducers n] "
+            + "[-split MB] [-buffer pares] [-tmp dir] [-D clave=valor]... entrada... salida";
+
+    private LocalRunner() {
+    }
+
+    /**
+     * Ejecuta el trabajo
+     *
+     * @param args Argumentos
+     * @throws Exception Error del trabajo
+     */
+    public static void main(String[] args) throws Exception {
+        String mapper = null, reducer = null, combiner = null;
+        Map<String, String> properties = new LinkedHashMap<>();
+        List<String> paths = new ArrayList<>();
+        int threads = LocalJob.THREADS, reducers = 1, buffer = LocalJob.SORT_BUFFER;
+        long split = LocalJob.SPLIT_SIZE;
+        File tmp = null;
+        try {
+            for (int i = 0; i < args.length; i++) {
+                switch (args[i]) {
+                    case "-mapper":
+                        mapper = args[++i];
+                        break;
+                    case "-reducer":
+                        reducer = args[++i];
+                        break;
+                    case "-combiner":
+                        combiner = args[++i];
+                        break;
+                    case "-threads":
+                        threads = Integer.parseInt(args[++i]);
+                        break;
+                    case "-reducers":
+                        reducers = Integer.parseInt(args[++i]);
+                        break;
+                    case "-split":
+                        split = Long.parseLong(args[++i]) << 20;
+                        break;
+                    case "-buffer":
+                        buffer = Integer.parseInt(args[++i]);
+                        break;
+                    case "-tmp":
+                        tmp = new File(args[++i]);
+                        break;
+                    case "-D":
+                        String[] property = args[++i].split("=", 2);
+                        properties.put(property[0], property.length > 1 ? property[1] : "");
+                        break;
+                    default:
+                        paths.add(args[i]);
+                }
+            }
+        } catch (ArrayIndexOutOfBoundsException | NumberFormatException ex) {
+            paths.clear();
+        }
+        if (mapper == null || paths.size() < 2) {
+            System.err.println(USAGE);
+            System.exit(2);
+        }
+        Object conf = HadoopTask.configuration(properties);
+        Class<?> combinerType = combiner == null ? null : Class.forName(combiner);
+        LocalJob job = new LocalJob(HadoopTask.mapper(Class.forName(mapper), conf, combinerType));
+        if (reducer != null) {
+            job.setReducer(HadoopTask.reducer(Class.forName(reducer), conf));
+        }
+        if (combinerType != null) {
+            job.setCombiner(HadoopTask.reducer(combinerType, conf));
+        }
+        job.setThreads(threads).setReducers(reducers).setSplitSize(split).setSortBuffer(buffer).setTempDir(tmp);
+        List<File> inputs = new ArrayList<>();
+        for (String path : paths.subList(0, paths.size() - 1)) {
+            inputs.add(new File(path));
+        }
+        LocalJob.Counters counters = job.run(inputs, new File(paths.get(paths.size() - 1)));
+        System.out.print(counters);
+    }
+
+}
@@ -0,0 +1,70 @@
+package perldoop.local;
+
+import java.io.Closeable;
+import java.io.File;
+import java.io.IOException;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.PriorityQueue;
+
+/**
+ * Mezcla de varios ficheros de pares ordenados en un unico recorrido ordenado
+ *
+ * @author César Pomar
+ */
+final class Merge implements LocalJob.Input<Object, Object>, Closeable {
+
+    private final List<Spill.Reader> readers = new ArrayList<>();
+    private final PriorityQueue<Spill.Reader> queue;
+    private Spill.Reader current;
+
+    /**
+     * Abre los ficheros y lee el primer par de cada uno
+     *
+     * @param files Ficheros ordenados
+     * @throws IOException Error de lectura
+     */
+    Merge(List<File> files) throws IOException {
+        queue = new PriorityQueue<>(Math.max(files.size(), 1), (a, b) -> Spill.compare(a.key(), b.key()));
+        try {
+            for (File file : files) {
+                Spill.Reader reader = new Spill.Reader(file);
+                readers.add(reader);
+                if (reader.next()) {
+                    queue.add(reader);
+                }
+            }
+        } catch (IOException ex) {
+            close();
+            throw ex;
+        }
+    }
+
+    @Override
+    public boolean next() throws IOException {
+        // El fichero del par anterior vuelve a la cola con su siguiente par
+        if (current != null && current.next()) {
+            queue.add(current);
+        }
+        current = queue.poll();
+        return current != null;
+    }
+
+    @Override
+    public Object key() {
+        return current.key();
+    }
+
+    @Override
+    public Object value() {
+        return current.value();
+    }
+
+    @Override
+    public void close() throws IOException {
+        for (Spill.Reader reader : readers) {
+            reader.close();
+        }
+    }
+
+}
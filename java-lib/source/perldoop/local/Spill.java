@@ -0,0 +1,183 @@
+package perldoop.local;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.Closeable;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.EOFException;
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.nio.charset.StandardCharsets;
+
+/**
+ * Fichero de pares ordenados por clave, con los tipos basicos que usa Perldoop
+ *
+ * @author César Pomar
+ */
+final class Spill {
+
+    private static final int BUFFER = 1 << 16;
+
+    // Tipos de los datos guardados
+    private static final int NULL = 0;
+    private static final int STRING = 1;
+    private static final int INTEGER = 2;
+    private static final int LONG = 3;
+    private static final int FLOAT = 4;
+    private static final int DOUBLE = 5;
+    private static final int BOOLEAN = 6;
+
+    private Spill() {
+    }
+
+    /**
+     * Compara dos claves, null es la menor
+     *
+     * @param a Clave
+     * @param b Clave
+     * @return Comparacion
+     */
+    @SuppressWarnings("unchecked")
+    static int compare(Object a, Object b) {
+        if (a == null || b == null) {
+            return a == b ? 0 : (a == null ? -1 : 1);
+        }
+        return ((Comparable<Object>) a).compareTo(b);
+    }
+
+    /**
+     * Escritura de un fichero de pares
+     */
+    static final class Writer implements Closeable {
+
+        private final DataOutputStream out;
+
+        /**
+         * Crea el fichero
+         *
+         * @param file Fichero
+         * @throws IOException Error al crear el fichero
+         */
+        Writer(File file) throws IOException {
+            out = new DataOutputStream(new BufferedOutputStream(new FileOutputStream(file), BUFFER));
+        }
+
+        /**
+         * Escribe un par
+         *
+         * @param key Clave
+         * @param value Valor
+         * @throws IOException Error de escritura o tipo no soportado
+         */
+        void write(Object key, Object value) throws IOException {
+            write(key);
+            write(value);
+        }
+
+        private void write(Object data) throws IOException {
+            if (data == null) {
+                out.writeByte(NULL);
+            } else if (data instanceof String) {
+                byte[] bytes = ((String) data).getBytes(StandardCharsets.UTF_8);
+                out.writeByte(STRING);
+                out.writeInt(bytes.length);
+                out.write(bytes);
+            } else if (data instanceof Integer) {
+                out.writeByte(INTEGER);
+                out.writeInt((Integer) data);
+            } else if (data instanceof Long) {
+                out.writeByte(LONG);
+                out.writeLong((Long) data);
+            } else if (data instanceof Float) {
+                out.writeByte(FLOAT);
+                out.writeFloat((Float) data);
+            } else if (data instanceof Double) {
+                out.writeByte(DOUBLE);
+                out.writeDouble((Double) data);
+            } else if (data instanceof Boolean) {
+                out.writeByte(BOOLEAN);
+                out.writeBoolean((Boolean) data);
+            } else {
+                throw new IOException("Tipo no soportado en la salida del mapper: " + data.getClass().getName());
+            }
+        }
+
+        @Override
+        public void close() throws IOException {
+            out.close();
+        }
+    }
+
+    /**
+     * Lectura de un fichero de pares
+     */
+    static final class Reader implements LocalJob.Input<Object, Object>, Closeable {
+
+        private final DataInputStream in;
+        private Object key;
+        private Object value;
+
+        /**
+         * Abre el fichero
+         *
+         * @param file Fichero
+         * @throws IOException Error al abrir el fichero
+         */
+        Reader(File file) throws IOException {
+            in = new DataInputStream(new BufferedInputStream(new FileInputStream(file), BUFFER));
+        }
+
+        @Override
+        public boolean next() throws IOException {
+            int type = in.read();
+            if (type == -1) {
+                return false;
+            }
+            key = read(type);
+            value = read(in.readUnsignedByte());
+            return true;
+        }
+
+        private Object read(int type) throws IOException {
+            switch (type) {
+                case NULL:
+                    return null;
+                case STRING:
+                    byte[] bytes = new byte[in.readInt()];
+                    in.readFully(bytes);
+                    return new String(bytes, StandardCharsets.UTF_8);
+                case INTEGER:
+                    return in.readInt();
+                case LONG:
+                    return in.readLong();
+                case FLOAT:
+                    return in.readFloat();
+                case DOUBLE:
+                    return in.readDouble();
+                case BOOLEAN:
+                    return in.readBoolean();
+                default:
+                    throw new EOFException("Fichero de pares corrupto");
+            }
+        }
+
+        @Override
+        public Object key() {
+            return key;
+        }
+
+        @Override
+        public Object value() {
+            return value;
+        }
+
+        @Override
+        public void close() throws IOException {
+            in.close();
+        }
+    }
+
+}
@@ -0,0 +1,93 @@
+package perldoop;
+
+import java.io.IOException;
+import java.util.Map;
+import java.util.TreeMap;
+import org.junit.Test;
+import junit.framework.*;
+import static org.junit.Assert.*;
+
+/**
+ * Pruebas de la clase LocalCombiner
+ *
+ * @author César Pomar
+ */
+public class LocalCombinerTest extends TestCase {
+
+    /**
+     * Suma de los valores de una clave, como el reducer de WordCount
+     */
+    public static class Sum implements LocalCombiner.Function<String, Integer> {
+
+        @Override
+        public void combine(String key, Iterable<Integer> values, LocalCombiner.Output<String, Integer> out) throws IOException, InterruptedException {
+            int count = 0;
+            for (Integer value : values) {
+                count += value;
+            }
+            out.write(key, count);
+        }
+    }
+
+    /**
+     * Salida que suma lo escrito en cada clave y cuenta las escrituras
+     */
+    private static class Counts implements LocalCombiner.Output<String, Integer> {
+
+        private final Map<String, Integer> counts = new TreeMap<>();
+        private int writes;
+
+        @Override
+        public void write(String key, Integer value) {
+            Integer count = counts.get(key);
+            counts.put(key, count == null ? value : count + value);
+            writes++;
+        }
+    }
+
+    @Test
+    public void testCombine() throws Exception {
+        System.out.println("combine");
+        Counts out = new Counts();
+        LocalCombiner<String, Integer> combiner = new LocalCombiner<>(new Sum(), 1000, out);
+        for (int i = 0; i < 100; i++) {
+            combiner.write("a", 1);
+            combiner.write("b", 2);
+        }
+        //Nada se escribe hasta vaciar la tabla
+        assertEquals(0, out.writes);
+        combiner.flush();
+        assertEquals(Integer.valueOf(100), out.counts.get("a"));
+        assertEquals(Integer.valueOf(200), out.counts.get("b"));
+        //Una escritura por clave
+        assertEquals(2, out.writes);
+        assertEquals(0, combiner.size());
+    }
+
+    @Test
+    public void testLimit() throws Exception {
+        System.out.println("limit");
+        Counts out = new Counts();
+        LocalCombiner<String, Integer> combiner = new LocalCombiner<>(new Sum(), 10, out);
+        for (int i = 0; i < 25; i++) {
+            combiner.write("k" + i, 1);
+        }
+        //La tabla se escribe al llegar al limite
+        assertEquals(20, out.writes);
+        assertEquals(5, combiner.size());
+        combiner.flush();
+        assertEquals(25, out.counts.size());
+        assertEquals(25, out.writes);
+    }
+
+    @Test
+    public void testCreate() {
+        System.out.println("create");
+        Counts out = new Counts();
+        assertNotNull(LocalCombiner.<String, Integer>create(Sum.class, 10, out));
+        //Sin combiner o si no es una combinacion no hay agregacion
+        assertNull(LocalCombiner.<String, Integer>create(null, 10, out));
+        assertNull(LocalCombiner.<String, Integer>create(String.class, 10, out));
+    }
+
+}
@@ -0,0 +1,230 @@
+package perldoop.local;
+
+import java.io.File;
+import java.io.IOException;
+import java.io.StringWriter;
+import java.net.URL;
+import java.net.URLClassLoader;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.List;
+import java.util.Map;
+import java.util.ServiceLoader;
+import java.util.TreeMap;
+import javax.tools.JavaCompiler;
+import javax.tools.StandardJavaFileManager;
+import javax.tools.ToolProvider;
+import org.junit.After;
+import org.junit.Before;
+import org.junit.Test;
+import static org.junit.Assert.*;
+import static org.junit.Assume.*;
+
+/**
+ * Pruebas de la ejecucion de un Mapper y un Reducer de hadoop con LocalJob. Hadoop no es una dependencia de las
+ * pruebas, si hadoop-client no esta en el classpath o no hay compilador las pruebas se omiten. Por eso las tareas de
+ * WordCount se compilan al preparar cada prueba.
+ *
+ * @author César Pomar
+ */
+public class HadoopTaskTest {
+
+    private static final String MAPPER = "perldoop.local.WordMapper";
+    private static final String REDUCER = "perldoop.local.SumReducer";
+
+    /**
+     * Mapper de WordCount, reutiliza sus Writable de salida como los generados por Perldoop
+     */
+    private static final String MAPPER_SOURCE = String.join("\n",
+            "package perldoop.local;",
+            "import java.io.IOException;",
+            "import org.apache.hadoop.io.IntWritable;",
+            "import org.apache.hadoop.io.Text;",
+            "import org.apache.hadoop.mapreduce.Mapper;",
+            "public class WordMapper extends Mapper<Object, Text, Text, IntWritable> {",
+            "    private final Text word = new Text();",
+            "    private final IntWritable one = new IntWritable(1);",
+            "    @Override",
+            "    public void map(Object key, Text value, Context context) throws IOException, InterruptedException {",
+            "        for (String w : value.toString().split(\" \")) {",
+            "            word.set(w);",
+            "            context.write(word, one);",
+            "        }",
+            "    }",
+            "}");
+
+    /**
+     * Reducer y combiner de WordCount
+     */
+    private static final String REDUCER_SOURCE = String.join("\n",
+            "package perldoop.local;",
+            "import java.io.IOException;",
+            "import org.apache.hadoop.io.IntWritable;",
+            "import org.apache.hadoop.io.Text;",
+            "import org.apache.hadoop.mapreduce.Reducer;",
+            "public class SumReducer extends Reducer<Text, IntWritable, Text, IntWritable> {",
+            "    private final IntWritable count = new IntWritable();",
+            "    @Override",
+            "    public void reduce(Text key, Iterable<IntWritable> values, Context context) throws IOException, InterruptedException {",
+            "        int sum = 0;",
+            "        for (IntWritable value : values) {",
+            "            sum += value.get();",
+            "        }",
+            "        count.set(sum);",
+            "        context.write(key, count);",
+            "    }",
+            "}");
+
+    private File dir;
+    private Object conf;
+    private URLClassLoader loader;
+
+    @Before
+    public void setUp() throws Exception {
+        assumeTrue("hadoop-client no esta en el classpath", hadoop());
+        JavaCompiler compiler = compiler();
+        assumeTrue("No hay un compilador de java", compiler != null);
+        dir = Files.createTempDirectory("perldoop-test-").toFile();
+        File source = new File(dir, "src/perldoop/local");
+        File classes = new File(dir, "classes");
+        source.mkdirs();
+        classes.mkdir();
+        File mapper = new File(source, "WordMapper.java");
+        File reducer = new File(source, "SumReducer.java");
+        write(mapper, MAPPER_SOURCE);
+        write(reducer, REDUCER_SOURCE);
+        StringWriter errors = new StringWriter();
+        try (StandardJavaFileManager files = compiler.getStandardFileManager(null, null, StandardCharsets.UTF_8)) {
+            List<String> options = Arrays.asList("-source", "1.8", "-target", "1.8", "-nowarn",
+                    "-classpath", System.getProperty("java.class.path"), "-d", classes.getPath());
+            boolean compiled = compiler.getTask(errors, files, null, options, null, files.getJavaFileObjects(mapper, reducer)).call();
+            assertTrue(errors.toString(), compiled);
+        }
+        loader = new URLClassLoader(new URL[]{classes.toURI().toURL()}, getClass().getClassLoader());
+        conf = HadoopTask.configuration(Collections.singletonMap("perldoop.test", "si"));
+    }
+
+    @After
+    public void tearDown() throws IOException {
+        if (loader != null) {
+            loader.close();
+        }
+        if (dir != null) {
+            delete(dir);
+        }
+    }
+
+    @Test
+    public void testWordCount() throws Exception {
+        System.out.println("wordCount");
+        Map<String, Integer> expected = new TreeMap<>();
+        List<File> inputs = new ArrayList<>();
+        for (int f = 0; f < 3; f++) {
+            StringBuilder text = new StringBuilder();
+            for (int i = 0; i < 50; i++) {
+                for (int j = 0; j <= i % 4; j++) {
+                    String word = "p" + ((i * 5 + j * 11 + f) % 23);
+                    text.append(j == 0 ? "" : " ").append(word);
+                    expected.merge(word, 1, Integer::sum);
+                }
+                text.append('\n');
+            }
+            File input = new File(dir, "in" + f + ".txt");
+            write(input, text.toString());
+            inputs.add(input);
+        }
+        Class<?> reducer = loader.loadClass(REDUCER);
+        LocalJob job = new LocalJob(HadoopTask.mapper(loader.loadClass(MAPPER), conf, reducer));
+        job.setReducer(HadoopTask.reducer(reducer, conf)).setCombiner(HadoopTask.reducer(reducer, conf));
+        //Trozos y volcados pequeños para que el combiner y la mezcla reciban varios Writable
+        job.setThreads(3).setReducers(2).setSplitSize(100).setSortBuffer(16).setMergeFactor(2).setTempDir(dir);
+        File out = new File(dir, "out");
+        LocalJob.Counters counters = job.run(inputs, out);
+        Map<String, Integer> result = new TreeMap<>();
+        for (String line : read(out, "part-r-")) {
+            String[] pair = line.split("\t");
+            assertNull(result.put(pair[0], Integer.parseInt(pair[1])));
+        }
+        assertEquals(expected, result);
+        assertEquals(150, counters.getMapInput());
+        assertEquals(expected.size(), counters.getOutput());
+        //El combiner reduce los pares volcados
+        assertTrue(counters.getSpilled() < counters.getMapOutput());
+    }
+
+    @Test
+    public void testMapper() throws Exception {
+        System.out.println("mapper");
+        File input = new File(dir, "in.txt");
+        write(input, "uno dos\ntres\n");
+        LocalJob job = new LocalJob(HadoopTask.mapper(loader.loadClass(MAPPER), conf, null));
+        File out = new File(dir, "out");
+        job.run(Collections.singletonList(input), out);
+        List<String> result = read(out, "part-m-");
+        Collections.sort(result);
+        assertEquals(Arrays.asList("dos\t1", "tres\t1", "uno\t1"), result);
+    }
+
+    @Test
+    public void testNoHadoopTask() throws Exception {
+        System.out.println("noHadoopTask");
+        try {
+            HadoopTask.reducer(loader.loadClass(MAPPER), conf).get();
+            fail("Un Mapper no es un Reducer");
+        } catch (IllegalArgumentException ex) {
+            assertTrue(ex.getMessage().contains("WordMapper"));
+        }
+    }
+
+    private static boolean hadoop() {
+        try {
+            Class.forName("org.apache.hadoop.mapreduce.Mapper");
+            return true;
+        } catch (ClassNotFoundException | LinkageError ex) {
+            return false;
+        }
+    }
+
+    /**
+     * Compilador del JDK o, si se ejecuta con un JRE, el que haya en el classpath
+     *
+     * @return Compilador o null
+     */
+    private static JavaCompiler compiler() {
+        JavaCompiler compiler = ToolProvider.getSystemJavaCompiler();
+        if (compiler == null) {
+            for (JavaCompiler other : ServiceLoader.load(JavaCompiler.class)) {
+                return other;
+            }
+        }
+        return compiler;
+    }
+
+    private static void write(File file, String text) throws IOException {
+        Files.write(file.toPath(), text.getBytes(StandardCharsets.UTF_8));
+    }
+
+    private static List<String> read(File dir, String prefix) throws IOException {
+        List<String> lines = new ArrayList<>();
+        for (File file : dir.listFiles()) {
+            if (file.getName().startsWith(prefix)) {
+                lines.addAll(Files.readAllLines(file.toPath(), StandardCharsets.UTF_8));
+            }
+        }
+        return lines;
+    }
+
+    private static void delete(File file) {
+        File[] files = file.listFiles();
+        if (files != null) {
+            for (File child : files) {
+                delete(child);
+            }
+        }
+        file.delete();
+    }
+
+}
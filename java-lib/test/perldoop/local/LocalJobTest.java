@@ -0,0 +1,211 @@
+package perldoop.local;
+
+import java.io.File;
+import java.io.IOException;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.List;
+import java.util.Map;
+import java.util.TreeMap;
+import junit.framework.*;
+import org.junit.Test;
+import perldoop.LocalCombiner;
+import static org.junit.Assert.*;
+
+/**
+ * Pruebas de la ejecucion local de trabajos
+ *
+ * @author César Pomar
+ */
+public class LocalJobTest extends TestCase {
+
+    /**
+     * Mapper de WordCount
+     */
+    public static class WordMap implements LocalJob.Task<Long, String> {
+
+        @Override
+        public void run(LocalJob.Input<Long, String> in, LocalCombiner.Output<Object, Object> out) throws IOException, InterruptedException {
+            while (in.next()) {
+                for (String word : in.value().split(" ")) {
+                    out.write(word, 1);
+                }
+            }
+        }
+    }
+
+    /**
+     * Reducer y combiner de WordCount
+     */
+    public static class Sum implements LocalJob.Task<Object, Iterable<Object>> {
+
+        @Override
+        public void run(LocalJob.Input<Object, Iterable<Object>> in, LocalCombiner.Output<Object, Object> out) throws IOException, InterruptedException {
+            while (in.next()) {
+                int count = 0;
+                for (Object value : in.value()) {
+                    count += (Integer) value;
+                }
+                out.write(in.key(), count);
+            }
+        }
+    }
+
+    private File dir;
+
+    @Override
+    protected void setUp() throws IOException {
+        dir = Files.createTempDirectory("perldoop-test-").toFile();
+    }
+
+    @Override
+    protected void tearDown() {
+        delete(dir);
+    }
+
+    @Test
+    public void testWordCount() throws Exception {
+        System.out.println("wordCount");
+        Map<String, Integer> expected = new TreeMap<>();
+        int lines = 0;
+        for (int f = 0; f < 3; f++) {
+            StringBuilder text = new StringBuilder();
+            for (int i = 0; i < 40; i++, lines++) {
+                for (int j = 0; j <= i % 5; j++) {
+                    String word = "w" + ((i * 7 + j * 3 + f) % 30);
+                    text.append(j == 0 ? "" : " ").append(word);
+                    expected.merge(word, 1, Integer::sum);
+                }
+                text.append(i % 2 == 0 ? "\n" : "\r\n");
+            }
+            write(new File(dir, "in" + f + ".txt"), text.toString());
+        }
+        //Trozos, volcados y mezclas pequeños para recorrer todos los casos
+        LocalJob job = new LocalJob(WordMap::new).setReducer(Sum::new).setCombiner(Sum::new);
+        job.setThreads(4).setReducers(3).setSplitSize(50).setSortBuffer(7).setMergeFactor(2).setTempDir(dir);
+        File out = new File(dir, "out");
+        LocalJob.Counters counters = job.run(Arrays.asList(new File(dir, "in0.txt"), new File(dir, "in1.txt"), new File(dir, "in2.txt")), out);
+        Map<String, Integer> result = new TreeMap<>();
+        for (String line : read(out, "part-r-")) {
+            String[] pair = line.split("\t");
+            assertNull(result.put(pair[0], Integer.parseInt(pair[1])));
+        }
+        assertEquals(expected, result);
+        assertEquals(lines, counters.getMapInput());
+        assertEquals(expected.size(), counters.getReduceGroups());
+        assertEquals(expected.size(), counters.getOutput());
+        assertEquals(3, out.list().length);
+    }
+
+    @Test
+    public void testMapOnly() throws Exception {
+        System.out.println("mapOnly");
+        List<String> expected = new ArrayList<>();
+        StringBuilder text = new StringBuilder();
+        for (int i = 0; i < 100; i++) {
+            expected.add("linea " + i);
+            text.append("linea ").append(i).append('\n');
+        }
+        File input = new File(dir, "input");
+        input.mkdir();
+        write(new File(input, "data.txt"), text.toString());
+        //Los ficheros ocultos de los directorios no se leen
+        write(new File(input, "_SUCCESS"), "oculto\n");
+        LocalJob job = new LocalJob(() -> (in, out) -> {
+            while (in.next()) {
+                out.write(in.value(), null);
+            }
+        });
+        job.setThreads(3).setSplitSize(64);
+        File out = new File(dir, "out");
+        job.run(Collections.singletonList(input), out);
+        List<String> result = read(out, "part-m-");
+        Collections.sort(expected);
+        Collections.sort(result);
+        assertEquals(expected, result);
+    }
+
+    @Test
+    public void testSplits() throws Exception {
+        System.out.println("splits");
+        String text = "uno\ndos\n\ntres\r\ncuatro cinco\nseis";
+        File file = new File(dir, "split.txt");
+        write(file, text);
+        List<String> expected = Arrays.asList("uno", "dos", "", "tres", "cuatro cinco", "seis");
+        long length = file.length();
+        //Cualquier tamaño de trozo lee cada linea una sola vez
+        for (long size = 1; size <= length; size++) {
+            List<String> result = new ArrayList<>();
+            for (long start = 0; start < length; start += size) {
+                try (LineReader in = new LineReader(file, start, Math.min(start + size, length))) {
+                    while (in.next()) {
+                        result.add(in.value());
+                    }
+                }
+            }
+            assertEquals("size " + size, expected, result);
+        }
+    }
+
+    @Test
+    public void testGroups() throws Exception {
+        System.out.println("groups");
+        File file = new File(dir, "spill");
+        try (Spill.Writer out = new Spill.Writer(file)) {
+            out.write("a", 1);
+            out.write("a", 2);
+            out.write("b", 3);
+            out.write("c", 4);
+            out.write("c", 5);
+        }
+        try (Merge in = new Merge(Collections.singletonList(file))) {
+            Groups groups = new Groups(in);
+            assertTrue(groups.next());
+            assertEquals("a", groups.key());
+            //Los valores no leidos se saltan
+            assertTrue(groups.next());
+            assertEquals("b", groups.key());
+            assertEquals(Collections.singletonList(3), list(groups.value()));
+            assertTrue(groups.next());
+            assertEquals(Arrays.asList(4, 5), list(groups.value()));
+            assertFalse(groups.next());
+            assertEquals(3, groups.count());
+        }
+    }
+
+    private static List<Object> list(Iterable<Object> values) {
+        List<Object> list = new ArrayList<>();
+        for (Object value : values) {
+            list.add(value);
+        }
+        return list;
+    }
+
+    private static void write(File file, String text) throws IOException {
+        Files.write(file.toPath(), text.getBytes(StandardCharsets.UTF_8));
+    }
+
+    private static List<String> read(File dir, String prefix) throws IOException {
+        List<String> lines = new ArrayList<>();
+        for (File file : dir.listFiles()) {
+            if (file.getName().startsWith(prefix)) {
+                lines.addAll(Files.readAllLines(file.toPath(), StandardCharsets.UTF_8));
+            }
+        }
+        return lines;
+    }
+
+    private static void delete(File file) {
+        File[] files = file.listFiles();
+        if (files != null) {
+            for (File child : files) {
+                delete(child);
+            }
+        }
+        file.delete();
+    }
+
+}
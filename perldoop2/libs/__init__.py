@@ -1,7 +1,8 @@
 
 from libs.messages import Messages
-from libs.datatype import Access, Code, DataType, Declare, Function, Package, Position, Type, Variable
+from libs.datatype import Access, Code, DataType, Declare, Fragments, Function, Node, Package, Position, Scope, ScopeTable, Type, Variable
 from libs.variables import Variables
+from libs.folding import Folding
 from libs.casting import Casting
 from libs.auxiliary import Auxiliary
 from libs.blocks import Blocks
@@ -11,5 +12,9 @@ from libs.operations import Operations
 from libs.functions import Functions
 from libs.options import Options
 from libs.hadoop import Hadoop
+from libs.driver import Driver
 from libs.lexer import Lexer
+from libs.profiler import Profiler, RuleStats
 from libs.parser import Parser
+from libs.cache import Cache
+from libs.bench import Bench
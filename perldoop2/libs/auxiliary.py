@@ -18,6 +18,7 @@
 #along with Perldoop.  If not, see <http://www.gnu.org/licenses/>.
 
 import re
+import io
 import logging
 import libs.ply.yacc as yacc
 from libs import Messages as Msg
@@ -26,6 +27,7 @@ from libs import DataType as Dtp
 from libs import Variables as Var
 from libs import Package
 from libs import Code
+from libs import Node
 
 class Auxiliary:
 	
@@ -57,26 +59,50 @@ class Auxiliary:
 			# Sin depurado
 			return False
 	
-	# Funcion para identar el codigo java
+	# Funcion para identar el codigo java, si se indica un fichero se escribe en el
 	@classmethod
-	def identer(Aux, text):
+	def identer(Aux, code, output=None):
 		IDENT = ' ' * 4
-		# Partimos el codigo en lineas
-		lines = text.splitlines(1)
-		pretty = ''  # codigo identado
-		tam_ident = len(IDENT)  # Tamaño de una identacion
-		ident = ''  # Tamaño de la identacion actual
-		open_block = re.compile(r'.*\{$')  # Linea que termina con una llave
-		close_block = re.compile(r'^\}.*')  # Linea que empieza con una llave
-		for line in lines:
-			# reducimos identacion
-			if close_block.match(line):
-				ident = ident[0:-tam_ident]
-			pretty += ident + line
-			# aumentamos identacion
-			if open_block.match(line):
-				ident += IDENT
-		return pretty
+		# Sin fichero acumulamos el codigo identado en memoria
+		pretty = io.StringIO() if output is None else output
+		write = pretty.write
+		idents = ['']  # Identaciones ya calculadas por nivel
+		level = 0  # Nivel de identacion actual
+		for line in Aux.code_lines(code):
+			# reducimos identacion si la linea empieza con una llave
+			if line[:1] == '}' and level:
+				level -= 1
+			if level:
+				write(idents[level])
+			write(line)
+			# aumentamos identacion si la linea termina con una llave
+			if line[-1:] == '{' or line[-2:] == '{\n':
+				level += 1
+				if level == len(idents):
+					idents.append(IDENT * level)
+		if output is None:
+			return pretty.getvalue()
+	
+	# Parte en lineas un codigo que puede llegar entero o por fragmentos
+	@classmethod
+	def code_lines(Aux, code):
+		if isinstance(code, str):
+			code = [code]
+		pieces = []  # Trozos de la linea incompleta de los fragmentos anteriores
+		for chunk in code:
+			if not chunk:
+				continue
+			# Sin salto de linea el fragmento solo continua la linea, se une al llegar el salto
+			tail = pieces[-1][-1] + chunk if pieces else ''
+			if pieces and tail.splitlines(True) == tail.splitlines():
+				pieces.append(chunk)
+				continue
+			lines = (''.join(pieces) + chunk).splitlines(True)
+			# La ultima linea puede continuar en el siguiente fragmento
+			pieces = [lines.pop()] if lines and lines[-1][-1:] != '\n' else []
+			yield from lines
+		if pieces:
+			yield ''.join(pieces)
 	
 	@classmethod
 	def check_unreachable(Aux, parser, code):
@@ -132,12 +158,27 @@ class Auxiliary:
 			# Creamos la sentencia de declaracion
 			if var.type:
 				# Si tiene tipo lo usamos
-				value += Cst.create_type(var.type) + ' ' + var.value + ';\n'
+				value += Cst.declare_type(var) + ' ' + var.value + ';\n'
 			else:
 				# Si no asumimos que ya forma parte de la codena
 				value += var.value + ';\n'					
 		return value
 	
+	# Decide que candidatas del modo unboxed son primitivas y escribe su tipo en las declaraciones
+	@classmethod
+	def resolve_unboxed(Aux, parser, parts):
+		variables = parser.unboxed_vars
+		# Una variable asignada desde otra solo es primitiva si esta tambien lo es
+		changed = True
+		while changed:
+			changed = False
+			for var in variables:
+				if not var.boxed and any(source.unboxed is None or source.boxed for source in var.sources):
+					var.boxed = True
+					changed = True
+		types = [Cst.create_type(var.type) if var.boxed else Cst.primitive_types[var.type[0]] for var in variables]
+		return [re.sub('\x00(\d+)\x00', lambda match: types[int(match.group(1))], part) if '\x00' in part else part for part in parts]
+	
 	# Comprobar si el codigo es valido
 	@classmethod
 	def check_code(Aux, parser, code, c_ref=True):
@@ -187,29 +228,108 @@ class Auxiliary:
 			Msg.error(parser, 'PACK_NOT_EXIST', pos, pack=name)
 			return Package(name, {}, {})
 	
-	# Elimina el acceso a un puntero recien creado
+	### Representacion intermedia de las expresiones ###
+	
+	# Nodo de la raiz de un codigo o acceso, solo si su expresion no ha cambiado desde que se creo
+	@classmethod
+	def root(Aux, code):
+		node = code.node
+		if node is not None and node.value == code.value:
+			return node
+		return None
+	
+	# Guarda la raiz de la expresion del codigo si las optimizaciones estan activadas
+	@classmethod
+	def set_node(Aux, parser, code, kind, name=None, inner=None, generic=None, child=None):
+		if parser.optimize_code:
+			code.node = Node(code.value, kind, name, inner, generic, child)
+	
+	# Crea un constructor como valor del codigo
+	@classmethod
+	def new(Aux, parser, code, name, generic, inner, child=None):
+		code.value = 'new ' + name + generic + '(' + inner + ')'
+		Aux.set_node(parser, code, Node.NEW, name, inner, generic, child)
+		return code.value
+	
+	# Convierte el valor del codigo en una referencia, sin tipo se usa la notacion diamante
 	@classmethod
-	def opt_get(Aux, value):
-		return re.sub(r'^new Ref(<[^\(]*>)?\((.*)\)\.get\(\)$', r'\2', value)
+	def new_ref(Aux, parser, code, type=''):
+		return Aux.new(parser, code, 'Ref', '<' + type + '>', code.value, Aux.root(code))
 	
-	# Usar notacion diamante en cado de igualar
+	# Casting del valor del codigo, no se repite si ya se hizo al mismo tipo
 	@classmethod
-	def opt_eq(Aux, value):
-		return re.sub(r'^(new [^<]*)<[^\(]*(\(.*)$', r'\1<>\2', value)
+	def cast(Aux, parser, code, type):
+		node = Aux.root(code)
+		if node is None or node.kind != Node.CAST or node.name != type:
+			inner = code.value
+			code.value = '((' + type + ')' + inner + ')'
+			Aux.set_node(parser, code, Node.CAST, type, inner, child=node)
+		return code.value
+	
+	# Lectura de un acceso, el puntero de una referencia recien creada se elimina
+	@classmethod
+	def opt_get(Aux, var):
+		node = Aux.root(var)
+		if node is not None and node.kind == Node.NEW and node.name == 'Ref' and var.read_value == '.get(' and var.end_value == ')':
+			var.value = node.inner
+			var.node = node.child
+		else:
+			var.value += var.read_value + var.end_value
+		return var.value
+	
+	# Usa la notacion diamante al igualar un constructor generico
+	@classmethod
+	def opt_eq(Aux, code, value):
+		node = Aux.root(code)
+		if node is not None and node.kind == Node.NEW and node.generic and node.value == value:
+			return 'new ' + node.name + '<>(' + node.inner + ')'
+		return value
 	
 	# Evita dobles parentesis
 	@classmethod
 	def opt_paren(Aux, code):
-		if code.value and code.value[0] == '(' and code.value[-1] == ')':
+		node = Aux.root(code)
+		if node is not None and node.kind == Node.PAREN:
+			code.value = node.inner
+			code.node = node.child
+		elif Aux.enclosed(code.value):
 			code.value = code.value[1:-1]
 	
+	# Comprueba en un solo recorrido si el primer parentesis de la expresion se cierra al final
+	@classmethod
+	def enclosed(Aux, value):
+		if len(value) < 2 or value[0] != '(' or value[-1] != ')':
+			return False
+		depth = 0
+		quote = None
+		scape = False
+		for i, c in enumerate(value):
+			if quote:
+				if scape:
+					scape = False
+				elif c == '\\':
+					scape = True
+				elif c == quote:
+					quote = None
+			elif c == '"' or c == "'":
+				quote = c
+			elif c == '(':
+				depth += 1
+			elif c == ')':
+				depth -= 1
+				if not depth:
+					return i == len(value) - 1
+		return False
+	
 	# Crea un paso por referencia a una variable
 	@classmethod
 	def arg_ref(Aux, parser, code, f_type, var):     
 		# Pide una variable reservada
 		var_f = Var.get_function_var(parser)
+		# La funcion puede dejar la variable a null
+		Var.escape(var)
 		# Solicita su declaracion 
-		code.declares.append(Code(value=var_f, type=[Dtp.REF] + var.type))
+		code.add_declare(Code(value=var_f, type=[Dtp.REF] + var.type))
 		# Añade el argumento a la funcion usando la referencia
 		code.value += var_f + '=new Ref<>(' + Cst.to_type(parser, Code(type=f_type), var) + ')'
 		# Retorna el codigo que debe ser usado en la actualizacion de la variable
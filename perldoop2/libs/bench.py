@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+#Copyright 2016 César Pomar <cesarpomar18@gmail.com>
+#
+#This file is part of Perldoop.
+#
+#Perldoop is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Perldoop is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Perldoop.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import os
+import sys
+import time
+import contextlib
+import tracemalloc
+from libs import Access
+from libs import Code
+from libs import Declare
+from libs import Lexer
+from libs import Parser
+from libs import Position
+from libs import Type
+from libs import Variable
+
+# Medidas de rendimiento del traductor
+class Bench():
+
+	# Ficheros perl de un corpus, los directorios se recorren enteros
+	@classmethod
+	def corpus(Bench, paths):
+		files = []
+		for path in paths:
+			if os.path.isdir(path):
+				for root, dirs, names in os.walk(path):
+					dirs.sort()
+					files += [os.path.join(root, name) for name in sorted(names) if name.endswith('.pl')]
+			else:
+				files.append(path)
+		return files
+
+	# Sustituye un metodo de un objeto por uno que acumula su tiempo
+	@classmethod
+	def timed(Bench, obj, name, times, key):
+		function = getattr(obj, name)
+		clock = time.perf_counter
+		def wrapper(*args):
+			start = clock()
+			try:
+				return function(*args)
+			finally:
+				times[key] += clock() - start
+		setattr(obj, name, wrapper)
+
+	# Analiza lexicamente un codigo, con split se mide cada etapa del analizador
+	@classmethod
+	def lex_source(Bench, perl, emulate_parens, read_comments, split=False):
+		parser = Parser()
+		parser.file_name = 'bench'
+		parser.emulate_parens = emulate_parens
+		parser.read_comments = read_comments
+		lexer = Lexer()
+		lexer.parser = parser
+		parser.lexer = lexer
+		times = {'ply': 0.0, 'emulate_parens': 0.0}
+		if split:
+			Bench.timed(lexer.lexer, 'token', times, 'ply')
+			Bench.timed(lexer, 'emulate_parens', times, 'emulate_parens')
+		tokens = 0
+		start = time.perf_counter()
+		lexer.input(perl)
+		while lexer.token():
+			tokens += 1
+		times['total'] = time.perf_counter() - start
+		# Lo que no es de PLY ni de la emulacion es del buffer de sentencias
+		times['token_buffer'] = times['total'] - times['ply'] - times['emulate_parens']
+		return tokens, times
+
+	# Mide el analizador lexico sobre un corpus
+	@classmethod
+	def lex(Bench, paths, scale=1, repeat=3, emulate_parens=False, read_comments=False):
+		report = {'corpus': paths, 'scale': scale, 'repeat': repeat, 'emulate_parens': emulate_parens, 'read_comments': read_comments, 'files': []}
+		total = {'files': 0, 'bytes': 0, 'tokens': 0, 'seconds': 0.0, 'split': {'ply': 0.0, 'token_buffer': 0.0, 'emulate_parens': 0.0}}
+		for file in Bench.corpus(paths):
+			input = open(file, 'r', encoding='utf8')
+			# Las entradas sinteticas repiten el fichero
+			perl = input.read() * scale
+			input.close()
+			# Los errores lexicos no se muestran
+			with contextlib.redirect_stdout(io.StringIO()):
+				# Nos quedamos con la mejor repeticion sin instrumentar
+				seconds = None
+				for i in range(repeat):
+					tokens, times = Bench.lex_source(perl, emulate_parens, read_comments)
+					if seconds is None or times['total'] < seconds:
+						seconds = times['total']
+				# Una pasada instrumentada para repartir el tiempo
+				tokens, split = Bench.lex_source(perl, emulate_parens, read_comments, True)
+			size = len(perl.encode('utf8'))
+			report['files'].append({'file': file, 'bytes': size, 'tokens': tokens, 'seconds': seconds,
+				'split': {key: split[key] for key in total['split']}})
+			total['files'] += 1
+			total['bytes'] += size
+			total['tokens'] += tokens
+			total['seconds'] += seconds
+			for key in total['split']:
+				total['split'][key] += split[key]
+		total['tokens_per_sec'] = total['tokens'] / total['seconds'] if total['seconds'] else 0.0
+		total['bytes_per_sec'] = total['bytes'] / total['seconds'] if total['seconds'] else 0.0
+		report['total'] = total
+		return report
+
+	# Informe legible de la medida del analizador lexico
+	@classmethod
+	def lex_text(Bench, report):
+		lines = ['%-40s %10s %10s %10s %12s' % ('file', 'bytes', 'tokens', 'ms', 'tokens/s')]
+		for entry in report['files']:
+			rate = entry['tokens'] / entry['seconds'] if entry['seconds'] else 0.0
+			lines.append('%-40s %10d %10d %10.2f %12.0f' % (os.path.basename(entry['file']), entry['bytes'], entry['tokens'], entry['seconds'] * 1000, rate))
+		total = report['total']
+		lines.append('%-40s %10d %10d %10.2f %12.0f' % ('total (%d files)' % total['files'], total['bytes'], total['tokens'], total['seconds'] * 1000, total['tokens_per_sec']))
+		lines.append('%.0f tokens/s, %.0f bytes/s' % (total['tokens_per_sec'], total['bytes_per_sec']))
+		split = total['split']
+		measured = sum(split.values())
+		if measured:
+			lines.append('ply %.1f%%, token_buffer %.1f%%, emulate_parens %.1f%%' % tuple(100 * split[key] / measured for key in ('ply', 'token_buffer', 'emulate_parens')))
+		return '\n'.join(lines) + '\n'
+
+	# Clases cuyas instancias se cuentan en la medida de memoria
+	datatypes = (Access, Code, Declare, Position, Type, Variable)
+
+	# Sustituye el constructor de una clase por uno que cuenta las instancias
+	@classmethod
+	def counted(Bench, cls, counts):
+		init = cls.__init__
+		def wrapper(self, *args, **kwargs):
+			counts[cls.__name__] += 1
+			init(self, *args, **kwargs)
+		cls.__init__ = wrapper
+		return init
+
+	# Traduce un codigo sin escribir la clase, los errores no se muestran
+	@classmethod
+	def translate_source(Bench, perl, file):
+		parser = Parser()
+		parser.file_name = os.path.basename(file)
+		parser.class_name = os.path.splitext(parser.file_name)[0]
+		with contextlib.redirect_stdout(io.StringIO()):
+			parser.parse(perl)
+
+	# Tamaño de una instancia vacia, incluido su diccionario de atributos si lo tiene
+	@classmethod
+	def instance_size(Bench, obj):
+		return sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, '__dict__') else 0)
+
+	# Mide la memoria de la traduccion sobre un corpus
+	@classmethod
+	def memory(Bench, paths, scale=1):
+		report = {'corpus': paths, 'scale': scale, 'files': []}
+		total = {'files': 0, 'bytes': 0, 'peak': 0, 'objects': dict.fromkeys((cls.__name__ for cls in Bench.datatypes), 0)}
+		for file in Bench.corpus(paths):
+			input = open(file, 'r', encoding='utf8')
+			perl = input.read() * scale
+			input.close()
+			# Una pasada contando las instancias creadas
+			counts = dict.fromkeys(total['objects'], 0)
+			originals = [(cls, Bench.counted(cls, counts)) for cls in Bench.datatypes]
+			try:
+				Bench.translate_source(perl, file)
+			finally:
+				for cls, init in originals:
+					cls.__init__ = init
+			# Otra sin instrumentar para el pico de memoria
+			tracemalloc.start()
+			try:
+				Bench.translate_source(perl, file)
+				peak = tracemalloc.get_traced_memory()[1]
+			finally:
+				tracemalloc.stop()
+			size = len(perl.encode('utf8'))
+			report['files'].append({'file': file, 'bytes': size, 'peak': peak, 'objects': counts})
+			total['files'] += 1
+			total['bytes'] += size
+			total['peak'] = max(total['peak'], peak)
+			for name in counts:
+				total['objects'][name] += counts[name]
+		report['total'] = total
+		report['sizes'] = {'Access': Bench.instance_size(Access(Code(type=[]))), 'Code': Bench.instance_size(Code()), 'Declare': Bench.instance_size(Declare('', None)),
+			'Position': Bench.instance_size(Position()), 'Type': Bench.instance_size(Type(None)), 'Variable': Bench.instance_size(Variable())}
+		# Pico de memoria residente de todo el proceso, solo disponible en unix
+		try:
+			import resource
+			rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+			# Linux lo da en KB y macOS en bytes
+			report['max_rss'] = rss if sys.platform == 'darwin' else rss * 1024
+		except ImportError:
+			report['max_rss'] = None
+		return report
+
+	# Informe legible de la medida de memoria
+	@classmethod
+	def memory_text(Bench, report):
+		names = list(report['total']['objects'])
+		lines = ['%-40s %10s %10s  %s' % ('file', 'bytes', 'peak KB', '  '.join(names))]
+		for entry in report['files']:
+			lines.append('%-40s %10d %10.0f  %s' % (os.path.basename(entry['file']), entry['bytes'], entry['peak'] / 1024, '  '.join('%d' % entry['objects'][name] for name in names)))
+		total = report['total']
+		lines.append('%-40s %10d %10.0f  %s' % ('total (%d files)' % total['files'], total['bytes'], total['peak'] / 1024, '  '.join('%d' % total['objects'][name] for name in names)))
+		lines.append('%d objects created, instance sizes: %s' % (sum(total['objects'].values()), ', '.join('%s=%dB' % item for item in sorted(report['sizes'].items()))))
+		if report['max_rss'] is not None:
+			lines.append('max RSS %.1f MB' % (report['max_rss'] / 2**20))
+		return '\n'.join(lines) + '\n'
@@ -21,6 +21,7 @@ from libs import Messages as Msg
 from libs import Auxiliary as Aux
 from libs import DataType as Dtp
 from libs import Casting as Cst
+from libs import Folding as Fold
 from libs import Variables as Var
 from libs import Code
 from libs import Function
@@ -91,7 +92,7 @@ class Blocks:
         parser.assigns.pop()
         # Propaga el return de la funcion
         if Dtp.RETURN in block.flags:
-            code.flags[Dtp.RETURN] = True 
+            code.set_flag(Dtp.RETURN) 
     
     @classmethod
     def block_dowhile(Bks, parser, exp, block, pos):
@@ -121,6 +122,33 @@ class Blocks:
         parser.variables.pop()  
         return code
     
+    # Valor de verdad de una condicion constante, solo hay constantes con optimizaciones
+    @classmethod
+    def static_condition(Bks, parser, exp):
+        value = Fold.value(exp)
+        if value is None or exp.declares:
+            return None
+        return Fold.truth(value)
+    
+    # Simplifica una rama con condicion constante, queda solo el cuerpo o nada
+    @classmethod
+    def static_branch(Bks, code, truth, block, head):
+        if truth is None:
+            return code
+        if not truth:
+            # La rama nunca se ejecuta, no aporta codigo, asignaciones ni flags
+            code.value = ''
+            code.flags = {}
+            code.var_assing = {}
+        # Java no admite codigo tras un bloque que salta siempre, en ese caso se deja el if
+        elif head or not (Dtp.RETURN in block.flags or Dtp.NEXT in block.flags or Dtp.LAST in block.flags):
+            code.value = head + '{\n' + block.value + '}'
+        else:
+            code.value = 'if(true){\n' + block.value + '}'
+        # La rama guarda como valor constante si se ejecuta
+        code.const = (code.value, truth)
+        return code
+    
     @classmethod
     def block_if(Bks, parser, exp, block, pos):
         # Verificamos la expresion de la condicion
@@ -137,7 +165,8 @@ class Blocks:
                 del  code.var_assing[var]
         # Borramos las variables del bloque
         parser.variables.pop()    
-        return code
+        # Con optimizaciones las condiciones constantes eliminan la comprobacion o la rama
+        return Bks.static_branch(code, Bks.static_condition(parser, exp), block, '')
     
     @classmethod
     def block_unless(Bks, parser, exp, block, pos):
@@ -155,7 +184,9 @@ class Blocks:
                 del  code.var_assing[var]
         # Borramos las variables del bloque
         parser.variables.pop()    
-        return code
+        # Con optimizaciones las condiciones constantes eliminan la comprobacion o la rama
+        truth = Bks.static_condition(parser, exp)
+        return Bks.static_branch(code, None if truth is None else not truth, block, '')
     
     @classmethod
     def block_elif(Bks, parser, exp, block, pos):
@@ -173,7 +204,8 @@ class Blocks:
                 del  code.var_assing[var]
         # Borramos las variables del bloque
         parser.variables.pop()    
-        return code
+        # Con optimizaciones las condiciones constantes eliminan la comprobacion o la rama
+        return Bks.static_branch(code, Bks.static_condition(parser, exp), block, 'else')
     
     @classmethod
     def block_else(Bks, parser, block, pos):
@@ -194,10 +226,18 @@ class Blocks:
     # Une los bloques elsif hasta el else
     @classmethod
     def block_elif_concat(Bks, parser, block1, block2):
+        truth = Fold.value(block1)
+        # Si el bloque siempre se ejecuta los siguientes sobran
+        if truth:
+            block2 = None
+        # Si nunca se ejecuta ocupan su lugar
+        elif truth is False and block2 is not None:
+            return block2
         # Si no hay bloque dos usamos directamente el uno
         if block2 is None:
             # Añadimos el salto de linea despues de cerrar la llava
-            block1.value += '\n'
+            if block1.value:
+                block1.value += '\n'
             return block1
         # Unimos los dos bloques
         code = Code(value=block1.value + block2.value, pos=block2.pos)
@@ -210,14 +250,18 @@ class Blocks:
         code.declares = block1.declares + block2.declares
         # Si ambos tienen un return entonces lo propagamos
         if Dtp.RETURN in block1.flags and Dtp.RETURN in block2.flags:
-            code.flags[Dtp.RETURN] = True
+            code.set_flag(Dtp.RETURN)
         return code    
     
     # Une el bloque if con los elsif
     @classmethod
     def block_if_concat(Bks, parser, block1, block2):
         # Realizamos las mismas tareas que con los elif
+        truth = Fold.value(block1)
         code = Bks.block_elif_concat(parser, block1, block2)
+        # Si el if nunca se ejecuta, la primera rama que queda pasa a ser la cabecera
+        if truth is False and code.value.startswith('else'):
+            code.value = code.value[4:].lstrip()
         # Las variables asignadas en todos los bloques las propagamos
         parser.assigns[-1].update(code.var_assing)  
         # Añadimos todas las declaraciones de las expresiones de los bloques if e elsif
@@ -241,10 +285,10 @@ class Blocks:
                     return True
                 # Cogemos el tipo de la asginacion
                 if not type_for:
-                    type_for = Cst.create_type(st.declares[0].type)
+                    type_for = Cst.declare_type(st.declares[0])
                 # Recorremos todas las declaraciones
                 for declare in st.declares:
-                    type = Cst.create_type(declare.type)
+                    type = Cst.declare_type(declare)
                     # Si hay una declaracio de tipo direfente se necesita un bloque esterno
                     if type != type_for:
                         return True
@@ -293,7 +337,7 @@ class Blocks:
             # Añadimos todas las declaracion
             for st in list1:
                 if st.declares:
-                    external_code += Bks.create_declare(st)
+                    external_code += Aux.create_declare(st)
                 if st.st_value:
                     external_code += st.st_value + ';\n'
         # Si usamos el bloque interno del for
@@ -303,7 +347,7 @@ class Blocks:
                 # Si hay declaraciones
                 if st.declares:
                     # Cogemos el tipo de la primera que encontramos
-                    if not for_head1: for_head1 = Cst.create_type(st.declares[0].type) + ' '
+                    if not for_head1: for_head1 = Cst.declare_type(st.declares[0]) + ' '
                     # Añadimos todas las declaraciones
                     for declare in st.declares:
                         for_head1 += declare.value + ','
@@ -333,6 +377,9 @@ class Blocks:
         parser.assigns[-1][var.variable.name] = True 
         return var
     
+    # Tipos de los elementos que se recorren por indice
+    index_types = (Dtp.INTEGER, Dtp.LONG, Dtp.FLOAT, Dtp.DOUBLE, Dtp.BOOLEAN)
+    
     @classmethod
     def block_foreach_var(Bks, parser, var, exp):
         # Creamos el codigo y ponemos las declaraciones
@@ -347,6 +394,11 @@ class Blocks:
         var_type = exp.type[1:]
         # Le damos el tipo a la variable
         var.variable.type = var_type
+        # Los elementos de la coleccion pueden ser null
+        Var.escape(var)
+        # Las colecciones de tipos basicos se recorren por indice
+        if parser.index_loops and exp.type[0] in (Dtp.ARRAY, Dtp.LIST) and len(var_type) == 1 and var_type[0] in Bks.index_types:
+            return Bks.block_foreach_index(parser, var, exp, var_type)
         # Creamos el tipo de la variable a usar como iterador
         code.value += Cst.create_type(var_type) + ' '
         # Java requiere iterar sobre una variable recien declarada
@@ -366,6 +418,28 @@ class Blocks:
         code.value += ' : ' + exp.value + '){' + block_st
         return code
     
+    # Recorre la coleccion con un indice primitivo, sin iterador ni indice en objeto
+    @classmethod
+    def block_foreach_index(Bks, parser, var, exp, var_type):
+        # La coleccion se evalua una sola vez, como en perl
+        l_var = Var.get_loop_var(parser)
+        c_var = Var.get_loop_var(parser)
+        collection = Code(type=exp.type, value=c_var)
+        if exp.type[0] == Dtp.LIST:
+            parser.imports['List'] = True
+            element = Code(type=var_type, value=c_var + '.get(' + l_var + ')')
+        else:
+            element = Code(type=var_type, value=c_var + '[' + l_var + ']')
+        # La declaracion de la coleccion va detras de las de la expresion, el bloque del for las encierra
+        code = Code(declares=exp.declares + [Code(value=c_var + ' = ' + exp.value, type=exp.type)])
+        code.value = 'for(int ' + l_var + '=0; ' + l_var + '<' + Cst.to_integer(collection) + '; ' + l_var + '++){\n'
+        # Si la variable se declara en el foreach lo hacemos dentro del bucle
+        if var.declares:
+            code.value += Cst.create_type(var_type) + ' ' + var.value + ' = ' + element.value + ';'
+        else:
+            code.value += var.value + ' = ' + Cst.to_type(parser, var, element) + ';'
+        return code
+    
     @classmethod
     def block_foreach(Bks, parser, exp):
         # Comprobamos el codigo, las refencias las obviamos porque se comprueban luego
@@ -376,6 +450,11 @@ class Blocks:
             return exp   
         # Necesitamos algo para recorrer asi que pedimos una varaible resevada para bucles
         l_var = Var.get_loop_var(parser)
+        # Con indices primitivos el limite se calcula una sola vez
+        if parser.index_loops:
+            n_var = Var.get_loop_var(parser)
+            code = Code(value='for(int ' + l_var + '=0, ' + n_var + '=' + Cst.to_integer(exp) + '; ' + l_var + '<' + n_var + '; ' + l_var + '++){', declares=exp.declares)
+            return code
         # Creamos el codigo y ponemos las declaraciones
         code = Code(value='for(Integer ' + l_var + '=0; ' + l_var + '<' + Cst.to_integer(exp) + '; ' + l_var + '++){', declares=exp.declares)
         return code
@@ -476,33 +555,37 @@ class Blocks:
             Msg.error(parser, 'LAST_ERROR', code.pos)
             del code.flags[Dtp.LAST]
     
-    # Crea la clase para el codigo
+    # Crea la clase para el codigo, retorna sus fragmentos en orden para escribirlos sin unirlos
     @classmethod
     def create_class(Bks, parser):
         # Gestionalos el codigo global
         if parser.main_class:
-            parser.atributes = 'private static String[] ARGV;\n' + parser.atributes
-            parser.global_code = parser.class_name + '.ARGV=ARGV;\n' + parser.global_code
-            init_code = 'public static void main(String[] ARGV){\n' + parser.global_code + '}\n\n'
+            parser.atributes.prepend('private static String[] ARGV;\n')
+            parser.global_code.prepend(parser.class_name + '.ARGV=ARGV;\n')
+            init_code = ['public static void main(String[] ARGV){\n'] + parser.global_code.parts() + ['}\n\n']
         elif parser.global_code:
-            init_code = 'static{\n' + parser.global_code + '}\n\n' 
+            init_code = ['static{\n'] + parser.global_code.parts() + ['}\n\n']
         else:
-            init_code = ''
+            init_code = []
         # Empezamos creando los imports y el codigo externo si existiera
-        class_code = parser.package_code + Aux.create_imports(parser) + '\n\n'
+        class_code = parser.package_code.parts() + [Aux.create_imports(parser), '\n\n']
         # Cabecera de la clase
-        class_code += 'public class ' + parser.class_name
+        class_code.append('public class ' + parser.class_name)
         # Si la clase extiende de otra
         if parser.extend_class:
-            class_code += ' extends ' + parser.extend_class
+            class_code.append(' extends ' + parser.extend_class)
         # Atributos de la clase
-        class_code += '{\n' + parser.atributes + '\n\n'
+        class_code += ['{\n'] + parser.atributes.parts() + ['\n\n']
         # Funciones de la clase
-        class_code += parser.functions_code
+        class_code += parser.functions_code.parts()
         # Añadimos el codigo de inicio
         class_code += init_code
-        # Cerramos la clase y retornamos
-        return class_code + '}'
+        # Cerramos la clase
+        class_code.append('}')
+        # En modo unboxed se decide el tipo de las candidatas a primitivas
+        if parser.unboxed_vars:
+            class_code = Aux.resolve_unboxed(parser, class_code)
+        return class_code
     
     @classmethod       
     def create_function(Bks, parser, name, code):
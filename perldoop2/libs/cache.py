@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+#Copyright 2016 César Pomar <cesarpomar18@gmail.com>
+#
+#This file is part of Perldoop.
+#
+#Perldoop is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Perldoop is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Perldoop.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import glob
+import pickle
+import hashlib
+import tempfile
+from libs import Variables as Var
+
+# Cache en disco de traducciones, indexada por el contenido de lo que influye en la salida
+class Cache():
+
+	EXT = '.cache'  # Extension de las entradas
+
+	version = None  # Huella del codigo del traductor
+
+	def __init__(self, path, size):
+		self.path = path  # Directorio de la cache
+		self.size = size  # Tamaño maximo en bytes
+		os.makedirs(path, exist_ok=True)
+
+	# Huella del traductor, cualquier cambio en libs o en perldoop.py invalida la cache
+	@classmethod
+	def translator_version(Cache):
+		if Cache.version is None:
+			digest = hashlib.sha256()
+			libs = os.path.dirname(os.path.abspath(__file__))
+			files = sorted(glob.glob(os.path.join(libs, '*.py')) + glob.glob(os.path.join(libs, 'ply', '*.py')))
+			# perldoop.py pasa las opciones al parser y obtiene el nombre de la clase
+			files.append(os.path.join(os.path.dirname(libs), 'perldoop.py'))
+			for file in files:
+				with open(file, 'rb') as source:
+					digest.update(source.read())
+			Cache.version = digest.hexdigest()
+		return Cache.version
+
+	# Firma de lo que exporta un paquete, solo cambia si cambian sus variables o funciones
+	@classmethod
+	def package_signature(Cache, name):
+		if name not in Var.packages:
+			return name + ':'
+		package = Var.packages[name]
+		variables = [var + ':' + str(value.name) + ':' + str(value.type) for var, value in package.variables.items()]
+		functions = [function + ':' + str(value.args) + ':' + str(value.returns) for function, value in package.functions.items()]
+		return name + ':' + ';'.join(sorted(variables)) + '|' + ';'.join(sorted(functions))
+
+	# Clave de una traduccion
+	def key(self, perl, file_name, options, packages):
+		digest = hashlib.sha256()
+		digest.update(Cache.translator_version().encode('utf8'))
+		digest.update(file_name.encode('utf8') + b'\0')
+		digest.update(repr(options).encode('utf8') + b'\0')
+		for name in sorted(packages):
+			digest.update(Cache.package_signature(name).encode('utf8') + b'\0')
+		digest.update(perl.encode('utf8'))
+		return digest.hexdigest()
+
+	# Obtiene una entrada, None si no existe
+	def get(self, key):
+		file = os.path.join(self.path, key + Cache.EXT)
+		try:
+			with open(file, 'rb') as input:
+				entry = pickle.load(input)
+		except (OSError, pickle.PickleError, EOFError, AttributeError):
+			return None
+		# Marcamos el uso para el desalojo
+		try:
+			os.utime(file)
+		except OSError:
+			pass
+		return entry
+
+	# Guarda una entrada, la escritura es atomica para no dejar entradas a medias
+	def put(self, key, entry):
+		try:
+			fd, temp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+			with os.fdopen(fd, 'wb') as output:
+				pickle.dump(entry, output, pickle.HIGHEST_PROTOCOL)
+			os.replace(temp, os.path.join(self.path, key + Cache.EXT))
+		except OSError:
+			# Sin cache la traduccion sigue siendo valida
+			pass
+
+	# Borra las entradas usadas hace mas tiempo hasta no superar el tamaño maximo
+	def evict(self):
+		entries = []
+		total = 0
+		for file in glob.glob(os.path.join(self.path, '*' + Cache.EXT)):
+			try:
+				stat = os.stat(file)
+			except OSError:
+				continue
+			entries.append((stat.st_mtime, stat.st_size, file))
+			total += stat.st_size
+		entries.sort()
+		for mtime, size, file in entries:
+			if total <= self.size:
+				break
+			try:
+				os.unlink(file)
+			except OSError:
+				pass
+			total -= size
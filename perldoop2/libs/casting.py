@@ -21,6 +21,7 @@
 import re
 from libs import Messages as Msg
 from libs import DataType as Dtp
+from libs import Folding as Fold
 from libs import Type
 
 class Casting:
@@ -47,6 +48,11 @@ class Casting:
 	
 	@classmethod
 	def to_boolean(Cst, code):
+		# Las constantes se convierten al traducir
+		if code.const is not None:
+			literal = Fold.cast(code, Dtp.BOOLEAN)
+			if literal is not None:
+				return literal
 		# Si ya tenemos un valor booleano
 		if code.value_opt:
 			return code.value_opt
@@ -67,6 +73,11 @@ class Casting:
 	
 	@classmethod
 	def to_integer(Cst, code):
+		# Las constantes se convierten al traducir
+		if code.const is not None:
+			literal = Fold.cast(code, Dtp.INTEGER)
+			if literal is not None:
+				return literal
 		# Si no es un tipo basico
 		if len(code.type) > 1:
 			if code.type[0] == Dtp.ARRAY:
@@ -100,6 +111,11 @@ class Casting:
 	
 	@classmethod
 	def to_long(Cst, code):
+		# Las constantes se convierten al traducir
+		if code.const is not None:
+			literal = Fold.cast(code, Dtp.LONG)
+			if literal is not None:
+				return literal
 		# Si no es un tipo basico
 		if len(code.type) > 1:
 			if code.type[0] == Dtp.ARRAY:
@@ -134,6 +150,11 @@ class Casting:
 	
 	@classmethod	
 	def to_float(Cst, code):
+		# Las constantes se convierten al traducir
+		if code.const is not None:
+			literal = Fold.cast(code, Dtp.FLOAT)
+			if literal is not None:
+				return literal
 		# Si no es un tipo basico
 		if len(code.type) > 1:
 			if code.type[0] == Dtp.ARRAY:
@@ -174,6 +195,11 @@ class Casting:
 	
 	@classmethod			
 	def to_double(Cst, code):		
+		# Las constantes se convierten al traducir
+		if code.const is not None:
+			literal = Fold.cast(code, Dtp.DOUBLE)
+			if literal is not None:
+				return literal
 		# Si no es un tipo basico
 		if len(code.type) > 1:
 			if code.type[0] == Dtp.ARRAY:
@@ -208,6 +234,11 @@ class Casting:
 	
 	@classmethod	
 	def to_string(Cst, code):
+		# Las constantes se convierten al traducir
+		if code.const is not None:
+			literal = Fold.cast(code, Dtp.STRING)
+			if literal is not None:
+				return literal
 		# Si no es un tipo basico
 		if len(code.type) > 1:
 			if code.type[0] == Dtp.ARRAY:
@@ -334,6 +365,22 @@ class Casting:
 			return False
 		return True
 	
+	# Tipos primitivos de los escalares basicos en modo unboxed
+	primitive_types = {
+	Dtp.BOOLEAN:'boolean',
+	Dtp.INTEGER:'int',
+	Dtp.LONG:'long',
+	Dtp.FLOAT:'float',
+	Dtp.DOUBLE:'double',
+	}
+	
+	# Tipo de una declaracion, las candidatas a primitivas dejan una marca que se resuelve al crear la clase
+	@classmethod
+	def declare_type(Cst, var):
+		if var.variable and var.variable.unboxed is not None:
+			return '\x00' + str(var.variable.unboxed) + '\x00'
+		return Cst.create_type(var.type)
+	
 	# Crea el tipo de la variable
 	@classmethod
 	def create_type(Cst, code_type):
@@ -351,21 +398,25 @@ class Casting:
 				declare = declare.replace('%t', type)
 		return declare
 	
-	# Reserva de memoria para una coleccion
+	# Clase y parametros genericos del constructor de una coleccion, None si es un array
 	@classmethod
-	def creare_inicialize(Cst, types, sizes):
-		# Si es un hash la declaracion es directa
+	def create_generic(Cst, types):
 		if types[0] == Dtp.HASH:
-			if sizes and sizes[0]:
-				return 'new HashPerl<String,'+Cst.create_type(types[1:])+'>(' + sizes[0] + ')'
-			else:
-				return 'new HashPerl<String,'+Cst.create_type(types[1:])+'>()'
-		# Si es una lista igual
+			return 'HashPerl', '<String,'+Cst.create_type(types[1:])+'>'
 		elif types[0] == Dtp.LIST:
+			return 'PerlList', '<'+Cst.create_type(types[1:])+'>'
+		return None
+	
+	# Reserva de memoria para una coleccion
+	@classmethod
+	def creare_inicialize(Cst, types, sizes):
+		# Los hash y las listas tienen constructor
+		generic = Cst.create_generic(types)
+		if generic:
 			if sizes and sizes[0]:
-				return 'new PerlList<'+Cst.create_type(types[1:])+'>(' + sizes[0] + ')'
+				return 'new ' + generic[0] + generic[1] + '(' + sizes[0] + ')'
 			else:
-				return 'new PerlList<'+Cst.create_type(types[1:])+'>()'
+				return 'new ' + generic[0] + generic[1] + '()'
 	
 		# El caso contrario añadimos los corchetes de cada array
 		declare = '%t'
@@ -65,12 +65,8 @@ class Collection:
         if type != type_check:
             Msg.error(parser, 'VAR_ERROR_ACCESS', pos, type=type, find=str(var.type[0]))
             return var
-        # Unimos el valor del acceso para lectura
-        var.value += var.read_value + var.end_value
-        # Si tenemos optimizacion
-        if parser.optimize_code:
-            # Eliminamos los accesos contrarios
-            var.value = Aux.opt_get(var.value)
+        # Unimos el valor del acceso para lectura, eliminando los accesos contrarios
+        Aux.opt_get(var)
         # Para un array
         if var.type[0] == Dtp.ARRAY:
             var.read_value = ''
@@ -103,7 +99,7 @@ class Collection:
             return var    
         if var.type[0] == Dtp.REF:
             # Unimos el valor del acceso para lectura
-            var.value += var.read_value + var.end_value
+            Aux.opt_get(var)
             # Podemos los valores de acceso
             var.read_value = '.get('
             var.store_value = '.set('
@@ -120,9 +116,9 @@ class Collection:
         if not var.var.variable or var.type[0] not in (Dtp.ARRAY, Dtp.HASH, Dtp.LIST):
             Msg.error(parser, 'VAR_REF_SCAlAR', var.pos)
         # Unimos el valor del acceso para lectura
-        var.value += var.read_value + var.end_value
+        Aux.opt_get(var)
         # Creamos la clase referencia
-        var.value = 'new Ref<' + Cst.create_type(var.type) + '>(' + var.value + ')'
+        Aux.new_ref(parser, var, Cst.create_type(var.type))
         var.read_value = ''
         var.store_value = ''
         var.end_value = ''
@@ -143,7 +139,8 @@ class Collection:
         # Actualizamos la posicion con los acceos
         code.pos = var.pos
         # Actualizamos el valor con un acceso de lectura
-        code.value = var.value + var.read_value + var.end_value
+        code.value = Aux.opt_get(var)
+        code.node = var.node
         # Cogemos las declaraciones de los accesos
         code.declares += var.declares
         return code
@@ -181,16 +178,15 @@ class Collection:
             Aux.check_code(parser, exp, c_ref=False)
             # Si un valor es una sentencia, el array lo sera
             if Dtp.STATEMENT in exp.flags:
-                code.flags[Dtp.STATEMENT] = True
+                code.set_flag(Dtp.STATEMENT)
             # Si no es un array de scalar, primero eliminamos las referencias
             if not scalar:
                 # Tiene que ser una referencia
                 if exp.type[0] == Dtp.REF:
                     # Accedemos a la referencia
                     access = Coll.access_pointed(parser, Access(exp), exp.pos)
-                    exp.value = access.value + access.read_value + access.end_value 
-                    if parser.optimize_code:
-                        exp.value = Aux.opt_get(exp.value) 
+                    exp.value = Aux.opt_get(access)
+                    exp.node = access.node
                     # Cogemos el tipo accedido
                     exp.type = access.type  
                 else:
@@ -200,7 +196,7 @@ class Collection:
         # Quitamos la ultima coma y cerramos la llava            
         code.value = code.value[:-1] + '}'  
         # Transformamos el codigo en referencia
-        code.value = 'new Ref<>(' + code.value + ')'    
+        Aux.new_ref(parser, code)
         return code  
     
     @classmethod
@@ -245,7 +241,7 @@ class Collection:
             Aux.check_code(parser, exp, c_ref=False)
             # Si un valor es una sentencia, el hash lo sera
             if Dtp.STATEMENT in exp.flags:
-                code.flags[Dtp.STATEMENT] = True
+                code.set_flag(Dtp.STATEMENT)
             # Es es clave, nos aseguramos de que valla como string
             if flag:
                 keys += Cst.to_string(exp) + ','    
@@ -256,9 +252,8 @@ class Collection:
                     if exp.type[0] == Dtp.REF:
                         # Accedemos a la referencia
                         access = Coll.access_pointed(parser, Access(exp), exp.pos)
-                        exp.value = access.value + access.read_value + access.end_value
-                        if parser.optimize_code:
-                            exp.value = Aux.opt_get(exp.value) 
+                        exp.value = Aux.opt_get(access)
+                        exp.node = access.node
                         # Cogemos el tipo accedido
                         exp.type = access.type  
                     else:
@@ -270,7 +265,7 @@ class Collection:
         # El valor final debe ser: Pd.hash(new String[]{...},new T[]{...})
         code.value += keys[:-1] + '}, ' + values[:-1] + '})'    
         # Lo convertimos en referencia
-        code.value = 'new Ref<>(' + code.value + ')'
+        Aux.new_ref(parser, code)
         return code    
     
     @classmethod
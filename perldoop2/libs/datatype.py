@@ -18,6 +18,9 @@
 #You should have received a copy of the GNU General Public License
 #along with Perldoop.  If not, see <http://www.gnu.org/licenses/>.
 
+import bisect
+import heapq
+
 class DataType:
 	BOOLEAN = 'Boolean'
 	INTEGER = 'Integer'
@@ -68,17 +71,49 @@ class DataType:
 	LIST = 'LIST'
 	REF = 'REF'
 
+# Lista vacia compartida por defecto, no se modifica, al añadir se crea una lista nueva
+class EmptyList(list):
+	__slots__ = ()
+	
+	def __iadd__(self, other):
+		return list(other) if other else self
+	
+	def read_only(self, *args):
+		raise TypeError('shared empty list is read only')
+	
+	append = extend = insert = pop = remove = clear = sort = reverse = __setitem__ = __delitem__ = __imul__ = read_only
+
+# Diccionario vacio compartido por defecto, no se modifica
+class EmptyDict(dict):
+	__slots__ = ()
+	
+	def read_only(self, *args, **kwargs):
+		raise TypeError('shared empty dict is read only')
+	
+	update = pop = popitem = setdefault = clear = __setitem__ = __delitem__ = read_only
+
+EMPTY_DECLARES = EmptyList()  # Declaraciones vacias
+EMPTY_FLAGS = EmptyDict()  # Flags vacias
+
 # Clase para almacenar variables
 class Variable():
-	def __init__(self, type=None, pos=None, name=None, multi_type=None, private=False):
+	__slots__ = ('name', 'type', 'multi_type', 'pos', 'private', 'assign', 'unboxed', 'boxed', 'sources')
+	
+	def __init__(self, type=None, pos=None, name=None, multi_type=None, private=False, assign=False):
 		self.name = name  # Nombre java de la variable
 		self.type = type  # Tipo de la variable
 		self.multi_type = multi_type  # Tipos en caso de multitipo
 		self.pos = pos  # Posicion de la variable en el codigo
 		self.private = private  # Indica si una variable puede ser accedida fuera del paquete	
+		self.assign = assign  # La variable ha sido asignada
+		self.unboxed = None  # Indice de la variable entre las candidatas a tipo primitivo (modo unboxed)
+		self.boxed = False  # La variable puede ser null y necesita su tipo objeto
+		self.sources = None  # Variables asignadas a la candidata, deben ser primitivas para que ella lo sea
 
 # Guardar posicion para mostrar errores		
 class Position():
+	__slots__ = ('line', 'lexpos')
+	
 	def __init__(self, p=None, pos=None, line=None, lexpos=None):
 		if line != None and lexpos != None:
 			self.line = line  # Linea del lexema
@@ -93,15 +128,20 @@ class Position():
 	def column(self, parser):
 		return parser.lexer.find_column(self.lexpos)
 
+# Posicion por defecto del codigo, compartida porque las posiciones no se modifican
+DEFAULT_POS = Position(line=1, lexpos=1)
+
 # Clase para almacenar el codigo segun se genera		
 class Code():
-	def __init__(self, value=None, type=None, st_value=None, value_opt=None, pos=None, declares=None, variable=None, multi_type=None, flags=None, ref_var=None, var_assing=None, ref=None):
+	__slots__ = ('fragments', 'value_opt', 'st_value', 'multi_type', 'type', 'declares', 'variable', 'ref_var', 'pos', 'flags', 'var_assing', 'ref', 'not_null', 'const', 'node')
+	
+	def __init__(self, value=None, type=None, st_value=None, value_opt=None, pos=None, declares=None, variable=None, multi_type=None, flags=None, ref_var=None, var_assing=None, ref=None, not_null=False):
 
-		# Valores por defecto
+		# Valores por defecto, las listas y diccionarios vacios se comparten hasta que se escribe en ellos
 		if value is None: value = ""
-		if declares is None: declares = []
-		if pos is None: pos = Position(line=1, lexpos=1)
-		if flags is None: flags = dict()
+		if declares is None: declares = EMPTY_DECLARES
+		if pos is None: pos = DEFAULT_POS
+		if flags is None: flags = EMPTY_FLAGS
 		
 		self.value = value  # Expresion en codigo java
 		self.value_opt = value_opt  # Expresion java alternativa con operaciones logicas, mas eficiente si puede aplicarse
@@ -115,15 +155,56 @@ class Code():
 		self.flags = flags  # Marcas para hacer comprobaciones sobre el codigo
 		self.var_assing = var_assing  # Variables asignadas dentro del codigo (solo se usa en los if)
 		self.ref = ref  # Marca que la coleccion debera ser refenciada en caso de una operacion que lo requiera
+		self.not_null = not_null  # La expresion nunca es null (numeros y resultados de operaciones)
+		self.const = None  # Literal y valor si la expresion es constante (solo con optimizaciones)
+		self.node = None  # Raiz de la expresion para reescribirla (solo con optimizaciones)
+	
+	# La expresion se guarda por fragmentos que solo se unen al leerla
+	@property
+	def value(self):
+		if len(self.fragments) > 1:
+			self.fragments = [''.join(self.fragments)]
+		return self.fragments[0]
+	
+	@value.setter
+	def value(self, value):
+		self.fragments = [value]
+	
+	# Añade codigo al final sin copiar el que ya existe
+	def append(self, value):
+		self.fragments.append(value)
+	
+	# Añade una declaracion, copiando la lista si es la compartida
+	def add_declare(self, declare):
+		if self.declares is EMPTY_DECLARES:
+			self.declares = [declare]
+		else:
+			self.declares.append(declare)
+	
+	# Marca una flag, copiando el diccionario si es el compartido
+	def set_flag(self, flag):
+		if self.flags is EMPTY_FLAGS:
+			self.flags = {flag:True}
+		else:
+			self.flags[flag] = True
+	
+	# Añade las flags de otro codigo
+	def update_flags(self, flags):
+		if flags:
+			if self.flags is EMPTY_FLAGS:
+				self.flags = dict(flags)
+			else:
+				self.flags.update(flags)
 	
 	# Al sumar dos codigos	
 	def __add__(self, other):		
 		r = Code()
 		# Se suman las declaraciones
-		r.declares = self.declares + other.declares
+		if self.declares or other.declares:
+			r.declares = self.declares + other.declares
 		# Las banderas
-		r.flags.update(self.flags)
-		r.flags.update(other.flags)
+		r.update_flags(self.flags)
+		r.update_flags(other.flags)
 		# Y se coge la posicion mas alta
 		if(self.pos.lexpos > other.pos.lexpos):
 			r.pos = self.pos
@@ -135,8 +216,32 @@ class Code():
 		return self.value
 			
 
+# Codigo de la clase por fragmentos, se une una sola vez al crear la clase
+class Fragments():
+	def __init__(self, *values):
+		self.head = []  # Fragmentos añadidos al principio, en orden inverso
+		self.tail = list(values)  # Fragmentos añadidos al final
+	
+	def prepend(self, value):
+		self.head.append(value)
+		
+	def append(self, value):
+		self.tail.append(value)
+	
+	def __bool__(self):
+		return any(self.head) or any(self.tail)
+		
+	# Fragmentos en orden
+	def parts(self):
+		return self.head[::-1] + self.tail
+		
+	def __str__(self):
+		return ''.join(self.parts())
+
 # Clase para almacenar las declaraciones		
 class Declare():
+	__slots__ = ('value', 'variable', 'pos')
+	
 	def __init__(self, value, pos, variable=False):
 		self.value = value  # Valor de la declaracion
 		self.variable = variable  # Contiene una variable
@@ -144,6 +249,8 @@ class Declare():
 		
 		
 class Type():
+	__slots__ = ('type', 'size')
+	
 	def __init__(self, type, size=None):
 		self.type = type  # Tipo puede ser Array o Hash
 		self.size = size  # Tamaño si se quiere memoria
@@ -162,6 +269,8 @@ class Type():
 		
 # Clase para almacenar los accesos a array y hash
 class Access():
+	__slots__ = ('var', 'value', 'type', 'pos', 'read_value', 'store_value', 'end_value', 'declares', 'ref', 'node')
+	
 	def __init__(self, var):
 		self.var = var  # Variable a la que se accede
 		self.value = var.value  # Valor desde que es accedido
@@ -170,11 +279,28 @@ class Access():
 		self.read_value = ''  # Codigo a añadir al valor si el acceso es de lectura
 		self.store_value = ' = '  # Codigo a añadir al valor si el acceso es de escritura
 		self.end_value = ''  # Codigo a añadir al final, tanto en lectura como escritura
-		self.declares = []  # Declaraciones en el acceso
+		self.declares = EMPTY_DECLARES  # Declaraciones en el acceso
 		self.ref = None  # Marca que la coleccion debera ser refenciada en caso de una operacion que lo requiera
+		self.node = var.node  # Raiz de la expresion del valor
 		
 	def __repr__(self):
 		return self.value
+
+# Raiz de una expresion java, solo es valida mientras el codigo conserve la expresion con la que se creo
+class Node():
+	__slots__ = ('value', 'kind', 'name', 'generic', 'inner', 'child')
+	
+	NEW = 'new'  # Constructor: new name generic(inner)
+	CAST = 'cast'  # Casting: ((name)inner)
+	PAREN = 'paren'  # Parentesis: (inner)
+	
+	def __init__(self, value, kind, name=None, inner=None, generic=None, child=None):
+		self.value = value  # Expresion completa
+		self.kind = kind  # Tipo de la raiz
+		self.name = name  # Clase del constructor o tipo del casting
+		self.generic = generic  # Parametros genericos del constructor
+		self.inner = inner  # Expresion interior
+		self.child = child  # Nodo de la expresion interior si tenia
 		
 class Function():
 	def __init__(self, args, returns, pos=None):
@@ -194,3 +320,123 @@ class Package():
 	
 	
 	
+
+# Nivel de una tabla de simbolos, avisa a la tabla de cada nombre que se añade o se borra
+class Scope(dict):
+	__slots__ = ('table', 'level', 'temps')
+	
+	def __init__(self, *args):
+		super().__init__(*args)
+		self.table = None  # Tabla en la que esta apilado
+		self.level = 0  # Nivel dentro de la tabla
+		self.temps = None  # Variables temporales que se liberan al desapilar el nivel
+	
+	def __setitem__(self, name, value):
+		if self.table is not None and name not in self:
+			self.table.bind(name, self.level)
+		dict.__setitem__(self, name, value)
+	
+	def __delitem__(self, name):
+		dict.__delitem__(self, name)
+		if self.table is not None:
+			self.table.unbind(name, self.level)
+	
+	def update(self, other):
+		for name, value in other.items():
+			self[name] = value
+	
+	def pop(self, name, *default):
+		if name in self:
+			value = dict.__getitem__(self, name)
+			del self[name]
+			return value
+		return dict.pop(self, name, *default)
+	
+	def setdefault(self, name, value=None):
+		if name not in self:
+			self[name] = value
+		return dict.__getitem__(self, name)
+	
+	def clear(self):
+		for name in list(self):
+			del self[name]
+
+# Tabla de simbolos por niveles, cada nombre guarda los niveles en los que esta declarado
+class ScopeTable(list):
+	
+	def __init__(self, scopes=()):
+		super().__init__()
+		self.index = {}  # Niveles de cada nombre, de menor a mayor
+		self.free = {}  # Numeros de las variables temporales liberadas de cada prefijo, de menor a mayor
+		for scope in scopes:
+			self.append(scope)
+	
+	# Apila un nivel, los diccionarios se convierten en niveles
+	def append(self, scope):
+		if not isinstance(scope, Scope) or scope.table is not None:
+			scope = Scope(scope)
+		scope.table = self
+		scope.level = len(self)
+		list.append(self, scope)
+		for name in scope:
+			self.bind(name, scope.level)
+	
+	# Desapila el ultimo nivel deshaciendo sus nombres, el nivel sigue siendo un diccionario valido
+	def pop(self):
+		scope = list.pop(self)
+		for name in scope:
+			self.unbind(name, scope.level)
+		# Sus variables temporales quedan libres
+		if scope.temps:
+			for prefix, n in scope.temps:
+				heapq.heappush(self.free.setdefault(prefix, []), n)
+			scope.temps = None
+		scope.table = None
+		return scope
+	
+	# Asocia una variable temporal al ultimo nivel
+	def hold(self, prefix, n):
+		scope = self[-1]
+		if scope.temps is None:
+			scope.temps = []
+		scope.temps.append((prefix, n))
+	
+	# Numero libre mas bajo de una variable temporal, None si no hay ninguno
+	def reuse(self, prefix):
+		free = self.free.get(prefix)
+		if free:
+			return heapq.heappop(free)
+	
+	def bind(self, name, level):
+		levels = self.index.get(name)
+		if levels is None:
+			self.index[name] = [level]
+		elif level >= levels[-1]:
+			levels.append(level)
+		else:
+			# Se escribe en un nivel inferior al actual
+			bisect.insort(levels, level)
+	
+	def unbind(self, name, level):
+		levels = self.index[name]
+		if levels[-1] == level:
+			levels.pop()
+		else:
+			levels.remove(level)
+		if not levels:
+			del self.index[name]
+	
+	# Nivel mas interno en el que esta declarado un nombre, -1 si no lo esta
+	def level(self, name):
+		levels = self.index.get(name)
+		return levels[-1] if levels else -1
+	
+	# Entrada mas interna de un nombre, None si no existe
+	def lookup(self, name):
+		levels = self.index.get(name)
+		if levels:
+			return self[levels[-1]][name]
+	
+	# Indica si algun nivel contiene el nombre
+	def bound(self, name):
+		return name in self.index
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+#Copyright 2016 César Pomar <cesarpomar18@gmail.com>
+#
+#This file is part of Perldoop.
+#
+#Perldoop is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Perldoop is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Perldoop.  If not, see <http://www.gnu.org/licenses/>.
+
+from libs import Messages as Msg
+from libs import Hadoop
+
+# Clase Tool que lanza el trabajo formado por el mapper y el reducer traducidos
+class Driver:
+
+	# Codecs de compresion disponibles
+	codecs = {
+	'gzip':'org.apache.hadoop.io.compress.GzipCodec',
+	'bzip2':'org.apache.hadoop.io.compress.BZip2Codec',
+	'snappy':'org.apache.hadoop.io.compress.SnappyCodec',
+	'lz4':'org.apache.hadoop.io.compress.Lz4Codec',
+	'deflate':'org.apache.hadoop.io.compress.DefaultCodec',
+	}
+
+	# Imports del driver
+	imports = (
+	'org.apache.hadoop.conf.Configuration',
+	'org.apache.hadoop.conf.Configured',
+	'org.apache.hadoop.fs.Path',
+	'org.apache.hadoop.io.*',
+	'org.apache.hadoop.mapreduce.Job',
+	'org.apache.hadoop.mapreduce.lib.input.FileInputFormat',
+	'org.apache.hadoop.mapreduce.lib.output.FileOutputFormat',
+	'org.apache.hadoop.util.Tool',
+	'org.apache.hadoop.util.ToolRunner',
+	)
+
+	# Clases traducidas de un tipo de trabajo
+	@classmethod
+	def find(Drv, name, type):
+		classes = sorted(job for job in Hadoop.jobs if Hadoop.jobs[job]['type'] == type)
+		if len(classes) > 1:
+			Msg.error(error='DRIVER_MANY', driver=name, type=type, classes=', '.join(classes))
+			return None, True
+		return (classes[0] if classes else None), False
+
+	# Crea el codigo java del driver, None si los trabajos traducidos no forman un job
+	@classmethod
+	def create(Drv, name, reducers=None, compress=None):
+		mapper, error = Drv.find(name, 'mapper')
+		reducer, error2 = Drv.find(name, 'reducer')
+		if error or error2:
+			return None
+		if not mapper:
+			Msg.error(error='DRIVER_MAPPER', driver=name)
+			return None
+		map_types = Hadoop.jobs[mapper]['types']
+		# La salida del mapper es la entrada del reducer
+		if reducer and Hadoop.jobs[reducer]['types'][:2] != map_types[2:]:
+			Msg.error(error='DRIVER_TYPES', mapper=mapper, reducer=reducer)
+			return None
+		# Sin reducer el trabajo solo tiene fase map y su salida es la final
+		out_types = Hadoop.jobs[reducer]['types'] if reducer else map_types
+		code = ''
+		for path in Drv.imports:
+			code += 'import ' + path + ';\n'
+		code += '\n\n\n'
+		code += 'public class ' + name + ' extends Configured implements Tool{\n'
+		code += '@Override\n'
+		code += 'public int run(String[] args) throws Exception{\n'
+		code += 'if(args.length != 2){\n'
+		code += 'System.err.println("Usage: ' + name + ' [generic options] <input> <output>");\n'
+		code += 'ToolRunner.printGenericCommandUsage(System.err);\n'
+		code += 'return 2;\n'
+		code += '}\n'
+		# Valores por defecto que se pueden cambiar con -D
+		code += 'Configuration conf = getConf();\n'
+		if reducer and reducers is not None:
+			code += 'conf.setIfUnset("mapreduce.job.reduces", "' + str(reducers) + '");\n'
+		if compress:
+			code += 'conf.setIfUnset("mapreduce.map.output.compress", "true");\n'
+			code += 'conf.setIfUnset("mapreduce.map.output.compress.codec", "' + Drv.codecs[compress] + '");\n'
+			code += 'conf.setIfUnset("mapreduce.output.fileoutputformat.compress", "true");\n'
+			code += 'conf.setIfUnset("mapreduce.output.fileoutputformat.compress.codec", "' + Drv.codecs[compress] + '");\n'
+		code += 'Job job = Job.getInstance(conf, "' + name + '");\n'
+		code += 'job.setJarByClass(' + name + '.class);\n'
+		code += 'job.setMapperClass(' + mapper + '.class);\n'
+		if reducer:
+			if Hadoop.jobs[reducer]['combiner']:
+				code += 'job.setCombinerClass(' + reducer + '.Combiner.class);\n'
+			code += 'job.setReducerClass(' + reducer + '.class);\n'
+		else:
+			code += 'job.setNumReduceTasks(0);\n'
+		code += 'job.setMapOutputKeyClass(' + Hadoop.hd_types[map_types[2]] + '.class);\n'
+		code += 'job.setMapOutputValueClass(' + Hadoop.hd_types[map_types[3]] + '.class);\n'
+		code += 'job.setOutputKeyClass(' + Hadoop.hd_types[out_types[2]] + '.class);\n'
+		code += 'job.setOutputValueClass(' + Hadoop.hd_types[out_types[3]] + '.class);\n'
+		code += 'FileInputFormat.addInputPath(job, new Path(args[0]));\n'
+		code += 'FileOutputFormat.setOutputPath(job, new Path(args[1]));\n'
+		code += 'return job.waitForCompletion(true) ? 0 : 1;\n'
+		code += '}\n\n'
+		code += 'public static void main(String[] args) throws Exception{\n'
+		code += 'System.exit(ToolRunner.run(new ' + name + '(), args));\n'
+		code += '}\n\n'
+		code += '}'
+		return code
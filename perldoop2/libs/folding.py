@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+
+#Copyright 2016 César Pomar <cesarpomar18@gmail.com>
+#
+#This file is part of Perldoop.
+#
+#Perldoop is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Perldoop is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Perldoop.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+import math
+from libs import DataType as Dtp
+
+# Evaluacion en tiempo de traduccion de las expresiones constantes, con la semantica de perl
+class Folding:
+
+	# Rangos de los enteros de java
+	INT_RANGE = (-2**31, 2**31 - 1)
+	LONG_RANGE = (-2**63, 2**63 - 1)
+	# Rango de los flotantes de java
+	FLOAT_RANGE = (1.4e-45, 3.4028235e38)
+	# Longitud maxima de una cadena calculada, las mas largas se dejan para la ejecucion
+	MAX_STRING = 1024
+
+	# Prefijo numerico de una cadena en perl
+	number_prefix = re.compile(r'\s*([+-]?)(?:(\d+)(?![.\deE])|(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?))')
+
+	# Escapes de las cadenas java generadas por el traductor
+	java_scapes = {'t':'\t', 'b':'\b', 'n':'\n', 'r':'\r', 'f':'\f', '"':'"', "'":"'", '\\':'\\'}
+
+	# Valor constante de un codigo, solo si su expresion no ha cambiado desde que se calculo
+	@classmethod
+	def value(Fold, code):
+		if code.const is not None and code.const[0] == code.value:
+			return code.const[1]
+		return None
+
+	# Marca un literal del codigo fuente como constante si las optimizaciones estan activadas
+	@classmethod
+	def literal(Fold, parser, code):
+		if not parser.optimize_code:
+			return code
+		value = None
+		if code.type[0] == Dtp.INTEGER:
+			if re.match(r'^[1-9]\d*$', code.value):
+				value = int(code.value)
+			elif re.match(r'^0[0-7]*$', code.value):
+				value = int(code.value, 8)
+		elif code.type[0] == Dtp.DOUBLE:
+			try:
+				value = float(code.value)
+			except ValueError:
+				pass
+		elif code.type[0] == Dtp.STRING:
+			value = Fold.java_string(code.value)
+		if value is not None:
+			code.const = (code.value, value)
+		return code
+
+	# Sustituye el codigo por el literal del valor si puede representarse en su tipo
+	@classmethod
+	def set(Fold, code, value):
+		literal = Fold.to_literal(code.type, value)
+		if literal is None:
+			return False
+		code.value = literal
+		code.value_opt = None
+		code.const = (literal, value)
+		return True
+
+	# Conversion de una constante a otro tipo basico, None si no es constante o no es representable
+	@classmethod
+	def cast(Fold, code, type):
+		value = Fold.value(code)
+		if value is None or len(code.type) != 1:
+			return None
+		# Las conversiones a entero truncan como en perl
+		if type in (Dtp.INTEGER, Dtp.LONG):
+			value = Fold.integer(value)
+		return Fold.to_literal([type], value)
+
+	# Calcula una operacion si todos sus operandos son constantes
+	@classmethod
+	def fold(Fold, code, function, *values):
+		if None in values:
+			return False
+		try:
+			value = function(*values)
+		except (ArithmeticError, ValueError):
+			return False
+		if value is None:
+			return False
+		return Fold.set(code, value)
+
+	# Literal java de un valor en el tipo indicado, None si no es representable
+	@classmethod
+	def to_literal(Fold, type, value):
+		if len(type) != 1:
+			return None
+		type = type[0]
+		if type == Dtp.STRING:
+			value = Fold.string(value)
+			if value is None or len(value) > Fold.MAX_STRING:
+				return None
+			return Fold.to_java_string(value)
+		if type == Dtp.BOOLEAN:
+			return 'true' if Fold.truth(value) else 'false'
+		value = Fold.number(value)
+		if value is None:
+			return None
+		if type in (Dtp.INTEGER, Dtp.LONG):
+			# Los flotantes no se truncan, el tipo de la operacion no lo haria
+			if isinstance(value, float):
+				if not value.is_integer():
+					return None
+				value = int(value)
+			low, high = Fold.INT_RANGE if type == Dtp.INTEGER else Fold.LONG_RANGE
+			if not low <= value <= high:
+				return None
+			return str(value) if type == Dtp.INTEGER else str(value) + 'l'
+		if type in (Dtp.FLOAT, Dtp.DOUBLE):
+			value = float(value)
+			if math.isinf(value) or math.isnan(value):
+				return None
+			if type == Dtp.FLOAT:
+				if value and not Fold.FLOAT_RANGE[0] <= abs(value) <= Fold.FLOAT_RANGE[1]:
+					return None
+				return repr(value) + 'f'
+			return repr(value)
+		return None
+
+	# Lee una cadena java generada por el traductor, None si tiene interpolaciones o escapes desconocidos
+	@classmethod
+	def java_string(Fold, literal):
+		if len(literal) < 2 or literal[0] != '"' or literal[-1] != '"':
+			return None
+		value = []
+		scape = False
+		for c in literal[1:-1]:
+			if scape:
+				if c not in Fold.java_scapes:
+					return None
+				value.append(Fold.java_scapes[c])
+				scape = False
+			elif c == '\\':
+				scape = True
+			elif c == '"':
+				return None
+			else:
+				value.append(c)
+		if scape:
+			return None
+		return ''.join(value)
+
+	# Escribe una cadena como literal java
+	@classmethod
+	def to_java_string(Fold, value):
+		literal = ['"']
+		for c in value:
+			if c == '\\':
+				literal.append('\\\\')
+			elif c == '"':
+				literal.append('\\"')
+			elif c == '\n':
+				literal.append('\\n')
+			elif c == '\t':
+				literal.append('\\t')
+			elif c == '\r':
+				literal.append('\\r')
+			elif ord(c) < 32 or ord(c) == 127:
+				literal.append('\\u%04x' % ord(c))
+			else:
+				literal.append(c)
+		literal.append('"')
+		return ''.join(literal)
+
+	# Valor numerico de un escalar como en perl, las cadenas usan su prefijo numerico
+	@classmethod
+	def number(Fold, value):
+		if isinstance(value, bool):
+			return 1 if value else 0
+		if isinstance(value, (int, float)):
+			return value
+		match = Fold.number_prefix.match(value)
+		if not match:
+			# Sin prefijo numerico perl usa 0, salvo Inf y NaN que no se calculan
+			if re.match(r'\s*[+-]?(inf|nan)', value, re.IGNORECASE):
+				return None
+			return 0
+		sign = -1 if match.group(1) == '-' else 1
+		if match.group(2) is not None:
+			return sign * int(match.group(2))
+		return sign * float(match.group(3))
+
+	# Valor entero de un escalar, perl trunca hacia cero
+	@classmethod
+	def integer(Fold, value):
+		value = Fold.number(value)
+		if value is None:
+			return None
+		return int(value)
+
+	# Cadena de un escalar como en perl, los flotantes con 15 digitos significativos
+	@classmethod
+	def string(Fold, value):
+		if isinstance(value, bool):
+			return '1' if value else ''
+		if isinstance(value, int):
+			return str(value)
+		if isinstance(value, float):
+			if math.isinf(value) or math.isnan(value):
+				return None
+			if value == 0:
+				return '0'
+			return '%.15g' % value
+		return value
+
+	# Valor de verdad de un escalar en perl, falsos son '', '0' y el cero
+	@classmethod
+	def truth(Fold, value):
+		if isinstance(value, str):
+			return value != '' and value != '0'
+		return bool(value)
+
+	# Entero de perl si cabe en 64 bits, si no flotante
+	@classmethod
+	def perl_number(Fold, value):
+		if isinstance(value, int) and not Fold.LONG_RANGE[0] <= value <= Fold.LONG_RANGE[1]:
+			return float(value)
+		return value
+
+	### Operaciones ###
+
+	# Suma, resta y multiplicacion
+	@classmethod
+	def arithmetic(Fold, op, a, b):
+		a, b = Fold.number(a), Fold.number(b)
+		if a is None or b is None:
+			return None
+		if op == '+':
+			return Fold.perl_number(a + b)
+		elif op == '-':
+			return Fold.perl_number(a - b)
+		elif op == '*':
+			return Fold.perl_number(a * b)
+		return None
+
+	# Division, por cero perl muere y se deja para la ejecucion
+	@classmethod
+	def divide(Fold, a, b):
+		a, b = Fold.number(a), Fold.number(b)
+		if a is None or not b:
+			return None
+		if isinstance(a, int) and isinstance(b, int) and a % b == 0:
+			return a // b
+		return a / b
+
+	@classmethod
+	def pow(Fold, a, b):
+		a, b = Fold.number(a), Fold.number(b)
+		if a is None or b is None:
+			return None
+		value = float(a) ** float(b)
+		# Las raices de negativos son complejas en python y NaN en perl
+		if isinstance(value, complex):
+			return None
+		return value
+
+	# Modulo entero, en perl el signo es el del segundo operando como en python
+	@classmethod
+	def mod(Fold, a, b):
+		a, b = Fold.integer(a), Fold.integer(b)
+		if a is None or not b:
+			return None
+		return a % b
+
+	# Concatenacion
+	@classmethod
+	def concat(Fold, a, b):
+		a, b = Fold.string(a), Fold.string(b)
+		if a is None or b is None:
+			return None
+		return a + b
+
+	# Repeticion de una cadena, las repeticiones negativas dan la cadena vacia
+	@classmethod
+	def repeat(Fold, a, b):
+		a, b = Fold.string(a), Fold.integer(b)
+		if a is None or b is None or len(a) * max(b, 0) > Fold.MAX_STRING:
+			return None
+		return a * max(b, 0)
+
+	# Cambio de signo, solo de numeros
+	@classmethod
+	def opposite(Fold, a):
+		value = Fold.number(a)
+		if value is None or (isinstance(a, str) and not Fold.number_prefix.match(a)):
+			return None
+		return Fold.perl_number(-value)
+
+	# Comparacion numerica
+	@classmethod
+	def num_compare(Fold, op, a, b):
+		a, b = Fold.number(a), Fold.number(b)
+		if a is None or b is None:
+			return None
+		return Fold.compare(op, (a > b) - (a < b))
+
+	# Operador <=>
+	@classmethod
+	def cmp_num(Fold, a, b):
+		a, b = Fold.number(a), Fold.number(b)
+		if a is None or b is None:
+			return None
+		return (a > b) - (a < b)
+
+	# Comparacion de cadenas, el operador java se aplica al resultado de cmp
+	@classmethod
+	def string_compare(Fold, compare, a, b):
+		a, b = Fold.string(a), Fold.string(b)
+		if a is None or b is None:
+			return None
+		cmp = (a > b) - (a < b)
+		if not compare:
+			return cmp
+		match = re.match(r'^\s*(==|!=|<=|>=|<|>)\s*0$', compare)
+		if not match:
+			return None
+		return Fold.compare(match.group(1), cmp)
+
+	# Resultado de un operador de comparacion sobre el resultado de cmp
+	@classmethod
+	def compare(Fold, op, cmp):
+		if op == '==':
+			return cmp == 0
+		elif op == '!=':
+			return cmp != 0
+		elif op == '<':
+			return cmp < 0
+		elif op == '<=':
+			return cmp <= 0
+		elif op == '>':
+			return cmp > 0
+		elif op == '>=':
+			return cmp >= 0
+		return None
+
+	# Negacion logica
+	@classmethod
+	def logic_not(Fold, a):
+		return not Fold.truth(a)
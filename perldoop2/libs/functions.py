@@ -282,15 +282,18 @@ class Functions():
         code.value_opt = code.value
         # Declaraciones 
         code.declares = list[0].declares + list[1].declares + hash.declares + [code_it, code_entry]
+        # Las variables quedan a null al acabar el hash
+        Var.escape(list[0])
+        Var.escape(list[1])
         # Si la variable no esta asignada
         if not Var.is_assign(self, list[0].variable.name):
             # Asignamos
             self.assigns[-1][list[0].variable.name] = True
             # Damos un valor por defecto
-            code.declares.append(Code(value=list[0].value + ' = null'))
+            code.add_declare(Code(value=list[0].value + ' = null'))
         if not Var.is_assign(self, list[1].variable.name):
             self.assigns[-1][list[1].variable.name] = True
-            code.declares.append(Code(value=list[1].value + ' = null'))
+            code.add_declare(Code(value=list[1].value + ' = null'))
         p[0] = code
         
     def p_function_defined(self, p):
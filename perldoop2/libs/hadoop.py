@@ -27,6 +27,7 @@ from libs import Collection as Coll
 from libs import Statements as Sts  
 from libs import Position
 from libs import Code
+from libs import Fragments
 
 
 class Hadoop():
@@ -39,6 +40,10 @@ class Hadoop():
     Dtp.DOUBLE:'DoubleWritable',
     Dtp.STRING:'Text',
     }    
+    
+    # Mappers y reducers traducidos, para generar el driver del trabajo
+    jobs = {}
+    
     def __init__(self):  
         super().__init__() 
         self.hadoop_type = [Dtp.STRING, Dtp.STRING, Dtp.STRING, Dtp.STRING]  # Tipo para mapper o reducer
@@ -48,34 +53,138 @@ class Hadoop():
         self.reducer_change = None  # Codigo para cada clave
         self.reducer_key = None  # Clave del reducer
         self.reducer_value = None  # Value actual del reducer
+        self.hadoop_write = False  # Se escribe en el contexto con los Writable de salida
+        self.reducer_combiner = None  # Posicion de la etiqueta <combiner> del reducer
+        self.reducer_mapper_combine = False  # El combiner del reducer sirve para la agregacion local de los mappers
+        self.mapper_combine = False  # El mapper agrega su salida con el combiner del trabajo
+    
+    # Importa una clase de hadoop salvo que la clase traducida se llame igual
+    def hd_import(self, name):
+        self.imports[name] = self.class_name != name
+    
+    # Nombre de una clase de hadoop, completo si la clase traducida se llama igual
+    def hd_class(self, name):
+        if self.class_name == name:
+            return Var.imports_path[name]
+        return name
+    
+    # Lectura de un Writable de entrada, los Text se decodifican a cadena y el resto tiene get
+    def hd_read(self, type, value):
+        if type == Dtp.STRING:
+            return Code(type=[type], value=value + '.toString()')
+        return Code(type=[type], value=value + '.get()')
+    
+    # Writable de salida, reutilizados en cada escritura, y la funcion que los escribe en el contexto
+    def hd_write_code(self):
+        if not self.hadoop_write:
+            return '', ''
+        key = self.hd_types[self.hadoop_type[2]]
+        value = self.hd_types[self.hadoop_type[3]]
+        fields = 'private final ' + key + ' pd_out_key = new ' + key + '();\n'
+        fields += 'private final ' + value + ' pd_out_value = new ' + value + '();\n'
+        code = 'private void pd_write(Context pd_context, ' + Cst.create_type([self.hadoop_type[2]]) + ' pd_key, '
+        code += Cst.create_type([self.hadoop_type[3]]) + ' pd_value) throws IOException, InterruptedException{\n'
+        code += 'pd_out_key.set(pd_key);\npd_out_value.set(pd_value);\npd_context.write(pd_out_key, pd_out_value);\n}\n\n'
+        return fields, code
+    
+    # Tipo java de la agregacion local de la salida
+    def hd_combine_type(self):
+        return 'LocalCombiner<' + Cst.create_type([self.hadoop_type[2]]) + ',' + Cst.create_type([self.hadoop_type[3]]) + '>'
+    
+    # Agregacion local del mapper: se crea con el combiner del trabajo y se vacia al terminar
+    def hd_mapper_combine_code(self):
+        fields = 'private ' + self.hd_combine_type() + ' pd_combine;\n'
+        code = '@Override\n'
+        code += 'protected void setup(Context pd_context) throws IOException, InterruptedException{\n'
+        code += 'int pd_limit = pd_context.getConfiguration().getInt("perldoop.mapper.combine.limit", LocalCombiner.LIMIT);\n'
+        code += 'try{\n'
+        code += 'pd_combine = LocalCombiner.create(pd_context.getCombinerClass(), pd_limit, (pd_key, pd_value) -> {\n'
+        code += 'pd_out_key.set(pd_key);\npd_out_value.set(pd_value);\npd_context.write(pd_out_key, pd_out_value);\n'
+        code += '});\n'
+        code += '}catch(ClassNotFoundException e){\n'
+        code += 'pd_combine = null;\n'
+        code += '}\n'
+        code += '}\n\n'
+        code += '@Override\n'
+        code += 'protected void cleanup(Context pd_context) throws IOException, InterruptedException{\n'
+        code += 'if(pd_combine != null){\n'
+        code += 'pd_combine.flush();\n'
+        code += '}\n'
+        code += '}\n\n'
+        # Las escrituras pasan por la agregacion si el trabajo tiene un combiner de perldoop
+        code += 'private void pd_write(Context pd_context, ' + Cst.create_type([self.hadoop_type[2]]) + ' pd_key, '
+        code += Cst.create_type([self.hadoop_type[3]]) + ' pd_value) throws IOException, InterruptedException{\n'
+        code += 'if(pd_combine != null){\n'
+        code += 'pd_combine.write(pd_key, pd_value);\n'
+        code += '}else{\n'
+        code += 'pd_out_key.set(pd_key);\npd_out_value.set(pd_value);\npd_context.write(pd_out_key, pd_out_value);\n'
+        code += '}\n'
+        code += '}\n\n'
+        return fields, code
+    
+    # Reduccion sobre los tipos de perl para la agregacion local de los mappers, con la escritura en su salida
+    def hd_combine_code(self, init, aux):
+        key = Cst.create_type([self.hadoop_type[0]])
+        value = Cst.create_type([self.hadoop_type[1]])
+        function = 'LocalCombiner.Function<' + key + ',' + value + '>'
+        output = 'LocalCombiner.Output<' + key + ',' + value + '>'
+        code = '@Override\n'
+        code += 'public void combine(' + key + ' pd_key, Iterable<' + value + '> pd_value, ' + output + ' pd_context) throws IOException, InterruptedException{\n'
+        code += init
+        code += self.reducer_key.value + ' = ' + Cst.to_type(self, self.reducer_key, Code(type=[self.hadoop_type[0]], value='pd_key')) + ';\n'
+        code += 'for(' + value + ' ' + aux + ' : pd_value){\n'
+        code += self.reducer_value.value + ' = ' + Cst.to_type(self, self.reducer_value, Code(type=[self.hadoop_type[1]], value=aux)) + ';\n'
+        code += self.reducer_op.value + '}\n'
+        code += self.reducer_change.value
+        code += '}\n\n'
+        if self.hadoop_write:
+            code += 'private void pd_write(' + output + ' pd_context, ' + key + ' pd_key, ' + value + ' pd_value) throws IOException, InterruptedException{\n'
+            code += 'pd_context.write(pd_key, pd_value);\n}\n\n'
+        return function, code
     
     def p_mapper_init(self, p):
         '''mapper_init : MAPPER_CODE
-                        | MAPPER_CODE TYPE TYPE TYPE'''        
+                        | MAPPER_CODE TYPE TYPE TYPE
+                        | MAPPER_CODE MAPPER_COMBINE
+                        | MAPPER_CODE TYPE TYPE TYPE MAPPER_COMBINE'''        
         if self.extend_class:
             Msg.error(self, 'ALREADY_EXTENDS', Position(p, 1))
         self.mapper_code = True
         if len(self.variables) > 1:
             Msg.error(self, 'SPECIAL_LOCAL_BLOCK', Position(p, 1))
+        # Si se pide la agregacion local
+        if len(p) == 3 or len(p) == 6:
+            self.mapper_combine = True
         # Si especifica tipo, cambiamos el por defecto
-        if len(p) > 2:
+        if len(p) > 3:
             self.hadoop_type = [Dtp.STRING, Dtp.var_types[p[2]], Dtp.var_types[p[3]], Dtp.var_types[p[4]]]
-        self.imports['Mapper'] = True
+        self.hd_import('Mapper')
         self.imports['HadoopIO'] = True
         self.imports['HadoopContext'] = True
         self.imports['IOException'] = True
             
     def p_reducer_init(self, p):
         '''reducer_init : REDUCER_CODE
-                        | REDUCER_CODE TYPE TYPE TYPE TYPE'''
+                        | REDUCER_CODE TYPE TYPE TYPE TYPE
+                        | REDUCER_CODE COMBINER
+                        | REDUCER_CODE COMBINER MAPPER_COMBINE
+                        | REDUCER_CODE TYPE TYPE TYPE TYPE COMBINER
+                        | REDUCER_CODE TYPE TYPE TYPE TYPE COMBINER MAPPER_COMBINE'''
+        typed = len(p) > 5
+        # Si se pide el combiner
+        if len(p) in (3, 4, 7, 8):
+            self.reducer_combiner = Position(p, 6 if typed else 2)
+        # Si el combiner tambien lo usan los mappers con <mapper_combine>
+        if len(p) in (4, 8):
+            self.reducer_mapper_combine = True
         # Si especifica tipo, cambiamos el por defecto
-        if len(p) > 2:
+        if typed:
             self.hadoop_type = [Dtp.var_types[p[2]], Dtp.var_types[p[3]], Dtp.var_types[p[4]], Dtp.var_types[p[5]]]
     
     def p_mapper_code(self, p):
         'statement_type : mapper_init LBRACE block_header statements RBRACE'
         # Extendemos la clase
-        self.extend_class = 'Mapper<Object,' + self.hd_types[self.hadoop_type[1]] + ','
+        self.extend_class = self.hd_class('Mapper') + '<Object,' + self.hd_types[self.hadoop_type[1]] + ','
         self.extend_class += self.hd_types[self.hadoop_type[2]] + ',' + self.hd_types[self.hadoop_type[3]] + '>'
         # Notacion de sobrescritura
         header = '@Override\n'
@@ -84,7 +193,15 @@ class Hadoop():
         # Creamos la funcion
         function = header + '{\ntry{\n' + p[4].value + '}catch(Exception e){\nSystem.out.println(e.toString());\n}\n}\n\n'
         # Creamos la funcion
-        self.functions_code = function + self.functions_code
+        self.functions_code.prepend(function)
+        fields, write = self.hd_write_code()
+        # Con agregacion local se sustituye la escritura directa
+        if self.mapper_combine and self.hadoop_write:
+            combine_fields, write = self.hd_mapper_combine_code()
+            fields += combine_fields
+        self.atributes.append(fields)
+        self.functions_code.append(write)
+        Hadoop.jobs[self.class_name] = {'type':'mapper', 'types':self.hadoop_type[:], 'combiner':self.mapper_combine}
         # Borramos todo sobre las variables dentro del bloque
         self.assigns.pop()
         self.variables.pop()    
@@ -98,10 +215,7 @@ class Hadoop():
         elif self.mapper_loop:
             Msg.error(self, 'HD_MAPPER_MANY_LOOP', Position(p, 1))
         # Cogemos el valor del mapper  
-        if self.hadoop_type[1] == Dtp.STRING:
-            code = Sts.equals(self, p[4], Code(type=[self.hadoop_type[1]], value='pd_value.toString()'))    
-        else:
-            code = Sts.equals(self, p[4], Code(type=[self.hadoop_type[1]], value='pd_value.get()'))    
+        code = Sts.equals(self, p[4], self.hd_read(self.hadoop_type[1], 'pd_value'))    
         # Podemos las declaraciones del codigo
         code.value = Aux.create_declare(code) + code.value + ';\n'
         # Las borramos
@@ -130,8 +244,10 @@ class Hadoop():
             # Creamos el codigo
             p[0] = list[0] + list[2]
             p[0].type = [Dtp.INTEGER]
-            p[0].value = 'pd_context.write(new ' + self.hd_types[self.hadoop_type[2]] + '(' + Cst.to_type(self, Code(type=[self.hadoop_type[2]]), list[0]) + ')'
-            p[0].value += ', new ' + self.hd_types[self.hadoop_type[3]] + '(' + Cst.to_type(self, Code(type=[self.hadoop_type[3]]), list[2]) + '))'
+            # Los Writable de salida se reutilizan en todas las escrituras
+            self.hadoop_write = True
+            p[0].value = 'pd_write(pd_context, ' + Cst.to_type(self, Code(type=[self.hadoop_type[2]]), list[0])
+            p[0].value += ', ' + Cst.to_type(self, Code(type=[self.hadoop_type[3]]), list[2]) + ')'
             p[0].st_value = p[0].value
         else:
             Msg.error(self, 'HD_PRINT', Position(p, 2))
@@ -145,7 +261,7 @@ class Hadoop():
         self.assigns.pop()
         self.variables.pop()
         p[0] = Code()
-        self.imports['Reducer'] = True
+        self.hd_import('Reducer')
         
     def p_reducer_change(self, p):
         'block : REDUCER_CHANGE LBRACE block_header statements RBRACE'
@@ -155,7 +271,7 @@ class Hadoop():
         self.assigns.pop()
         self.variables.pop()
         p[0] = Code()
-        self.imports['Reducer'] = True
+        self.hd_import('Reducer')
         
     def p_reducer_key(self, p):
         'statement_type : labels_line list post_block SEMI REDUCER_KEY line_comment '
@@ -163,6 +279,8 @@ class Hadoop():
         if p[2][0].declares:
             var = p[2][0].declares[0] 
             self.reducer_key = Code(value = var.variable.name, type = var.type)
+            # Se inicializa a null y toma los valores del reducer
+            var.variable.boxed = True
             # Si no ha sido inicializada, lo hacemos con null
             if not self.reducer_key.value in self.assigns[-1]:
                 self.assigns[-1][self.reducer_key.value] = True
@@ -178,6 +296,8 @@ class Hadoop():
         if p[2][0].declares:
             var = p[2][0].declares[0] 
             self.reducer_value = Code(value = var.variable.name, type = var.type)
+            # Se inicializa a null y toma los valores del reducer
+            var.variable.boxed = True
             # Si no ha sido inicializada, lo hacemos con null  
             if not self.reducer_value.value in self.assigns[-1]:
                 self.assigns[-1][self.reducer_value.value] = True
@@ -188,7 +308,8 @@ class Hadoop():
             
     def p_reducer_code(self, p):
         'block : reducer_init LBRACE block_header REDUCER_VAR statements REDUCER_VAR statements RBRACE'
-        self.imports['HadoopTypes'] = True
+        self.imports['HadoopIO'] = True
+        self.imports['IOException'] = True
         # Genera el reducer con la union de los bloques
         if not(self.reducer_op and self.reducer_change and self.reducer_key and self.reducer_value):
             Msg.error(self, 'HD_REDUCER_INCOMPLETE', Position(p, 4)) 
@@ -197,8 +318,8 @@ class Hadoop():
         if self.extend_class:
             Msg.error(self, 'ALREADY_EXTENDS', Position(p, 1))            
         # Extendemos la clase
-        self.extend_class += 'Reducer<' + self.hd_types[self.hadoop_type[0]] + ',' + self.hd_types[self.hadoop_type[1]] + ','
-        self.extend_class += self.hd_types[self.hadoop_type[2]] + ',' + self.hd_types[self.hadoop_type[3]] + ',' + '>'
+        self.extend_class += self.hd_class('Reducer') + '<' + self.hd_types[self.hadoop_type[0]] + ',' + self.hd_types[self.hadoop_type[1]] + ','
+        self.extend_class += self.hd_types[self.hadoop_type[2]] + ',' + self.hd_types[self.hadoop_type[3]] + '>'
         # Notacion de sobrescritura
         header = '@Override\n'
         # Cabecera del metodo
@@ -207,16 +328,36 @@ class Hadoop():
         # Cuerpo del medoto
         body = p[5].value
         # Igualizamos la clave a la del reduce
-        body += self.reducer_key.value + ' = ' + Cst.to_type(self, self.reducer_key, Code(type=[self.hadoop_type[0]], value='pd_key.get()')) + ';\n'
+        body += self.reducer_key.value + ' = ' + Cst.to_type(self, self.reducer_key, self.hd_read(self.hadoop_type[0], 'pd_key')) + ';\n'
         # pedimos una variable auxiliar
         aux = Var.get_loop_var(self)
         body += 'for(' + self.hd_types[self.hadoop_type[1]] + ' ' + aux + ' : pd_value){\n'
         # Igualamos el valor al del reduce
-        body += self.reducer_value.value + ' = ' + Cst.to_type(self, self.reducer_value, Code(type=[self.hadoop_type[1]], value=aux+'.get()')) + ';\n'
+        body += self.reducer_value.value + ' = ' + Cst.to_type(self, self.reducer_value, self.hd_read(self.hadoop_type[1], aux)) + ';\n'
         body += self.reducer_op.value + '}\n'
         body += self.reducer_change.value
         # Creamos la funcion
-        self.functions_code = header + '{\n' + body + '}\n\n'
+        reduce = header + '{\n' + body + '}\n\n'
+        fields, write = self.hd_write_code()
+        self.atributes.append(fields)
+        self.functions_code = Fragments(reduce, write)
+        Hadoop.jobs[self.class_name] = {'type':'reducer', 'types':self.hadoop_type[:], 'combiner':False}
+        # El combiner repite la reduccion, solo si la salida tiene los tipos de la entrada
+        if self.reducer_combiner or self.combiner:
+            if self.hadoop_type[:2] == self.hadoop_type[2:]:
+                Hadoop.jobs[self.class_name]['combiner'] = True
+                # Sin la etiqueta se avisa, hadoop puede aplicar la reduccion varias veces sobre resultados parciales
+                if not self.reducer_combiner:
+                    Msg.error(self, 'HD_COMBINER_AUTO', Position(p, 2), reducer=self.class_name)
+                combiner = 'public static class Combiner extends ' + self.extend_class
+                combine = ''
+                # Solo los combiner de la agregacion local de los mappers necesitan LocalCombiner
+                if self.reducer_mapper_combine:
+                    function, combine = self.hd_combine_code(p[5].value, aux)
+                    combiner += ' implements ' + function
+                self.functions_code.append(combiner + '{\n' + fields + '\n' + reduce + combine + write + '}\n\n')
+            elif self.reducer_combiner:
+                Msg.error(self, 'HD_COMBINER_TYPES', self.reducer_combiner)
         # Borramos todo sobre las variables dentro del bloque
         self.assigns.pop()
         self.variables.pop()  
@@ -18,6 +18,9 @@
 #along with Perldoop.  If not, see <http://www.gnu.org/licenses/>.
 
 import re
+import array
+import bisect
+import collections
 from libs.ply.lex import TOKEN, LexToken
 import libs.ply.lex as lex
 from libs import Messages as Msg
@@ -27,19 +30,28 @@ from libs import Position
 
 
 class Lexer():
+	
+	master = None  # Analizador lexico compartido, la expresion maestra se compila una sola vez
 
 	def __init__(self):
-		self.lexer = lex.lex(object=self)  # Analizador lexico
+		if Lexer.master is None:
+			Lexer.master = lex.lex(object=self)
+		self.lexer = Lexer.master.clone(self)  # Analizador lexico
+		self.lexer.lexstatestack = []  # La pila de estados no se comparte
+		self.lexer.begin('INITIAL')  # Reglas del estado inicial enlazadas con esta instancia
 		self.debug_mode = False  # Modo depuracion
 		self.parser = None  # Analizador sintactico
 		self.comment = None  # Token del comentario actual sin etiquetas
 		self.perl_line = -1  # Linea del ultimo componente perl
-		self.buffer = []  # Buffer de tokens
+		self.buffer = []  # Sentencia que se esta leyendo
+		self.ready = collections.deque()  # Tokens de la sentencia lista para el analizador
 		self.t = None  # Token actual
+		self.starts = None  # Posicion de inicio de cada linea, se calcula con el primer mensaje
 		
 	def input(self, text):	
 		self.lexer.input(text)
 		self.input = text	
+		self.starts = None
 		self.t = self.lexer.token()
 		
 	def token(self):
@@ -48,13 +60,27 @@ class Lexer():
 			print(token)
 		return token	
 		
+	# Tabla con la posicion de inicio de cada linea, la linea n empieza en line_starts()[n - 1]
+	def line_starts(self):
+		if self.starts is None:
+			self.starts = array.array('q', [0])
+			self.starts.extend(match.end() for match in re.finditer('\n', self.input))
+		return self.starts
+	
+	# Indice en la tabla de la linea que contiene una posicion
+	def line_index(self, lexpos):
+		return bisect.bisect_right(self.line_starts(), lexpos) - 1
+	
+	# Inicio y fin, sin el salto de linea, de la linea que contiene una posicion
+	def line_span(self, lexpos):
+		starts = self.line_starts()
+		index = bisect.bisect_right(starts, lexpos) - 1
+		end = starts[index + 1] - 1 if index + 1 < len(starts) else len(self.input)
+		return starts[index], end
+	
 	# Busca la columna correspondiente a un token, mas eficiente que calcularlo para todos
 	def find_column(self, lexpos):
-		last_cr = self.input.rfind('\n', 0, lexpos)
-		if last_cr < 0:
-			last_cr = -1
-		column = (lexpos - last_cr)
-		return column
+		return lexpos - self.line_starts()[self.line_index(lexpos)] + 1
 	
 	def t_ANY_error(self, t):
 		Msg.error(self.parser, 'ILEGAL_TOKEN', Position(line=t.lineno, lexpos=t.lexpos), c=t.value[0])
@@ -123,7 +149,7 @@ class Lexer():
 			# Hadoop
 			'MAPPER_CODE', 'MAPPER_LOOP', 'HADOOP_PRINT',
 			'REDUCER_CODE', 'REDUCER_OP', 'REDUCER_CHANGE',
-			'REDUCER_KEY', 'REDUCER_VALUE', 'REDUCER_VAR',
+			'REDUCER_KEY', 'REDUCER_VALUE', 'REDUCER_VAR', 'COMBINER', 'MAPPER_COMBINE',
 	)
 	
 	# Asignamos palabras a los tokens
@@ -460,151 +486,151 @@ class Lexer():
 	# ##
 	# ##Funciones Auxiliares del analizador
 	# ##
-	def token_buffer(self, ready=False):	
-		# Emular parentesis al terminar
-		if ready and self.parser.emulate_parens:
-			self.emulate_parens()
-		if self.buffer:
-			return self.buffer.pop(0)
+	def token_buffer(self):
+		# Tokens de la sentencia lista para el analizador
+		if self.ready:
+			return self.ready.popleft()
+		while self.t:
+			self.read_statement()
+			# Emular parentesis al terminar
+			if self.parser.emulate_parens:
+				self.ready.extend(self.emulate_parens(self.buffer))
+			else:
+				self.ready.extend(self.buffer)
+			self.buffer = []
+			if self.ready:
+				return self.ready.popleft()
+		return None
+	
+	# Lee tokens hasta completar una sentencia, moviendo las etiquetas a su principio
+	def read_statement(self):
 		stack = [0]  # Principio de la sentencia
 		end = False  # Se ha terminado de leer codigo perl
-		# Si hay un token
-		if self.t:
-			while True:
-				# Si no hay token
-				if not self.t:
-					return self.token_buffer(True)
-				# Si el token es una etiqueta
-				if self.t.type in self.labels_moved:
-					# Si esta en distinta linea
-					if self.perl_line != self.t.lineno:
-						self.perl_line = self.t.lineno
-						return self.token_buffer(True)
-					# Si la etiqueta se tiene que mover
-					if self.labels_moved[self.t.type]:
-						end = True
-						self.buffer.insert(stack[-1], self.t)
-						stack[-1] += 1
-						self.t = self.lexer.token()
-					# Si no paramos
-					else:
-						self.buffer.append(self.t)				
-						self.t = self.lexer.token()
-						return self.token_buffer(True)
+		while self.t:
+			# Si el token es una etiqueta
+			if self.t.type in self.labels_moved:
+				# Si esta en distinta linea
+				if self.perl_line != self.t.lineno:
+					self.perl_line = self.t.lineno
+					return
+				# Si la etiqueta se tiene que mover
+				if self.labels_moved[self.t.type]:
+					end = True
+					self.buffer.insert(stack[-1], self.t)
+					stack[-1] += 1
+					self.t = self.lexer.token()
+				# Si no paramos
 				else:
-					# Si no se pude leer mas perl
-					if end:
-						return self.token_buffer(True)
-					# Si esun comentario
-					elif self.t.type == 'COMMENT' :
-						# Si hay que leer comentario y este contiene algo
-						if self.parser.read_comments and not re.match("^[^ \t]*$", self.t.value):
-							if self.perl_line == self.t.lineno:
-								self.comment.type = 'COMMENT_LINE'
-								self.buffer.append(self.t)				
-						self.t = self.lexer.token()
-						return self.token_buffer(True)		
-					# Si es la llamada a una funcion				
-					elif (self.t.type == 'ID' and len(self.buffer) > 0 and self.buffer[-1].type == 'SUB'):
-						self.buffer.append(self.t)				
-						self.t = self.lexer.token()
-						return self.token_buffer(True)
-					# Si es un punto y coma
-					elif self.t.type == 'SEMI':
-						end = True
-					# Si se abren llaves
-					elif self.t.type == 'LBRACE':
-						stack.append(len(self.buffer) + 1)
-					# Si se cierran llaves
-					elif self.t.type == 'RBRACE':
-						# Si se abrieron llaves y hay algo dentro
-						if len(stack) > 1 and (len(self.buffer) > 0 and self.buffer[-1].type != 'LBRACE'):
-							stack.pop()
-						else:
+					self.buffer.append(self.t)				
+					self.t = self.lexer.token()
+					return
+			else:
+				# Si no se pude leer mas perl
+				if end:
+					return
+				# Si esun comentario
+				elif self.t.type == 'COMMENT' :
+					# Si hay que leer comentario y este contiene algo
+					if self.parser.read_comments and not re.match("^[^ \t]*$", self.t.value):
+						if self.perl_line == self.t.lineno:
+							self.comment.type = 'COMMENT_LINE'
 							self.buffer.append(self.t)				
-							self.t = self.lexer.token()
-							return self.token_buffer(True)	
-					self.buffer.append(self.t)	
-					self.perl_line = self.t.lineno			
 					self.t = self.lexer.token()
-		return None			
+					return
+				# Si es la llamada a una funcion				
+				elif (self.t.type == 'ID' and len(self.buffer) > 0 and self.buffer[-1].type == 'SUB'):
+					self.buffer.append(self.t)				
+					self.t = self.lexer.token()
+					return
+				# Si es un punto y coma
+				elif self.t.type == 'SEMI':
+					end = True
+				# Si se abren llaves
+				elif self.t.type == 'LBRACE':
+					stack.append(len(self.buffer) + 1)
+				# Si se cierran llaves
+				elif self.t.type == 'RBRACE':
+					# Si se abrieron llaves y hay algo dentro
+					if len(stack) > 1 and (len(self.buffer) > 0 and self.buffer[-1].type != 'LBRACE'):
+						stack.pop()
+					else:
+						self.buffer.append(self.t)				
+						self.t = self.lexer.token()
+						return
+				self.buffer.append(self.t)	
+				self.perl_line = self.t.lineno			
+				self.t = self.lexer.token()
+
+	# Crea un parentesis en la posicion de un token
+	def paren_token(self, type, token):
+		t = LexToken()
+		t.lineno = token.lineno
+		t.lexpos = token.lexpos
+		t.type = type
+		t.value = '(' if type == 'LPAREN' else ')'
+		return t
 
-	# Emular unos parentesis despues de las funciones
-	def emulate_parens(self):
+	# Emular unos parentesis despues de las funciones, retorna la sentencia con los parentesis
+	def emulate_parens(self, buffer):
 		stack = []  # Pila de argumentos
 		last = None  # Ultimo token leido
-		next = None  # Siguiente token a leer
-		index = 0  # Posicion dentro del buffer
+		statement = []  # Sentencia con los parentesis añadidos
 		# Buscamos en todo el buffer
-		while index < len(self.buffer):
-			token = self.buffer[index]  # Cogemos el token actual
-			if len(self.buffer) != index + 1:
-				next = self.buffer[index + 1]  # Si hay siguiente lo cogemos
+		for index, token in enumerate(buffer):
+			next = buffer[index + 1] if index + 1 < len(buffer) else None  # Si hay siguiente lo cogemos
 			# Si encontramos una llamada a una funcion definida en el codigo y esta no esta precedida de parentesis
 			if (((token.type == 'ID' and token.value in self.parser.functions) or token.type in Ftn.perlArgs) 
 			and (not last or last.type != 'SUB') 	and next and next.type != 'LPAREN' and next.type != 'TWO_COLON'):
+				paren = True
 				# Guardamos en la pila el numero de argumentos
 				if token.type == 'ID':
 					# Si pertenece a un paquete
-					if index - 2 > -1 and last.type == 'TWO_COLON' and self.buffer[index - 2].type == 'ID':
+					if len(statement) > 1 and last.type == 'TWO_COLON' and statement[-2].type == 'ID':
 						# Token del paquete
-						last2 = self.buffer[index - 2]
+						last2 = statement[-2]
 						# Si el paquete existe y contiene la funcion
 						if last2.value in Var.packages and token.value in Var.packages[last2.value].functions:
 							stack.append(len(Var.packages[last2.value].functions[token.value].args))
 						else:
-							continue
-					stack.append(len(self.parser.functions[token.value].args))
+							paren = False
+					if paren:
+						stack.append(len(self.parser.functions[token.value].args))
 				else:
 					stack.append(Ftn.perlArgs[token.type])
-				# Creamos el token del parentesis
-				t = LexToken()
-				t.lineno = token.lineno
-				t.lexpos = token.lexpos
-				t.type = 'LPAREN'
-				t.value = '('
-				# Lo añadimos
-				self.buffer.insert(index + 1, t)
-				# Para que no analice el parentesis
-				index += 1
+				statement.append(token)
+				# Añadimos el parentesis despues de la funcion
+				if paren:
+					statement.append(self.paren_token('LPAREN', token))
 			# Si estamos dentro de una lista, las comas no cuentan y lo marcamos con una bandera
 			elif token.type in ('LBRACKET', 'LBRACE', 'LPAREN'):
 				stack.append(token.type)
+				statement.append(token)
 			# Si la lista termino quitamos la bandera de la pila				
 			elif (stack and ((token.type == 'RBRACKET' and stack[-1] == 'LBRACKET') or 
 			(token.type == 'RBRACE'  and stack[-1] == 'LBRACE') or 
 			(token.type == 'RPAREN'  and stack[-1] == 'LPAREN'))):
 				stack.pop()
+				statement.append(token)
 			# Si encontramos una compa fuera de una lista
 			elif token.type == 'COMMA' and stack and stack[-1] not in ('LBRACKET', 'LBRACE', 'LPAREN'):
 				if stack[-1] > 0:  # Funcion sin argumentos
 					stack[-1] -= 1  # Quitamos un argumento a la funcion actual
 				if stack[-1] == 0:  # Si no quedan arugmentos
 					stack.pop()  # Quitamos la funcion de la pila
-					# Creamos el token del parentesis
-					t = LexToken()
-					t.lineno = token.lineno
-					t.lexpos = token.lexpos
-					t.type = 'RPAREN'
-					t.value = ')'
-					# insertamos en el buffer
-					self.buffer.insert(index, t)
-					# Para que no analice el parentesis
-					index += 1
+					# Cerramos el parentesis antes de la coma
+					statement.append(self.paren_token('RPAREN', token))
+				statement.append(token)
 			# Al llegar a un ;
 			elif token.type == 'SEMI':
 				for f in stack:  # Por cada funcion
 					if f not in ('LBRACKET', 'LBRACE', 'LPAREN'):  # Que no sea bandera
 						# Cerramos todos los parentesis
-						t = LexToken()
-						t.lineno = token.lineno
-						t.lexpos = token.lexpos
-						t.type = 'RPAREN'
-						t.value = ')'
-						self.buffer.insert(index, t)
+						statement.append(self.paren_token('RPAREN', token))
 				stack = []  # limpiamos la pila
+				statement.append(token)
+			else:
+				statement.append(token)
 			last = token  # ponemos el anterior
-			next = None  # limpiamos siguiente
-			index += 1  # siguiente posicion
+		return statement
 				
 	
@@ -26,6 +26,7 @@ class Messages:
 	not_fatal = {
 	'VAR_FOR_TYPED',
 	'LABEL_UNKNOWN_IGNORE',
+	'HD_COMBINER_AUTO',
 	}
 	
 	# Definicion de los idiomas
@@ -37,10 +38,36 @@ class Messages:
 	'HELP_OUT':'Carpeta donde se guardará los ficheros generados, por defecto es el directorio actual.', 	
 	'HELP_COMMENTS':'Los comentarios dentro del código Perl, se mantendrán en el código java.', 	
 	'HELP_EMULATE_PAREN':'Añade automáticamente los paréntesis a las funciones, si el código es sintácticamente correcto, debería hacerlo correctamente.', 	
-	'HELP_OPTIMIZE_CODE':'Mejora el código de salida haciéndolo más visible y eliminado redundancias dando lugar a un mayor rendimiento.', 	
+	'HELP_OPTIMIZE_CODE':'Mejora el código de salida haciéndolo más visible y eliminado redundancias dando lugar a un mayor rendimiento. Calcula al traducir las expresiones constantes y elimina las ramas if/unless que nunca se ejecutan.', 	
+	'HELP_INDEX_LOOPS':'Recorre con un índice int los foreach sobre arrays y listas de tipos básicos en lugar de usar un iterador. Los elementos siguen siendo objetos porque pueden ser null.', 	
+	'HELP_UNBOXED':'Declara con tipos primitivos (int, long, float, double, boolean) los escalares locales que nunca pueden ser null.', 	
+	'HELP_COMBINER':'Genera una clase Combiner con la reduccion de los reducer cuya salida tiene los mismos tipos que su entrada. La reducción debe ser asociativa y conmutativa, como una suma o un máximo, porque hadoop puede aplicarla varias veces sobre resultados parciales.', 	
+	'HELP_DRIVER':'Genera una clase Tool con este nombre que lanza el trabajo del mapper, combiner y reducer traducidos, con las clases de sus claves y valores.', 	
+	'HELP_REDUCERS':'Número de reducers del trabajo en el driver, se puede cambiar al lanzarlo con -D mapreduce.job.reduces.', 	
+	'HELP_COMPRESS':'Comprime en el driver la salida de los mappers y la final con este codec, se puede cambiar al lanzarlo con -D.', 	
 	'HELP_UNRECHEABLE_CODE':'Comprueba la existencia de código muerto, si existe, el código resultante no podrá ser copilado.', 	
 	'HELP_JREGEX':'Utiliza las librerías java Jregex y Jtr para evaluar las expresiones regulares en lugar de invocar a perl. (Más rápido pero puede no funcionar en todos los casos)', 
 	'HELP_ERROR_ABORT':'Para el análisis en caso de encontrar un error.', 	
+	'HELP_JOBS':'Número de ficheros traducidos en paralelo, los paquetes se traducen antes que los ficheros que los usan.', 	
+	'HELP_INCREMENTAL':'Solo traduce los ficheros modificados y los que usan paquetes cuyas variables o funciones han cambiado desde la última traducción incremental.', 	
+	'HELP_SERVE':'Inicia un demonio que mantiene el traductor cargado y atiende las traducciones a través de un socket unix.', 	
+	'HELP_DAEMON':'Envía las traducciones al demonio si hay uno escuchando en el socket, si no se traducen localmente.', 	
+	'HELP_SOCKET':'Socket unix del demonio, por defecto en $XDG_RUNTIME_DIR o en un directorio del usuario dentro del directorio temporal.', 	
+	'HELP_NO_CACHE':'No usa la caché de traducciones, todos los ficheros se vuelven a analizar.', 	
+	'HELP_CACHE_DIR':'Directorio de la caché de traducciones, por defecto ~/.cache/perldoop.', 	
+	'HELP_CACHE_SIZE':'Tamaño máximo de la caché de traducciones en MB, se borran primero las entradas usadas hace más tiempo.', 	
+	'HELP_BENCH':'Medidas de rendimiento del traductor.', 	
+	'HELP_BENCH_LEX':'Mide el analizador léxico sin el sintáctico: tokens/s, bytes/s y tiempo de PLY, token_buffer y emulate_parens.', 	
+	'HELP_BENCH_MEM':'Mide la memoria de la traducción: pico de memoria reservada, instancias creadas de Code, Position, Type, Declare, Access y Variable y memoria residente máxima.', 	
+	'HELP_BENCH_CORPUS':'Ficheros Perl o directorios con ficheros Perl a medir.', 	
+	'HELP_BENCH_SCALE':'Repite el contenido de cada fichero n veces para crear entradas más grandes.', 	
+	'HELP_BENCH_REPEAT':'Número de repeticiones de cada medida, se usa la más rápida.', 	
+	'HELP_BENCH_JSON':'Guarda el resultado en un fichero JSON.', 	
+	'HELP_PROFILER':'Opciones para medir el tiempo de la traducción.', 	
+	'HELP_PROFILE':'Traduce los ficheros en serie midiendo cada fase, regla y clase auxiliar, muestra un informe y lo guarda en un fichero JSON.', 	
+	'HELP_PROFILE_SORT':'Orden de las tablas del informe: tiempo propio, tiempo total o número de llamadas.', 	
+	'HELP_RULE_STATS':'Traduce los ficheros en serie contando las reducciones y el tiempo de cada producción de la gramática, y muestra las n más costosas.', 	
+	'HELP_SPEEDSCOPE':'Guarda también las llamadas medidas en formato speedscope.', 	
 	'HELP_DEBUGGER':'Opciones para la depuración del análisis.', 	
 	'HELP_DEBUGGER_LEXER':'Activa la impresión de tokens para el analizador léxico.', 	
 	'HELP_DEBUGGER_PARSER':'Activa la impresión de reglas para el analizador sintáctico.', 	
@@ -52,6 +79,13 @@ class Messages:
 	'FILE_NOT_ACCESS':'No se ha podido acceder al fiero %file.',
 	'OUT_NOT_FOUND':'El directorio de salida no existe.',
 	'OUT_NOT_ACCESS':'No tienes permiso de escritura en el directorio de salida.', 		
+	'FILES_REQUIRED':'Se debe indicar al menos un fichero Perl.',
+	'SERVE_RUNNING':'Ya hay un demonio escuchando en %socket.',
+	'SOCKET_INSECURE':'El socket %socket o su directorio no pertenecen al usuario o pueden usarlo otros usuarios.',
+	'SERVE_CLASS':'El demonio ha devuelto un nombre de clase no válido: %name.',
+	'DRIVER_MAPPER':'El driver %driver necesita traducir un mapper.',
+	'DRIVER_MANY':'El driver %driver solo admite un %type y se han traducido: %classes.',
+	'DRIVER_TYPES':'La clave y el valor de salida del mapper %mapper no son del tipo de la entrada del reducer %reducer.',
 	# Errores Generales
 	'ERROR':'Error',
 	'WARNING':'Aviso',
@@ -118,7 +152,9 @@ class Messages:
 	'HD_PRINT':'El print de Hadoop debe constar de 4 argumentos (key,separador1,valor,separador2).',
 	'HD_REDUCER_KEY':'No se ha encontrado la variable key para el reducer.',
 	'HD_REDUCER_VALUE':'No se ha encontrado la variable value para el reducer.',
-	'HD_REDUCER_INCOMPLETE':'No se han especificado todos los bloques del reducer.'
+	'HD_REDUCER_INCOMPLETE':'No se han especificado todos los bloques del reducer.',
+	'HD_COMBINER_TYPES':'El combiner requiere que la clave y el valor de salida del reducer sean del mismo tipo que los de entrada.',
+	'HD_COMBINER_AUTO':'Se ha generado un combiner para el reducer %reducer, su reducción debe ser asociativa y conmutativa, si no lo es use la etiqueta <combiner> solo en los reducer que lo sean.'
 	}
 	
 	english = {}
@@ -183,16 +219,11 @@ class Messages:
 		if pos and pos.lexpos:
 			# TamaÃ±o maximo a ambos lados del error
 			TAM = 40
-			# Codigo de ambos lados
-			lcode = parser.lexer.input[pos.lexpos - TAM:pos.lexpos]
-			rcode = parser.lexer.input[pos.lexpos:pos.lexpos + TAM]
-			# Si hay fin de linea, cortamos por ahÃ­
-			init = lcode.rfind("\n") + 1
-			end = rcode.find("\n")
-			if end == -1: end = TAM * 2
-			# Cogemos el codigo sin saltos de linea
-			lcode = lcode[init:]
-			rcode = rcode[:end]
+			# Limites de la linea del error
+			init, end = parser.lexer.line_span(pos.lexpos)
+			# Codigo de ambos lados sin salir de la linea
+			lcode = parser.lexer.input[max(init, pos.lexpos - TAM):pos.lexpos]
+			rcode = parser.lexer.input[pos.lexpos:min(end, pos.lexpos + TAM)]
 			# Identamos y mostramos el error
 			print (" "*8 + lcode + rcode)
 			# Identamos y mostramos la marca de posicion
@@ -19,6 +19,7 @@
 
 from libs import Auxiliary as Aux
 from libs import Casting as Cst
+from libs import Folding as Fold
 from libs import DataType as Dtp
 from libs import Messages as Msg
 from libs import Variables as Var
@@ -35,6 +36,8 @@ class Operations:
         # Comprobamos las expresiones
         Aux.check_code(parser, exp1)
         Aux.check_code(parser, exp2)
+        # Constantes de los operandos antes de convertirlos
+        a, b = Fold.value(exp1), Fold.value(exp2)
         # Componemos transformando los operandos si hace falta
         code.value = Cst.to_number(exp1) + ' ' + op + ' ' + Cst.to_number(exp2)
         # Calculamos el tipo, cogiendo el mas amplio
@@ -42,6 +45,10 @@ class Operations:
             code.type = exp1.type
         else:
             code.type = exp2.type    
+        # Si los operandos son constantes se calcula al traducir
+        Fold.fold(code, Fold.arithmetic, op, a, b)
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -50,6 +57,8 @@ class Operations:
         # Comprobamos las expresiones
         Aux.check_code(parser, exp1)
         Aux.check_code(parser, exp2)
+        # Constantes de los operandos antes de convertirlos
+        a, b = Fold.value(exp1), Fold.value(exp2)
         # Transformamos los operando en numeros
         Cst.to_number(exp1)
         Cst.to_number(exp2)     
@@ -65,6 +74,10 @@ class Operations:
             exp2.value = "(float)" + exp2.value    
         # #Componemos la operacion
         code.value = exp1.value + ' / ' + exp2.value 
+        # Si los operandos son constantes se calcula al traducir
+        Fold.fold(code, Fold.divide, a, b)
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
         
     @classmethod    
@@ -73,9 +86,15 @@ class Operations:
         # Comprobamos las expresiones
         Aux.check_code(parser, exp1)
         Aux.check_code(parser, exp2)
+        # Constantes de los operandos antes de convertirlos
+        a, b = Fold.value(exp1), Fold.value(exp2)
         # La operacion en java es de tipo double
         code.type = [Dtp.DOUBLE]
         code.value = 'Math.pow(' + Cst.to_number(exp1) + ',' + Cst.to_number(exp2) + ')'
+        # Si los operandos son constantes se calcula al traducir
+        Fold.fold(code, Fold.pow, a, b)
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -84,6 +103,8 @@ class Operations:
         # Comprobamos las expresiones
         Aux.check_code(parser, exp1)
         Aux.check_code(parser, exp2)
+        # Constantes de los operandos antes de convertirlos
+        a, b = Fold.value(exp1), Fold.value(exp2)
         # Transformamos los operando en numeros
         Cst.to_number(exp1)
         Cst.to_number(exp2)
@@ -98,6 +119,10 @@ class Operations:
         code.type = exp1.type 
         # Componemos la operacion
         code.value = exp1.value + ' % ' + exp2.value    
+        # Si los operandos son constantes se calcula al traducir
+        Fold.fold(code, Fold.mod, a, b)
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -106,12 +131,16 @@ class Operations:
         # Comprobamos las expresiones
         Aux.check_code(parser, exp1)
         Aux.check_code(parser, exp2)
+        # Constantes de los operandos antes de convertirlos
+        a, b = Fold.value(exp1), Fold.value(exp2)
         # Comprobamos si se aplica sobre un string
         if exp1.type[0] != Dtp.STRING:
             Msg.error(parser, 'NOT_STRING_CONCAT', exp1.pos)
         # Perl ya obliga a que el primer operador sea string y el resto al igual que en java no importa
         code.type = [Dtp.STRING]
         code.value = exp1.value + ' + ' + exp2.value
+        # Si los operandos son constantes se calcula al traducir
+        Fold.fold(code, Fold.concat, a, b)
         return code
     
     @classmethod
@@ -120,17 +149,27 @@ class Operations:
         # Comprobamos las expresiones
         Aux.check_code(parser, exp1)
         Aux.check_code(parser, exp2)
+        # Constantes de los operandos antes de convertirlos
+        a, b = Fold.value(exp1), Fold.value(exp2)
         code.type = [Dtp.STRING] 
         # Se repite una cadena un numero entero de veces
         code.value = 'Pd.repeat(' + Cst.to_string(exp1) + ', ' + Cst.to_integer(exp2) + ')'
+        # Si los operandos son constantes se calcula al traducir
+        Fold.fold(code, Fold.repeat, a, b)
         return code 
     
     @classmethod
     def op_opposite(Ops, parser, exp):
         # Comprobamos la expresion
         Aux.check_code(parser, exp)
+        # Constante del operando antes de convertirlo
+        a = Fold.value(exp)
         # Convertimos la expresion a numero y la negamos
         exp.value = "-" + Cst.to_number(exp) 
+        # Si el operando es constante se calcula al traducir
+        Fold.fold(exp, Fold.opposite, a)
+        # El resultado de una operacion nunca es null
+        exp.not_null = True
         return exp 
     
     @classmethod    
@@ -166,6 +205,8 @@ class Operations:
             code.type = code_type.type
         # La operacion es una sentencia
         code.st_value = code.value
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -201,6 +242,8 @@ class Operations:
             code.type = code_type.type
         # La operacion es una sentencia
         code.st_value = code.value
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -229,6 +272,8 @@ class Operations:
             # Aunque la variable incremente, muestra el valor anterior
             # Comvertimos en numero y restamos 1
             code.value = Cst.to_double(code) + ' - 1' 
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -258,6 +303,8 @@ class Operations:
             # Comvertimos en numero y restamos 1
             code.value = Cst.to_double(code) + ' + 1'
             code.type = [Dtp.DOUBLE]    
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -266,11 +313,17 @@ class Operations:
         # Comprobamos las expresiones
         Aux.check_code(parser, num1)
         Aux.check_code(parser, num2)
+        # Constantes de los operandos antes de convertirlos
+        a, b = Fold.value(num1), Fold.value(num2)
         # Transformamos los operando en numeros y componemos la expresion
         code.value = Cst.to_number(num1) + ' ' + op + ' ' + Cst.to_number(num2)
         code.value_opt = code.value
         # La funcion es Booleana
         code.type = [Dtp.BOOLEAN]
+        # Si los operandos son constantes se calcula al traducir
+        Fold.fold(code, Fold.num_compare, op, a, b)
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -279,10 +332,16 @@ class Operations:
         # Comprobamos las expresiones
         Aux.check_code(parser, num1)
         Aux.check_code(parser, num2)
+        # Constantes de los operandos antes de convertirlos
+        a, b = Fold.value(num1), Fold.value(num2)
         # Transformamos los operando en numeros y componemos la expresion
         code.value = 'Pd.cmp(' + Cst.to_number(num1) + ', ' + Cst.to_number(num2) + ')'
         # La funcion es Entera
         code.type = [Dtp.INTEGER]
+        # Si los operandos son constantes se calcula al traducir
+        Fold.fold(code, Fold.cmp_num, a, b)
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -297,10 +356,16 @@ class Operations:
         # Comprobamos las expresiones
         Aux.check_code(parser, str1)
         Aux.check_code(parser, str2)   
+        # Constantes de los operandos antes de convertirlos
+        a, b = Fold.value(str1), Fold.value(str2)
         # Componemos la expresion 
         code.value = 'Pd.cmp(' + Cst.to_string(str1) + ', ' + Cst.to_string(str2) + ')' + compare
         code.value_opt = code.value
         code.type = [Dtp.BOOLEAN]
+        # Si los operandos son constantes se calcula al traducir
+        Fold.fold(code, Fold.string_compare, compare, a, b)
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -385,6 +450,8 @@ class Operations:
         # Componemos la operacion
         code.value = Cst.to_floor(exp1) + ' ' + op + ' ' + Cst.to_floor(exp2)
         code.type = exp1.type
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code
     
     @classmethod
@@ -393,6 +460,8 @@ class Operations:
         Aux.check_code(parser, exp)
         # Componemos la operacion
         exp.value = '~' + Cst.to_floor(exp)
+        # El resultado de una operacion nunca es null
+        exp.not_null = True
         return exp
     
     @classmethod
@@ -447,6 +516,8 @@ class Operations:
     def logic_not(Ops, parser, exp, low=False):
         # Comprobamos la expresion
         Aux.check_code(parser, exp)
+        # Constante del operando antes de convertirlo
+        a = Fold.value(exp)
         # Si el operador es de baja precedencia, a�adimos parentesis a sus expresiones  
         if low:    
             b_value = '!(' + Cst.to_boolean(exp) + ')'
@@ -462,6 +533,10 @@ class Operations:
             exp.value = '(' + Cst.to_boolean(exp) + ')?0:1'
             exp.value_opt = b_value 
             exp.type = [Dtp.INTEGER]
+        # Si el operando es constante se calcula al traducir
+        Fold.fold(exp, Fold.logic_not, a)
+        # El resultado de una operacion nunca es null
+        exp.not_null = True
         return exp    
     
     @classmethod
@@ -478,6 +553,8 @@ class Operations:
         code.type = [Dtp.INTEGER]
         if exp1.st_value or exp2.st_value:
             code.st_value = code.value
+        # El resultado de una operacion nunca es null
+        code.not_null = True
         return code   
     
     @classmethod
@@ -496,6 +573,8 @@ class Operations:
             code.value += Cst.to_type(parser, exp1, exp2)
         # El tipo es el del primer operador
         code.type = exp1.type
+        # Solo es primitivo si lo son ambas ramas
+        code.not_null = exp1.not_null and exp2.not_null
         return code
     
     @classmethod
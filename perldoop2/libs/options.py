@@ -19,6 +19,8 @@
 
 from libs import Variables as Var
 from libs import Messages as Msg
+from libs import Fragments
+from libs import ScopeTable
 
 Msg.LANGUAGE = 'spanish'
 
@@ -35,6 +37,9 @@ class Options():
         self.optimize_code = False  # Optimiza el acceso de algunas sentencias
         self.jregex = False #Evaluar expresiones regualres con libreria jregex
         self.unreachable_code = False  # Comprueba la existencia de codigo inalcanzable
+        self.index_loops = False  # Los foreach sobre colecciones de tipos basicos usan indices primitivos
+        self.unboxed = False  # Los escalares locales que nunca son null se declaran con tipos primitivos
+        self.combiner = False  # Genera el combiner de los reducer cuya salida tiene los tipos de la entrada
         self.error_abort = False  # Indica si en caso de error para el analisis
         
         # Opciones depuracion
@@ -46,19 +51,21 @@ class Options():
 
         # Atributos del analisis
         self.declare_types = {}  # Tipos declarados en las etiquetas
-        self.variables = Var.global_vars(self)  # Variables del codigo por niveles
-        self.assigns = [{}]  # Variables inicializadas
+        self.variables = ScopeTable(Var.global_vars(self))  # Variables del codigo por niveles
+        self.assigns = ScopeTable([{}])  # Variables inicializadas
         self.reserved_var = {}  # Variables reservadas dinamicamente
+        self.temp_vars = {}  # Siguiente numero de las variables reservadas de cada prefijo
+        self.unboxed_vars = []  # Variables candidatas a tipo primitivo en modo unboxed
         self.imports = {}  # Imports necesarios para java
         self.labels_line = {}  # Etiquetas de la linea
         
         self.functions = {}  # Cabeceras de las funciones declaradas
         self.function_head = None  # Cabecera de la funcion actual
         
-        self.package_code = ''  # Codigo fuera de la clase que pertenece al paquete           
-        self.global_code = ''  # Codigo fuera de funciones es agrupado todo junto
-        self.functions_code = ''  # Codigo de las funciones
-        self.atributes = ''  # Declaracion de variables globales
+        self.package_code = Fragments()  # Codigo fuera de la clase que pertenece al paquete           
+        self.global_code = Fragments()  # Codigo fuera de funciones es agrupado todo junto
+        self.functions_code = Fragments()  # Codigo de las funciones
+        self.atributes = Fragments()  # Declaracion de variables globales
         
         self.code_error = False  # Indica si el codigo contiene errores
         self.init_var = True  # Indica si las variables son inicializadas al igualar
@@ -17,6 +17,7 @@
 #You should have received a copy of the GNU General Public License
 #along with Perldoop.  If not, see <http://www.gnu.org/licenses/>.
 
+import copy
 import libs.ply.yacc as yacc
 from libs import Messages as Msg
 from libs import DataType as Dtp
@@ -24,9 +25,12 @@ from libs import Auxiliary as Aux
 from libs import Statements as Sts  
 from libs import Collection as Coll
 from libs import Operations as Ops
+from libs import Folding as Fold
 from libs import Blocks as Bks
 from libs import Functions
 from libs import Lexer
+from libs import Profiler
+from libs import RuleStats
 from libs import Options
 from libs import Hadoop
 from libs import Code
@@ -34,22 +38,46 @@ from libs import Position
 from libs import Type
 from libs import Declare
 from libs import Access
+from libs import Node
 
 class Parser(Options, Functions, Hadoop):
+	
+	tables = None  # Automata LALR compartido por todos los analizadores del proceso
 
 	def __init__(self):
 		# Inicializamos los atributos padres
 		super(). __init__()
 		# Declaraciones del analizador
 		self.__package__ = 'libs'  # Indica que la clase esta dentro del paquete
-		self.parser = yacc.yacc(module=self, start='file')  # Declara en analizador
+		# La gramatica y las tablas solo se validan y cargan la primera vez
+		if Parser.tables is None:
+			Parser.tables = yacc.yacc(module=self, start='file')
+		self.parser = self.bind_tables(Parser.tables)  # Declara en analizador
 
+	# Copia el automata compartido enlazando las reglas con este analizador
+	def bind_tables(self, tables):
+		parser = copy.copy(tables)
+		parser.productions = []
+		for production in tables.productions:
+			production = copy.copy(production)
+			if production.func:
+				production.callable = getattr(self, production.func)
+			parser.productions.append(production)
+		parser.errorfunc = self.p_error
+		return parser
 		
 	def parse(self, text):
 		self.lexer = Lexer()
 		self.lexer.debug_mode = self.lexer_debug
 		self.lexer.parser = self
-		return self.parser.parse(input=text, lexer=self.lexer, debug=Aux.debugger(self))
+		# Con el perfilador activo se mide el analizador lexico y cada regla
+		if Profiler.active:
+			Profiler.active.instrument(self)
+		# Contadores ligeros de reducciones
+		if RuleStats.active:
+			RuleStats.active.instrument(self)
+		with Profiler.phase('parse'):
+			return self.parser.parse(input=text, lexer=self.lexer, debug=Aux.debugger(self))
 		
 	def p_error(self, p):
 		if p:
@@ -105,8 +133,8 @@ class Parser(Options, Functions, Hadoop):
 	def p_code(self, p):
 		'code : statements function'
 		Bks.check_st(self, p[1])
-		self.functions_code = p[2] + self.functions_code
-		self.global_code = p[1].value + self.global_code
+		self.functions_code.prepend(p[2])
+		self.global_code.prepend(p[1].value)
 		
 	### function ###	
 	def p_function_empty(self, p):
@@ -222,7 +250,7 @@ class Parser(Options, Functions, Hadoop):
 		
 	def p_statement_java_import(self, p):
 		'statement_type : JAVA_IMPORT'
-		self.package_code += p[1]
+		self.package_code.append(p[1])
 		p[0] = Code()
 						
 	def p_statement_error(self, p):
@@ -233,12 +261,12 @@ class Parser(Options, Functions, Hadoop):
 	def p_special_statement_break(self, p):
 		'special_statement : LAST'
 		p[0] = Code(value='break')
-		p[0].flags[Dtp.LAST] = True
+		p[0].set_flag(Dtp.LAST)
 			
 	def p_special_statement_next(self, p):
 		'special_statement : NEXT'
 		p[0] = Code(value='continue')
-		p[0].flags[Dtp.NEXT] = True
+		p[0].set_flag(Dtp.NEXT)
 		
 	def p_special_statement_return_paren(self, p):
 		'special_statement : RETURN LPAREN list RPAREN' 
@@ -462,11 +490,18 @@ class Parser(Options, Functions, Hadoop):
 	### Expression###			
 	def p_expression_paren(self, p):
 		'expression : LPAREN expression RPAREN'
+		const = Fold.value(p[2])
+		node = Aux.root(p[2])
+		inner = p[2].value
 		p[0] = p[2]
 		p[0].pos = Position(p, 3)
-		p[0].value = p[1] + p[2].value + p[3]		
+		p[0].value = p[1] + inner + p[3]		
+		Aux.set_node(self, p[0], Node.PAREN, inner=inner, child=node)
 		if p[0].value_opt:
 			p[0].value_opt = p[1] + p[0].value_opt + p[3];
+		# Los parentesis no cambian el valor constante
+		if const is not None:
+			p[0].const = (p[0].value, const)
 				
 	def p_expression_assignment(self, p):
 		'expression : assignment'
@@ -842,7 +877,7 @@ class Parser(Options, Functions, Hadoop):
 	def p_var_access(self, p):
 		'var_access : variable'		
 		p[0] = Access(p[1])
-		p[1].flags[Dtp.VARIABLE] = True
+		p[1].set_flag(Dtp.VARIABLE)
 		
 	def p_var_array(self, p):
 		'var_access : LBRACKET list RBRACKET'
@@ -957,19 +992,19 @@ class Parser(Options, Functions, Hadoop):
 	### Value ###		
 	def p_value_int(self, p):
 		'value : INT_NUMBER'
-		p[0] = Code(value=p[1], type=[Dtp.INTEGER], pos=Position(p, 1))
+		p[0] = Fold.literal(self, Code(value=p[1], type=[Dtp.INTEGER], pos=Position(p, 1), not_null=True))
 		
 	def p_value_float(self, p):	
 		'value : FLOAT_NUMBER'
-		p[0] = Code(value=p[1], type=[Dtp.DOUBLE], pos=Position(p, 1))
+		p[0] = Fold.literal(self, Code(value=p[1], type=[Dtp.DOUBLE], pos=Position(p, 1), not_null=True))
 		
 	def p_value_string_quote(self, p):	
 		'value : STRING_QUOTE'
-		p[0] = Code(value='"' + Aux.fixScapes(Aux.scapeChar(p[1],['"'])) + '"', type=[Dtp.STRING], pos=Position(p, 1))
+		p[0] = Fold.literal(self, Code(value='"' + Aux.fixScapes(Aux.scapeChar(p[1],['"'])) + '"', type=[Dtp.STRING], pos=Position(p, 1)))
 		
 	def p_value_string_double_quote(self, p):	
 		'value : STRING_DOUBLE_QUOTE'
-		p[0] = Code(value='"' + Aux.interpolateVar(self, Aux.fixScapes(p[1])) + '"', type=[Dtp.STRING], pos=Position(p, 1))
+		p[0] = Fold.literal(self, Code(value='"' + Aux.interpolateVar(self, Aux.fixScapes(p[1])) + '"', type=[Dtp.STRING], pos=Position(p, 1)))
 		
 	def p_value_cmd(self, p):	
 		'value : CMD'
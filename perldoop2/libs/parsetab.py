@@ -5,9 +5,9 @@ _tabversion = '3.8'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'FC7895058179AE27645BBA859E8D0085'
+_lr_signature = '5339652B3D0D71419AA3B17972641BF6'
     
-_lr_action_items = {'POINTED':([102,111,116,192,193,194,201,202,222,301,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,488,520,524,546,548,549,552,581,588,589,609,],[-262,237,-241,-254,-258,-255,-253,-257,237,237,-252,-256,-243,237,-261,237,-260,-267,-268,-266,-242,-265,-264,-263,237,-259,237,-251,-250,-245,237,-246,-249,-244,-248,-247,237,]),'FLOAT_NUMBER':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,62,62,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-35,-44,-87,-88,-48,-92,-69,-72,-92,62,62,-35,-35,-93,-35,62,-57,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-69,-49,-35,-47,-35,62,62,-69,-69,-35,-111,-69,62,62,62,62,62,62,62,62,62,-67,-67,-22,-50,-69,-69,62,-100,-69,-35,-35,-112,-17,62,62,62,62,62,-43,-67,-67,-37,-9,-30,62,-35,-26,-69,-69,62,-35,62,62,-42,-34,-69,-35,-114,-69,-35,62,-109,-35,62,62,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'LBRACE':([0,2,4,5,8,9,12,16,19,21,22,23,24,25,26,27,30,32,34,35,36,38,44,45,46,47,48,49,50,51,59,60,63,65,67,68,71,73,74,75,76,77,79,80,81,82,83,84,85,87,89,90,91,94,95,98,99,100,101,102,105,107,108,109,111,112,116,117,118,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,157,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,192,193,194,197,199,201,202,204,205,206,208,209,211,217,219,221,222,224,226,228,229,231,232,235,237,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,304,305,306,308,309,313,314,315,317,318,320,323,325,328,329,330,331,341,343,344,345,347,349,350,352,354,359,364,368,369,370,373,376,377,384,386,387,388,396,399,401,402,408,410,427,428,429,469,470,478,481,482,484,485,486,487,488,490,492,493,496,498,499,500,502,503,504,513,520,524,525,529,546,548,549,551,552,556,557,558,559,560,562,563,565,567,568,569,570,573,574,575,576,577,581,582,583,588,589,592,594,595,597,598,600,601,604,605,607,609,613,614,615,616,617,618,619,620,621,622,627,629,632,633,634,635,636,639,640,643,644,645,646,647,648,649,],[-35,4,-92,-67,-1,-85,-59,-70,63,63,-36,-58,-86,-35,-55,133,-73,142,-35,-56,-68,147,-3,155,-45,156,-92,158,-111,161,-71,-60,63,63,63,-97,63,63,63,63,63,63,189,63,63,63,199,63,204,63,63,63,63,63,63,63,63,63,63,-262,63,63,63,63,245,63,-241,63,302,63,63,63,63,-35,-44,-87,-88,-48,-92,4,-72,-92,63,63,-35,-35,345,-93,-35,63,-57,63,63,63,63,63,63,63,63,63,63,63,63,63,245,-258,245,63,63,245,-257,63,63,63,63,63,63,63,63,63,245,63,63,63,63,63,63,63,401,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,245,63,245,-256,63,63,63,63,63,63,63,63,4,-49,-35,-47,-35,63,63,63,4,4,-35,500,-111,4,-2,-243,63,63,63,245,-261,63,245,-260,63,-267,-268,-266,63,-242,63,63,63,63,-265,-264,-263,245,-259,-67,-67,-22,-50,4,-20,4,245,63,-108,568,-100,4,-35,-35,-112,-17,577,63,-251,-250,63,63,-245,245,-246,63,-249,63,-43,-67,-67,-37,-9,-30,-91,63,-35,-91,-4,-26,4,4,63,-35,-244,63,63,-248,-247,63,-42,-34,614,-107,4,617,-35,-114,4,245,-10,-35,63,-109,-35,63,63,4,-91,-110,4,4,-46,639,-95,-91,-94,-35,644,4,-35,-96,-98,-115,4,-99,]),'STR_NE':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,275,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,275,-54,-253,-257,-220,-41,-6,-126,275,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,275,275,275,-243,275,-143,-261,275,-130,-143,-260,275,275,-267,-268,-266,-238,-242,275,275,275,275,-151,-152,275,275,275,275,275,275,275,275,275,275,275,275,275,275,-232,-265,-264,-263,275,None,275,-206,275,-204,-216,-217,-211,-182,-196,-187,None,-178,275,275,None,-205,None,275,-210,-179,275,None,275,275,-223,-181,-195,-200,-197,-180,None,None,-183,-207,-192,-222,-143,-259,275,275,275,275,275,275,275,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,275,-251,275,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,275,275,-245,-150,-246,-233,-249,-121,-199,-38,275,-21,-14,-244,-103,-12,-237,-248,-247,-153,275,275,275,-65,-15,-102,-13,275,275,]),'CLOSE':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,95,95,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-35,-44,-87,-88,-48,-92,-69,-72,-92,95,95,-35,-35,-93,-35,95,-57,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-69,-49,-35,-47,-35,95,95,-69,-69,-35,-111,-69,95,95,95,95,95,95,95,95,95,-67,-67,-22,-50,-69,-69,95,-100,-69,-35,-35,-112,-17,95,95,95,95,95,-43,-67,-67,-37,-9,-30,95,-35,-26,-69,-69,95,-35,95,95,-42,-34,-69,-35,-114,-69,-35,95,-109,-35,95,95,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'EXISTS':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,65,65,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-35,-44,-87,-88,-48,-92,-69,-72,-92,65,65,-35,-35,-93,-35,65,-57,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-69,-49,-35,-47,-35,65,65,-69,-69,-35,-111,-69,65,65,65,65,65,65,65,65,65,-67,-67,-22,-50,-69,-69,65,-100,-69,-35,-35,-112,-17,65,65,65,65,65,-43,-67,-67,-37,-9,-30,65,-35,-26,-69,-69,65,-35,65,65,-42,-34,-69,-35,-114,-69,-35,65,-109,-35,65,65,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'NEXT':([0,2,4,5,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,18,-92,-67,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,18,-92,-35,-35,-93,-35,-57,18,-49,-35,-47,-35,18,18,-35,-111,18,-67,-67,-22,-50,18,18,-100,18,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,18,18,-35,-42,-34,18,-35,-114,18,-35,-109,-35,18,-110,18,18,-46,-95,-94,-35,18,-35,-96,-98,-115,18,-99,]),'SUB':([0,2,5,12,22,23,25,26,29,33,35,36,46,50,60,134,135,140,143,144,160,167,321,323,326,328,349,478,481,482,484,496,502,503,557,558,559,560,561,562,563,573,594,595,605,616,622,632,634,636,645,646,647,649,],[-35,-24,-67,-59,-36,-58,-35,-55,-31,-27,-56,-68,-45,-111,-60,-44,-25,-48,-31,327,-93,-57,-32,-49,-28,-47,-111,-67,-67,-22,-50,-100,-112,-17,-43,-67,-67,-37,-33,-9,-30,-26,-42,-34,-114,-109,-110,-46,-95,-94,-96,-98,-115,-99,]),'VAR':([0,2,4,5,9,12,22,23,24,25,26,30,34,35,36,46,50,60,133,134,136,139,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,9,-92,-67,-85,-59,-36,-58,-86,-35,-55,136,-35,-56,-68,-45,-111,-60,-35,-44,-87,-88,-48,-92,9,-92,-35,-35,-93,-35,-57,9,-49,-35,-47,-35,9,9,-35,-111,9,-67,-67,-22,-50,9,9,-100,9,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,9,9,-35,-42,-34,9,-35,-114,9,-35,-109,-35,9,-110,9,9,-46,-95,-94,-35,9,-35,-96,-98,-115,9,-99,]),'LAND':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,277,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,277,-54,-253,-257,-220,-41,-6,-126,277,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,277,277,277,-243,277,-143,-261,277,-130,-143,-260,277,277,-267,-268,-266,-238,-242,277,277,277,277,-151,-152,277,277,277,277,277,277,277,277,277,277,277,277,277,277,-232,-265,-264,-263,277,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,277,-209,-205,-193,277,-210,-179,277,-194,-221,277,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-143,-259,277,277,277,277,277,277,277,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,277,-251,277,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,277,277,-245,-150,-246,-233,-249,-121,-199,-38,277,-21,-14,-244,-103,-12,-237,-248,-247,-153,277,277,277,-65,-15,-102,-13,277,277,]),'DELETE':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,67,67,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-35,-44,-87,-88,-48,-92,-69,-72,-92,67,67,-35,-35,-93,-35,67,-57,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-69,-49,-35,-47,-35,67,67,-69,-69,-35,-111,-69,67,67,67,67,67,67,67,67,67,-67,-67,-22,-50,-69,-69,67,-100,-69,-35,-35,-112,-17,67,67,67,67,67,-43,-67,-67,-37,-9,-30,67,-35,-26,-69,-69,67,-35,67,67,-42,-34,-69,-35,-114,-69,-35,67,-109,-35,67,67,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'SORT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,68,68,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-35,-44,-87,-88,-48,-92,-69,-72,-92,68,68,-35,-35,-93,-35,68,-57,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-69,-49,-35,-47,-35,68,68,-69,-69,-35,-111,-69,68,68,68,68,68,68,68,68,68,-67,-67,-22,-50,-69,-69,68,-100,-69,-35,-35,-112,-17,68,68,68,68,68,-43,-67,-67,-37,-9,-30,68,-35,-26,-69,-69,68,-35,68,68,-42,-34,-69,-35,-114,-69,-35,68,-109,-35,68,68,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'LSHIFT':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,300,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,300,-54,-253,-257,-220,-41,-6,-126,300,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,300,300,300,-243,300,-143,-261,300,-130,-143,-260,300,300,-267,-268,-266,-238,-242,300,300,300,300,-151,-152,300,300,300,300,300,300,300,300,300,300,300,300,300,300,-232,-265,-264,-263,300,300,300,300,300,300,-216,-217,-211,-182,300,-187,300,-178,300,300,300,300,300,300,-210,-179,300,300,300,300,-223,-181,300,300,300,-180,300,300,-183,300,-192,-222,-143,-259,300,300,300,300,300,300,300,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,300,-251,300,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,300,300,-245,-150,-246,-233,-249,-121,-199,-38,300,-21,-14,-244,-103,-12,-237,-248,-247,-153,300,300,300,-65,-15,-102,-13,300,300,]),'MAPPER_LOOP':([0,2,4,5,7,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-92,-92,-67,39,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,-92,-92,-35,-35,-93,-35,-57,-92,-49,-35,-47,-35,-92,-92,-35,-111,-92,-67,-67,-22,-50,-92,-92,-100,-92,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,-92,-92,-35,-42,-34,-92,-35,-114,-92,-35,-109,-35,-92,-110,-92,-92,-46,-95,-94,-35,-92,-35,-96,-98,-115,-92,-99,]),'LOR':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,285,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,285,-54,-253,-257,-220,-41,-6,-126,285,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,285,285,285,-243,285,-143,-261,285,-130,-143,-260,285,285,-267,-268,-266,-238,-242,285,285,285,285,-151,-152,285,285,285,285,285,285,285,285,285,285,285,285,285,285,-232,-265,-264,-263,285,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,285,-209,-205,-193,285,-210,-179,-224,-194,-221,285,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-143,-259,285,285,285,285,285,285,285,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,285,-251,285,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,285,285,-245,-150,-246,-233,-249,-121,-199,-38,285,-21,-14,-244,-103,-12,-237,-248,-247,-153,285,285,285,-65,-15,-102,-13,285,285,]),'SMART_EQ':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,279,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,279,-54,-253,-257,-220,-41,-6,-126,279,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,279,279,279,-243,279,-143,-261,279,-130,-143,-260,279,279,-267,-268,-266,-238,-242,279,279,279,279,-151,-152,279,279,279,279,279,279,279,279,279,279,279,279,279,279,-232,-265,-264,-263,279,None,279,-206,279,-204,-216,-217,-211,-182,-196,-187,None,-178,279,279,None,-205,None,279,-210,-179,279,None,279,279,-223,-181,-195,-200,-197,-180,None,None,-183,-207,-192,-222,-143,-259,279,279,279,279,279,279,279,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,279,-251,279,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,279,279,-245,-150,-246,-233,-249,-121,-199,-38,279,-21,-14,-244,-103,-12,-237,-248,-247,-153,279,279,279,-65,-15,-102,-13,279,279,]),'HADOOP_PRINT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,70,70,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-35,-44,-87,-88,-48,-92,-69,-72,-92,70,70,-35,-35,-93,-35,70,-57,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-69,-49,-35,-47,-35,70,70,-69,-69,-35,-111,-69,70,70,70,70,70,70,70,70,70,-67,-67,-22,-50,-69,-69,70,-100,-69,-35,-35,-112,-17,70,70,70,70,70,-43,-67,-67,-37,-9,-30,70,-35,-26,-69,-69,70,-35,70,70,-42,-34,-69,-35,-114,-69,-35,70,-109,-35,70,70,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'M_REGEX':([271,283,],[439,451,]),'SHIFT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,71,71,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-35,-44,-87,-88,-48,-92,-69,-72,-92,71,71,-35,-35,-93,-35,71,-57,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-69,-49,-35,-47,-35,71,71,-69,-69,-35,-111,-69,71,71,71,71,71,71,71,71,71,-67,-67,-22,-50,-69,-69,71,-100,-69,-35,-35,-112,-17,71,71,71,71,71,-43,-67,-67,-37,-9,-30,71,-35,-26,-69,-69,71,-35,71,71,-42,-34,-69,-35,-114,-69,-35,71,-109,-35,71,71,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'STR_EQ':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,295,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,295,-54,-253,-257,-220,-41,-6,-126,295,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,295,295,295,-243,295,-143,-261,295,-130,-143,-260,295,295,-267,-268,-266,-238,-242,295,295,295,295,-151,-152,295,295,295,295,295,295,295,295,295,295,295,295,295,295,-232,-265,-264,-263,295,None,295,-206,295,-204,-216,-217,-211,-182,-196,-187,None,-178,295,295,None,-205,None,295,-210,-179,295,None,295,295,-223,-181,-195,-200,-197,-180,None,None,-183,-207,-192,-222,-143,-259,295,295,295,295,295,295,295,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,295,-251,295,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,295,295,-245,-150,-246,-233,-249,-121,-199,-38,295,-21,-14,-244,-103,-12,-237,-248,-247,-153,295,295,295,-65,-15,-102,-13,295,295,]),'STDIN':([243,564,],[409,596,]),'NUM_NE':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,286,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,286,-54,-253,-257,-220,-41,-6,-126,286,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,286,286,286,-243,286,-143,-261,286,-130,-143,-260,286,286,-267,-268,-266,-238,-242,286,286,286,286,-151,-152,286,286,286,286,286,286,286,286,286,286,286,286,286,286,-232,-265,-264,-263,286,None,286,-206,286,-204,-216,-217,-211,-182,-196,-187,None,-178,286,286,None,-205,None,286,-210,-179,286,None,286,286,-223,-181,-195,-200,-197,-180,None,None,-183,-207,-192,-222,-143,-259,286,286,286,286,286,286,286,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,286,-251,286,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,286,286,-245,-150,-246,-233,-249,-121,-199,-38,286,-21,-14,-244,-103,-12,-237,-248,-247,-153,286,286,286,-65,-15,-102,-13,286,286,]),'ANDEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,251,-241,-254,-258,-255,-253,-257,-252,-256,-243,251,-261,251,-260,-267,-268,-266,-242,-265,-264,-263,251,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'CMP_NUM':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,296,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,296,-54,-253,-257,-220,-41,-6,-126,296,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,296,296,296,-243,296,-143,-261,296,-130,-143,-260,296,296,-267,-268,-266,-238,-242,296,296,296,296,-151,-152,296,296,296,296,296,296,296,296,296,296,296,296,296,296,-232,-265,-264,-263,296,None,296,-206,296,-204,-216,-217,-211,-182,-196,-187,None,-178,296,296,None,-205,None,296,-210,-179,296,None,296,296,-223,-181,-195,-200,-197,-180,None,None,-183,-207,-192,-222,-143,-259,296,296,296,296,296,296,296,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,296,-251,296,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,296,296,-245,-150,-246,-233,-249,-121,-199,-38,296,-21,-14,-244,-103,-12,-237,-248,-247,-153,296,296,296,-65,-15,-102,-13,296,296,]),'error':([0,2,4,5,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,14,-92,-67,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,14,-92,-35,-35,-93,-35,-57,14,-49,-35,-47,-35,14,14,-35,-111,14,-67,-67,-22,-50,14,14,-100,14,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,14,14,-35,-42,-34,14,-35,-114,14,-35,-109,-35,14,-110,14,14,-46,-95,-94,-35,14,-35,-96,-98,-115,14,-99,]),'EXIT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,107,107,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,-35,-44,-87,-88,-48,-92,-69,-72,-92,107,107,-35,-35,-93,-35,107,-57,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,-69,-49,-35,-47,-35,107,107,-69,-69,-35,-111,-69,107,107,107,107,107,107,107,107,107,-67,-67,-22,-50,-69,-69,107,-100,-69,-35,-35,-112,-17,107,107,107,107,107,-43,-67,-67,-37,-9,-30,107,-35,-26,-69,-69,107,-35,107,107,-42,-34,-69,-35,-114,-69,-35,107,-109,-35,107,107,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'REDUCER_VAR':([5,12,22,23,26,35,36,46,50,60,134,140,158,160,167,323,328,346,349,478,481,484,496,499,502,503,557,558,559,560,562,563,573,574,594,595,605,616,622,632,634,636,645,646,647,649,],[-67,-59,-36,-58,-55,-56,-68,-45,-111,-60,-44,-48,-92,-93,-57,-49,-47,499,-111,-67,-67,-50,-100,-35,-112,-17,-43,-67,-67,-37,-9,-30,-26,604,-42,-34,-114,-109,-110,-46,-95,-94,-96,-98,-115,-99,]),'NUM_GE':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,292,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,292,-54,-253,-257,-220,-41,-6,-126,292,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,292,292,292,-243,292,-143,-261,292,-130,-143,-260,292,292,-267,-268,-266,-238,-242,292,292,292,292,-151,-152,292,292,292,292,292,292,292,292,292,292,292,292,292,292,-232,-265,-264,-263,292,292,292,None,292,None,-216,-217,-211,-182,None,-187,292,-178,292,292,292,None,292,292,-210,-179,292,292,292,292,-223,-181,None,None,None,-180,292,292,-183,None,-192,-222,-143,-259,292,292,292,292,292,292,292,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,292,-251,292,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,292,292,-245,-150,-246,-233,-249,-121,-199,-38,292,-21,-14,-244,-103,-12,-237,-248,-247,-153,292,292,292,-65,-15,-102,-13,292,292,]),'TIMES':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,294,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,294,-54,-253,-257,-220,-41,-6,-126,294,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,294,294,294,-243,294,-143,-261,294,-130,-143,-260,294,294,-267,-268,-266,-238,-242,294,294,294,294,-151,-152,294,294,294,294,294,294,294,294,294,294,294,294,294,294,-232,-265,-264,-263,294,294,294,294,294,294,-216,-217,-211,-182,294,-187,294,294,294,294,294,294,294,294,-210,294,294,294,294,294,294,-181,294,294,294,-180,294,294,-183,294,294,294,-143,-259,294,294,294,294,294,294,294,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,294,-251,294,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,294,294,-245,-150,-246,-233,-249,-121,-199,-38,294,-21,-14,-244,-103,-12,-237,-248,-247,-153,294,294,294,-65,-15,-102,-13,294,294,]),'RBRACKET':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,234,236,242,250,260,266,301,304,305,307,310,311,354,370,372,377,386,387,388,397,399,403,404,405,406,407,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,506,507,508,509,511,512,514,516,517,518,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,545,546,547,549,550,552,553,554,555,578,580,581,584,586,587,588,589,590,591,609,623,624,625,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-145,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,399,-120,-190,-191,-234,-146,-188,-252,-256,-122,-39,-226,-243,-261,-130,-260,-267,-268,-266,-238,-242,-157,-171,-161,546,-151,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-144,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,589,-245,-150,-246,-233,-249,-121,-199,-38,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-65,-15,-102,-13,]),'RETURNS':([0,2,5,12,22,23,25,26,29,33,35,36,46,50,60,134,135,140,160,167,321,323,328,349,478,481,482,484,496,502,503,557,558,559,560,561,562,563,573,594,595,605,616,622,632,634,636,645,646,647,649,],[-35,-24,-67,-59,-36,-58,-35,-55,-31,143,-56,-68,-45,-111,-60,-44,-25,-48,-93,-57,-32,-49,-47,-111,-67,-67,-22,-50,-100,-112,-17,-43,-67,-67,-37,-33,-9,-30,-26,-42,-34,-114,-109,-110,-46,-95,-94,-96,-98,-115,-99,]),'POP':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,73,73,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-35,-44,-87,-88,-48,-92,-69,-72,-92,73,73,-35,-35,-93,-35,73,-57,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-69,-49,-35,-47,-35,73,73,-69,-69,-35,-111,-69,73,73,73,73,73,73,73,73,73,-67,-67,-22,-50,-69,-69,73,-100,-69,-35,-35,-112,-17,73,73,73,73,73,-43,-67,-67,-37,-9,-30,73,-35,-26,-69,-69,73,-35,73,73,-42,-34,-69,-35,-114,-69,-35,73,-109,-35,73,73,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'IF':([0,2,4,5,7,12,22,23,25,26,34,35,36,46,50,60,62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,130,131,133,134,140,142,145,147,155,156,160,161,167,171,174,178,180,182,184,186,188,192,193,194,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,266,301,304,305,307,310,311,320,323,325,328,329,343,344,345,349,350,354,370,372,377,386,387,388,397,399,403,404,405,407,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,478,481,482,484,485,487,496,498,499,500,502,503,506,507,508,509,511,512,514,516,517,518,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,546,547,549,550,552,553,554,555,557,558,559,560,562,563,568,573,574,575,577,578,580,581,584,586,587,588,589,590,591,593,594,595,600,604,605,607,609,614,616,617,620,622,623,624,625,626,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-92,-92,-67,42,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-145,-271,-241,-137,-136,-273,-131,315,315,-35,-44,-48,-92,-92,-92,-35,-35,-93,-35,-57,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-146,-188,-252,-256,-122,-39,-226,-92,-49,-35,-47,-35,-92,-92,-35,-111,-92,-243,-261,-130,-260,-267,-268,-266,-238,-242,-157,-171,-161,-151,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-144,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,-67,-67,-22,-50,-92,-92,-100,-92,-35,-35,-112,-17,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,-245,-150,-246,-233,-249,-121,-199,-38,-43,-67,-67,-37,-9,-30,-35,-26,-92,-92,-35,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-176,-42,-34,-92,-35,-114,-92,-65,-35,-109,-35,-92,-110,-15,-102,-13,-177,-92,-92,-46,-95,-94,-35,-92,-35,-96,-98,-115,-92,-99,]),'AND':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,267,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,267,-54,-253,-257,-220,-41,-6,-126,267,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,267,267,267,-243,267,-143,-261,267,-130,-143,-260,267,267,-267,-268,-266,-238,-242,267,267,267,267,-151,-152,267,267,267,267,267,267,267,267,267,267,267,267,267,267,-232,-265,-264,-263,267,-208,-219,-206,267,-204,-216,-217,-211,-182,-196,-187,-203,-178,267,267,-209,-205,-193,267,-210,-179,267,-194,267,267,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-143,-259,267,267,267,267,267,267,267,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,267,-251,267,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,267,267,-245,-150,-246,-233,-249,-121,-199,-38,267,-21,-14,-244,-103,-12,-237,-248,-247,-153,267,267,267,-65,-15,-102,-13,267,267,]),'SAY':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,74,74,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-35,-44,-87,-88,-48,-92,-69,-72,-92,74,74,-35,-35,-93,-35,74,-57,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-69,-49,-35,-47,-35,74,74,-69,-69,-35,-111,-69,74,74,74,74,74,74,74,74,74,-67,-67,-22,-50,-69,-69,74,-100,-69,-35,-35,-112,-17,74,74,74,74,74,-43,-67,-67,-37,-9,-30,74,-35,-26,-69,-69,74,-35,74,74,-42,-34,-69,-35,-114,-69,-35,74,-109,-35,74,74,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'CHOP':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,82,82,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-35,-44,-87,-88,-48,-92,-69,-72,-92,82,82,-35,-35,-93,-35,82,-57,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-69,-49,-35,-47,-35,82,82,-69,-69,-35,-111,-69,82,82,82,82,82,82,82,82,82,-67,-67,-22,-50,-69,-69,82,-100,-69,-35,-35,-112,-17,82,82,82,82,82,-43,-67,-67,-37,-9,-30,82,-35,-26,-69,-69,82,-35,82,82,-42,-34,-69,-35,-114,-69,-35,82,-109,-35,82,82,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'NOT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,84,84,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-35,-44,-87,-88,-48,-92,-69,-72,-92,84,84,-35,-35,-93,-35,84,-57,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-69,-49,-35,-47,-35,84,84,-69,-69,-35,-111,-69,84,84,84,84,84,84,84,84,84,-67,-67,-22,-50,-69,-69,84,-100,-69,-35,-35,-112,-17,84,84,84,84,84,-43,-67,-67,-37,-9,-30,84,-35,-26,-69,-69,84,-35,84,84,-42,-34,-69,-35,-114,-69,-35,84,-109,-35,84,84,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'CHOMP':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,75,75,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-35,-44,-87,-88,-48,-92,-69,-72,-92,75,75,-35,-35,-93,-35,75,-57,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-69,-49,-35,-47,-35,75,75,-69,-69,-35,-111,-69,75,75,75,75,75,75,75,75,75,-67,-67,-22,-50,-69,-69,75,-100,-69,-35,-35,-112,-17,75,75,75,75,75,-43,-67,-67,-37,-9,-30,75,-35,-26,-69,-69,75,-35,75,75,-42,-34,-69,-35,-114,-69,-35,75,-109,-35,75,75,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'EACH':([522,556,],[582,582,]),'RETURN':([0,2,4,5,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,19,-92,-67,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,19,-92,-35,-35,-93,-35,-57,19,-49,-35,-47,-35,19,19,-35,-111,19,-67,-67,-22,-50,19,19,-100,19,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,19,19,-35,-42,-34,19,-35,-114,19,-35,-109,-35,19,-110,19,19,-46,-95,-94,-35,19,-35,-96,-98,-115,19,-99,]),'DOLLAR':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,41,46,50,59,60,63,65,67,71,73,74,75,76,77,79,80,81,82,83,84,87,89,90,91,92,94,95,98,99,100,101,105,107,108,109,112,113,117,118,122,124,126,129,133,134,136,139,140,142,145,146,147,150,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,330,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,410,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,582,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,118,118,-36,-58,-86,-35,-55,-73,-35,-56,-68,-101,-45,-111,-71,-60,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,216,118,118,118,118,118,118,118,118,118,118,118,263,118,118,118,118,118,118,-35,-44,-87,-88,-48,-92,-69,-72,-92,332,118,118,-35,-35,-93,-35,118,-57,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,-69,-49,-35,-47,-35,118,118,118,-69,-69,-35,-111,-69,118,118,118,118,118,118,118,118,118,118,-67,-67,-22,-50,-69,-69,118,-100,-69,-35,-35,-112,-17,118,118,118,118,118,-43,-67,-67,-37,-9,-30,118,-35,-26,-69,-69,118,-35,118,118,118,-42,-34,-69,-35,-114,-69,-35,118,-109,-35,118,118,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'UC':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,76,76,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-35,-44,-87,-88,-48,-92,-69,-72,-92,76,76,-35,-35,-93,-35,76,-57,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-69,-49,-35,-47,-35,76,76,-69,-69,-35,-111,-69,76,76,76,76,76,76,76,76,76,-67,-67,-22,-50,-69,-69,76,-100,-69,-35,-35,-112,-17,76,76,76,76,76,-43,-67,-67,-37,-9,-30,76,-35,-26,-69,-69,76,-35,76,76,-42,-34,-69,-35,-114,-69,-35,76,-109,-35,76,76,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'REDUCER_CHANGE':([0,2,4,5,7,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-92,-92,-67,38,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,-92,-92,-35,-35,-93,-35,-57,-92,-49,-35,-47,-35,-92,-92,-35,-111,-92,-67,-67,-22,-50,-92,-92,-100,-92,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,-92,-92,-35,-42,-34,-92,-35,-114,-92,-35,-109,-35,-92,-110,-92,-92,-46,-95,-94,-35,-92,-35,-96,-98,-115,-92,-99,]),'CMP':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,265,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,265,-54,-253,-257,-220,-41,-6,-126,265,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,265,265,265,-243,265,-143,-261,265,-130,-143,-260,265,265,-267,-268,-266,-238,-242,265,265,265,265,-151,-152,265,265,265,265,265,265,265,265,265,265,265,265,265,265,-232,-265,-264,-263,265,None,265,-206,265,-204,-216,-217,-211,-182,-196,-187,None,-178,265,265,None,-205,None,265,-210,-179,265,None,265,265,-223,-181,-195,-200,-197,-180,None,None,-183,-207,-192,-222,-143,-259,265,265,265,265,265,265,265,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,265,-251,265,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,265,265,-245,-150,-246,-233,-249,-121,-199,-38,265,-21,-14,-244,-103,-12,-237,-248,-247,-153,265,265,265,-65,-15,-102,-13,265,265,]),'COMMA':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,354,362,369,370,372,376,377,382,386,387,388,397,399,403,404,405,407,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,506,507,508,509,511,512,514,516,517,518,519,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,546,547,549,550,552,553,554,555,578,580,581,584,586,587,588,589,590,591,609,623,624,625,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,266,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,266,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,266,-243,266,-143,-261,-130,-143,-260,266,-267,-268,-266,-238,-242,-157,-171,-161,-151,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-143,-259,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,266,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,-245,-150,-246,-233,-249,-121,-199,-38,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-65,-15,-102,-13,]),'JOIN':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,104,104,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-35,-44,-87,-88,-48,-92,-69,-72,-92,104,104,-35,-35,-93,-35,104,-57,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-69,-49,-35,-47,-35,104,104,-69,-69,-35,-111,-69,104,104,104,104,104,104,104,104,104,-67,-67,-22,-50,-69,-69,104,-100,-69,-35,-35,-112,-17,104,104,104,104,104,-43,-67,-67,-37,-9,-30,104,-35,-26,-69,-69,104,-35,104,104,-42,-34,-69,-35,-114,-69,-35,104,-109,-35,104,104,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'DIE':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,77,77,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-35,-44,-87,-88,-48,-92,-69,-72,-92,77,77,-35,-35,-93,-35,77,-57,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-69,-49,-35,-47,-35,77,77,-69,-69,-35,-111,-69,77,77,77,77,77,77,77,77,77,-67,-67,-22,-50,-69,-69,77,-100,-69,-35,-35,-112,-17,77,77,77,77,77,-43,-67,-67,-37,-9,-30,77,-35,-26,-69,-69,77,-35,77,77,-42,-34,-69,-35,-114,-69,-35,77,-109,-35,77,77,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'UNTIL':([0,2,4,5,7,12,22,23,25,26,34,35,36,46,50,60,62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,130,131,133,134,140,142,145,147,155,156,160,161,167,171,174,178,180,182,184,186,188,192,193,194,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,266,301,304,305,307,310,311,320,323,325,328,329,343,344,345,349,350,354,370,372,377,386,387,388,397,399,403,404,405,407,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,478,481,482,484,485,487,496,497,498,499,500,502,503,506,507,508,509,511,512,514,516,517,518,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,546,547,549,550,552,553,554,555,557,558,559,560,562,563,568,573,574,575,577,578,580,581,584,586,587,588,589,590,591,593,594,595,600,604,605,607,609,614,616,617,620,622,623,624,625,626,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-92,-92,-67,40,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-145,-271,-241,-137,-136,-273,-131,313,313,-35,-44,-48,-92,-92,-92,-35,-35,-93,-35,-57,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-146,-188,-252,-256,-122,-39,-226,-92,-49,-35,-47,-35,-92,-92,-35,-111,-92,-243,-261,-130,-260,-267,-268,-266,-238,-242,-157,-171,-161,-151,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-144,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,-67,-67,-22,-50,-92,-92,-100,572,-92,-35,-35,-112,-17,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,-245,-150,-246,-233,-249,-121,-199,-38,-43,-67,-67,-37,-9,-30,-35,-26,-92,-92,-35,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-176,-42,-34,-92,-35,-114,-92,-65,-35,-109,-35,-92,-110,-15,-102,-13,-177,-92,-92,-46,-95,-94,-35,-92,-35,-96,-98,-115,-92,-99,]),'FOR':([0,2,4,5,7,12,22,23,25,26,34,35,36,46,50,60,62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,130,131,133,134,140,142,145,147,155,156,160,161,167,171,174,178,180,182,184,186,188,192,193,194,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,266,301,304,305,307,310,311,320,323,325,328,329,343,344,345,349,350,354,370,372,377,386,387,388,397,399,403,404,405,407,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,478,481,482,484,485,487,496,498,499,500,502,503,506,507,508,509,511,512,514,516,517,518,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,546,547,549,550,552,553,554,555,557,558,559,560,562,563,568,573,574,575,577,578,580,581,584,586,587,588,589,590,591,593,594,595,600,604,605,607,609,614,616,617,620,622,623,624,625,626,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-92,-92,-67,41,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-145,-271,-241,-137,-136,-273,-131,318,318,-35,-44,-48,-92,-92,-92,-35,-35,-93,-35,-57,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-146,-188,-252,-256,-122,-39,-226,-92,-49,-35,-47,-35,-92,-92,-35,-111,-92,-243,-261,-130,-260,-267,-268,-266,-238,-242,-157,-171,-161,-151,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-144,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,-67,-67,-22,-50,-92,-92,-100,-92,-35,-35,-112,-17,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,-245,-150,-246,-233,-249,-121,-199,-38,-43,-67,-67,-37,-9,-30,-35,-26,-92,-92,-35,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-176,-42,-34,-92,-35,-114,-92,-65,-35,-109,-35,-92,-110,-15,-102,-13,-177,-92,-92,-46,-95,-94,-35,-92,-35,-96,-98,-115,-92,-99,]),'PERCENTAGE':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,41,46,50,59,60,62,63,64,65,67,69,71,72,73,74,75,76,77,78,79,80,81,82,83,84,87,89,90,91,92,94,95,97,98,99,100,101,102,103,105,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,125,126,127,129,133,134,136,139,140,142,145,146,147,150,151,152,155,156,160,161,162,167,168,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,236,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,260,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,304,305,306,307,308,309,310,311,313,314,315,317,318,320,323,325,328,329,330,331,338,340,341,343,344,345,349,350,351,354,359,362,364,368,369,370,371,372,373,376,377,378,382,384,386,387,388,396,397,399,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,478,479,480,481,482,484,485,487,489,490,494,496,498,499,500,502,503,506,507,508,509,511,512,513,514,516,517,518,519,520,521,523,524,525,526,527,528,529,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,551,552,553,554,555,556,557,558,559,560,562,563,566,567,568,573,574,575,576,577,578,580,581,582,583,584,586,587,588,589,590,591,592,593,594,595,600,604,605,606,607,609,614,615,616,617,618,619,620,622,623,624,625,627,629,630,631,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,79,79,-36,-58,-86,-35,-55,-73,-35,-56,-68,-101,-45,-111,-71,-60,-270,79,-139,79,79,-142,79,-138,79,79,79,79,79,-132,79,79,79,79,79,79,79,79,79,79,215,79,79,-135,79,79,79,79,-262,-272,79,79,79,79,-269,-143,-235,261,274,-271,-241,79,79,-137,-136,79,79,-273,79,-131,79,-35,-44,-87,-88,-48,-92,-69,-72,-92,336,79,79,-35,-35,-93,-35,79,-57,79,79,-149,79,79,-141,79,79,-215,79,-213,79,-8,79,-52,79,-124,79,-134,79,79,-254,-258,-255,274,79,-54,79,-253,-257,-220,79,79,79,-41,79,79,-6,79,-126,274,79,-185,79,-90,79,-189,-186,79,-77,79,-164,79,79,-166,-239,79,-156,79,-120,79,79,79,79,-190,79,79,79,79,79,79,79,-191,79,79,79,79,79,79,79,79,-234,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-188,79,-252,-256,79,-122,79,79,-39,-226,79,79,79,79,79,-69,-49,-35,-47,-35,79,79,274,274,79,-69,-69,-35,-111,-69,274,-243,79,274,79,79,-143,-261,274,-130,79,-143,-260,274,274,79,-267,-268,-266,79,-238,-242,79,79,274,274,274,274,-151,79,-152,79,274,274,274,274,274,274,274,274,274,274,274,274,274,274,-232,-265,-264,-263,274,274,274,274,274,274,-216,-217,-211,-182,274,-187,274,274,274,274,274,274,274,274,-210,274,274,274,274,274,274,-181,274,274,274,-180,274,274,-183,274,274,274,-143,-259,274,274,274,-67,274,274,-67,-22,-50,-69,-69,274,79,274,-100,-69,-35,-35,-112,-17,-148,-83,-140,-113,-214,-212,79,-7,-51,-123,-133,274,-251,274,-53,-250,79,-184,-40,-198,79,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,274,274,-245,-150,-246,-233,79,-249,-121,-199,-38,79,-43,-67,-67,-37,-9,-30,274,79,-35,-26,-69,-69,79,-35,-21,-14,-244,79,79,-103,-12,-237,-248,-247,-153,274,79,274,-42,-34,-69,-35,-114,274,-69,-65,-35,79,-109,-35,79,79,-69,-110,-15,-102,-13,-69,-69,274,274,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'DIVEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,249,-241,-254,-258,-255,-253,-257,-252,-256,-243,249,-261,249,-260,-267,-268,-266,-242,-265,-264,-263,249,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'BACKSLASH':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,79,80,81,82,83,84,87,89,90,91,94,95,98,99,100,101,105,107,108,109,112,117,118,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,330,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,410,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,582,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,80,80,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-35,-44,-87,-88,-48,-92,-69,-72,-92,80,80,-35,-35,-93,-35,80,-57,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-69,-49,-35,-47,-35,80,80,80,-69,-69,-35,-111,-69,80,80,80,80,80,80,80,80,80,80,-67,-67,-22,-50,-69,-69,80,-100,-69,-35,-35,-112,-17,80,80,80,80,80,-43,-67,-67,-37,-9,-30,80,-35,-26,-69,-69,80,-35,80,80,80,-42,-34,-69,-35,-114,-69,-35,80,-109,-35,80,80,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'JAVA_LINE':([0,2,4,5,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,23,-92,-67,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,23,-92,-35,-35,-93,-35,-57,23,-49,-35,-47,-35,23,23,-35,-111,23,-67,-67,-22,-50,23,23,-100,23,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,23,23,-35,-42,-34,23,-35,-114,23,-35,-109,-35,23,-110,23,23,-46,-95,-94,-35,23,-35,-96,-98,-115,23,-99,]),'LPAREN':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,40,41,42,43,46,50,52,59,60,62,63,64,65,66,67,68,69,71,72,73,74,75,76,77,78,79,80,81,82,83,84,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,104,105,107,108,109,110,111,112,115,116,117,118,119,121,122,123,124,125,126,127,129,133,134,136,139,140,142,145,146,147,148,149,151,152,153,155,156,160,161,162,167,168,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,236,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,260,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,304,305,306,307,308,309,310,311,313,314,315,317,318,320,323,325,328,329,330,331,334,335,341,343,344,345,348,349,350,354,359,362,364,368,370,372,373,377,382,384,386,387,388,396,397,399,401,402,403,404,405,407,408,409,410,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,478,481,482,484,485,487,490,496,498,499,500,501,502,503,506,507,508,509,511,512,513,514,516,517,518,520,523,524,525,526,527,528,529,530,532,533,534,535,536,537,538,539,540,542,543,546,547,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,571,572,573,574,575,576,577,578,580,581,582,583,584,586,587,588,589,590,591,592,594,595,600,602,603,604,605,607,609,614,615,616,617,618,619,620,622,623,624,625,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,81,129,-36,-58,-86,-35,-55,-73,-35,-56,-68,-91,151,152,-91,-45,-111,162,-71,-60,-270,168,-139,170,172,173,175,-142,177,-138,179,181,183,185,187,-132,191,191,168,197,191,168,205,206,208,209,211,168,217,168,219,221,-135,191,168,224,226,-262,-272,228,229,232,168,235,-269,-143,258,-271,-241,191,191,-137,-136,306,308,309,-273,168,-131,168,-35,-44,-87,-88,-48,-92,-69,-72,-92,330,331,168,168,341,-35,-35,-93,-35,168,-57,168,168,-149,168,168,-141,168,359,168,-215,168,-213,168,364,168,-52,168,-124,168,-134,368,168,-254,-258,-255,168,-54,368,-253,-257,-220,168,168,168,-41,168,168,384,168,-126,-229,168,-185,168,-90,168,-189,-186,168,-77,168,-164,168,168,-166,396,168,-156,168,-120,168,168,168,168,-190,408,168,168,168,168,168,168,-191,168,168,168,168,168,168,168,168,-234,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,168,-188,368,-252,-256,168,-122,168,168,-39,-226,168,168,168,168,168,-69,-49,-35,-47,-35,191,168,490,-104,168,-69,-69,-35,-91,-111,-69,-243,168,513,168,168,-261,-130,168,-260,529,168,-267,-268,-266,168,-238,-242,168,168,-157,-171,-161,-151,168,-152,191,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,-67,-67,-22,-50,-69,-69,168,-100,-69,-35,-35,576,-112,-17,-148,-83,-140,-113,-214,-212,168,-7,-51,-123,-133,-251,-53,-250,583,-184,-40,-198,168,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,-245,-150,-246,-233,168,-249,-121,-199,-38,592,-43,-67,-67,-37,-9,-30,168,-35,-91,-91,-26,-69,-69,168,-35,-21,-14,-244,191,168,-103,-12,-237,-248,-247,-153,-231,168,-42,-34,-69,618,619,-35,-114,-69,-65,-35,168,-109,-35,168,168,-69,-110,-15,-102,-13,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'X':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,297,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,297,-54,-253,-257,-220,-41,-6,-126,297,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,297,297,297,-243,297,-143,-261,297,-130,-143,-260,297,297,-267,-268,-266,-238,-242,297,297,297,297,-151,-152,297,297,297,297,297,297,297,297,297,297,297,297,297,297,-232,-265,-264,-263,297,297,297,297,297,297,-216,-217,-211,-182,297,-187,297,297,297,297,297,297,297,297,-210,297,297,297,297,297,297,-181,297,297,297,-180,297,297,-183,297,297,297,-143,-259,297,297,297,297,297,297,297,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,297,-251,297,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,297,297,-245,-150,-246,-233,-249,-121,-199,-38,297,-21,-14,-244,-103,-12,-237,-248,-247,-153,297,297,297,-65,-15,-102,-13,297,297,]),'PACKAGE':([0,2,4,5,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,15,-92,-67,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,15,-92,-35,-35,-93,-35,-57,15,-49,-35,-47,-35,15,15,-35,-111,15,-67,-67,-22,-50,15,15,-100,15,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,15,15,-35,-42,-34,15,-35,-114,15,-35,-109,-35,15,-110,15,15,-46,-95,-94,-35,15,-35,-96,-98,-115,15,-99,]),'DO':([0,2,4,5,7,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-92,-92,-67,47,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,-92,-92,-35,-35,-93,-35,-57,-92,-49,-35,-47,-35,-92,-92,-35,-111,-92,-67,-67,-22,-50,-92,-92,-100,-92,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,-92,-92,-35,-42,-34,-92,-35,-114,-92,-35,-109,-35,-92,-110,-92,-92,-46,-95,-94,-35,-92,-35,-96,-98,-115,-92,-99,]),'RBRACE':([4,5,12,22,23,26,34,35,36,46,50,60,62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,133,134,140,142,145,147,155,156,160,161,167,169,171,174,178,180,182,184,186,188,192,193,194,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,266,301,304,305,307,310,311,320,323,325,328,329,343,344,345,349,350,354,369,370,372,376,377,378,386,387,388,397,399,403,404,405,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,478,481,484,485,487,496,498,500,502,503,506,507,508,509,511,512,514,516,517,518,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,546,547,549,550,552,553,554,555,557,558,559,560,562,563,568,573,575,577,578,580,581,584,586,587,588,589,590,591,594,595,600,604,605,607,609,614,616,617,620,622,623,624,625,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-92,-67,-59,-36,-58,-55,-35,-56,-68,-45,-111,-60,-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-145,-271,-241,-137,-136,-273,-131,-35,-44,-48,-92,328,-92,-35,-35,-93,-35,-57,354,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-146,-188,-252,-256,-122,-39,-226,482,-49,-35,-47,-35,496,497,-35,-111,503,-243,520,-261,-130,524,-260,525,-267,-268,-266,-238,-242,-157,-171,-161,-151,-152,-147,-154,549,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-144,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,552,-259,-67,-67,-50,562,563,-100,573,-35,-112,-17,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,588,-245,-150,-246,-233,-249,-121,-199,-38,-43,-67,-67,-37,-9,-30,-35,-26,605,-35,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-42,-34,616,-35,-114,622,-65,-35,-109,-35,632,-110,-15,-102,-13,634,636,-46,-95,-94,-35,647,-35,-96,-98,-115,649,-99,]),'AT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,41,46,50,59,60,63,65,67,71,73,74,75,76,77,79,80,81,82,83,84,87,89,90,91,92,94,95,98,99,100,101,105,107,108,109,112,113,117,118,122,124,126,129,133,134,136,139,140,142,145,146,147,150,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,330,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,410,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,582,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,83,83,-36,-58,-86,-35,-55,-73,-35,-56,-68,-101,-45,-111,-71,-60,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,214,83,83,83,83,83,83,83,83,83,83,83,262,83,83,83,83,83,83,-35,-44,-87,-88,-48,-92,-69,-72,-92,333,83,83,-35,-35,-93,-35,83,-57,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-69,-49,-35,-47,-35,83,83,83,-69,-69,-35,-111,-69,83,83,83,83,83,83,83,83,83,83,-67,-67,-22,-50,-69,-69,83,-100,-69,-35,-35,-112,-17,83,83,83,83,83,-43,-67,-67,-37,-9,-30,83,-35,-26,-69,-69,83,-35,83,83,83,-42,-34,-69,-35,-114,-69,-35,83,-109,-35,83,83,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'XOR':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,287,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,287,-54,-253,-257,-220,-41,-6,-126,287,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,287,287,287,-243,287,-143,-261,287,-130,-143,-260,287,287,-267,-268,-266,-238,-242,287,287,287,287,-151,-152,287,287,287,287,287,287,287,287,287,287,287,287,287,287,-232,-265,-264,-263,287,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,287,287,-209,-205,-193,287,-210,-179,287,-194,-221,287,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-143,-259,287,287,287,287,287,287,287,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,287,-251,287,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,287,287,-245,-150,-246,-233,-249,-121,-199,-38,287,-21,-14,-244,-103,-12,-237,-248,-247,-153,287,287,287,-65,-15,-102,-13,287,287,]),'OREQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,248,-241,-254,-258,-255,-253,-257,-252,-256,-243,248,-261,248,-260,-267,-268,-266,-242,-265,-264,-263,248,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'LSHIFTEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,247,-241,-254,-258,-255,-253,-257,-252,-256,-243,247,-261,247,-260,-267,-268,-266,-242,-265,-264,-263,247,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'COLON':([62,64,69,72,78,97,102,103,110,111,112,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,354,370,372,377,386,387,388,397,399,403,404,405,407,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,506,507,508,509,511,512,514,516,517,518,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,546,547,549,550,552,553,554,555,578,580,581,584,586,587,588,589,590,591,609,623,624,625,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,-243,-261,-130,-260,-267,-268,-266,-238,-242,-157,-171,-161,-151,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,551,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,-245,-150,-246,-233,-249,-121,-199,-38,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-65,-15,-102,-13,]),'Y_REGEX':([271,],[438,]),'COMMENT':([0,2,4,5,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,26,-92,-67,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,26,-92,-35,-35,-93,-35,-57,26,-49,-35,-47,-35,26,26,-35,-111,26,-67,-67,-22,-50,26,26,-100,26,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,26,26,-35,-42,-34,26,-35,-114,26,-35,-109,-35,26,-110,26,26,-46,-95,-94,-35,26,-35,-96,-98,-115,26,-99,]),'REDUCER_CODE':([0,2,4,5,7,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-92,-92,-67,44,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,-92,-92,-35,-35,-93,-35,-57,-92,-49,-35,-47,-35,-92,-92,-35,-111,-92,-67,-67,-22,-50,-92,-92,-100,-92,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,-92,-92,-35,-42,-34,-92,-35,-114,-92,-35,-109,-35,-92,-110,-92,-92,-46,-95,-94,-35,-92,-35,-96,-98,-115,-92,-99,]),'OR':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,269,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,269,-54,-253,-257,-220,-41,-6,-126,269,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,269,269,269,-243,269,-143,-261,269,-130,-143,-260,269,269,-267,-268,-266,-238,-242,269,269,269,269,-151,-152,269,269,269,269,269,269,269,269,269,269,269,269,269,269,-232,-265,-264,-263,269,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,269,269,-209,-205,-193,269,-210,-179,269,-194,-221,269,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-143,-259,269,269,269,269,269,269,269,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,269,-251,269,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,269,269,-245,-150,-246,-233,-249,-121,-199,-38,269,-21,-14,-244,-103,-12,-237,-248,-247,-153,269,269,269,-65,-15,-102,-13,269,269,]),'VALUES':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,87,87,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-35,-44,-87,-88,-48,-92,-69,-72,-92,87,87,-35,-35,-93,-35,87,-57,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-69,-49,-35,-47,-35,87,87,-69,-69,-35,-111,-69,87,87,87,87,87,87,87,87,87,-67,-67,-22,-50,-69,-69,87,-100,-69,-35,-35,-112,-17,87,87,87,87,87,-43,-67,-67,-37,-9,-30,87,-35,-26,-69,-69,87,-35,87,87,-42,-34,-69,-35,-114,-69,-35,87,-109,-35,87,87,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'PUSH':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,88,88,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-35,-44,-87,-88,-48,-92,-69,-72,-92,88,88,-35,-35,-93,-35,88,-57,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-69,-49,-35,-47,-35,88,88,-69,-69,-35,-111,-69,88,88,88,88,88,88,88,88,88,-67,-67,-22,-50,-69,-69,88,-100,-69,-35,-35,-112,-17,88,88,88,88,88,-43,-67,-67,-37,-9,-30,88,-35,-26,-69,-69,88,-35,88,88,-42,-34,-69,-35,-114,-69,-35,88,-109,-35,88,88,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'XOREQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,254,-241,-254,-258,-255,-253,-257,-252,-256,-243,254,-261,254,-260,-267,-268,-266,-242,-265,-264,-263,254,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'ARGS':([0,2,5,12,22,23,25,26,35,36,46,50,60,134,140,160,167,323,328,349,478,481,482,484,496,502,503,557,558,559,560,562,563,573,594,595,605,616,622,632,634,636,645,646,647,649,],[-35,29,-67,-59,-36,-58,-35,-55,-56,-68,-45,-111,-60,-44,-48,-93,-57,-49,-47,-111,-67,-67,-22,-50,-100,-112,-17,-43,-67,-67,-37,-9,-30,-26,-42,-34,-114,-109,-110,-46,-95,-94,-96,-98,-115,-99,]),'L_LIST':([0,2,4,5,6,9,11,12,13,20,22,23,24,25,26,30,31,34,35,36,37,46,50,54,55,56,57,58,60,128,133,134,136,137,138,139,140,141,142,145,147,155,156,160,161,164,165,166,167,320,322,323,324,325,328,329,343,344,345,349,350,478,481,482,483,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,31,-92,-67,31,-85,-82,-59,57,-82,-36,-58,-86,-35,-55,31,-82,-35,-56,-68,57,-45,-111,-84,-75,-82,-82,-82,-60,-74,-35,-44,-87,57,31,-88,-48,-78,-92,31,-92,-35,-35,-93,-35,-79,-81,-80,-57,31,31,-49,57,-35,-47,-35,31,31,-35,-111,31,-67,-67,-22,57,-50,31,31,-100,31,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,31,31,-35,-42,-34,31,-35,-114,31,-35,-109,-35,31,-110,31,31,-46,-95,-94,-35,31,-35,-96,-98,-115,31,-99,]),'PRINT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,70,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,89,89,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,89,89,89,176,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-35,-44,-87,-88,-48,-92,-69,-72,-92,89,89,-35,-35,-93,-35,89,-57,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-69,-49,-35,-47,-35,89,89,-69,-69,-35,-111,-69,89,89,89,89,89,89,89,89,89,-67,-67,-22,-50,-69,-69,89,-100,-69,-35,-35,-112,-17,89,89,89,89,89,-43,-67,-67,-37,-9,-30,89,-35,-26,-69,-69,89,-35,89,89,-42,-34,-69,-35,-114,-69,-35,89,-109,-35,89,89,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'DIVIDE':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,290,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,290,-54,-253,-257,-220,-41,-6,-126,290,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,290,290,290,-243,290,-143,-261,290,-130,-143,-260,290,290,-267,-268,-266,-238,-242,290,290,290,290,-151,-152,290,290,290,290,290,290,290,290,290,290,290,290,290,290,-232,-265,-264,-263,290,290,290,290,290,290,-216,-217,-211,-182,290,-187,290,290,290,290,290,290,290,290,-210,290,290,290,290,290,290,-181,290,290,290,-180,290,290,-183,290,290,290,-143,-259,290,290,290,290,290,290,290,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,290,-251,290,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,290,290,-245,-150,-246,-233,-249,-121,-199,-38,290,-21,-14,-244,-103,-12,-237,-248,-247,-153,290,290,290,-65,-15,-102,-13,290,290,]),'UCFIRST':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,90,90,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-35,-44,-87,-88,-48,-92,-69,-72,-92,90,90,-35,-35,-93,-35,90,-57,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-69,-49,-35,-47,-35,90,90,-69,-69,-35,-111,-69,90,90,90,90,90,90,90,90,90,-67,-67,-22,-50,-69,-69,90,-100,-69,-35,-35,-112,-17,90,90,90,90,90,-43,-67,-67,-37,-9,-30,90,-35,-26,-69,-69,90,-35,90,90,-42,-34,-69,-35,-114,-69,-35,90,-109,-35,90,90,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'LLNOT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,91,91,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,-35,-44,-87,-88,-48,-92,-69,-72,-92,91,91,-35,-35,-93,-35,91,-57,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,-69,-49,-35,-47,-35,91,91,-69,-69,-35,-111,-69,91,91,91,91,91,91,91,91,91,-67,-67,-22,-50,-69,-69,91,-100,-69,-35,-35,-112,-17,91,91,91,91,91,-43,-67,-67,-37,-9,-30,91,-35,-26,-69,-69,91,-35,91,91,-42,-34,-69,-35,-114,-69,-35,91,-109,-35,91,91,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'OUR':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,41,46,50,59,60,63,65,67,71,73,74,75,76,77,79,80,81,82,83,84,87,89,90,91,94,95,98,99,100,101,105,107,108,109,112,117,118,122,124,126,129,133,134,136,139,140,142,145,146,147,150,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,330,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,410,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,582,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,92,92,-36,-58,-86,-35,-55,-73,-35,-56,-68,-101,-45,-111,-71,-60,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-35,-44,-87,-88,-48,-92,-69,-72,-92,92,92,92,-35,-35,-93,-35,92,-57,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-69,-49,-35,-47,-35,92,92,92,-69,-69,-35,-111,-69,92,92,92,92,92,92,92,92,92,92,-67,-67,-22,-50,-69,-69,92,-100,-69,-35,-35,-112,-17,92,92,92,92,92,-43,-67,-67,-37,-9,-30,92,-35,-26,-69,-69,92,-35,92,92,92,-42,-34,-69,-35,-114,-69,-35,92,-109,-35,92,92,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'MINUSEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,238,-241,-254,-258,-255,-253,-257,-252,-256,-243,238,-261,238,-260,-267,-268,-266,-242,-265,-264,-263,238,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'TWO_COLON':([112,193,202,305,],[259,259,259,259,]),'POWEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,240,-241,-254,-258,-255,-253,-257,-252,-256,-243,240,-261,240,-260,-267,-268,-266,-242,-265,-264,-263,240,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'REDUCER_KEY':([481,],[559,]),'SEMI':([0,2,4,5,12,14,17,18,19,22,23,25,26,28,34,35,36,46,50,60,61,62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,120,121,125,127,130,131,133,134,140,142,145,147,151,155,156,160,161,167,171,174,178,180,182,184,186,188,192,193,194,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,266,301,304,305,307,310,311,316,319,320,323,325,328,329,337,338,339,343,344,345,349,350,354,370,372,374,377,386,387,388,397,399,403,404,405,407,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,475,476,477,478,479,480,481,482,484,485,487,491,496,498,499,500,502,503,506,507,508,509,511,512,514,516,517,518,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,546,547,549,550,552,553,554,555,557,558,559,560,562,563,567,568,573,574,575,577,578,580,581,584,586,587,588,589,590,591,593,594,595,599,600,604,605,607,609,614,616,617,620,622,623,624,625,626,627,629,632,634,636,637,638,639,641,642,643,644,645,646,647,648,649,],[-35,5,-92,-67,-59,60,-61,-62,-66,-36,-58,-35,-55,134,-35,-56,-68,-45,-111,-60,167,-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-145,-271,-241,-137,-64,-136,-273,-131,-116,-116,-35,-44,-48,-92,5,-92,-105,-35,-35,-93,-35,-57,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-146,-188,-252,-256,-122,-39,-226,478,481,5,-49,-35,-47,-35,-91,-145,-106,5,5,-35,-111,5,-243,-261,-130,-63,-260,-267,-268,-266,-238,-242,-157,-171,-161,-151,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-144,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,-128,-127,-117,-67,-118,-129,-67,-22,-50,5,5,567,-100,5,-35,-35,-112,-17,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,-245,-150,-246,-233,-249,-121,-199,-38,-43,-67,-67,-37,-9,-30,-105,-35,-26,5,5,-35,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-176,-42,-34,615,5,-35,-114,5,-65,-35,-109,-35,5,-110,-15,-102,-13,-177,5,5,-46,-95,-94,-91,-91,-35,645,646,5,-35,-96,-98,-115,5,-99,]),'STR_LE':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,280,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,280,-54,-253,-257,-220,-41,-6,-126,280,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,280,280,280,-243,280,-143,-261,280,-130,-143,-260,280,280,-267,-268,-266,-238,-242,280,280,280,280,-151,-152,280,280,280,280,280,280,280,280,280,280,280,280,280,280,-232,-265,-264,-263,280,280,280,None,280,None,-216,-217,-211,-182,None,-187,280,-178,280,280,280,None,280,280,-210,-179,280,280,280,280,-223,-181,None,None,None,-180,280,280,-183,None,-192,-222,-143,-259,280,280,280,280,280,280,280,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,280,-251,280,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,280,280,-245,-150,-246,-233,-249,-121,-199,-38,280,-21,-14,-244,-103,-12,-237,-248,-247,-153,280,280,280,-65,-15,-102,-13,280,280,]),'LLXOR':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,282,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,282,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,282,282,282,-243,282,-143,-261,282,-130,-143,-260,282,282,-267,-268,-266,-238,-242,-157,-171,-161,282,-151,-152,-147,-154,282,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,282,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-143,-259,282,282,282,282,282,282,282,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,282,-251,282,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,282,282,-245,-150,-246,-233,-249,-121,-199,-38,282,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,282,282,-65,-15,-102,-13,282,282,]),'UNLESS':([0,2,4,5,7,12,22,23,25,26,34,35,36,46,50,60,62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,130,131,133,134,140,142,145,147,155,156,160,161,167,171,174,178,180,182,184,186,188,192,193,194,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,266,301,304,305,307,310,311,320,323,325,328,329,343,344,345,349,350,354,370,372,377,386,387,388,397,399,403,404,405,407,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,478,481,482,484,485,487,496,498,499,500,502,503,506,507,508,509,511,512,514,516,517,518,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,546,547,549,550,552,553,554,555,557,558,559,560,562,563,568,573,574,575,577,578,580,581,584,586,587,588,589,590,591,593,594,595,600,604,605,607,609,614,616,617,620,622,623,624,625,626,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-92,-92,-67,52,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-145,-271,-241,-137,-136,-273,-131,317,317,-35,-44,-48,-92,-92,-92,-35,-35,-93,-35,-57,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-146,-188,-252,-256,-122,-39,-226,-92,-49,-35,-47,-35,-92,-92,-35,-111,-92,-243,-261,-130,-260,-267,-268,-266,-238,-242,-157,-171,-161,-151,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-144,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,-67,-67,-22,-50,-92,-92,-100,-92,-35,-35,-112,-17,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,-245,-150,-246,-233,-249,-121,-199,-38,-43,-67,-67,-37,-9,-30,-35,-26,-92,-92,-35,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-176,-42,-34,-92,-35,-114,-92,-65,-35,-109,-35,-92,-110,-15,-102,-13,-177,-92,-92,-46,-95,-94,-35,-92,-35,-96,-98,-115,-92,-99,]),'EQUALS':([102,111,116,192,193,194,201,202,304,305,354,369,370,374,376,377,386,387,388,399,427,428,429,469,470,474,488,505,506,508,511,512,514,516,517,518,520,523,524,527,530,532,534,536,537,539,542,543,546,549,550,552,553,555,581,587,588,589,624,626,],[-262,243,-241,-254,-258,-255,-253,-257,-252,-256,-243,243,-261,522,243,-260,-267,-268,-266,-242,-265,-264,-263,243,-259,556,564,522,522,522,522,522,522,522,522,522,-251,522,-250,522,522,522,522,522,522,522,522,522,-245,-246,522,-249,522,522,-244,522,-248,-247,522,522,]),'PLUSEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,244,-241,-254,-258,-255,-253,-257,-252,-256,-243,244,-261,244,-260,-267,-268,-266,-242,-265,-264,-263,244,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'WHILE':([0,2,4,5,7,12,22,23,25,26,34,35,36,39,46,50,60,62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,130,131,133,134,140,142,145,147,155,156,160,161,167,171,174,178,180,182,184,186,188,192,193,194,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,266,301,304,305,307,310,311,320,323,325,328,329,343,344,345,349,350,354,370,372,377,386,387,388,397,399,403,404,405,407,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,478,481,482,484,485,487,496,497,498,499,500,502,503,506,507,508,509,511,512,514,516,517,518,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,546,547,549,550,552,553,554,555,557,558,559,560,562,563,568,573,574,575,577,578,580,581,584,586,587,588,589,590,591,593,594,595,600,604,605,607,609,614,616,617,620,622,623,624,625,626,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-92,-92,-67,43,-59,-36,-58,-35,-55,-35,-56,-68,148,-45,-111,-60,-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-145,-271,-241,-137,-136,-273,-131,314,314,-35,-44,-48,-92,-92,-92,-35,-35,-93,-35,-57,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-146,-188,-252,-256,-122,-39,-226,-92,-49,-35,-47,-35,-92,-92,-35,-111,-92,-243,-261,-130,-260,-267,-268,-266,-238,-242,-157,-171,-161,-151,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-144,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,-67,-67,-22,-50,-92,-92,-100,571,-92,-35,-35,-112,-17,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,-245,-150,-246,-233,-249,-121,-199,-38,-43,-67,-67,-37,-9,-30,-35,-26,-92,-92,-35,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-176,-42,-34,-92,-35,-114,-92,-65,-35,-109,-35,-92,-110,-15,-102,-13,-177,-92,-92,-46,-95,-94,-35,-92,-35,-96,-98,-115,-92,-99,]),'LANDEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,239,-241,-254,-258,-255,-253,-257,-252,-256,-243,239,-261,239,-260,-267,-268,-266,-242,-265,-264,-263,239,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'NUM_GT':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,548,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,293,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,293,-54,-253,-257,-220,-41,-6,-126,293,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,293,293,293,-243,293,-143,-261,293,-130,-143,-260,293,293,-267,-268,-266,-238,-242,293,293,293,293,-151,-152,293,293,293,293,293,293,293,293,293,293,293,293,293,293,-232,-265,-264,-263,293,293,293,None,293,None,-216,-217,-211,-182,None,-187,293,-178,293,293,293,None,293,293,-210,-179,293,293,293,293,-223,-181,None,None,None,-180,293,293,-183,None,-192,-222,-143,-259,293,293,293,293,293,293,293,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,293,-251,293,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,293,293,-245,-150,590,-246,-233,-249,-121,-199,-38,293,-21,-14,-244,-103,-12,-237,-248,-247,-153,293,293,293,-65,-15,-102,-13,293,293,]),'PLUS':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,62,63,64,65,67,69,71,72,73,74,75,76,77,78,81,82,84,87,89,90,91,94,95,97,99,100,101,102,103,105,107,108,109,110,111,112,114,115,116,119,121,122,124,125,126,127,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,236,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,260,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,304,305,306,307,308,309,310,311,313,314,315,317,318,320,323,325,328,329,331,338,340,341,343,344,345,349,350,351,354,359,362,364,368,369,370,371,372,373,376,377,378,382,384,386,387,388,396,397,399,401,402,403,404,405,406,407,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,478,479,480,481,482,484,485,487,489,490,494,496,498,499,500,502,503,506,507,508,509,511,512,513,514,516,517,518,519,520,521,523,524,525,526,527,528,529,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,551,552,553,554,555,556,557,558,559,560,562,563,566,567,568,573,574,575,576,577,578,580,581,583,584,586,587,588,589,590,591,592,593,594,595,600,604,605,606,607,609,614,615,616,617,618,619,620,622,623,624,625,627,629,630,631,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,94,94,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,-270,94,-139,94,94,-142,94,-138,94,94,94,94,94,-132,94,94,94,94,94,94,94,94,94,-135,94,94,94,-262,-272,94,94,94,94,-269,-143,-235,276,-271,-241,-137,-136,94,94,-273,94,-131,94,-35,-44,-87,-88,-48,-92,-69,-72,-92,94,94,-35,-35,-93,-35,94,-57,94,94,-149,94,94,-141,94,94,-215,94,-213,94,-8,94,-52,94,-124,94,-134,94,94,-254,-258,-255,276,94,-54,94,-253,-257,-220,94,94,94,-41,94,94,-6,94,-126,276,94,-185,94,-90,94,-189,-186,94,-77,94,-164,94,94,-166,-239,94,-156,94,-120,94,94,94,94,-190,94,94,94,94,94,94,94,-191,94,94,94,94,94,94,94,94,-234,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-188,94,-252,-256,94,-122,94,94,-39,-226,94,94,94,94,94,-69,-49,-35,-47,-35,94,276,276,94,-69,-69,-35,-111,-69,276,-243,94,276,94,94,-143,-261,276,-130,94,-143,-260,276,276,94,-267,-268,-266,94,-238,-242,94,94,276,276,276,276,-151,94,-152,276,276,276,276,276,276,276,276,276,276,276,276,276,276,-232,-265,-264,-263,276,276,276,276,276,276,-216,-217,-211,-182,276,-187,276,-178,276,276,276,276,276,276,-210,-179,276,276,276,276,276,-181,276,276,276,-180,276,276,-183,276,-192,276,-143,-259,276,276,276,-67,276,276,-67,-22,-50,-69,-69,276,94,276,-100,-69,-35,-35,-112,-17,-148,-83,-140,-113,-214,-212,94,-7,-51,-123,-133,276,-251,276,-53,-250,94,-184,-40,-198,94,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,276,276,-245,-150,-246,-233,94,-249,-121,-199,-38,94,-43,-67,-67,-37,-9,-30,276,94,-35,-26,-69,-69,94,-35,-21,-14,-244,94,-103,-12,-237,-248,-247,-153,276,94,276,-42,-34,-69,-35,-114,276,-69,-65,-35,94,-109,-35,94,94,-69,-110,-15,-102,-13,-69,-69,276,276,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'MINUSMINUS':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,102,105,107,108,109,111,112,116,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,192,193,194,197,199,201,202,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,304,305,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,354,359,364,368,369,370,373,376,377,384,386,387,388,396,399,401,402,408,427,428,429,469,470,478,481,482,484,485,487,490,496,498,499,500,502,503,513,520,524,525,529,546,549,551,552,556,557,558,559,560,562,563,567,568,573,574,575,576,577,581,583,588,589,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,98,98,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-262,98,98,98,98,250,98,-241,98,98,98,98,-35,-44,-87,-88,-48,-92,-69,-72,-92,98,98,-35,-35,-93,-35,98,-57,98,98,98,98,98,98,98,98,98,98,98,98,98,-254,-258,-255,98,98,-253,-257,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-252,-256,98,98,98,98,98,98,98,98,-69,-49,-35,-47,-35,98,98,-69,-69,-35,-111,-69,-243,98,98,98,250,-261,98,250,-260,98,-267,-268,-266,98,-242,98,98,98,-265,-264,-263,250,-259,-67,-67,-22,-50,-69,-69,98,-100,-69,-35,-35,-112,-17,98,-251,-250,98,98,-245,-246,98,-249,98,-43,-67,-67,-37,-9,-30,98,-35,-26,-69,-69,98,-35,-244,98,-248,-247,98,-42,-34,-69,-35,-114,-69,-35,98,-109,-35,98,98,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'SIZE':([0,2,4,5,9,11,12,20,22,23,24,25,26,30,31,34,35,36,46,50,56,57,58,60,133,134,136,139,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,24,-92,-67,-85,54,-59,54,-36,-58,-86,-35,-55,139,54,-35,-56,-68,-45,-111,54,54,54,-60,-35,-44,-87,-88,-48,-92,24,-92,-35,-35,-93,-35,-57,24,-49,-35,-47,-35,24,24,-35,-111,24,-67,-67,-22,-50,24,24,-100,24,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,24,24,-35,-42,-34,24,-35,-114,24,-35,-109,-35,24,-110,24,24,-46,-95,-94,-35,24,-35,-96,-98,-115,24,-99,]),'S_REGEX':([271,],[437,]),'L_ARRAY':([0,2,4,5,6,9,11,12,13,20,22,23,24,25,26,30,31,34,35,36,37,46,50,54,55,56,57,58,60,128,133,134,136,137,138,139,140,141,142,145,147,155,156,160,161,164,165,166,167,320,322,323,324,325,328,329,343,344,345,349,350,478,481,482,483,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,11,-92,-67,11,-85,-82,-59,58,-82,-36,-58,-86,-35,-55,11,-82,-35,-56,-68,58,-45,-111,-84,-75,-82,-82,-82,-60,-74,-35,-44,-87,58,11,-88,-48,-78,-92,11,-92,-35,-35,-93,-35,-79,-81,-80,-57,11,11,-49,58,-35,-47,-35,11,11,-35,-111,11,-67,-67,-22,58,-50,11,11,-100,11,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,11,11,-35,-42,-34,11,-35,-114,11,-35,-109,-35,11,-110,11,11,-46,-95,-94,-35,11,-35,-96,-98,-115,11,-99,]),'JAVA_IMPORT':([0,2,4,5,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,12,-92,-67,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,12,-92,-35,-35,-93,-35,-57,12,-49,-35,-47,-35,12,12,-35,-111,12,-67,-67,-22,-50,12,12,-100,12,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,12,12,-35,-42,-34,12,-35,-114,12,-35,-109,-35,12,-110,12,12,-46,-95,-94,-35,12,-35,-96,-98,-115,12,-99,]),'MINUS':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,62,63,64,65,67,69,71,72,73,74,75,76,77,78,81,82,84,87,89,90,91,94,95,97,99,100,101,102,103,105,107,108,109,110,111,112,114,115,116,119,121,122,124,125,126,127,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,191,192,193,194,195,197,198,199,201,202,203,204,205,206,207,208,209,210,211,212,213,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,236,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,260,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,304,305,306,307,308,309,310,311,313,314,315,317,318,320,323,325,328,329,331,338,340,341,343,344,345,349,350,351,354,359,362,364,368,369,370,371,372,373,376,377,378,382,384,386,387,388,396,397,399,401,402,403,404,405,406,407,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,478,479,480,481,482,484,485,487,489,490,494,496,498,499,500,502,503,506,507,508,509,511,512,513,514,516,517,518,519,520,521,523,524,525,526,527,528,529,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,551,552,553,554,555,556,557,558,559,560,562,563,566,567,568,573,574,575,576,577,578,580,581,583,584,586,587,588,589,590,591,592,593,594,595,600,604,605,606,607,609,614,615,616,617,618,619,620,622,623,624,625,627,629,630,631,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,99,99,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,-270,99,-139,99,99,-142,99,-138,99,99,99,99,99,-132,99,99,99,99,99,99,99,99,99,-135,99,99,99,-262,-272,99,99,99,99,-269,-143,-235,284,-271,-241,-137,-136,99,99,-273,99,-131,99,-35,-44,-87,-88,-48,-92,-69,-72,-92,99,99,-35,-35,-93,-35,99,-57,99,99,-149,99,99,-141,99,99,-215,99,-213,99,-8,99,-52,99,-124,99,-134,99,99,-254,-258,-255,284,99,-54,99,-253,-257,-220,99,99,99,-41,99,99,-6,99,-126,284,99,-185,99,-90,99,-189,-186,99,-77,99,-164,99,99,-166,-239,99,-156,99,-120,99,99,99,99,-190,99,99,99,99,99,99,99,-191,99,99,99,99,99,99,99,99,-234,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-188,99,-252,-256,99,-122,99,99,-39,-226,99,99,99,99,99,-69,-49,-35,-47,-35,99,284,284,99,-69,-69,-35,-111,-69,284,-243,99,284,99,99,-143,-261,284,-130,99,-143,-260,284,284,99,-267,-268,-266,99,-238,-242,99,99,284,284,284,284,-151,99,-152,284,284,284,284,284,284,284,284,284,284,284,284,284,284,-232,-265,-264,-263,284,284,284,284,284,284,-216,-217,-211,-182,284,-187,284,-178,284,284,284,284,284,284,-210,-179,284,284,284,284,284,-181,284,284,284,-180,284,284,-183,284,-192,284,-143,-259,284,284,284,-67,284,284,-67,-22,-50,-69,-69,284,99,284,-100,-69,-35,-35,-112,-17,-148,-83,-140,-113,-214,-212,99,-7,-51,-123,-133,284,-251,284,-53,-250,99,-184,-40,-198,99,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,284,284,-245,-150,-246,-233,99,-249,-121,-199,-38,99,-43,-67,-67,-37,-9,-30,284,99,-35,-26,-69,-69,99,-35,-21,-14,-244,99,-103,-12,-237,-248,-247,-153,284,99,284,-42,-34,-69,-35,-114,284,-69,-65,-35,99,-109,-35,99,99,-69,-110,-15,-102,-13,-69,-69,284,284,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'LC':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,109,109,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-35,-44,-87,-88,-48,-92,-69,-72,-92,109,109,-35,-35,-93,-35,109,-57,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-69,-49,-35,-47,-35,109,109,-69,-69,-35,-111,-69,109,109,109,109,109,109,109,109,109,-67,-67,-22,-50,-69,-69,109,-100,-69,-35,-35,-112,-17,109,109,109,109,109,-43,-67,-67,-37,-9,-30,109,-35,-26,-69,-69,109,-35,109,109,-42,-34,-69,-35,-114,-69,-35,109,-109,-35,109,109,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'DEFINED':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,100,100,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-35,-44,-87,-88,-48,-92,-69,-72,-92,100,100,-35,-35,-93,-35,100,-57,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-69,-49,-35,-47,-35,100,100,-69,-69,-35,-111,-69,100,100,100,100,100,100,100,100,100,-67,-67,-22,-50,-69,-69,100,-100,-69,-35,-35,-112,-17,100,100,100,100,100,-43,-67,-67,-37,-9,-30,100,-35,-26,-69,-69,100,-35,100,100,-42,-34,-69,-35,-114,-69,-35,100,-109,-35,100,100,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'SPLICE':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,86,86,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-35,-44,-87,-88,-48,-92,-69,-72,-92,86,86,-35,-35,-93,-35,86,-57,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-69,-49,-35,-47,-35,86,86,-69,-69,-35,-111,-69,86,86,86,86,86,86,86,86,86,-67,-67,-22,-50,-69,-69,86,-100,-69,-35,-35,-112,-17,86,86,86,86,86,-43,-67,-67,-37,-9,-30,86,-35,-26,-69,-69,86,-35,86,86,-42,-34,-69,-35,-114,-69,-35,86,-109,-35,86,86,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'LENGTH':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,101,101,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-35,-44,-87,-88,-48,-92,-69,-72,-92,101,101,-35,-35,-93,-35,101,-57,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-69,-49,-35,-47,-35,101,101,-69,-69,-35,-111,-69,101,101,101,101,101,101,101,101,101,-67,-67,-22,-50,-69,-69,101,-100,-69,-35,-35,-112,-17,101,101,101,101,101,-43,-67,-67,-37,-9,-30,101,-35,-26,-69,-69,101,-35,101,101,-42,-34,-69,-35,-114,-69,-35,101,-109,-35,101,101,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'TIMESEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,252,-241,-254,-258,-255,-253,-257,-252,-256,-243,252,-261,252,-260,-267,-268,-266,-242,-265,-264,-263,252,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'LNOT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,126,126,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,-35,-44,-87,-88,-48,-92,-69,-72,-92,126,126,-35,-35,-93,-35,126,-57,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,-69,-49,-35,-47,-35,126,126,-69,-69,-35,-111,-69,126,126,126,126,126,126,126,126,126,-67,-67,-22,-50,-69,-69,126,-100,-69,-35,-35,-112,-17,126,126,126,126,126,-43,-67,-67,-37,-9,-30,126,-35,-26,-69,-69,126,-35,126,126,-42,-34,-69,-35,-114,-69,-35,126,-109,-35,126,126,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'NUM_LT':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,243,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,291,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,291,-54,-253,-257,-220,-41,-6,-126,291,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,410,-191,-234,-188,-252,-256,-122,-39,-226,291,291,291,-243,291,-143,-261,291,-130,-143,-260,291,291,-267,-268,-266,-238,-242,291,291,291,291,-151,-152,291,291,291,291,291,291,291,291,291,291,291,291,291,291,-232,-265,-264,-263,291,291,291,None,291,None,-216,-217,-211,-182,None,-187,291,-178,291,291,291,None,291,291,-210,-179,291,291,291,291,-223,-181,None,None,None,-180,291,291,-183,None,-192,-222,-143,-259,291,291,291,291,291,291,291,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,291,-251,291,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,291,291,-245,-150,-246,-233,-249,-121,-199,-38,291,-21,-14,-244,-103,-12,-237,-248,-247,-153,291,291,291,-65,-15,-102,-13,291,291,]),'TYPE':([0,2,4,5,8,9,11,12,13,20,22,23,24,25,26,29,30,31,34,35,36,37,44,46,50,53,54,55,56,57,58,60,128,133,134,135,136,137,139,140,141,142,143,145,147,154,155,156,160,161,163,164,165,166,167,320,321,323,324,325,326,328,329,342,343,344,345,349,350,478,481,482,483,484,485,487,495,496,498,499,500,502,503,557,558,559,560,561,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,16,-92,-67,53,-85,-82,-59,59,-82,-36,-58,-86,-35,-55,-31,140,-82,-35,-56,-68,146,154,-45,-111,163,-84,-75,-82,-82,-82,-60,-74,-35,-44,321,-87,323,-88,-48,-78,-92,-31,16,-92,342,-35,-35,-93,-35,352,-79,-81,-80,-57,16,-32,-49,484,-35,321,-47,-35,495,16,16,-35,-111,16,-67,-67,-22,561,-50,16,16,570,-100,16,-35,-35,-112,-17,-43,-67,-67,-37,-33,-9,-30,-35,-26,16,16,-35,-42,-34,16,-35,-114,16,-35,-109,-35,16,-110,16,16,-46,-95,-94,-35,16,-35,-96,-98,-115,16,-99,]),'STRING_DOUBLE_QUOTE':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,103,103,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-35,-44,-87,-88,-48,-92,-69,-72,-92,103,103,-35,-35,-93,-35,103,-57,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-69,-49,-35,-47,-35,103,103,-69,-69,-35,-111,-69,103,103,103,103,103,103,103,103,103,-67,-67,-22,-50,-69,-69,103,-100,-69,-35,-35,-112,-17,103,103,103,103,103,-43,-67,-67,-37,-9,-30,103,-35,-26,-69,-69,103,-35,103,103,-42,-34,-69,-35,-114,-69,-35,103,-109,-35,103,103,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'STR_GT':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,268,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,268,-54,-253,-257,-220,-41,-6,-126,268,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,268,268,268,-243,268,-143,-261,268,-130,-143,-260,268,268,-267,-268,-266,-238,-242,268,268,268,268,-151,-152,268,268,268,268,268,268,268,268,268,268,268,268,268,268,-232,-265,-264,-263,268,268,268,None,268,None,-216,-217,-211,-182,None,-187,268,-178,268,268,268,None,268,268,-210,-179,268,268,268,268,-223,-181,None,None,None,-180,268,268,-183,None,-192,-222,-143,-259,268,268,268,268,268,268,268,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,268,-251,268,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,268,268,-245,-150,-246,-233,-249,-121,-199,-38,268,-21,-14,-244,-103,-12,-237,-248,-247,-153,268,268,268,-65,-15,-102,-13,268,268,]),'XEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,255,-241,-254,-258,-255,-253,-257,-252,-256,-243,255,-261,255,-260,-267,-268,-266,-242,-265,-264,-263,255,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'MODEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,256,-241,-254,-258,-255,-253,-257,-252,-256,-243,256,-261,256,-260,-267,-268,-266,-242,-265,-264,-263,256,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'LAST':([0,2,4,5,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,17,-92,-67,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,17,-92,-35,-35,-93,-35,-57,17,-49,-35,-47,-35,17,17,-35,-111,17,-67,-67,-22,-50,17,17,-100,17,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,17,17,-35,-42,-34,17,-35,-114,17,-35,-109,-35,17,-110,17,17,-46,-95,-94,-35,17,-35,-96,-98,-115,17,-99,]),'RSHIFT':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,289,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,289,-54,-253,-257,-220,-41,-6,-126,289,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,289,289,289,-243,289,-143,-261,289,-130,-143,-260,289,289,-267,-268,-266,-238,-242,289,289,289,289,-151,-152,289,289,289,289,289,289,289,289,289,289,289,289,289,289,-232,-265,-264,-263,289,289,289,289,289,289,-216,-217,-211,-182,289,-187,289,-178,289,289,289,289,289,289,-210,-179,289,289,289,289,-223,-181,289,289,289,-180,289,289,-183,289,-192,-222,-143,-259,289,289,289,289,289,289,289,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,289,-251,289,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,289,289,-245,-150,-246,-233,-249,-121,-199,-38,289,-21,-14,-244,-103,-12,-237,-248,-247,-153,289,289,289,-65,-15,-102,-13,289,289,]),'STR_GE':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,298,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,298,-54,-253,-257,-220,-41,-6,-126,298,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,298,298,298,-243,298,-143,-261,298,-130,-143,-260,298,298,-267,-268,-266,-238,-242,298,298,298,298,-151,-152,298,298,298,298,298,298,298,298,298,298,298,298,298,298,-232,-265,-264,-263,298,298,298,None,298,None,-216,-217,-211,-182,None,-187,298,-178,298,298,298,None,298,298,-210,-179,298,298,298,298,-223,-181,None,None,None,-180,298,298,-183,None,-192,-222,-143,-259,298,298,298,298,298,298,298,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,298,-251,298,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,298,298,-245,-150,-246,-233,-249,-121,-199,-38,298,-21,-14,-244,-103,-12,-237,-248,-247,-153,298,298,298,-65,-15,-102,-13,298,298,]),'L_HASH':([0,2,4,5,6,9,11,12,13,20,22,23,24,25,26,30,31,34,35,36,37,46,50,54,55,56,57,58,60,128,133,134,136,137,138,139,140,141,142,145,147,155,156,160,161,164,165,166,167,320,322,323,324,325,328,329,343,344,345,349,350,478,481,482,483,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,20,-92,-67,20,-85,-82,-59,56,-82,-36,-58,-86,-35,-55,20,-82,-35,-56,-68,56,-45,-111,-84,-75,-82,-82,-82,-60,-74,-35,-44,-87,56,20,-88,-48,-78,-92,20,-92,-35,-35,-93,-35,-79,-81,-80,-57,20,20,-49,56,-35,-47,-35,20,20,-35,-111,20,-67,-67,-22,56,-50,20,20,-100,20,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,20,20,-35,-42,-34,20,-35,-114,20,-35,-109,-35,20,-110,20,20,-46,-95,-94,-35,20,-35,-96,-98,-115,20,-99,]),'REDUCER_VALUE':([481,],[558,]),'SUBSTR':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,96,96,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-35,-44,-87,-88,-48,-92,-69,-72,-92,96,96,-35,-35,-93,-35,96,-57,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-69,-49,-35,-47,-35,96,96,-69,-69,-35,-111,-69,96,96,96,96,96,96,96,96,96,-67,-67,-22,-50,-69,-69,96,-100,-69,-35,-35,-112,-17,96,96,96,96,96,-43,-67,-67,-37,-9,-30,96,-35,-26,-69,-69,96,-35,96,96,-42,-34,-69,-35,-114,-69,-35,96,-109,-35,96,96,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'RPAREN':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,196,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,258,260,266,301,304,305,307,310,311,312,338,339,340,351,353,354,355,356,357,358,360,361,362,363,365,366,367,370,372,375,377,379,380,381,382,383,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,403,404,405,407,408,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,471,472,473,489,494,506,507,508,509,510,511,512,514,515,516,517,518,519,520,521,523,524,526,527,528,530,531,532,533,534,535,536,537,538,539,540,541,542,543,546,547,549,550,552,553,554,555,566,578,579,580,581,584,585,586,587,588,589,590,591,596,606,608,609,610,611,612,615,623,624,625,628,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-145,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,372,374,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,425,-234,-146,-188,-252,-256,-122,-39,-226,474,492,-106,493,504,505,-243,506,507,508,509,511,512,372,514,516,517,518,-261,-130,523,-260,526,527,528,372,530,532,-267,-268,-266,533,534,535,536,537,538,539,540,-238,542,-242,543,-157,-171,-161,-151,547,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,550,-265,-264,-263,-227,-208,-144,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,553,554,555,565,569,-148,-83,-140,-113,578,-214,-212,-7,580,-51,-123,-133,372,-251,581,-53,-250,-184,-40,-198,-5,586,-125,-23,-89,-172,-76,-163,-29,-165,-236,587,-155,-119,-245,-150,-246,-233,-249,-121,-199,-38,598,-21,608,-14,-244,-103,611,-12,-237,-248,-247,-153,-231,613,621,623,-65,624,625,626,-105,-15,-102,-13,635,637,638,]),'ELSE':([50,159,349,616,622,647,],[-92,347,-92,-109,-110,-115,]),'STR_LT':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,270,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,270,-54,-253,-257,-220,-41,-6,-126,270,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,270,270,270,-243,270,-143,-261,270,-130,-143,-260,270,270,-267,-268,-266,-238,-242,270,270,270,270,-151,-152,270,270,270,270,270,270,270,270,270,270,270,270,270,270,-232,-265,-264,-263,270,270,270,None,270,None,-216,-217,-211,-182,None,-187,270,-178,270,270,270,None,270,270,-210,-179,270,270,270,270,-223,-181,None,None,None,-180,270,270,-183,None,-192,-222,-143,-259,270,270,270,270,270,270,270,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,270,-251,270,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,270,270,-245,-150,-246,-233,-249,-121,-199,-38,270,-21,-14,-244,-103,-12,-237,-248,-247,-153,270,270,270,-65,-15,-102,-13,270,270,]),'LBRACKET':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,79,80,81,82,83,84,87,89,90,91,94,95,98,99,100,101,102,105,107,108,109,111,112,116,117,118,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,192,193,194,197,199,201,202,204,205,206,208,209,211,217,219,221,222,224,226,228,229,231,232,235,237,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,304,305,306,308,309,313,314,315,317,318,320,323,325,328,329,330,331,341,343,344,345,349,350,354,359,364,368,369,370,373,376,377,384,386,387,388,396,399,401,402,408,410,427,428,429,469,470,478,481,482,484,485,487,488,490,496,498,499,500,502,503,513,520,524,525,529,546,548,549,551,552,556,557,558,559,560,562,563,567,568,573,574,575,576,577,581,582,583,588,589,592,594,595,600,604,605,607,609,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,108,108,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,-262,108,108,108,108,241,108,-241,108,108,108,108,108,108,-35,-44,-87,-88,-48,-92,-69,-72,-92,108,108,-35,-35,-93,-35,108,-57,108,108,108,108,108,108,108,108,108,108,108,108,108,241,-258,241,108,108,241,-257,108,108,108,108,108,108,108,108,108,241,108,108,108,108,108,108,108,402,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,241,108,241,-256,108,108,108,108,108,108,108,108,-69,-49,-35,-47,-35,108,108,108,-69,-69,-35,-111,-69,-243,108,108,108,241,-261,108,241,-260,108,-267,-268,-266,108,-242,108,108,108,108,-265,-264,-263,241,-259,-67,-67,-22,-50,-69,-69,241,108,-100,-69,-35,-35,-112,-17,108,-251,-250,108,108,-245,241,-246,108,-249,108,-43,-67,-67,-37,-9,-30,108,-35,-26,-69,-69,108,-35,-244,108,108,-248,-247,108,-42,-34,-69,-35,-114,-69,241,-35,108,-109,-35,108,108,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'LLOR':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,264,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,264,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,264,264,264,-243,264,-143,-261,264,-130,-143,-260,264,264,-267,-268,-266,-238,-242,-157,-171,-161,264,-151,-152,-147,-154,264,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,264,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-143,-259,264,264,264,264,264,264,264,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,264,-251,264,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,264,264,-245,-150,-246,-233,-249,-121,-199,-38,264,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,264,264,-65,-15,-102,-13,264,264,]),'STR_REX':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,271,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,271,-54,-253,-257,-220,-41,-6,-126,271,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,271,271,271,-243,271,-143,-261,271,-130,-143,-260,271,271,-267,-268,-266,-238,-242,271,271,271,271,-151,-152,271,271,271,271,271,271,271,271,271,271,271,271,271,271,-232,-265,-264,-263,271,271,271,271,271,271,-216,-217,-211,-182,271,271,271,271,271,271,271,271,271,271,-210,271,271,271,271,271,271,271,271,271,271,271,271,271,271,271,271,271,-143,-259,271,271,271,271,271,271,271,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,271,-251,271,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,271,271,-245,-150,-246,-233,-249,-121,-199,-38,271,-21,-14,-244,-103,-12,-237,-248,-247,-153,271,271,271,-65,-15,-102,-13,271,271,]),'POW':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,272,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,272,-54,-253,-257,272,-41,-6,-126,272,272,-90,-189,272,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,272,272,272,272,-243,272,-143,-261,272,-130,-143,-260,272,272,-267,-268,-266,-238,-242,272,272,272,272,-151,-152,272,272,272,272,272,272,272,272,272,272,272,272,272,272,-232,-265,-264,-263,272,272,272,272,272,272,-216,-217,-211,272,272,272,272,272,272,272,272,272,272,272,-210,272,272,272,272,272,272,272,272,272,272,272,272,272,272,272,272,272,-143,-259,272,272,272,272,272,272,272,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,272,-251,272,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,272,272,-245,-150,-246,-233,-249,-121,-199,-38,272,-21,-14,-244,-103,-12,-237,-248,-247,-153,272,272,272,-65,-15,-102,-13,272,272,]),'NUM_LE':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,273,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,273,-54,-253,-257,-220,-41,-6,-126,273,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,273,273,273,-243,273,-143,-261,273,-130,-143,-260,273,273,-267,-268,-266,-238,-242,273,273,273,273,-151,-152,273,273,273,273,273,273,273,273,273,273,273,273,273,273,-232,-265,-264,-263,273,273,273,None,273,None,-216,-217,-211,-182,None,-187,273,-178,273,273,273,None,273,273,-210,-179,273,273,273,273,-223,-181,None,None,None,-180,273,273,-183,None,-192,-222,-143,-259,273,273,273,273,273,273,273,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,273,-251,273,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,273,273,-245,-150,-246,-233,-249,-121,-199,-38,273,-21,-14,-244,-103,-12,-237,-248,-247,-153,273,273,273,-65,-15,-102,-13,273,273,]),'$end':([0,1,2,3,5,10,12,22,23,25,26,35,36,46,50,60,132,134,140,160,167,323,328,349,478,481,482,484,496,502,503,557,558,559,560,562,563,573,594,595,605,616,622,632,634,636,645,646,647,649,],[-35,0,-18,-11,-67,-16,-59,-36,-58,-35,-55,-56,-68,-45,-111,-60,-19,-44,-48,-93,-57,-49,-47,-111,-67,-67,-22,-50,-100,-112,-17,-43,-67,-67,-37,-9,-30,-26,-42,-34,-114,-109,-110,-46,-95,-94,-96,-98,-115,-99,]),'SPLIT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,93,93,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-35,-44,-87,-88,-48,-92,-69,-72,-92,93,93,-35,-35,-93,-35,93,-57,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-69,-49,-35,-47,-35,93,93,-69,-69,-35,-111,-69,93,93,93,93,93,93,93,93,93,-67,-67,-22,-50,-69,-69,93,-100,-69,-35,-35,-112,-17,93,93,93,93,93,-43,-67,-67,-37,-9,-30,93,-35,-26,-69,-69,93,-35,93,93,-42,-34,-69,-35,-114,-69,-35,93,-109,-35,93,93,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'INT_NUMBER':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,110,110,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-35,-44,-87,-88,-48,-92,-69,-72,-92,110,110,-35,-35,-93,-35,110,-57,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-69,-49,-35,-47,-35,110,110,-69,-69,-35,-111,-69,110,110,110,110,110,110,110,110,110,-67,-67,-22,-50,-69,-69,110,-100,-69,-35,-35,-112,-17,110,110,110,110,110,-43,-67,-67,-37,-9,-30,110,-35,-26,-69,-69,110,-35,110,110,-42,-34,-69,-35,-114,-69,-35,110,-109,-35,110,110,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'PERIODEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,246,-241,-254,-258,-255,-253,-257,-252,-256,-243,246,-261,246,-260,-267,-268,-266,-242,-265,-264,-263,246,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'OPEN':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,66,66,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-35,-44,-87,-88,-48,-92,-69,-72,-92,66,66,-35,-35,-93,-35,66,-57,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-69,-49,-35,-47,-35,66,66,-69,-69,-35,-111,-69,66,66,66,66,66,66,66,66,66,-67,-67,-22,-50,-69,-69,66,-100,-69,-35,-35,-112,-17,66,66,66,66,66,-43,-67,-67,-37,-9,-30,66,-35,-26,-69,-69,66,-35,66,66,-42,-34,-69,-35,-114,-69,-35,66,-109,-35,66,66,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'QUEST_CLOSE':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,278,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,278,-54,-253,-257,-220,-41,-6,-126,278,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,278,278,278,-243,278,-143,-261,278,-130,-143,-260,278,278,-267,-268,-266,-238,-242,278,278,278,278,-151,-152,278,278,278,278,278,278,278,278,278,278,278,278,278,278,-232,-265,-264,-263,278,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,278,-209,-205,-193,278,-210,-179,-224,-194,-221,278,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-143,-259,278,278,278,278,278,278,278,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,278,-251,278,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,278,278,-245,-150,-246,-233,-249,-121,-199,-38,278,-21,-14,-244,-103,-12,-237,-248,-247,-153,278,278,278,-65,-15,-102,-13,278,278,]),'REF':([0,2,4,5,9,12,22,23,24,25,26,29,30,34,35,36,46,50,60,133,134,135,136,139,140,142,143,145,147,155,156,160,161,167,320,321,323,325,326,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,561,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,6,-92,-67,-85,-59,-36,-58,-86,-35,-55,-31,138,-35,-56,-68,-45,-111,-60,-35,-44,322,-87,-88,-48,-92,-31,6,-92,-35,-35,-93,-35,-57,6,-32,-49,-35,322,-47,-35,6,6,-35,-111,6,-67,-67,-22,-50,6,6,-100,6,-35,-35,-112,-17,-43,-67,-67,-37,-33,-9,-30,-35,-26,6,6,-35,-42,-34,6,-35,-114,6,-35,-109,-35,6,-110,6,6,-46,-95,-94,-35,6,-35,-96,-98,-115,6,-99,]),'SYSTEM':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,105,105,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,-35,-44,-87,-88,-48,-92,-69,-72,-92,105,105,-35,-35,-93,-35,105,-57,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,-69,-49,-35,-47,-35,105,105,-69,-69,-35,-111,-69,105,105,105,105,105,105,105,105,105,-67,-67,-22,-50,-69,-69,105,-100,-69,-35,-35,-112,-17,105,105,105,105,105,-43,-67,-67,-37,-9,-30,105,-35,-26,-69,-69,105,-35,105,105,-42,-34,-69,-35,-114,-69,-35,105,-109,-35,105,105,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'NUM_EQ':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,281,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,281,-54,-253,-257,-220,-41,-6,-126,281,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,281,281,281,-243,281,-143,-261,281,-130,-143,-260,281,281,-267,-268,-266,-238,-242,281,281,281,281,-151,-152,281,281,281,281,281,281,281,281,281,281,281,281,281,281,-232,-265,-264,-263,281,None,281,-206,281,-204,-216,-217,-211,-182,-196,-187,None,-178,281,281,None,-205,None,281,-210,-179,281,None,281,281,-223,-181,-195,-200,-197,-180,None,None,-183,-207,-192,-222,-143,-259,281,281,281,281,281,281,281,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,281,-251,281,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,281,281,-245,-150,-246,-233,-249,-121,-199,-38,281,-21,-14,-244,-103,-12,-237,-248,-247,-153,281,281,281,-65,-15,-102,-13,281,281,]),'ID':([0,2,4,5,9,12,15,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,79,81,82,83,84,87,89,90,91,94,95,99,100,101,105,106,107,108,109,112,118,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,190,191,197,199,200,204,205,206,208,209,211,214,215,216,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,259,261,262,263,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,303,306,308,309,313,314,315,317,318,320,323,325,327,328,329,331,332,333,336,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,61,-70,112,112,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,112,112,112,112,112,112,112,112,112,193,112,112,202,112,112,112,112,112,112,112,112,112,112,112,231,112,112,112,112,305,112,112,112,112,-35,-44,-87,-88,-48,-92,-69,-72,-92,112,112,-35,-35,-93,-35,112,-57,112,112,112,112,112,112,112,112,112,112,112,112,370,112,112,112,377,112,112,112,112,112,112,386,387,388,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,-240,427,428,429,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,470,112,112,112,112,112,112,112,112,-69,-49,-35,486,-47,-35,112,305,202,193,112,-69,-69,-35,-111,-69,112,112,112,112,112,112,112,112,112,-67,-67,-22,-50,-69,-69,112,-100,-69,-35,-35,-112,-17,112,112,112,112,112,-43,-67,-67,-37,-9,-30,112,-35,-26,-69,-69,112,-35,112,112,-42,-34,-69,-35,-114,-69,-35,112,-109,-35,112,112,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'STR_NO_REX':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,283,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,283,-54,-253,-257,-220,-41,-6,-126,283,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,283,283,283,-243,283,-143,-261,283,-130,-143,-260,283,283,-267,-268,-266,-238,-242,283,283,283,283,-151,-152,283,283,283,283,283,283,283,283,283,283,283,283,283,283,-232,-265,-264,-263,283,283,283,283,283,283,-216,-217,-211,-182,283,283,283,283,283,283,283,283,283,283,-210,283,283,283,283,283,283,283,283,283,283,283,283,283,283,283,283,283,-143,-259,283,283,283,283,283,283,283,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,283,-251,283,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,283,283,-245,-150,-246,-233,-249,-121,-199,-38,283,-21,-14,-244,-103,-12,-237,-248,-247,-153,283,283,283,-65,-15,-102,-13,283,283,]),'TWO_PERIOD':([62,64,69,72,78,97,102,103,110,111,112,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,354,362,370,371,372,377,382,386,387,388,397,399,403,404,405,407,409,411,412,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,506,507,508,509,511,512,514,516,517,518,519,520,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,546,547,549,550,552,553,554,555,578,580,581,584,586,587,588,589,590,591,609,623,624,625,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,373,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,-243,373,-261,373,-130,-260,373,-267,-268,-266,-238,-242,-157,-171,-161,-151,-152,-147,-154,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,-227,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,-209,-205,-193,-230,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-259,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,373,-251,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,-245,-150,-246,-233,-249,-121,-199,-38,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,-65,-15,-102,-13,]),'REDUCER_OP':([0,2,4,5,7,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-92,-92,-67,48,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,-92,-92,-35,-35,-93,-35,-57,-92,-49,-35,-47,-35,-92,-92,-35,-111,-92,-67,-67,-22,-50,-92,-92,-100,-92,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,-92,-92,-35,-42,-34,-92,-35,-114,-92,-35,-109,-35,-92,-110,-92,-92,-46,-95,-94,-35,-92,-35,-96,-98,-115,-92,-99,]),'MY':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,41,46,50,59,60,63,65,67,71,73,74,75,76,77,79,80,81,82,83,84,87,89,90,91,94,95,98,99,100,101,105,107,108,109,112,117,118,122,124,126,129,133,134,136,139,140,142,145,146,147,150,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,330,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,410,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,582,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,113,113,-36,-58,-86,-35,-55,-73,-35,-56,-68,-101,-45,-111,-71,-60,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,-35,-44,-87,-88,-48,-92,-69,-72,-92,113,113,113,-35,-35,-93,-35,113,-57,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,-69,-49,-35,-47,-35,113,113,113,-69,-69,-35,-111,-69,113,113,113,113,113,113,113,113,113,113,-67,-67,-22,-50,-69,-69,113,-100,-69,-35,-35,-112,-17,113,113,113,113,113,-43,-67,-67,-37,-9,-30,113,-35,-26,-69,-69,113,-35,113,113,113,-42,-34,-69,-35,-114,-69,-35,113,-109,-35,113,113,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'STRING_QUOTE':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,115,115,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-35,-44,-87,-88,-48,-92,-69,-72,-92,115,115,-35,-35,-93,-35,115,-57,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-69,-49,-35,-47,-35,115,115,-69,-69,-35,-111,-69,115,115,115,115,115,115,115,115,115,-67,-67,-22,-50,-69,-69,115,-100,-69,-35,-35,-112,-17,115,115,115,115,115,-43,-67,-67,-37,-9,-30,115,-35,-26,-69,-69,115,-35,115,115,-42,-34,-69,-35,-114,-69,-35,115,-109,-35,115,115,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'LLAND':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,288,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,288,-54,-253,-257,-220,-41,-6,-126,-229,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,288,288,288,-243,288,-143,-261,288,-130,-143,-260,288,288,-267,-268,-266,-238,-242,-157,-171,-161,288,-151,-152,-147,-154,288,-175,-169,-167,-159,-162,-158,-173,-168,-174,-160,-170,-232,-265,-264,-263,288,-208,-219,-206,-218,-204,-216,-217,-211,-182,-196,-187,-203,-178,-225,288,-209,-205,-193,288,-210,-179,-224,-194,-221,-228,-223,-181,-195,-200,-197,-180,-202,-201,-183,-207,-192,-222,-143,-259,288,288,288,288,288,288,288,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,288,-251,288,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,288,288,-245,-150,-246,-233,-249,-121,-199,-38,288,-21,-14,-244,-103,-12,-237,-248,-247,-153,-231,288,288,-65,-15,-102,-13,288,288,]),'PLUSPLUS':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,102,105,107,108,109,111,112,116,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,192,193,194,197,199,201,202,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,304,305,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,354,359,364,368,369,370,373,376,377,384,386,387,388,396,399,401,402,408,427,428,429,469,470,478,481,482,484,485,487,490,496,498,499,500,502,503,513,520,524,525,529,546,549,551,552,556,557,558,559,560,562,563,567,568,573,574,575,576,577,581,583,588,589,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,117,117,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,-262,117,117,117,117,242,117,-241,117,117,117,117,-35,-44,-87,-88,-48,-92,-69,-72,-92,117,117,-35,-35,-93,-35,117,-57,117,117,117,117,117,117,117,117,117,117,117,117,117,-254,-258,-255,117,117,-253,-257,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,-252,-256,117,117,117,117,117,117,117,117,-69,-49,-35,-47,-35,117,117,-69,-69,-35,-111,-69,-243,117,117,117,242,-261,117,242,-260,117,-267,-268,-266,117,-242,117,117,117,-265,-264,-263,242,-259,-67,-67,-22,-50,-69,-69,117,-100,-69,-35,-35,-112,-17,117,-251,-250,117,117,-245,-246,117,-249,117,-43,-67,-67,-37,-9,-30,117,-35,-26,-69,-69,117,-35,-244,117,-248,-247,117,-42,-34,-69,-35,-114,-69,-35,117,-109,-35,117,117,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'COMMENT_LINE':([5,478,481,558,559,],[36,36,36,36,36,]),'MAPPER_CODE':([0,2,4,5,12,22,23,25,26,34,35,36,46,50,60,133,134,140,142,145,147,155,156,160,161,167,320,323,325,328,329,343,344,345,349,350,478,481,482,484,485,487,496,498,499,500,502,503,557,558,559,560,562,563,568,573,574,575,577,594,595,600,604,605,607,614,616,617,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,8,-92,-67,-59,-36,-58,-35,-55,-35,-56,-68,-45,-111,-60,-35,-44,-48,-92,8,-92,-35,-35,-93,-35,-57,8,-49,-35,-47,-35,8,8,-35,-111,8,-67,-67,-22,-50,8,8,-100,8,-35,-35,-112,-17,-43,-67,-67,-37,-9,-30,-35,-26,8,8,-35,-42,-34,8,-35,-114,8,-35,-109,-35,8,-110,8,8,-46,-95,-94,-35,8,-35,-96,-98,-115,8,-99,]),'LOREQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,253,-241,-254,-258,-255,-253,-257,-252,-256,-243,253,-261,253,-260,-267,-268,-266,-242,-265,-264,-263,253,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'UNDEF':([243,],[407,]),'ELSIF':([50,159,349,616,622,647,],[-92,348,-92,-109,-110,-115,]),'UNSHIFT':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,123,123,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,-35,-44,-87,-88,-48,-92,-69,-72,-92,123,123,-35,-35,-93,-35,123,-57,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,-69,-49,-35,-47,-35,123,123,-69,-69,-35,-111,-69,123,123,123,123,123,123,123,123,123,-67,-67,-22,-50,-69,-69,123,-100,-69,-35,-35,-112,-17,123,123,123,123,123,-43,-67,-67,-37,-9,-30,123,-35,-26,-69,-69,123,-35,123,123,-42,-34,-69,-35,-114,-69,-35,123,-109,-35,123,123,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'RSHIFTEQUAL':([102,111,116,192,193,194,201,202,304,305,354,369,370,376,377,386,387,388,399,427,428,429,469,470,520,524,546,549,552,581,588,589,],[-262,257,-241,-254,-258,-255,-253,-257,-252,-256,-243,257,-261,257,-260,-267,-268,-266,-242,-265,-264,-263,257,-259,-251,-250,-245,-246,-249,-244,-248,-247,]),'KEYS':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,124,124,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,-35,-44,-87,-88,-48,-92,-69,-72,-92,124,124,-35,-35,-93,-35,124,-57,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,-69,-49,-35,-47,-35,124,124,-69,-69,-35,-111,-69,124,124,124,124,124,124,124,124,124,-67,-67,-22,-50,-69,-69,124,-100,-69,-35,-35,-112,-17,124,124,124,124,124,-43,-67,-67,-37,-9,-30,124,-35,-26,-69,-69,124,-35,124,124,-42,-34,-69,-35,-114,-69,-35,124,-109,-35,124,124,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'CMD':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,125,125,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,-35,-44,-87,-88,-48,-92,-69,-72,-92,125,125,-35,-35,-93,-35,125,-57,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,-69,-49,-35,-47,-35,125,125,-69,-69,-35,-111,-69,125,125,125,125,125,125,125,125,125,-67,-67,-22,-50,-69,-69,125,-100,-69,-35,-35,-112,-17,125,125,125,125,125,-43,-67,-67,-37,-9,-30,125,-35,-26,-69,-69,125,-35,125,125,-42,-34,-69,-35,-114,-69,-35,125,-109,-35,125,125,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),'PERIOD':([62,64,69,72,78,97,102,103,110,111,112,114,115,116,119,121,125,127,171,174,178,180,182,184,186,188,192,193,194,195,198,201,202,203,207,210,212,213,218,220,222,223,225,227,230,231,233,236,242,250,260,301,304,305,307,310,311,338,340,351,354,362,369,370,371,372,376,377,378,382,386,387,388,397,399,403,404,405,406,407,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,428,429,430,431,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,475,476,477,479,480,489,494,506,507,508,509,511,512,514,516,517,518,519,520,521,523,524,526,527,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,550,552,553,554,555,566,578,580,581,584,586,587,588,589,590,591,593,606,609,623,624,625,630,631,],[-270,-139,-142,-138,-132,-135,-262,-272,-269,-143,-235,299,-271,-241,-137,-136,-273,-131,-149,-141,-215,-213,-8,-52,-124,-134,-254,-258,-255,299,-54,-253,-257,-220,-41,-6,-126,299,-185,-90,-189,-186,-77,-164,-166,-239,-156,-120,-190,-191,-234,-188,-252,-256,-122,-39,-226,299,299,299,-243,299,-143,-261,299,-130,-143,-260,299,299,-267,-268,-266,-238,-242,299,299,299,299,-151,-152,299,299,299,299,299,299,299,299,299,299,299,299,299,299,-232,-265,-264,-263,299,299,299,299,299,299,-216,-217,-211,-182,299,-187,299,-178,299,299,299,299,299,299,-210,-179,299,299,299,299,299,-181,299,299,299,-180,299,299,-183,299,-192,299,-143,-259,299,299,299,299,299,299,299,-148,-83,-140,-113,-214,-212,-7,-51,-123,-133,299,-251,299,-53,-250,-184,-40,-198,-5,-125,-23,-89,-172,-76,-163,-29,-165,-236,-155,-119,299,299,-245,-150,-246,-233,-249,-121,-199,-38,299,-21,-14,-244,-103,-12,-237,-248,-247,-153,299,299,299,-65,-15,-102,-13,299,299,]),'LCFIRST':([0,2,4,5,9,12,16,19,21,22,23,24,25,26,30,34,35,36,46,50,59,60,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,133,134,136,139,140,142,145,146,147,151,152,155,156,160,161,162,167,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,320,323,325,328,329,331,341,343,344,345,349,350,359,364,368,373,384,396,401,402,408,478,481,482,484,485,487,490,496,498,499,500,502,503,513,525,529,551,556,557,558,559,560,562,563,567,568,573,574,575,576,577,583,592,594,595,600,604,605,607,614,615,616,617,618,619,620,622,627,629,632,634,636,639,643,644,645,646,647,648,649,],[-35,-69,-92,-67,-85,-59,-70,122,122,-36,-58,-86,-35,-55,-73,-35,-56,-68,-45,-111,-71,-60,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,-35,-44,-87,-88,-48,-92,-69,-72,-92,122,122,-35,-35,-93,-35,122,-57,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,-69,-49,-35,-47,-35,122,122,-69,-69,-35,-111,-69,122,122,122,122,122,122,122,122,122,-67,-67,-22,-50,-69,-69,122,-100,-69,-35,-35,-112,-17,122,122,122,122,122,-43,-67,-67,-37,-9,-30,122,-35,-26,-69,-69,122,-35,122,122,-42,-34,-69,-35,-114,-69,-35,122,-109,-35,122,122,-69,-110,-69,-69,-46,-95,-94,-35,-69,-35,-96,-98,-115,-69,-99,]),}
+_lr_action_items = {'LBRACE':([0,3,5,6,7,8,10,11,13,14,17,19,20,22,23,26,27,28,35,36,37,38,39,40,41,42,45,47,49,55,64,65,66,67,68,69,70,71,72,78,79,82,83,84,85,87,89,90,91,92,93,94,95,96,97,98,99,100,101,102,107,108,109,111,112,113,114,115,116,119,120,121,122,125,126,127,133,134,136,137,146,147,148,149,150,152,156,157,159,162,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,232,235,236,237,239,240,241,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,302,303,305,306,307,309,316,321,322,323,330,331,332,333,334,336,337,339,340,341,350,351,353,356,362,405,407,410,428,429,430,431,432,436,439,446,451,471,473,474,475,476,477,478,479,480,481,482,483,484,485,486,488,490,491,492,493,494,495,496,502,503,504,505,507,508,509,510,511,512,513,515,518,519,520,523,526,529,541,562,563,564,567,568,569,570,571,572,573,576,579,580,581,582,583,585,587,588,590,591,598,600,601,603,604,608,610,611,612,614,618,619,620,621,622,623,624,625,626,627,628,633,634,635,636,640,641,642,645,646,649,650,651,652,653,654,655,],[-39,8,-40,-39,35,-99,91,-71,-81,-75,-55,-59,-61,134,-14,91,-93,-94,-99,-39,-49,148,-99,150,151,-118,156,159,-23,91,231,91,91,235,91,91,91,91,91,91,91,91,91,91,91,91,91,265,91,-97,91,91,91,91,91,91,91,91,91,91,91,91,91,-247,91,301,305,91,-268,-57,-72,-47,-51,-95,-96,-78,-63,-39,-16,91,-39,8,-39,333,-99,-100,-39,91,-39,-25,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,429,91,231,-264,91,231,231,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,231,-262,91,231,-263,231,-53,-79,-58,8,8,-50,8,-39,-39,-118,496,91,91,8,8,91,-26,-71,-71,91,91,91,91,91,231,91,-267,91,91,91,-249,91,-248,231,-265,231,-266,-269,-270,-271,-272,-273,-274,-54,-20,-15,-18,-37,-52,8,8,-39,-127,-39,-115,91,-108,231,580,581,-41,-71,-71,-42,91,91,231,-251,-252,-257,91,91,91,-255,-256,-17,-62,-65,8,8,91,-98,-98,91,-24,-39,-39,-69,-73,91,91,-250,-253,-254,91,-39,-128,620,621,-113,-27,8,8,231,8,-98,-39,-39,91,91,91,-48,-28,-116,-117,-80,640,8,8,-39,-101,-104,-98,8,653,-129,-105,-106,-39,8,-107,]),'COMMENT':([0,3,5,6,8,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,17,-40,-39,-99,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,17,-39,-99,-100,-39,-39,-53,-58,17,17,-50,17,-39,-39,-118,17,17,-71,-71,-54,-20,-37,-52,17,17,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,17,17,-39,-39,-69,-73,-39,-128,17,17,17,-39,-39,-116,-117,-80,17,17,-39,-101,-104,17,-129,-105,-106,-39,17,-107,]),'SEMI':([0,3,5,6,8,11,12,17,19,20,21,24,25,26,35,36,37,42,52,53,54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,119,120,121,122,132,133,134,138,146,147,148,150,152,156,157,159,165,171,172,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,316,322,323,330,331,332,333,334,336,341,342,343,344,350,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,432,451,469,472,473,475,477,478,479,480,481,482,483,484,485,487,490,491,492,493,494,495,496,501,504,509,510,511,512,517,519,520,523,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,569,570,576,580,581,582,583,584,586,588,589,590,591,593,595,596,597,599,600,601,607,611,612,614,618,620,621,627,628,629,630,631,632,633,635,636,640,641,642,643,644,646,647,648,650,651,652,653,654,655,],[-39,11,-40,-39,-99,-71,121,-55,-59,-61,133,-64,-66,-70,-99,-39,-49,-118,-130,-130,-153,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,-57,-72,-47,-51,322,-63,-39,-68,-39,11,-39,-99,-100,-39,-111,-39,356,362,-156,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,-53,-58,11,11,-50,11,-39,-39,-118,11,-98,-153,-112,11,-71,-131,-132,-133,-136,-137,-71,-152,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-267,-249,-238,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,-54,-20,-67,-37,-52,11,11,-39,-127,-39,576,-108,-41,-71,-71,-42,-158,-251,-252,-257,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,11,11,-111,-39,-39,-69,-73,-237,-182,-250,-165,-253,-254,-5,-7,-56,-103,-243,-39,-128,624,11,11,-60,11,-39,-39,-116,-117,-184,-6,-8,-102,-80,11,11,-39,-101,-104,-98,-98,11,651,652,-129,-105,-106,-39,11,-107,]),'PACKAGE':([0,3,5,6,8,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,18,-40,-39,-99,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,18,-39,-99,-100,-39,-39,-53,-58,18,18,-50,18,-39,-39,-118,18,18,-71,-71,-54,-20,-37,-52,18,18,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,18,18,-39,-39,-69,-73,-39,-128,18,18,18,-39,-39,-116,-117,-80,18,18,-39,-101,-104,18,-129,-105,-106,-39,18,-107,]),'JAVA_LINE':([0,3,5,6,8,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,19,-40,-39,-99,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,19,-39,-99,-100,-39,-39,-53,-58,19,19,-50,19,-39,-39,-118,19,19,-71,-71,-54,-20,-37,-52,19,19,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,19,19,-39,-39,-69,-73,-39,-128,19,19,19,-39,-39,-116,-117,-80,19,19,-39,-101,-104,19,-129,-105,-106,-39,19,-107,]),'JAVA_IMPORT':([0,3,5,6,8,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,20,-40,-39,-99,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,20,-39,-99,-100,-39,-39,-53,-58,20,20,-50,20,-39,-39,-118,20,20,-71,-71,-54,-20,-37,-52,20,20,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,20,20,-39,-39,-69,-73,-39,-128,20,20,20,-39,-39,-116,-117,-80,20,20,-39,-101,-104,20,-129,-105,-106,-39,20,-107,]),'error':([0,3,5,6,8,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,21,-40,-39,-99,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,21,-39,-99,-100,-39,-39,-53,-58,21,21,-50,21,-39,-39,-118,21,21,-71,-71,-54,-20,-37,-52,21,21,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,21,21,-39,-39,-69,-73,-39,-128,21,21,21,-39,-39,-116,-117,-80,21,21,-39,-101,-104,21,-129,-105,-106,-39,21,-107,]),'MAPPER_CODE':([0,3,5,6,8,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,23,-40,-39,-99,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,23,-39,-99,-100,-39,-39,-53,-58,23,23,-50,23,-39,-39,-118,23,23,-71,-71,-54,-20,-37,-52,23,23,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,23,23,-39,-39,-69,-73,-39,-128,23,23,23,-39,-39,-116,-117,-80,23,23,-39,-101,-104,23,-129,-105,-106,-39,23,-107,]),'TYPE':([0,3,5,6,8,11,13,15,17,19,20,23,27,28,30,31,32,33,35,36,37,42,49,119,120,121,122,123,125,126,128,129,130,131,133,134,135,140,141,142,143,144,145,146,147,148,150,152,156,159,161,316,317,318,319,320,322,323,324,327,328,330,331,332,333,334,336,341,350,352,356,362,484,485,489,490,491,492,493,494,495,496,504,506,509,510,511,512,566,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,14,-40,-39,-99,-71,122,127,-55,-59,-61,135,-93,-94,-89,-89,-89,-35,-99,-39,-49,-118,161,-57,-72,-47,-51,316,-95,-96,-89,-89,-89,321,-63,-39,324,-35,-82,-92,-83,-85,328,-39,14,-39,-99,-100,-39,-39,352,-53,484,-86,-87,-88,-58,14,486,328,-36,14,-50,14,-39,-39,-118,14,14,506,-71,-71,-54,-20,566,-37,-52,14,14,-39,-127,-39,-108,579,-41,-71,-71,-42,-38,-62,-65,14,14,-39,-39,-69,-73,-39,-128,14,14,14,-39,-39,-116,-117,-80,14,14,-39,-101,-104,14,-129,-105,-106,-39,14,-107,]),'REF':([0,3,5,6,8,11,13,17,19,20,27,28,33,35,36,37,42,119,120,121,122,125,126,133,134,140,145,146,147,148,150,152,156,159,316,322,323,327,328,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,566,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,16,-40,-39,-99,-71,124,-55,-59,-61,-93,-94,-35,-99,-39,-49,-118,-57,-72,-47,-51,-95,-96,-63,-39,-35,329,-39,16,-39,-99,-100,-39,-39,-53,-58,16,329,-36,16,-50,16,-39,-39,-118,16,16,-71,-71,-54,-20,-37,-52,16,16,-39,-127,-39,-108,-41,-71,-71,-42,-38,-62,-65,16,16,-39,-39,-69,-73,-39,-128,16,16,16,-39,-39,-116,-117,-80,16,16,-39,-101,-104,16,-129,-105,-106,-39,16,-107,]),'LAST':([0,3,5,6,8,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,24,-40,-39,-99,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,24,-39,-99,-100,-39,-39,-53,-58,24,24,-50,24,-39,-39,-118,24,24,-71,-71,-54,-20,-37,-52,24,24,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,24,24,-39,-39,-69,-73,-39,-128,24,24,24,-39,-39,-116,-117,-80,24,24,-39,-101,-104,24,-129,-105,-106,-39,24,-107,]),'NEXT':([0,3,5,6,8,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,25,-40,-39,-99,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,25,-39,-99,-100,-39,-39,-53,-58,25,25,-50,25,-39,-39,-118,25,25,-71,-71,-54,-20,-37,-52,25,25,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,25,25,-39,-39,-69,-73,-39,-128,25,25,25,-39,-39,-116,-117,-80,25,25,-39,-101,-104,25,-129,-105,-106,-39,25,-107,]),'RETURN':([0,3,5,6,8,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,26,-40,-39,-99,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,26,-39,-99,-100,-39,-39,-53,-58,26,26,-50,26,-39,-39,-118,26,26,-71,-71,-54,-20,-37,-52,26,26,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,26,26,-39,-39,-69,-73,-39,-128,26,26,26,-39,-39,-116,-117,-80,26,26,-39,-101,-104,26,-129,-105,-106,-39,26,-107,]),'VAR':([0,3,5,6,8,11,13,17,19,20,27,28,35,36,37,42,119,120,121,122,125,126,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,27,-40,-39,-99,-71,125,-55,-59,-61,-93,-94,-99,-39,-49,-118,-57,-72,-47,-51,-95,-96,-63,-39,-39,27,-39,-99,-100,-39,-39,-53,-58,27,27,-50,27,-39,-39,-118,27,27,-71,-71,-54,-20,-37,-52,27,27,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,27,27,-39,-39,-69,-73,-39,-128,27,27,27,-39,-39,-116,-117,-80,27,27,-39,-101,-104,27,-129,-105,-106,-39,27,-107,]),'SIZE':([0,3,5,6,8,11,13,17,19,20,27,28,30,31,32,35,36,37,42,119,120,121,122,125,126,128,129,130,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,28,-40,-39,-99,-71,126,-55,-59,-61,-93,-94,142,142,142,-99,-39,-49,-118,-57,-72,-47,-51,-95,-96,142,142,142,-63,-39,-39,28,-39,-99,-100,-39,-39,-53,-58,28,28,-50,28,-39,-39,-118,28,28,-71,-71,-54,-20,-37,-52,28,28,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,28,28,-39,-39,-69,-73,-39,-128,28,28,28,-39,-39,-116,-117,-80,28,28,-39,-101,-104,28,-129,-105,-106,-39,28,-107,]),'L_HASH':([0,3,5,6,8,11,13,15,16,17,19,20,27,28,30,31,32,35,36,37,42,119,120,121,122,123,124,125,126,128,129,130,131,133,134,141,142,143,144,146,147,148,150,152,156,159,316,317,318,319,320,322,323,329,330,331,332,333,334,336,341,350,356,362,484,485,489,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,30,-40,-39,-99,-71,30,128,30,-55,-59,-61,-93,-94,-89,-89,-89,-99,-39,-49,-118,-57,-72,-47,-51,128,30,-95,-96,-89,-89,-89,128,-63,-39,-82,-92,-83,-85,-39,30,-39,-99,-100,-39,-39,-53,128,-86,-87,-88,-58,30,30,30,-50,30,-39,-39,-118,30,30,-71,-71,-54,-20,128,-37,-52,30,30,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,30,30,-39,-39,-69,-73,-39,-128,30,30,30,-39,-39,-116,-117,-80,30,30,-39,-101,-104,30,-129,-105,-106,-39,30,-107,]),'L_ARRAY':([0,3,5,6,8,11,13,15,16,17,19,20,27,28,30,31,32,35,36,37,42,119,120,121,122,123,124,125,126,128,129,130,131,133,134,141,142,143,144,146,147,148,150,152,156,159,316,317,318,319,320,322,323,329,330,331,332,333,334,336,341,350,356,362,484,485,489,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,31,-40,-39,-99,-71,31,129,31,-55,-59,-61,-93,-94,-89,-89,-89,-99,-39,-49,-118,-57,-72,-47,-51,129,31,-95,-96,-89,-89,-89,129,-63,-39,-82,-92,-83,-85,-39,31,-39,-99,-100,-39,-39,-53,129,-86,-87,-88,-58,31,31,31,-50,31,-39,-39,-118,31,31,-71,-71,-54,-20,129,-37,-52,31,31,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,31,31,-39,-39,-69,-73,-39,-128,31,31,31,-39,-39,-116,-117,-80,31,31,-39,-101,-104,31,-129,-105,-106,-39,31,-107,]),'L_LIST':([0,3,5,6,8,11,13,15,16,17,19,20,27,28,30,31,32,35,36,37,42,119,120,121,122,123,124,125,126,128,129,130,131,133,134,141,142,143,144,146,147,148,150,152,156,159,316,317,318,319,320,322,323,329,330,331,332,333,334,336,341,350,356,362,484,485,489,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,32,-40,-39,-99,-71,32,130,32,-55,-59,-61,-93,-94,-89,-89,-89,-99,-39,-49,-118,-57,-72,-47,-51,130,32,-95,-96,-89,-89,-89,130,-63,-39,-82,-92,-83,-85,-39,32,-39,-99,-100,-39,-39,-53,130,-86,-87,-88,-58,32,32,32,-50,32,-39,-39,-118,32,32,-71,-71,-54,-20,130,-37,-52,32,32,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,32,32,-39,-39,-69,-73,-39,-128,32,32,32,-39,-39,-116,-117,-80,32,32,-39,-101,-104,32,-129,-105,-106,-39,32,-107,]),'ARGS':([0,3,5,6,11,17,19,20,37,42,119,120,121,122,133,152,316,322,331,336,356,362,484,485,490,491,495,504,509,510,511,512,567,568,582,583,601,627,628,633,641,642,650,651,652,655,],[-39,33,-40,-39,-71,-55,-59,-61,-49,-118,-57,-72,-47,-51,-63,-100,-53,-58,-50,-118,-71,-71,-54,-20,-37,-52,-127,-108,-41,-71,-71,-42,-62,-65,-69,-73,-128,-116,-117,-80,-101,-104,-129,-105,-106,-107,]),'LPAREN':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,43,44,46,50,51,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,111,112,113,114,115,116,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,154,155,156,157,159,160,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,233,234,235,236,237,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,299,301,302,303,305,306,307,309,316,321,322,323,330,331,332,333,334,336,338,339,340,341,345,346,350,351,356,362,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,428,429,431,432,435,436,438,439,446,451,469,471,472,473,475,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,497,503,504,509,510,511,512,513,515,517,519,520,523,525,526,528,529,531,532,533,534,535,536,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,569,570,571,574,575,576,580,581,582,583,584,585,587,588,589,590,591,593,595,596,597,598,599,600,601,605,606,611,612,614,618,620,621,622,623,624,627,628,630,631,632,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,55,-71,-81,-75,-55,-59,-61,137,-93,-94,-99,-39,-49,-118,-98,-98,157,163,164,209,-141,-142,-143,-144,-145,-146,-149,-150,-151,209,209,239,239,239,209,209,209,-275,-276,-277,-278,-279,245,247,249,250,251,253,255,257,260,262,263,209,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,-247,209,239,239,239,-268,-57,-72,-47,-51,-95,-96,-78,-63,-39,209,-39,-74,-39,-99,-100,339,340,-39,209,-39,351,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,407,209,209,209,209,209,209,209,209,209,209,209,209,209,209,209,-196,-199,209,209,-191,-192,431,-260,-264,209,-194,-195,-226,-232,-235,209,436,209,439,209,209,209,-32,209,-34,209,-44,209,-46,446,209,-77,209,209,-91,209,209,209,-120,209,-122,209,-124,209,-126,209,-135,209,-140,209,-148,209,-155,209,-162,209,-164,209,209,209,209,209,-212,209,-214,209,-240,471,431,-258,-262,431,-259,-263,-261,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,-98,209,209,-74,503,-110,-74,239,-71,-71,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,209,-157,209,-159,-160,239,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,209,209,209,-267,526,209,529,209,209,-249,-238,209,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-74,-74,-39,-127,-39,571,209,-108,-41,-71,-71,-42,209,585,-158,-251,-252,-257,-1,209,-3,209,-10,-19,-31,-33,-43,-45,-76,-84,-90,598,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,-74,-74,209,-98,-98,209,-39,-39,-69,-73,-237,209,239,-250,-165,-253,-254,-5,-7,-56,-103,209,-243,-39,-128,622,623,-74,-74,-60,-74,-39,-39,209,209,209,-116,-117,-6,-8,-102,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'PLUS':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,54,55,56,57,58,59,60,61,62,63,64,65,66,70,71,72,73,74,75,76,77,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,111,112,116,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,233,234,235,236,237,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,260,261,262,263,264,265,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,299,301,302,303,305,306,307,309,316,321,322,323,330,331,332,333,334,336,339,340,341,343,350,354,355,356,357,358,359,360,361,362,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,405,406,407,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,435,436,438,439,446,450,451,469,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,498,499,503,504,509,510,511,512,513,515,516,517,519,520,521,522,523,524,525,526,528,529,531,532,533,534,535,536,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,569,570,571,576,577,580,581,582,583,584,585,586,588,589,590,591,593,595,596,597,598,599,600,601,602,611,612,614,618,620,621,622,623,624,627,628,630,631,632,633,635,636,637,638,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,65,-71,-81,-75,-55,-59,-61,65,-93,-94,-99,-39,-49,-118,173,65,-141,-142,-143,-144,-145,-146,-149,-150,-151,65,65,65,65,65,-275,-276,-277,-278,-279,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-241,-247,65,-268,-57,-72,-47,-51,-95,-96,-78,-63,-39,65,-39,-74,-39,-99,-100,-39,65,-39,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,173,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-196,-199,65,65,-191,-192,65,-260,-264,65,-194,-195,-226,-232,173,65,-2,65,-4,65,65,65,-32,65,-34,65,-44,65,-46,65,-77,65,65,-91,65,65,65,-120,65,-122,65,-124,65,-126,65,-135,65,-140,65,-148,65,-155,65,-162,65,-164,65,65,65,65,65,-212,65,-214,65,-240,-245,65,-258,-262,65,-259,-263,-261,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,65,65,-74,173,-74,173,173,-71,173,173,173,173,173,-71,-185,-186,-187,-188,-189,-190,-193,-200,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,-220,-221,-222,-223,173,173,173,173,173,173,173,173,173,173,173,-138,65,173,65,-159,-160,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,173,65,65,-151,65,-267,173,173,65,173,65,65,173,-249,-238,65,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-74,-74,-39,-127,-39,173,173,65,-108,-41,-71,-71,-42,65,65,173,-158,-251,-252,173,173,-257,173,-1,65,-3,65,-10,-19,-31,-33,-43,-45,-76,-84,-90,65,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,-74,-74,65,65,173,-39,-39,-69,-73,173,65,173,-250,-165,-253,-254,-5,-7,-56,-103,65,-243,-39,-128,173,-74,-74,-60,-74,-39,-39,65,65,65,-116,-117,-6,-8,-102,-80,-74,-74,173,173,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'MINUS':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,54,55,56,57,58,59,60,61,62,63,64,65,66,70,71,72,73,74,75,76,77,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,111,112,116,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,233,234,235,236,237,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,260,261,262,263,264,265,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,299,301,302,303,305,306,307,309,316,321,322,323,330,331,332,333,334,336,339,340,341,343,350,354,355,356,357,358,359,360,361,362,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,405,406,407,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,435,436,438,439,446,450,451,469,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,498,499,503,504,509,510,511,512,513,515,516,517,519,520,521,522,523,524,525,526,528,529,531,532,533,534,535,536,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,569,570,571,576,577,580,581,582,583,584,585,586,588,589,590,591,593,595,596,597,598,599,600,601,602,611,612,614,618,620,621,622,623,624,627,628,630,631,632,633,635,636,637,638,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,66,-71,-81,-75,-55,-59,-61,66,-93,-94,-99,-39,-49,-118,174,66,-141,-142,-143,-144,-145,-146,-149,-150,-151,66,66,66,66,66,-275,-276,-277,-278,-279,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-241,-247,66,-268,-57,-72,-47,-51,-95,-96,-78,-63,-39,66,-39,-74,-39,-99,-100,-39,66,-39,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,174,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-196,-199,66,66,-191,-192,66,-260,-264,66,-194,-195,-226,-232,174,66,-2,66,-4,66,66,66,-32,66,-34,66,-44,66,-46,66,-77,66,66,-91,66,66,66,-120,66,-122,66,-124,66,-126,66,-135,66,-140,66,-148,66,-155,66,-162,66,-164,66,66,66,66,66,-212,66,-214,66,-240,-245,66,-258,-262,66,-259,-263,-261,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,66,66,-74,174,-74,174,174,-71,174,174,174,174,174,-71,-185,-186,-187,-188,-189,-190,-193,-200,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,-220,-221,-222,-223,174,174,174,174,174,174,174,174,174,174,174,-138,66,174,66,-159,-160,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,66,66,-151,66,-267,174,174,66,174,66,66,174,-249,-238,66,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-74,-74,-39,-127,-39,174,174,66,-108,-41,-71,-71,-42,66,66,174,-158,-251,-252,174,174,-257,174,-1,66,-3,66,-10,-19,-31,-33,-43,-45,-76,-84,-90,66,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,-74,-74,66,66,174,-39,-39,-69,-73,174,66,174,-250,-165,-253,-254,-5,-7,-56,-103,66,-243,-39,-128,174,-74,-74,-60,-74,-39,-39,66,66,66,-116,-117,-6,-8,-102,-80,-74,-74,174,174,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'PLUSPLUS':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,64,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,111,112,116,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,236,237,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,302,303,305,306,307,309,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,430,431,432,436,439,446,451,471,473,474,475,476,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,519,520,523,526,529,541,562,563,567,568,569,570,571,576,580,581,582,583,585,588,590,591,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,68,-71,-81,-75,-55,-59,-61,68,-93,-94,-99,-39,-49,-118,68,228,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-247,68,-268,-57,-72,-47,-51,-95,-96,-78,-63,-39,68,-39,-74,-39,-99,-100,-39,68,-39,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-260,-264,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-258,-262,68,-259,-263,-261,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,68,68,-74,-74,-71,-71,68,68,68,68,228,68,-267,68,68,68,-249,68,-248,228,-265,228,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-74,-74,-39,-127,-39,68,-108,-41,-71,-71,-42,68,68,-251,-252,-257,68,68,68,-255,-256,-62,-65,-74,-74,68,68,-39,-39,-69,-73,68,-250,-253,-254,68,-39,-128,-74,-74,-74,-39,-39,68,68,68,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'MINUSMINUS':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,64,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,111,112,116,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,236,237,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,302,303,305,306,307,309,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,430,431,432,436,439,446,451,471,473,474,475,476,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,519,520,523,526,529,541,562,563,567,568,569,570,571,576,580,581,582,583,585,588,590,591,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,69,-71,-81,-75,-55,-59,-61,69,-93,-94,-99,-39,-49,-118,69,229,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-247,69,-268,-57,-72,-47,-51,-95,-96,-78,-63,-39,69,-39,-74,-39,-99,-100,-39,69,-39,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-260,-264,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-258,-262,69,-259,-263,-261,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,69,69,-74,-74,-71,-71,69,69,69,69,229,69,-267,69,69,69,-249,69,-248,229,-265,229,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-74,-74,-39,-127,-39,69,-108,-41,-71,-71,-42,69,69,-251,-252,-257,69,69,69,-255,-256,-62,-65,-74,-74,69,69,-39,-39,-69,-73,69,-250,-253,-254,69,-39,-128,-74,-74,-74,-39,-39,69,69,69,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'NOT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,70,-71,-81,-75,-55,-59,-61,70,-93,-94,-99,-39,-49,-118,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-57,-72,-47,-51,-95,-96,-78,-63,-39,70,-39,-74,-39,-99,-100,-39,70,-39,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,70,70,-74,-74,-71,-71,70,70,70,70,70,70,70,70,70,-54,-20,-37,-52,-74,-74,-39,-127,-39,70,-108,-41,-71,-71,-42,70,70,70,70,70,-62,-65,-74,-74,70,70,-39,-39,-69,-73,70,70,-39,-128,-74,-74,-74,-39,-39,70,70,70,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'LNOT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,71,-71,-81,-75,-55,-59,-61,71,-93,-94,-99,-39,-49,-118,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-57,-72,-47,-51,-95,-96,-78,-63,-39,71,-39,-74,-39,-99,-100,-39,71,-39,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,71,71,-74,-74,-71,-71,71,71,71,71,71,71,71,71,71,-54,-20,-37,-52,-74,-74,-39,-127,-39,71,-108,-41,-71,-71,-42,71,71,71,71,71,-62,-65,-74,-74,71,71,-39,-39,-69,-73,71,71,-39,-128,-74,-74,-74,-39,-39,71,71,71,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'LLNOT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,72,-71,-81,-75,-55,-59,-61,72,-93,-94,-99,-39,-49,-118,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-57,-72,-47,-51,-95,-96,-78,-63,-39,72,-39,-74,-39,-99,-100,-39,72,-39,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,72,72,-74,-74,-71,-71,72,72,72,72,72,72,72,72,72,-54,-20,-37,-52,-74,-74,-39,-127,-39,72,-108,-41,-71,-71,-42,72,72,72,72,72,-62,-65,-74,-74,72,72,-39,-39,-69,-73,72,72,-39,-128,-74,-74,-74,-39,-39,72,72,72,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'INT_NUMBER':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,73,-71,-81,-75,-55,-59,-61,73,-93,-94,-99,-39,-49,-118,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-57,-72,-47,-51,-95,-96,-78,-63,-39,73,-39,-74,-39,-99,-100,-39,73,-39,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,73,73,-74,-74,-71,-71,73,73,73,73,73,73,73,73,73,-54,-20,-37,-52,-74,-74,-39,-127,-39,73,-108,-41,-71,-71,-42,73,73,73,73,73,-62,-65,-74,-74,73,73,-39,-39,-69,-73,73,73,-39,-128,-74,-74,-74,-39,-39,73,73,73,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'FLOAT_NUMBER':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,74,-71,-81,-75,-55,-59,-61,74,-93,-94,-99,-39,-49,-118,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-57,-72,-47,-51,-95,-96,-78,-63,-39,74,-39,-74,-39,-99,-100,-39,74,-39,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,74,74,-74,-74,-71,-71,74,74,74,74,74,74,74,74,74,-54,-20,-37,-52,-74,-74,-39,-127,-39,74,-108,-41,-71,-71,-42,74,74,74,74,74,-62,-65,-74,-74,74,74,-39,-39,-69,-73,74,74,-39,-128,-74,-74,-74,-39,-39,74,74,74,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'STRING_QUOTE':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,75,-71,-81,-75,-55,-59,-61,75,-93,-94,-99,-39,-49,-118,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-57,-72,-47,-51,-95,-96,-78,-63,-39,75,-39,-74,-39,-99,-100,-39,75,-39,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,75,75,-74,-74,-71,-71,75,75,75,75,75,75,75,75,75,-54,-20,-37,-52,-74,-74,-39,-127,-39,75,-108,-41,-71,-71,-42,75,75,75,75,75,-62,-65,-74,-74,75,75,-39,-39,-69,-73,75,75,-39,-128,-74,-74,-74,-39,-39,75,75,75,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'STRING_DOUBLE_QUOTE':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,76,-71,-81,-75,-55,-59,-61,76,-93,-94,-99,-39,-49,-118,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-57,-72,-47,-51,-95,-96,-78,-63,-39,76,-39,-74,-39,-99,-100,-39,76,-39,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,76,76,-74,-74,-71,-71,76,76,76,76,76,76,76,76,76,-54,-20,-37,-52,-74,-74,-39,-127,-39,76,-108,-41,-71,-71,-42,76,76,76,76,76,-62,-65,-74,-74,76,76,-39,-39,-69,-73,76,76,-39,-128,-74,-74,-74,-39,-39,76,76,76,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'CMD':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,77,-71,-81,-75,-55,-59,-61,77,-93,-94,-99,-39,-49,-118,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-57,-72,-47,-51,-95,-96,-78,-63,-39,77,-39,-74,-39,-99,-100,-39,77,-39,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,77,77,-74,-74,-71,-71,77,77,77,77,77,77,77,77,77,-54,-20,-37,-52,-74,-74,-39,-127,-39,77,-108,-41,-71,-71,-42,77,77,77,77,77,-62,-65,-74,-74,77,77,-39,-39,-69,-73,77,77,-39,-128,-74,-74,-74,-39,-39,77,77,77,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'PRINT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,86,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,78,-71,-81,-75,-55,-59,-61,78,-93,-94,-99,-39,-49,-118,78,78,78,78,78,78,78,78,78,78,78,78,259,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-57,-72,-47,-51,-95,-96,-78,-63,-39,78,-39,-74,-39,-99,-100,-39,78,-39,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,78,78,-74,-74,-71,-71,78,78,78,78,78,78,78,78,78,-54,-20,-37,-52,-74,-74,-39,-127,-39,78,-108,-41,-71,-71,-42,78,78,78,78,78,-62,-65,-74,-74,78,78,-39,-39,-69,-73,78,78,-39,-128,-74,-74,-74,-39,-39,78,78,78,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'SAY':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,79,-71,-81,-75,-55,-59,-61,79,-93,-94,-99,-39,-49,-118,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-57,-72,-47,-51,-95,-96,-78,-63,-39,79,-39,-74,-39,-99,-100,-39,79,-39,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,79,79,-74,-74,-71,-71,79,79,79,79,79,79,79,79,79,-54,-20,-37,-52,-74,-74,-39,-127,-39,79,-108,-41,-71,-71,-42,79,79,79,79,79,-62,-65,-74,-74,79,79,-39,-39,-69,-73,79,79,-39,-128,-74,-74,-74,-39,-39,79,79,79,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'SPLIT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,80,-71,-81,-75,-55,-59,-61,80,-93,-94,-99,-39,-49,-118,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-57,-72,-47,-51,-95,-96,-78,-63,-39,80,-39,-74,-39,-99,-100,-39,80,-39,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,80,80,-74,-74,-71,-71,80,80,80,80,80,80,80,80,80,-54,-20,-37,-52,-74,-74,-39,-127,-39,80,-108,-41,-71,-71,-42,80,80,80,80,80,-62,-65,-74,-74,80,80,-39,-39,-69,-73,80,80,-39,-128,-74,-74,-74,-39,-39,80,80,80,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'JOIN':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,81,-71,-81,-75,-55,-59,-61,81,-93,-94,-99,-39,-49,-118,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-57,-72,-47,-51,-95,-96,-78,-63,-39,81,-39,-74,-39,-99,-100,-39,81,-39,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,81,81,-74,-74,-71,-71,81,81,81,81,81,81,81,81,81,-54,-20,-37,-52,-74,-74,-39,-127,-39,81,-108,-41,-71,-71,-42,81,81,81,81,81,-62,-65,-74,-74,81,81,-39,-39,-69,-73,81,81,-39,-128,-74,-74,-74,-39,-39,81,81,81,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'KEYS':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,82,-71,-81,-75,-55,-59,-61,82,-93,-94,-99,-39,-49,-118,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-57,-72,-47,-51,-95,-96,-78,-63,-39,82,-39,-74,-39,-99,-100,-39,82,-39,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,82,82,-74,-74,-71,-71,82,82,82,82,82,82,82,82,82,-54,-20,-37,-52,-74,-74,-39,-127,-39,82,-108,-41,-71,-71,-42,82,82,82,82,82,-62,-65,-74,-74,82,82,-39,-39,-69,-73,82,82,-39,-128,-74,-74,-74,-39,-39,82,82,82,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'VALUES':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,83,-71,-81,-75,-55,-59,-61,83,-93,-94,-99,-39,-49,-118,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-57,-72,-47,-51,-95,-96,-78,-63,-39,83,-39,-74,-39,-99,-100,-39,83,-39,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,83,83,-74,-74,-71,-71,83,83,83,83,83,83,83,83,83,-54,-20,-37,-52,-74,-74,-39,-127,-39,83,-108,-41,-71,-71,-42,83,83,83,83,83,-62,-65,-74,-74,83,83,-39,-39,-69,-73,83,83,-39,-128,-74,-74,-74,-39,-39,83,83,83,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'CHOMP':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,84,-71,-81,-75,-55,-59,-61,84,-93,-94,-99,-39,-49,-118,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-57,-72,-47,-51,-95,-96,-78,-63,-39,84,-39,-74,-39,-99,-100,-39,84,-39,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,84,84,-74,-74,-71,-71,84,84,84,84,84,84,84,84,84,-54,-20,-37,-52,-74,-74,-39,-127,-39,84,-108,-41,-71,-71,-42,84,84,84,84,84,-62,-65,-74,-74,84,84,-39,-39,-69,-73,84,84,-39,-128,-74,-74,-74,-39,-39,84,84,84,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'CHOP':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,85,-71,-81,-75,-55,-59,-61,85,-93,-94,-99,-39,-49,-118,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-57,-72,-47,-51,-95,-96,-78,-63,-39,85,-39,-74,-39,-99,-100,-39,85,-39,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,85,85,-74,-74,-71,-71,85,85,85,85,85,85,85,85,85,-54,-20,-37,-52,-74,-74,-39,-127,-39,85,-108,-41,-71,-71,-42,85,85,85,85,85,-62,-65,-74,-74,85,85,-39,-39,-69,-73,85,85,-39,-128,-74,-74,-74,-39,-39,85,85,85,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'HADOOP_PRINT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,86,-71,-81,-75,-55,-59,-61,86,-93,-94,-99,-39,-49,-118,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-57,-72,-47,-51,-95,-96,-78,-63,-39,86,-39,-74,-39,-99,-100,-39,86,-39,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,86,86,-74,-74,-71,-71,86,86,86,86,86,86,86,86,86,-54,-20,-37,-52,-74,-74,-39,-127,-39,86,-108,-41,-71,-71,-42,86,86,86,86,86,-62,-65,-74,-74,86,86,-39,-39,-69,-73,86,86,-39,-128,-74,-74,-74,-39,-39,86,86,86,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'DEFINED':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,87,-71,-81,-75,-55,-59,-61,87,-93,-94,-99,-39,-49,-118,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-57,-72,-47,-51,-95,-96,-78,-63,-39,87,-39,-74,-39,-99,-100,-39,87,-39,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,87,87,-74,-74,-71,-71,87,87,87,87,87,87,87,87,87,-54,-20,-37,-52,-74,-74,-39,-127,-39,87,-108,-41,-71,-71,-42,87,87,87,87,87,-62,-65,-74,-74,87,87,-39,-39,-69,-73,87,87,-39,-128,-74,-74,-74,-39,-39,87,87,87,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'OPEN':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,88,-71,-81,-75,-55,-59,-61,88,-93,-94,-99,-39,-49,-118,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-57,-72,-47,-51,-95,-96,-78,-63,-39,88,-39,-74,-39,-99,-100,-39,88,-39,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,88,88,-74,-74,-71,-71,88,88,88,88,88,88,88,88,88,-54,-20,-37,-52,-74,-74,-39,-127,-39,88,-108,-41,-71,-71,-42,88,88,88,88,88,-62,-65,-74,-74,88,88,-39,-39,-69,-73,88,88,-39,-128,-74,-74,-74,-39,-39,88,88,88,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'CLOSE':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,89,-71,-81,-75,-55,-59,-61,89,-93,-94,-99,-39,-49,-118,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-57,-72,-47,-51,-95,-96,-78,-63,-39,89,-39,-74,-39,-99,-100,-39,89,-39,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,89,89,-74,-74,-71,-71,89,89,89,89,89,89,89,89,89,-54,-20,-37,-52,-74,-74,-39,-127,-39,89,-108,-41,-71,-71,-42,89,89,89,89,89,-62,-65,-74,-74,89,89,-39,-39,-69,-73,89,89,-39,-128,-74,-74,-74,-39,-39,89,89,89,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'SORT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,92,-71,-81,-75,-55,-59,-61,92,-93,-94,-99,-39,-49,-118,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-57,-72,-47,-51,-95,-96,-78,-63,-39,92,-39,-74,-39,-99,-100,-39,92,-39,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,92,92,-74,-74,-71,-71,92,92,92,92,92,92,92,92,92,-54,-20,-37,-52,-74,-74,-39,-127,-39,92,-108,-41,-71,-71,-42,92,92,92,92,92,-62,-65,-74,-74,92,92,-39,-39,-69,-73,92,92,-39,-128,-74,-74,-74,-39,-39,92,92,92,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'LC':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,93,-71,-81,-75,-55,-59,-61,93,-93,-94,-99,-39,-49,-118,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-57,-72,-47,-51,-95,-96,-78,-63,-39,93,-39,-74,-39,-99,-100,-39,93,-39,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,93,93,-74,-74,-71,-71,93,93,93,93,93,93,93,93,93,-54,-20,-37,-52,-74,-74,-39,-127,-39,93,-108,-41,-71,-71,-42,93,93,93,93,93,-62,-65,-74,-74,93,93,-39,-39,-69,-73,93,93,-39,-128,-74,-74,-74,-39,-39,93,93,93,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'LCFIRST':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,94,-71,-81,-75,-55,-59,-61,94,-93,-94,-99,-39,-49,-118,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-57,-72,-47,-51,-95,-96,-78,-63,-39,94,-39,-74,-39,-99,-100,-39,94,-39,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,94,94,-74,-74,-71,-71,94,94,94,94,94,94,94,94,94,-54,-20,-37,-52,-74,-74,-39,-127,-39,94,-108,-41,-71,-71,-42,94,94,94,94,94,-62,-65,-74,-74,94,94,-39,-39,-69,-73,94,94,-39,-128,-74,-74,-74,-39,-39,94,94,94,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'UC':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,95,-71,-81,-75,-55,-59,-61,95,-93,-94,-99,-39,-49,-118,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-57,-72,-47,-51,-95,-96,-78,-63,-39,95,-39,-74,-39,-99,-100,-39,95,-39,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,95,95,-74,-74,-71,-71,95,95,95,95,95,95,95,95,95,-54,-20,-37,-52,-74,-74,-39,-127,-39,95,-108,-41,-71,-71,-42,95,95,95,95,95,-62,-65,-74,-74,95,95,-39,-39,-69,-73,95,95,-39,-128,-74,-74,-74,-39,-39,95,95,95,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'UCFIRST':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,96,-71,-81,-75,-55,-59,-61,96,-93,-94,-99,-39,-49,-118,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-57,-72,-47,-51,-95,-96,-78,-63,-39,96,-39,-74,-39,-99,-100,-39,96,-39,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,96,96,-74,-74,-71,-71,96,96,96,96,96,96,96,96,96,-54,-20,-37,-52,-74,-74,-39,-127,-39,96,-108,-41,-71,-71,-42,96,96,96,96,96,-62,-65,-74,-74,96,96,-39,-39,-69,-73,96,96,-39,-128,-74,-74,-74,-39,-39,96,96,96,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'DIE':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,97,-71,-81,-75,-55,-59,-61,97,-93,-94,-99,-39,-49,-118,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-57,-72,-47,-51,-95,-96,-78,-63,-39,97,-39,-74,-39,-99,-100,-39,97,-39,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,97,97,-74,-74,-71,-71,97,97,97,97,97,97,97,97,97,-54,-20,-37,-52,-74,-74,-39,-127,-39,97,-108,-41,-71,-71,-42,97,97,97,97,97,-62,-65,-74,-74,97,97,-39,-39,-69,-73,97,97,-39,-128,-74,-74,-74,-39,-39,97,97,97,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'DELETE':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,98,-71,-81,-75,-55,-59,-61,98,-93,-94,-99,-39,-49,-118,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-57,-72,-47,-51,-95,-96,-78,-63,-39,98,-39,-74,-39,-99,-100,-39,98,-39,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,98,98,-74,-74,-71,-71,98,98,98,98,98,98,98,98,98,-54,-20,-37,-52,-74,-74,-39,-127,-39,98,-108,-41,-71,-71,-42,98,98,98,98,98,-62,-65,-74,-74,98,98,-39,-39,-69,-73,98,98,-39,-128,-74,-74,-74,-39,-39,98,98,98,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'EXISTS':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,99,-71,-81,-75,-55,-59,-61,99,-93,-94,-99,-39,-49,-118,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-57,-72,-47,-51,-95,-96,-78,-63,-39,99,-39,-74,-39,-99,-100,-39,99,-39,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,99,99,-74,-74,-71,-71,99,99,99,99,99,99,99,99,99,-54,-20,-37,-52,-74,-74,-39,-127,-39,99,-108,-41,-71,-71,-42,99,99,99,99,99,-62,-65,-74,-74,99,99,-39,-39,-69,-73,99,99,-39,-128,-74,-74,-74,-39,-39,99,99,99,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'EXIT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,100,-71,-81,-75,-55,-59,-61,100,-93,-94,-99,-39,-49,-118,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-57,-72,-47,-51,-95,-96,-78,-63,-39,100,-39,-74,-39,-99,-100,-39,100,-39,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,100,100,-74,-74,-71,-71,100,100,100,100,100,100,100,100,100,-54,-20,-37,-52,-74,-74,-39,-127,-39,100,-108,-41,-71,-71,-42,100,100,100,100,100,-62,-65,-74,-74,100,100,-39,-39,-69,-73,100,100,-39,-128,-74,-74,-74,-39,-39,100,100,100,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'LENGTH':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,101,-71,-81,-75,-55,-59,-61,101,-93,-94,-99,-39,-49,-118,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-57,-72,-47,-51,-95,-96,-78,-63,-39,101,-39,-74,-39,-99,-100,-39,101,-39,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,101,101,-74,-74,-71,-71,101,101,101,101,101,101,101,101,101,-54,-20,-37,-52,-74,-74,-39,-127,-39,101,-108,-41,-71,-71,-42,101,101,101,101,101,-62,-65,-74,-74,101,101,-39,-39,-69,-73,101,101,-39,-128,-74,-74,-74,-39,-39,101,101,101,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'SYSTEM':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,102,-71,-81,-75,-55,-59,-61,102,-93,-94,-99,-39,-49,-118,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-57,-72,-47,-51,-95,-96,-78,-63,-39,102,-39,-74,-39,-99,-100,-39,102,-39,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,102,102,-74,-74,-71,-71,102,102,102,102,102,102,102,102,102,-54,-20,-37,-52,-74,-74,-39,-127,-39,102,-108,-41,-71,-71,-42,102,102,102,102,102,-62,-65,-74,-74,102,102,-39,-39,-69,-73,102,102,-39,-128,-74,-74,-74,-39,-39,102,102,102,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'SUBSTR':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,103,-71,-81,-75,-55,-59,-61,103,-93,-94,-99,-39,-49,-118,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-57,-72,-47,-51,-95,-96,-78,-63,-39,103,-39,-74,-39,-99,-100,-39,103,-39,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,103,103,-74,-74,-71,-71,103,103,103,103,103,103,103,103,103,-54,-20,-37,-52,-74,-74,-39,-127,-39,103,-108,-41,-71,-71,-42,103,103,103,103,103,-62,-65,-74,-74,103,103,-39,-39,-69,-73,103,103,-39,-128,-74,-74,-74,-39,-39,103,103,103,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'SPLICE':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,104,-71,-81,-75,-55,-59,-61,104,-93,-94,-99,-39,-49,-118,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-57,-72,-47,-51,-95,-96,-78,-63,-39,104,-39,-74,-39,-99,-100,-39,104,-39,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,104,104,-74,-74,-71,-71,104,104,104,104,104,104,104,104,104,-54,-20,-37,-52,-74,-74,-39,-127,-39,104,-108,-41,-71,-71,-42,104,104,104,104,104,-62,-65,-74,-74,104,104,-39,-39,-69,-73,104,104,-39,-128,-74,-74,-74,-39,-39,104,104,104,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'PUSH':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,105,-71,-81,-75,-55,-59,-61,105,-93,-94,-99,-39,-49,-118,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,-57,-72,-47,-51,-95,-96,-78,-63,-39,105,-39,-74,-39,-99,-100,-39,105,-39,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,105,105,-74,-74,-71,-71,105,105,105,105,105,105,105,105,105,-54,-20,-37,-52,-74,-74,-39,-127,-39,105,-108,-41,-71,-71,-42,105,105,105,105,105,-62,-65,-74,-74,105,105,-39,-39,-69,-73,105,105,-39,-128,-74,-74,-74,-39,-39,105,105,105,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'UNSHIFT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,106,-71,-81,-75,-55,-59,-61,106,-93,-94,-99,-39,-49,-118,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,-57,-72,-47,-51,-95,-96,-78,-63,-39,106,-39,-74,-39,-99,-100,-39,106,-39,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,106,106,-74,-74,-71,-71,106,106,106,106,106,106,106,106,106,-54,-20,-37,-52,-74,-74,-39,-127,-39,106,-108,-41,-71,-71,-42,106,106,106,106,106,-62,-65,-74,-74,106,106,-39,-39,-69,-73,106,106,-39,-128,-74,-74,-74,-39,-39,106,106,106,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'POP':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,107,-71,-81,-75,-55,-59,-61,107,-93,-94,-99,-39,-49,-118,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,-57,-72,-47,-51,-95,-96,-78,-63,-39,107,-39,-74,-39,-99,-100,-39,107,-39,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,107,107,-74,-74,-71,-71,107,107,107,107,107,107,107,107,107,-54,-20,-37,-52,-74,-74,-39,-127,-39,107,-108,-41,-71,-71,-42,107,107,107,107,107,-62,-65,-74,-74,107,107,-39,-39,-69,-73,107,107,-39,-128,-74,-74,-74,-39,-39,107,107,107,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'SHIFT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,108,-71,-81,-75,-55,-59,-61,108,-93,-94,-99,-39,-49,-118,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,-57,-72,-47,-51,-95,-96,-78,-63,-39,108,-39,-74,-39,-99,-100,-39,108,-39,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,108,108,-74,-74,-71,-71,108,108,108,108,108,108,108,108,108,-54,-20,-37,-52,-74,-74,-39,-127,-39,108,-108,-41,-71,-71,-42,108,108,108,108,108,-62,-65,-74,-74,108,108,-39,-39,-69,-73,108,108,-39,-128,-74,-74,-74,-39,-39,108,108,108,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'ID':([0,3,5,6,8,10,11,13,14,17,18,19,20,26,27,28,35,36,37,42,55,65,66,67,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,110,112,113,114,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,238,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,298,299,301,304,305,308,310,311,312,313,314,315,316,321,322,323,326,330,331,332,333,334,336,339,340,341,347,348,349,350,356,362,405,407,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,109,-71,-81,-75,-55,132,-59,-61,109,-93,-94,-99,-39,-49,-118,109,109,109,237,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,299,109,303,307,-57,-72,-47,-51,-95,-96,-78,-63,-39,109,-39,-74,-39,-99,-100,-39,109,-39,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,432,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-246,109,109,475,109,477,478,479,480,481,482,483,-53,-79,-58,-74,488,-74,-50,-74,-39,-39,-118,109,109,-74,303,307,237,-74,-71,-71,109,109,109,109,109,109,109,109,109,-54,-20,-37,-52,-74,-74,-39,-127,-39,109,-108,-41,-71,-71,-42,109,109,109,109,109,-62,-65,-74,-74,109,109,-39,-39,-69,-73,109,109,-39,-128,-74,-74,-74,-39,-39,109,109,109,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'LBRACKET':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,64,65,66,67,68,69,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,111,112,113,114,115,116,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,232,235,236,237,239,240,241,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,302,303,305,306,307,309,316,321,322,323,330,331,332,333,334,336,339,340,341,350,351,356,362,405,407,410,428,429,430,431,432,436,439,446,451,471,473,474,475,476,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,503,504,505,509,510,511,512,513,515,518,519,520,523,526,529,541,562,563,567,568,569,570,571,576,580,581,582,583,585,587,588,590,591,598,600,601,611,612,614,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,112,-71,-81,-75,-55,-59,-61,112,-93,-94,-99,-39,-49,-118,112,230,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,-247,112,112,112,112,-268,-57,-72,-47,-51,-95,-96,-78,-63,-39,112,-39,-74,-39,-99,-100,-39,112,-39,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,428,112,230,-264,112,230,230,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,230,-262,112,230,-263,230,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,112,112,-74,-74,112,-71,-71,112,112,112,112,112,230,112,-267,112,112,112,-249,112,-248,230,-265,230,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-74,-74,-39,-127,-39,112,-108,230,-41,-71,-71,-42,112,112,230,-251,-252,-257,112,112,112,-255,-256,-62,-65,-74,-74,112,112,-39,-39,-69,-73,112,112,-250,-253,-254,112,-39,-128,-74,-74,230,-74,-39,-39,112,112,112,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'DOLLAR':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,46,55,65,66,67,68,69,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,113,114,115,117,118,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,158,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,351,356,362,405,407,410,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,587,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,113,-71,-81,-75,-55,-59,-61,113,-93,-94,-99,-39,-49,-118,-109,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,310,313,-57,-72,-47,-51,-95,-96,-78,-63,-39,113,-39,-74,-39,-99,-100,-39,113,347,-39,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,113,113,-74,-74,113,-71,-71,113,113,113,113,113,113,113,113,113,113,-54,-20,-37,-52,-74,-74,-39,-127,-39,113,-108,-41,-71,-71,-42,113,113,113,113,113,-62,-65,-74,-74,113,113,-39,-39,-69,-73,113,113,113,-39,-128,-74,-74,-74,-39,-39,113,113,113,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'AT':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,46,55,65,66,67,68,69,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,113,114,115,117,118,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,158,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,351,356,362,405,407,410,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,587,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,114,-71,-81,-75,-55,-59,-61,114,-93,-94,-99,-39,-49,-118,-109,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,311,314,-57,-72,-47,-51,-95,-96,-78,-63,-39,114,-39,-74,-39,-99,-100,-39,114,348,-39,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,114,114,-74,-74,114,-71,-71,114,114,114,114,114,114,114,114,114,114,-54,-20,-37,-52,-74,-74,-39,-127,-39,114,-108,-41,-71,-71,-42,114,114,114,114,114,-62,-65,-74,-74,114,114,-39,-39,-69,-73,114,114,114,-39,-128,-74,-74,-74,-39,-39,114,114,114,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'PERCENTAGE':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,46,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,111,112,113,114,115,116,117,118,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,158,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,233,234,235,236,237,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,260,261,262,263,264,265,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,299,301,302,303,305,306,307,309,316,321,322,323,330,331,332,333,334,336,339,340,341,343,350,351,354,355,356,357,358,359,360,361,362,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,435,436,438,439,446,450,451,469,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,498,499,503,504,509,510,511,512,513,515,516,517,519,520,521,522,523,524,525,526,528,529,531,532,533,534,535,536,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,569,570,571,576,577,580,581,582,583,584,585,586,587,588,589,590,591,593,595,596,597,598,599,600,601,602,611,612,614,618,620,621,622,623,624,627,628,630,631,632,633,635,636,637,638,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,67,-71,-81,-75,-55,-59,-61,67,-93,-94,-99,-39,-49,-118,-109,179,67,-141,-142,-143,-144,-145,-146,-149,-150,-151,67,67,67,67,67,67,67,67,-275,-276,-277,-278,-279,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-241,-247,67,67,67,67,-268,312,315,-57,-72,-47,-51,-95,-96,-78,-63,-39,67,-39,-74,-39,-99,-100,-39,67,349,-39,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,179,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-196,-199,67,67,-191,-192,67,-260,-264,67,-194,-195,-226,-232,179,67,-2,67,-4,67,67,67,-32,67,-34,67,-44,67,-46,67,-77,67,67,-91,67,67,67,-120,67,-122,67,-124,67,-126,67,-135,67,-140,67,-148,67,-155,67,-162,67,-164,67,67,67,67,67,-212,67,-214,67,-240,-245,67,-258,-262,67,-259,-263,-261,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,67,67,-74,179,-74,67,179,179,-71,179,179,179,179,179,-71,179,179,-187,-188,-189,-190,-193,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,-220,-221,-222,-223,179,179,179,179,179,179,179,179,179,179,179,-138,67,179,67,-159,-160,67,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,67,67,-151,67,-267,179,179,67,179,67,67,179,-249,-238,67,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-74,-74,-39,-127,-39,179,179,67,-108,-41,-71,-71,-42,67,67,179,-158,-251,-252,179,179,-257,179,-1,67,-3,67,-10,-19,-31,-33,-43,-45,-76,-84,-90,67,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,-74,-74,67,67,179,-39,-39,-69,-73,179,67,179,67,-250,-165,-253,-254,-5,-7,-56,-103,67,-243,-39,-128,179,-74,-74,-60,-74,-39,-39,67,67,67,-116,-117,-6,-8,-102,-80,-74,-74,179,179,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'BACKSLASH':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,55,65,66,67,68,69,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,113,114,115,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,351,356,362,405,407,410,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,587,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,115,-71,-81,-75,-55,-59,-61,115,-93,-94,-99,-39,-49,-118,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-57,-72,-47,-51,-95,-96,-78,-63,-39,115,-39,-74,-39,-99,-100,-39,115,-39,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,115,115,-74,-74,115,-71,-71,115,115,115,115,115,115,115,115,115,115,-54,-20,-37,-52,-74,-74,-39,-127,-39,115,-108,-41,-71,-71,-42,115,115,115,115,115,-62,-65,-74,-74,115,115,-39,-39,-69,-73,115,115,115,-39,-128,-74,-74,-74,-39,-39,115,115,115,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'MY':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,46,55,65,66,67,68,69,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,113,114,115,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,158,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,351,356,362,405,407,410,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,587,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,117,-71,-81,-75,-55,-59,-61,117,-93,-94,-99,-39,-49,-118,-109,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,-57,-72,-47,-51,-95,-96,-78,-63,-39,117,-39,-74,-39,-99,-100,-39,117,117,-39,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,117,117,-74,-74,117,-71,-71,117,117,117,117,117,117,117,117,117,117,-54,-20,-37,-52,-74,-74,-39,-127,-39,117,-108,-41,-71,-71,-42,117,117,117,117,117,-62,-65,-74,-74,117,117,-39,-39,-69,-73,117,117,117,-39,-128,-74,-74,-74,-39,-39,117,117,117,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'OUR':([0,3,5,6,8,10,11,13,14,17,19,20,26,27,28,35,36,37,42,46,55,65,66,67,68,69,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,113,114,115,119,120,121,122,125,126,127,133,134,137,146,147,148,150,152,156,157,158,159,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,316,321,322,323,330,331,332,333,334,336,339,340,341,350,351,356,362,405,407,410,428,429,431,436,439,446,471,484,485,490,491,492,493,494,495,496,503,504,509,510,511,512,513,515,526,529,541,567,568,569,570,571,576,580,581,582,583,585,587,598,600,601,611,612,618,620,621,622,623,624,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-74,-40,-39,-99,118,-71,-81,-75,-55,-59,-61,118,-93,-94,-99,-39,-49,-118,-109,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,-57,-72,-47,-51,-95,-96,-78,-63,-39,118,-39,-74,-39,-99,-100,-39,118,118,-39,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,-53,-79,-58,-74,-74,-50,-74,-39,-39,-118,118,118,-74,-74,118,-71,-71,118,118,118,118,118,118,118,118,118,118,-54,-20,-37,-52,-74,-74,-39,-127,-39,118,-108,-41,-71,-71,-42,118,118,118,118,118,-62,-65,-74,-74,118,118,-39,-39,-69,-73,118,118,118,-39,-128,-74,-74,-74,-39,-39,118,118,118,-116,-117,-80,-74,-74,-39,-101,-104,-74,-129,-105,-106,-39,-74,-107,]),'REDUCER_OP':([0,3,5,6,8,9,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-99,-40,-39,-99,39,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,-99,-39,-99,-100,-39,-39,-53,-58,-99,-99,-50,-99,-39,-39,-118,-99,-99,-71,-71,-54,-20,-37,-52,-99,-99,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,-99,-99,-39,-39,-69,-73,-39,-128,-99,-99,-99,-39,-39,-116,-117,-80,-99,-99,-39,-101,-104,-99,-129,-105,-106,-39,-99,-107,]),'REDUCER_CHANGE':([0,3,5,6,8,9,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-99,-40,-39,-99,40,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,-99,-39,-99,-100,-39,-39,-53,-58,-99,-99,-50,-99,-39,-39,-118,-99,-99,-71,-71,-54,-20,-37,-52,-99,-99,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,-99,-99,-39,-39,-69,-73,-39,-128,-99,-99,-99,-39,-39,-116,-117,-80,-99,-99,-39,-101,-104,-99,-129,-105,-106,-39,-99,-107,]),'WHILE':([0,3,5,6,8,9,11,17,19,20,35,36,37,42,48,52,53,54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,119,120,121,122,133,134,146,147,148,150,152,156,159,172,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,316,322,323,330,331,332,333,334,336,341,350,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,432,451,469,472,473,475,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,500,504,509,510,511,512,517,519,520,523,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,569,570,580,581,582,583,584,586,588,589,590,591,593,595,596,597,599,600,601,611,612,614,618,620,621,627,628,629,630,631,632,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-99,-40,-39,-99,43,-71,-55,-59,-61,-99,-39,-49,-118,160,168,168,-153,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,-57,-72,-47,-51,-63,-39,-39,-99,-39,-99,-100,-39,-39,-156,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,-53,-58,-99,-99,-50,-99,-39,-39,-118,-99,-99,-71,-71,-152,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-267,-249,-238,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-99,-99,-39,-127,-39,574,-108,-41,-71,-71,-42,-158,-251,-252,-257,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,-99,-99,-39,-39,-69,-73,-237,-182,-250,-165,-253,-254,-5,-7,-56,-103,-243,-39,-128,-99,-99,-60,-99,-39,-39,-116,-117,-184,-6,-8,-102,-80,-99,-99,-39,-101,-104,-99,-129,-105,-106,-39,-99,-107,]),'UNTIL':([0,3,5,6,8,9,11,17,19,20,35,36,37,42,52,53,54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,119,120,121,122,133,134,146,147,148,150,152,156,159,172,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,316,322,323,330,331,332,333,334,336,341,350,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,432,451,469,472,473,475,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,500,504,509,510,511,512,517,519,520,523,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,569,570,580,581,582,583,584,586,588,589,590,591,593,595,596,597,599,600,601,611,612,614,618,620,621,627,628,629,630,631,632,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-99,-40,-39,-99,44,-71,-55,-59,-61,-99,-39,-49,-118,169,169,-153,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,-57,-72,-47,-51,-63,-39,-39,-99,-39,-99,-100,-39,-39,-156,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,-53,-58,-99,-99,-50,-99,-39,-39,-118,-99,-99,-71,-71,-152,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-267,-249,-238,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-99,-99,-39,-127,-39,575,-108,-41,-71,-71,-42,-158,-251,-252,-257,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,-99,-99,-39,-39,-69,-73,-237,-182,-250,-165,-253,-254,-5,-7,-56,-103,-243,-39,-128,-99,-99,-60,-99,-39,-39,-116,-117,-184,-6,-8,-102,-80,-99,-99,-39,-101,-104,-99,-129,-105,-106,-39,-99,-107,]),'DO':([0,3,5,6,8,9,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-99,-40,-39,-99,45,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,-99,-39,-99,-100,-39,-39,-53,-58,-99,-99,-50,-99,-39,-39,-118,-99,-99,-71,-71,-54,-20,-37,-52,-99,-99,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,-99,-99,-39,-39,-69,-73,-39,-128,-99,-99,-99,-39,-39,-116,-117,-80,-99,-99,-39,-101,-104,-99,-129,-105,-106,-39,-99,-107,]),'FOR':([0,3,5,6,8,9,11,17,19,20,35,36,37,42,52,53,54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,119,120,121,122,133,134,146,147,148,150,152,156,159,172,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,316,322,323,330,331,332,333,334,336,341,350,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,432,451,469,472,473,475,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,504,509,510,511,512,517,519,520,523,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,569,570,580,581,582,583,584,586,588,589,590,591,593,595,596,597,599,600,601,611,612,614,618,620,621,627,628,629,630,631,632,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-99,-40,-39,-99,46,-71,-55,-59,-61,-99,-39,-49,-118,170,170,-153,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,-57,-72,-47,-51,-63,-39,-39,-99,-39,-99,-100,-39,-39,-156,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,-53,-58,-99,-99,-50,-99,-39,-39,-118,-99,-99,-71,-71,-152,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-267,-249,-238,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-99,-99,-39,-127,-39,-108,-41,-71,-71,-42,-158,-251,-252,-257,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,-99,-99,-39,-39,-69,-73,-237,-182,-250,-165,-253,-254,-5,-7,-56,-103,-243,-39,-128,-99,-99,-60,-99,-39,-39,-116,-117,-184,-6,-8,-102,-80,-99,-99,-39,-101,-104,-99,-129,-105,-106,-39,-99,-107,]),'MAPPER_LOOP':([0,3,5,6,8,9,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-99,-40,-39,-99,48,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,-99,-39,-99,-100,-39,-39,-53,-58,-99,-99,-50,-99,-39,-39,-118,-99,-99,-71,-71,-54,-20,-37,-52,-99,-99,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,-99,-99,-39,-39,-69,-73,-39,-128,-99,-99,-99,-39,-39,-116,-117,-80,-99,-99,-39,-101,-104,-99,-129,-105,-106,-39,-99,-107,]),'REDUCER_CODE':([0,3,5,6,8,9,11,17,19,20,35,36,37,42,119,120,121,122,133,134,146,147,148,150,152,156,159,316,322,323,330,331,332,333,334,336,341,350,356,362,484,485,490,491,492,493,494,495,496,504,509,510,511,512,567,568,569,570,580,581,582,583,600,601,611,612,618,620,621,627,628,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-99,-40,-39,-99,49,-71,-55,-59,-61,-99,-39,-49,-118,-57,-72,-47,-51,-63,-39,-39,-99,-39,-99,-100,-39,-39,-53,-58,-99,-99,-50,-99,-39,-39,-118,-99,-99,-71,-71,-54,-20,-37,-52,-99,-99,-39,-127,-39,-108,-41,-71,-71,-42,-62,-65,-99,-99,-39,-39,-69,-73,-39,-128,-99,-99,-99,-39,-39,-116,-117,-80,-99,-99,-39,-101,-104,-99,-129,-105,-106,-39,-99,-107,]),'IF':([0,3,5,6,8,9,11,17,19,20,35,36,37,42,52,53,54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,119,120,121,122,133,134,146,147,148,150,152,156,159,172,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,316,322,323,330,331,332,333,334,336,341,350,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,432,451,469,472,473,475,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,504,509,510,511,512,517,519,520,523,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,569,570,580,581,582,583,584,586,588,589,590,591,593,595,596,597,599,600,601,611,612,614,618,620,621,627,628,629,630,631,632,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-99,-40,-39,-99,50,-71,-55,-59,-61,-99,-39,-49,-118,166,166,-153,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,-57,-72,-47,-51,-63,-39,-39,-99,-39,-99,-100,-39,-39,-156,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,-53,-58,-99,-99,-50,-99,-39,-39,-118,-99,-99,-71,-71,-152,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-267,-249,-238,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-99,-99,-39,-127,-39,-108,-41,-71,-71,-42,-158,-251,-252,-257,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,-99,-99,-39,-39,-69,-73,-237,-182,-250,-165,-253,-254,-5,-7,-56,-103,-243,-39,-128,-99,-99,-60,-99,-39,-39,-116,-117,-184,-6,-8,-102,-80,-99,-99,-39,-101,-104,-99,-129,-105,-106,-39,-99,-107,]),'UNLESS':([0,3,5,6,8,9,11,17,19,20,35,36,37,42,52,53,54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,119,120,121,122,133,134,146,147,148,150,152,156,159,172,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,316,322,323,330,331,332,333,334,336,341,350,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,432,451,469,472,473,475,477,478,479,480,481,482,483,484,485,490,491,492,493,494,495,496,504,509,510,511,512,517,519,520,523,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,569,570,580,581,582,583,584,586,588,589,590,591,593,595,596,597,599,600,601,611,612,614,618,620,621,627,628,629,630,631,632,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-39,-99,-40,-39,-99,51,-71,-55,-59,-61,-99,-39,-49,-118,167,167,-153,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,-57,-72,-47,-51,-63,-39,-39,-99,-39,-99,-100,-39,-39,-156,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,-53,-58,-99,-99,-50,-99,-39,-39,-118,-99,-99,-71,-71,-152,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-267,-249,-238,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,-54,-20,-37,-52,-99,-99,-39,-127,-39,-108,-41,-71,-71,-42,-158,-251,-252,-257,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,-99,-99,-39,-39,-69,-73,-237,-182,-250,-165,-253,-254,-5,-7,-56,-103,-243,-39,-128,-99,-99,-60,-99,-39,-39,-116,-117,-184,-6,-8,-102,-80,-99,-99,-39,-101,-104,-99,-129,-105,-106,-39,-99,-107,]),'RETURNS':([0,3,5,6,11,17,19,20,29,33,37,42,119,120,121,122,133,145,152,316,322,328,331,336,356,362,484,485,490,491,495,504,509,510,511,512,566,567,568,582,583,601,627,628,633,641,642,650,651,652,655,],[-39,-21,-40,-39,-71,-55,-59,-61,140,-35,-49,-118,-57,-72,-47,-51,-63,-22,-100,-53,-58,-36,-50,-118,-71,-71,-54,-20,-37,-52,-127,-108,-41,-71,-71,-42,-38,-62,-65,-69,-73,-128,-116,-117,-80,-101,-104,-129,-105,-106,-107,]),'SUB':([0,3,5,6,11,17,19,20,29,33,37,42,119,120,121,122,133,139,140,145,152,316,322,327,328,331,336,356,362,484,485,490,491,495,504,509,510,511,512,566,567,568,582,583,601,627,628,633,641,642,650,651,652,655,],[-39,-21,-40,-39,-71,-55,-59,-61,-29,-35,-49,-118,-57,-72,-47,-51,-63,326,-35,-22,-100,-53,-58,-30,-36,-50,-118,-71,-71,-54,-20,-37,-52,-127,-108,-41,-71,-71,-42,-38,-62,-65,-69,-73,-128,-116,-117,-80,-101,-104,-129,-105,-106,-107,]),'$end':([0,1,2,3,4,5,6,11,17,19,20,34,37,42,119,120,121,122,133,152,316,322,331,336,356,362,484,485,490,491,495,504,509,510,511,512,567,568,582,583,601,627,628,633,641,642,650,651,652,655,],[-39,0,-9,-12,-11,-40,-39,-71,-55,-59,-61,-13,-49,-118,-57,-72,-47,-51,-63,-100,-53,-58,-50,-118,-71,-71,-54,-20,-37,-52,-127,-108,-41,-71,-71,-42,-62,-65,-69,-73,-128,-116,-117,-80,-101,-104,-129,-105,-106,-107,]),'RBRACE':([5,8,11,17,19,20,35,36,37,42,54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,119,120,121,122,133,134,146,147,148,150,152,156,159,172,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,266,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,316,322,323,330,331,332,333,334,336,341,350,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,427,430,432,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,484,490,491,492,493,495,496,504,509,510,511,512,517,519,520,522,523,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,567,568,570,580,581,582,583,584,588,589,590,591,593,595,596,597,599,600,601,611,612,614,618,620,621,627,628,630,631,632,633,635,636,640,641,642,646,650,651,652,653,654,655,],[-40,-99,-71,-55,-59,-61,-99,-39,-49,-118,-153,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,-57,-72,-47,-51,-63,-39,-39,331,-39,-99,-100,-39,-39,-156,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,451,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,-53,-58,485,490,-50,491,-39,-39,-118,500,504,-71,-71,-152,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,520,523,-267,541,-249,-238,-244,-248,562,-265,563,-266,-269,-270,-271,-272,-273,-274,-54,-37,-52,567,568,-127,-39,-108,-41,-71,-71,-42,-158,-251,-252,591,-257,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-62,-65,601,-39,-39,-69,-73,-237,-250,-165,-253,-254,-5,-7,-56,-103,-243,-39,-128,627,628,-60,633,-39,-39,-116,-117,-6,-8,-102,-80,641,642,-39,-101,-104,650,-129,-105,-106,-39,655,-107,]),'REDUCER_VAR':([5,11,17,19,20,37,42,119,120,121,122,133,151,152,316,322,331,335,336,356,362,484,490,491,494,495,504,509,510,511,512,567,568,569,582,583,601,627,628,633,641,642,650,651,652,655,],[-40,-71,-55,-59,-61,-49,-118,-57,-72,-47,-51,-63,-99,-100,-53,-58,-50,494,-118,-71,-71,-54,-37,-52,-39,-127,-108,-41,-71,-71,-42,-62,-65,600,-69,-73,-128,-116,-117,-80,-101,-104,-129,-105,-106,-107,]),'COMMENT_LINE':([11,356,362,510,511,],[120,120,120,120,120,]),'MAPPER_COMBINE':([23,162,486,610,],[136,353,564,626,]),'ELSE':([42,153,336,627,628,650,],[-99,337,-99,-116,-117,-129,]),'ELSIF':([42,153,336,627,628,650,],[-99,338,-99,-116,-117,-129,]),'COMBINER':([49,579,],[162,610,]),'COMMA':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,430,432,435,438,451,469,472,473,474,475,476,477,478,479,480,481,482,483,517,519,520,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,584,588,589,590,591,593,595,596,597,599,614,630,631,632,],[172,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,172,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,172,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-151,-267,172,172,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,-158,-251,-252,-257,172,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-237,-250,-165,-253,-254,-5,-7,-56,-103,-243,-60,-6,-8,-102,]),'RBRACKET':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,172,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,300,302,303,306,307,309,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,432,451,469,472,473,475,477,478,479,480,481,482,483,517,519,520,521,523,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,584,588,589,590,591,593,595,596,597,599,614,630,631,632,],[-153,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,-156,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,473,-258,-262,-259,-263,-261,-152,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,519,-267,-249,-238,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,-158,-251,-252,590,-257,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-237,-250,-165,-253,-254,-5,-7,-56,-103,-243,-60,-6,-8,-102,]),'RPAREN':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,172,210,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,296,297,299,302,303,306,307,309,325,343,344,354,355,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,402,404,406,407,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,432,434,435,437,438,440,441,442,443,444,445,447,448,449,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,475,477,478,479,480,481,482,483,498,499,516,517,519,520,523,524,525,527,528,530,531,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,577,584,588,589,590,591,592,593,594,595,596,597,599,602,609,613,614,615,616,617,624,630,631,632,637,638,639,],[-153,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,-156,403,404,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,469,-240,-245,-258,-262,-259,-263,-261,487,502,-112,507,508,-152,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,514,-138,-157,517,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-267,525,404,528,404,531,532,533,534,535,536,538,539,540,-249,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,-238,559,560,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,572,573,588,-158,-251,-252,-257,404,-1,593,-3,595,-10,-19,-31,-33,-43,-45,596,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,599,-255,-256,608,-237,-250,-165,-253,-254,615,-5,616,-7,-56,-103,-243,619,625,629,-60,630,631,632,-111,-6,-8,-102,643,644,645,]),'TIMES':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[175,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,175,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,175,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,175,175,175,175,175,175,175,175,175,175,-187,-188,-189,-190,-193,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,-220,-221,-222,-223,175,175,175,175,175,175,175,175,175,175,175,-138,175,-159,-160,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,175,-151,-267,175,175,175,175,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,175,175,175,-158,-251,-252,175,175,-257,175,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,175,175,175,-250,-165,-253,-254,-5,-7,-56,-103,-243,175,-60,-6,-8,-102,175,175,]),'DIVIDE':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[176,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,176,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,176,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,176,176,176,176,176,176,176,176,176,176,-187,-188,-189,-190,-193,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,-220,-221,-222,-223,176,176,176,176,176,176,176,176,176,176,176,-138,176,-159,-160,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,-151,-267,176,176,176,176,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,176,176,176,-158,-251,-252,176,176,-257,176,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,176,176,176,-250,-165,-253,-254,-5,-7,-56,-103,-243,176,-60,-6,-8,-102,176,176,]),'POW':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[177,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,177,-196,-199,177,177,-260,-264,-194,-195,177,177,177,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,-220,-221,-222,-223,177,177,177,177,177,177,177,177,177,177,177,-138,177,-159,-160,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,-151,-267,177,177,177,177,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,177,177,177,-158,-251,-252,177,177,-257,177,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,177,177,177,-250,-165,-253,-254,-5,-7,-56,-103,-243,177,-60,-6,-8,-102,177,177,]),'X':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[178,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,178,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,178,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,178,178,178,178,178,178,178,178,178,178,-187,-188,-189,-190,-193,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,-220,-221,-222,-223,178,178,178,178,178,178,178,178,178,178,178,-138,178,-159,-160,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,178,-151,-267,178,178,178,178,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,178,178,178,-158,-251,-252,178,178,-257,178,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,178,178,178,-250,-165,-253,-254,-5,-7,-56,-103,-243,178,-60,-6,-8,-102,178,178,]),'PERIOD':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[180,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,180,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,180,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,180,180,180,180,180,180,180,180,-185,-186,-187,-188,-189,-190,-193,-200,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,-220,-221,-222,-223,180,180,180,180,180,180,180,180,180,180,180,-138,180,-159,-160,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,180,-151,-267,180,180,180,180,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,180,180,180,-158,-251,-252,180,180,-257,180,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,180,180,180,-250,-165,-253,-254,-5,-7,-56,-103,-243,180,-60,-6,-8,-102,180,180,]),'NUM_EQ':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[181,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,181,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,181,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,181,181,181,181,181,181,181,181,-185,-186,-187,-188,-189,-190,-193,-200,None,None,-203,-204,-205,-206,None,None,None,-210,-215,-216,-217,None,None,-220,-221,-222,-223,181,181,181,-228,-229,181,181,181,181,181,181,-138,181,-159,-160,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,181,-151,-267,181,181,181,181,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,181,181,181,-158,-251,-252,181,181,-257,181,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,181,181,181,-250,-165,-253,-254,-5,-7,-56,-103,-243,181,-60,-6,-8,-102,181,181,]),'NUM_NE':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[182,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,182,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,182,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,182,182,182,182,182,182,182,182,-185,-186,-187,-188,-189,-190,-193,-200,None,None,-203,-204,-205,-206,None,None,None,-210,-215,-216,-217,None,None,-220,-221,-222,-223,182,182,182,-228,-229,182,182,182,182,182,182,-138,182,-159,-160,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,-151,-267,182,182,182,182,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,182,182,182,-158,-251,-252,182,182,-257,182,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,182,182,182,-250,-165,-253,-254,-5,-7,-56,-103,-243,182,-60,-6,-8,-102,182,182,]),'NUM_LT':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,212,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[183,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,183,410,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,183,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,183,183,183,183,183,183,183,183,-185,-186,-187,-188,-189,-190,-193,-200,183,183,None,None,None,None,183,183,183,None,None,None,None,183,183,-220,-221,-222,-223,183,183,183,-228,-229,183,183,183,183,183,183,-138,183,-159,-160,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,183,-151,-267,183,183,183,183,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,183,183,183,-158,-251,-252,183,183,-257,183,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,183,183,183,-250,-165,-253,-254,-5,-7,-56,-103,-243,183,-60,-6,-8,-102,183,183,]),'NUM_LE':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[184,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,184,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,184,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,184,184,184,184,184,184,184,184,-185,-186,-187,-188,-189,-190,-193,-200,184,184,None,None,None,None,184,184,184,None,None,None,None,184,184,-220,-221,-222,-223,184,184,184,-228,-229,184,184,184,184,184,184,-138,184,-159,-160,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,-151,-267,184,184,184,184,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,184,184,184,-158,-251,-252,184,184,-257,184,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,184,184,184,-250,-165,-253,-254,-5,-7,-56,-103,-243,184,-60,-6,-8,-102,184,184,]),'NUM_GT':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,518,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[185,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,185,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,185,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,185,185,185,185,185,185,185,185,-185,-186,-187,-188,-189,-190,-193,-200,185,185,None,None,None,None,185,185,185,None,None,None,None,185,185,-220,-221,-222,-223,185,185,185,-228,-229,185,185,185,185,185,185,-138,185,-159,-160,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,-151,-267,185,185,185,185,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,185,185,185,-158,589,-251,-252,185,185,-257,185,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,185,185,185,-250,-165,-253,-254,-5,-7,-56,-103,-243,185,-60,-6,-8,-102,185,185,]),'NUM_GE':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[186,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,186,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,186,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,186,186,186,186,186,186,186,186,-185,-186,-187,-188,-189,-190,-193,-200,186,186,None,None,None,None,186,186,186,None,None,None,None,186,186,-220,-221,-222,-223,186,186,186,-228,-229,186,186,186,186,186,186,-138,186,-159,-160,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,-151,-267,186,186,186,186,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,186,186,186,-158,-251,-252,186,186,-257,186,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,186,186,186,-250,-165,-253,-254,-5,-7,-56,-103,-243,186,-60,-6,-8,-102,186,186,]),'CMP_NUM':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[187,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,187,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,187,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,187,187,187,187,187,187,187,187,-185,-186,-187,-188,-189,-190,-193,-200,None,None,-203,-204,-205,-206,None,None,None,-210,-215,-216,-217,None,None,-220,-221,-222,-223,187,187,187,-228,-229,187,187,187,187,187,187,-138,187,-159,-160,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,-151,-267,187,187,187,187,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,187,187,187,-158,-251,-252,187,187,-257,187,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,187,187,187,-250,-165,-253,-254,-5,-7,-56,-103,-243,187,-60,-6,-8,-102,187,187,]),'STR_EQ':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[188,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,188,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,188,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,188,188,188,188,188,188,188,188,-185,-186,-187,-188,-189,-190,-193,-200,None,None,-203,-204,-205,-206,None,None,None,-210,-215,-216,-217,None,None,-220,-221,-222,-223,188,188,188,-228,-229,188,188,188,188,188,188,-138,188,-159,-160,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,-151,-267,188,188,188,188,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,188,188,188,-158,-251,-252,188,188,-257,188,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,188,188,188,-250,-165,-253,-254,-5,-7,-56,-103,-243,188,-60,-6,-8,-102,188,188,]),'STR_NE':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[189,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,189,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,189,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,189,189,189,189,189,189,189,189,-185,-186,-187,-188,-189,-190,-193,-200,None,None,-203,-204,-205,-206,None,None,None,-210,-215,-216,-217,None,None,-220,-221,-222,-223,189,189,189,-228,-229,189,189,189,189,189,189,-138,189,-159,-160,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,-151,-267,189,189,189,189,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,189,189,189,-158,-251,-252,189,189,-257,189,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,189,189,189,-250,-165,-253,-254,-5,-7,-56,-103,-243,189,-60,-6,-8,-102,189,189,]),'STR_LT':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[190,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,190,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,190,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,190,190,190,190,190,190,190,190,-185,-186,-187,-188,-189,-190,-193,-200,190,190,None,None,None,None,190,190,190,None,None,None,None,190,190,-220,-221,-222,-223,190,190,190,-228,-229,190,190,190,190,190,190,-138,190,-159,-160,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,-151,-267,190,190,190,190,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,190,190,190,-158,-251,-252,190,190,-257,190,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,190,190,190,-250,-165,-253,-254,-5,-7,-56,-103,-243,190,-60,-6,-8,-102,190,190,]),'STR_LE':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[191,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,191,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,191,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,191,191,191,191,191,191,191,191,-185,-186,-187,-188,-189,-190,-193,-200,191,191,None,None,None,None,191,191,191,None,None,None,None,191,191,-220,-221,-222,-223,191,191,191,-228,-229,191,191,191,191,191,191,-138,191,-159,-160,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,-151,-267,191,191,191,191,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,191,191,191,-158,-251,-252,191,191,-257,191,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,191,191,191,-250,-165,-253,-254,-5,-7,-56,-103,-243,191,-60,-6,-8,-102,191,191,]),'STR_GT':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[192,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,192,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,192,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,192,192,192,192,192,192,192,192,-185,-186,-187,-188,-189,-190,-193,-200,192,192,None,None,None,None,192,192,192,None,None,None,None,192,192,-220,-221,-222,-223,192,192,192,-228,-229,192,192,192,192,192,192,-138,192,-159,-160,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,-151,-267,192,192,192,192,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,192,192,192,-158,-251,-252,192,192,-257,192,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,192,192,192,-250,-165,-253,-254,-5,-7,-56,-103,-243,192,-60,-6,-8,-102,192,192,]),'STR_GE':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[193,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,193,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,193,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,193,193,193,193,193,193,193,193,-185,-186,-187,-188,-189,-190,-193,-200,193,193,None,None,None,None,193,193,193,None,None,None,None,193,193,-220,-221,-222,-223,193,193,193,-228,-229,193,193,193,193,193,193,-138,193,-159,-160,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,-151,-267,193,193,193,193,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,193,193,193,-158,-251,-252,193,193,-257,193,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,193,193,193,-250,-165,-253,-254,-5,-7,-56,-103,-243,193,-60,-6,-8,-102,193,193,]),'CMP':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[194,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,194,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,194,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,194,194,194,194,194,194,194,194,-185,-186,-187,-188,-189,-190,-193,-200,None,None,-203,-204,-205,-206,None,None,None,-210,-215,-216,-217,None,None,-220,-221,-222,-223,194,194,194,-228,-229,194,194,194,194,194,194,-138,194,-159,-160,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,-151,-267,194,194,194,194,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,194,194,194,-158,-251,-252,194,194,-257,194,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,194,194,194,-250,-165,-253,-254,-5,-7,-56,-103,-243,194,-60,-6,-8,-102,194,194,]),'SMART_EQ':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[195,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,195,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,195,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,195,195,195,195,195,195,195,195,-185,-186,-187,-188,-189,-190,-193,-200,None,None,-203,-204,-205,-206,None,None,None,-210,-215,-216,-217,None,None,-220,-221,-222,-223,195,195,195,-228,-229,195,195,195,195,195,195,-138,195,-159,-160,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,-151,-267,195,195,195,195,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,195,195,195,-158,-251,-252,195,195,-257,195,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,195,195,195,-250,-165,-253,-254,-5,-7,-56,-103,-243,195,-60,-6,-8,-102,195,195,]),'STR_NO_REX':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[196,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,196,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,196,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,196,196,196,196,196,196,196,196,196,196,196,196,-189,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,-220,-221,-222,-223,196,196,196,196,196,196,196,196,196,196,196,-138,196,-159,-160,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,-151,-267,196,196,196,196,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,196,196,196,-158,-251,-252,196,196,-257,196,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,196,196,196,-250,-165,-253,-254,-5,-7,-56,-103,-243,196,-60,-6,-8,-102,196,196,]),'STR_REX':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[197,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,197,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,197,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,197,197,197,197,197,197,197,197,197,197,197,197,-189,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,-220,-221,-222,-223,197,197,197,197,197,197,197,197,197,197,197,-138,197,-159,-160,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,197,-151,-267,197,197,197,197,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,197,197,197,-158,-251,-252,197,197,-257,197,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,197,197,197,-250,-165,-253,-254,-5,-7,-56,-103,-243,197,-60,-6,-8,-102,197,197,]),'OR':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[198,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,198,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,198,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,198,198,198,198,198,198,198,198,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,198,198,198,198,198,198,-138,198,-159,-160,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,198,-151,-267,198,198,198,198,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,198,198,198,-158,-251,-252,198,198,-257,198,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,198,198,198,-250,-165,-253,-254,-5,-7,-56,-103,-243,198,-60,-6,-8,-102,198,198,]),'AND':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[199,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,199,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,199,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,199,199,199,199,199,199,199,199,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,199,-225,199,-228,-229,199,199,199,199,199,199,-138,199,-159,-160,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,199,-151,-267,199,199,199,199,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,199,199,199,-158,-251,-252,199,199,-257,199,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,199,199,199,-250,-165,-253,-254,-5,-7,-56,-103,-243,199,-60,-6,-8,-102,199,199,]),'XOR':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[200,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,200,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,200,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,200,200,200,200,200,200,200,200,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,200,200,200,200,200,200,-138,200,-159,-160,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,200,-151,-267,200,200,200,200,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,200,200,200,-158,-251,-252,200,200,-257,200,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,200,200,200,-250,-165,-253,-254,-5,-7,-56,-103,-243,200,-60,-6,-8,-102,200,200,]),'LSHIFT':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[201,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,201,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,201,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,201,201,201,201,201,201,201,201,-185,-186,-187,-188,-189,-190,-193,-200,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,-220,-221,-222,-223,201,201,201,-228,-229,201,201,201,201,201,201,-138,201,-159,-160,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,201,-151,-267,201,201,201,201,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,201,201,201,-158,-251,-252,201,201,-257,201,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,201,201,201,-250,-165,-253,-254,-5,-7,-56,-103,-243,201,-60,-6,-8,-102,201,201,]),'RSHIFT':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[202,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,202,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,202,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,202,202,202,202,202,202,202,202,-185,-186,-187,-188,-189,-190,-193,-200,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,-220,-221,-222,-223,202,202,202,-228,-229,202,202,202,202,202,202,-138,202,-159,-160,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,-151,-267,202,202,202,202,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,202,202,202,-158,-251,-252,202,202,-257,202,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,202,202,202,-250,-165,-253,-254,-5,-7,-56,-103,-243,202,-60,-6,-8,-102,202,202,]),'LOR':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[203,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,203,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,203,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,203,203,203,203,203,203,203,203,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,203,203,203,203,-138,203,-159,-160,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,-151,-267,203,203,203,203,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,203,203,203,-158,-251,-252,203,203,-257,203,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,203,203,203,-250,-165,-253,-254,-5,-7,-56,-103,-243,203,-60,-6,-8,-102,203,203,]),'LAND':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[204,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,204,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,204,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,204,204,204,204,204,204,204,204,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,204,-231,204,204,204,204,-138,204,-159,-160,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,-151,-267,204,204,204,204,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,204,204,204,-158,-251,-252,204,204,-257,204,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,204,204,204,-250,-165,-253,-254,-5,-7,-56,-103,-243,204,-60,-6,-8,-102,204,204,]),'LLOR':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[205,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,205,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,205,205,205,205,205,205,205,205,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,205,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,205,205,-151,-267,205,205,205,205,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,205,205,205,-158,-251,-252,205,205,-257,205,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,205,-237,205,-250,-165,-253,-254,-5,-7,-56,-103,-243,205,-60,-6,-8,-102,205,205,]),'LLAND':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[206,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,206,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,206,206,206,206,206,206,206,206,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,206,-234,206,206,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,206,206,-151,-267,206,206,206,206,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,206,206,206,-158,-251,-252,206,206,-257,206,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,206,-237,206,-250,-165,-253,-254,-5,-7,-56,-103,-243,206,-60,-6,-8,-102,206,206,]),'LLXOR':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[207,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,207,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,207,207,207,207,207,207,207,207,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,207,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,207,207,-151,-267,207,207,207,207,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,207,207,207,-158,-251,-252,207,207,-257,207,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,207,-237,207,-250,-165,-253,-254,-5,-7,-56,-103,-243,207,-60,-6,-8,-102,207,207,]),'QUEST_CLOSE':([54,56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,343,354,355,357,358,359,360,361,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,430,432,433,435,438,450,451,469,472,473,474,475,476,477,478,479,480,481,482,483,498,499,516,517,519,520,521,522,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,577,584,586,588,589,590,591,593,595,596,597,599,602,614,630,631,632,637,638,],[208,-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,208,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,208,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,208,208,208,208,208,208,208,208,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,208,208,208,208,-138,208,-159,-160,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,208,-151,-267,208,208,208,208,-249,-238,-244,-248,-151,-265,-151,-266,-269,-270,-271,-272,-273,-274,208,208,208,-158,-251,-252,208,208,-257,208,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,208,208,208,-250,-165,-253,-254,-5,-7,-56,-103,-243,208,-60,-6,-8,-102,208,208,]),'TWO_PERIOD':([56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,211,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,432,433,435,438,451,469,472,473,475,477,478,479,480,481,482,483,517,519,520,523,524,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,584,588,589,590,591,593,595,596,597,599,614,630,631,632,],[-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,405,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-267,405,405,405,-249,-238,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,-158,-251,-252,-257,405,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-237,-250,-165,-253,-254,-5,-7,-56,-103,-243,-60,-6,-8,-102,]),'COLON':([56,57,58,59,60,61,62,63,64,73,74,75,76,77,109,111,116,228,229,233,234,236,237,240,241,242,243,244,246,248,252,254,256,258,261,264,269,271,273,275,277,279,281,283,285,287,293,295,297,299,302,303,306,307,309,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,404,406,408,409,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,432,451,469,472,473,475,477,478,479,480,481,482,483,517,519,520,523,525,528,531,532,533,534,535,536,538,539,540,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,562,563,584,588,589,590,591,593,595,596,597,599,614,630,631,632,],[-141,-142,-143,-144,-145,-146,-149,-150,-151,-275,-276,-277,-278,-279,-241,-247,-268,-196,-199,-191,-192,-260,-264,-194,-195,-226,-232,-235,-2,-4,-32,-34,-44,-46,-77,-91,-120,-122,-124,-126,-135,-140,-148,-155,-162,-164,-212,-214,-240,-245,-258,-262,-259,-263,-261,-185,-186,-187,-188,-189,-190,-193,-200,-201,-202,-203,-204,-205,-206,-207,-208,-209,-210,-215,-216,-217,-218,-219,-220,-221,-222,-223,-224,-225,-227,-228,-229,-230,-231,-233,-234,-236,513,-138,-157,-159,-160,-166,-167,-168,-169,-171,-172,-173,-174,-175,-176,-177,-178,-179,-180,-181,-267,-249,-238,-244,-248,-265,-266,-269,-270,-271,-272,-273,-274,-158,-251,-252,-257,-1,-3,-10,-19,-31,-33,-43,-45,-76,-84,-90,-114,-119,-121,-123,-125,-134,-139,-147,-154,-161,-163,-170,-183,-197,-198,-211,-213,-239,-242,-255,-256,-237,-250,-165,-253,-254,-5,-7,-56,-103,-243,-60,-6,-8,-102,]),'EQUALS':([64,111,116,236,237,302,303,306,307,309,403,430,432,451,473,474,475,476,477,478,479,480,481,482,483,487,505,514,519,520,523,525,528,533,534,535,536,538,540,543,544,545,546,547,548,549,550,551,552,557,558,559,562,563,588,590,591,599,629,632,],[212,-247,-268,-260,-264,-258,-262,-259,-263,-261,515,212,-267,-249,-248,212,-265,212,-266,-269,-270,-271,-272,-273,-274,565,578,565,-251,-252,-257,565,565,565,565,565,565,565,565,565,565,565,565,565,565,565,565,565,565,565,565,565,-255,-256,-250,-253,-254,565,565,565,]),'PLUSEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[213,-247,-268,-260,-264,-258,-262,-259,-263,-261,213,-267,-249,-248,213,-265,213,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'MINUSEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[214,-247,-268,-260,-264,-258,-262,-259,-263,-261,214,-267,-249,-248,214,-265,214,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'TIMESEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[215,-247,-268,-260,-264,-258,-262,-259,-263,-261,215,-267,-249,-248,215,-265,215,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'DIVEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[216,-247,-268,-260,-264,-258,-262,-259,-263,-261,216,-267,-249,-248,216,-265,216,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'MODEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[217,-247,-268,-260,-264,-258,-262,-259,-263,-261,217,-267,-249,-248,217,-265,217,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'POWEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[218,-247,-268,-260,-264,-258,-262,-259,-263,-261,218,-267,-249,-248,218,-265,218,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'ANDEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[219,-247,-268,-260,-264,-258,-262,-259,-263,-261,219,-267,-249,-248,219,-265,219,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'OREQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[220,-247,-268,-260,-264,-258,-262,-259,-263,-261,220,-267,-249,-248,220,-265,220,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'XOREQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[221,-247,-268,-260,-264,-258,-262,-259,-263,-261,221,-267,-249,-248,221,-265,221,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'LSHIFTEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[222,-247,-268,-260,-264,-258,-262,-259,-263,-261,222,-267,-249,-248,222,-265,222,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'RSHIFTEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[223,-247,-268,-260,-264,-258,-262,-259,-263,-261,223,-267,-249,-248,223,-265,223,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'LANDEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[224,-247,-268,-260,-264,-258,-262,-259,-263,-261,224,-267,-249,-248,224,-265,224,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'LOREQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[225,-247,-268,-260,-264,-258,-262,-259,-263,-261,225,-267,-249,-248,225,-265,225,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'XEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[226,-247,-268,-260,-264,-258,-262,-259,-263,-261,226,-267,-249,-248,226,-265,226,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'PERIODEQUAL':([64,111,116,236,237,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,519,520,523,562,563,588,590,591,],[227,-247,-268,-260,-264,-258,-262,-259,-263,-261,227,-267,-249,-248,227,-265,227,-266,-269,-270,-271,-272,-273,-274,-251,-252,-257,-255,-256,-250,-253,-254,]),'POINTED':([64,111,116,236,237,240,241,302,303,306,307,309,430,432,451,473,474,475,476,477,478,479,480,481,482,483,505,518,519,520,523,562,563,588,590,591,614,],[232,-247,-268,-260,-264,232,232,-258,-262,-259,-263,-261,232,-267,-249,-248,232,-265,232,-266,-269,-270,-271,-272,-273,-274,232,232,-251,-252,-257,-255,-256,-250,-253,-254,232,]),'TWO_COLON':([109,237,303,307,],[298,298,298,298,]),'M_REGEX':([196,197,],[387,388,]),'S_REGEX':([197,],[389,]),'Y_REGEX':([197,],[390,]),'UNDEF':([212,],[408,]),'STDIN':([212,578,],[409,609,]),'REDUCER_KEY':([356,],[510,]),'REDUCER_VALUE':([356,],[511,]),'EACH':([515,565,],[587,587,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -16,7 +16,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'statements':([0,25,34,133,155,156,161,325,329,345,499,500,568,577,604,614,617,639,644,],[2,2,145,320,343,344,350,485,487,498,574,575,600,607,620,627,629,643,648,]),'value':([19,21,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'block_header':([2,4,48,50,142,145,147,158,320,343,344,349,350,485,487,498,574,575,600,607,620,627,629,643,648,],[7,34,157,159,325,7,329,346,7,7,7,159,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'for_variable':([150,],[334,]),'function_call':([19,21,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'file':([0,],[1,]),'function_types':([29,143,],[135,326,]),'comparations':([19,21,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'elif':([50,349,],[160,502,]),'for_each':([7,],[45,]),'logical':([19,21,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'var_access':([19,21,63,65,67,71,73,74,75,76,77,79,80,81,82,83,84,87,89,90,91,94,95,98,99,100,101,105,107,108,109,112,117,118,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,330,331,341,359,364,368,373,384,396,401,402,408,410,490,513,525,529,551,556,567,576,582,583,592,615,618,619,],[111,111,111,111,111,111,111,111,111,111,111,192,194,111,111,201,111,111,111,111,111,111,111,222,111,111,111,111,111,111,111,111,301,304,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,369,111,111,376,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,469,111,111,111,111,111,111,111,111,488,111,111,111,111,111,111,111,111,111,111,111,548,111,111,111,111,111,111,111,111,609,111,111,111,111,111,]),'declare':([2,145,320,343,344,350,485,487,498,574,575,600,607,620,627,629,643,648,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'for_type':([41,],[150,]),'line_comment':([5,478,481,558,559,],[35,557,560,594,595,]),'function':([2,],[10,]),'package':([19,21,63,65,67,71,73,74,75,76,77,79,81,82,83,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,118,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,332,333,336,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[106,106,106,106,106,106,106,106,106,106,106,190,106,106,200,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,303,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,303,200,190,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,]),'opt_list':([151,567,615,],[337,599,628,]),'post_block':([130,131,],[316,319,]),'labels_line':([2,145,320,343,344,350,485,487,498,574,575,600,607,620,627,629,643,648,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'statement_type':([2,145,320,343,344,350,485,487,498,574,575,600,607,620,627,629,643,648,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'arithmetic':([19,21,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'reducer_init':([7,],[49,]),'regex':([19,21,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,]),'code':([0,25,],[3,132,]),'size_opt':([11,20,31,56,57,58,],[55,128,141,164,165,166,]),'block':([7,],[46,]),'variable_my':([19,21,63,65,67,71,73,74,75,76,77,79,80,81,82,83,84,87,89,90,91,94,95,98,99,100,101,105,107,108,109,112,117,118,122,124,126,129,150,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,330,331,341,359,364,368,373,384,396,401,402,408,410,490,513,525,529,551,556,567,576,582,583,592,615,618,619,],[102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,]),'function_body':([2,],[25,]),'expression':([19,21,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[114,114,114,171,174,178,180,182,184,186,188,195,198,203,207,210,212,213,218,220,223,225,227,230,233,114,236,260,307,310,311,195,338,340,351,195,195,114,195,114,195,195,362,195,195,195,114,371,195,114,378,114,195,114,382,195,114,195,114,195,195,114,195,397,195,195,403,404,405,406,411,412,413,414,415,416,417,418,419,420,421,422,423,424,195,430,431,114,433,434,435,436,440,441,442,443,444,445,446,447,448,449,450,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,114,195,114,195,475,476,477,479,480,489,494,114,114,519,521,114,195,544,545,195,566,114,584,114,591,593,114,606,195,195,114,630,631,]),'variable':([19,21,63,65,67,71,73,74,75,76,77,79,80,81,82,83,84,87,89,90,91,94,95,98,99,100,101,105,107,108,109,112,117,118,122,124,126,129,150,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,330,331,341,359,364,368,373,384,396,401,402,408,410,490,513,525,529,551,556,567,576,582,583,592,615,618,619,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,335,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'special_statement':([2,145,320,343,344,350,485,487,498,574,575,600,607,620,627,629,643,648,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'function_header':([2,],[27,]),'change_init':([40,43,337,348,565,569,571,572,621,635,637,638,],[149,153,491,501,597,601,602,603,633,640,641,642,]),'multi_equals':([21,],[130,]),'binary':([19,21,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,]),'loop_head':([7,],[51,]),'list':([19,21,63,81,108,129,151,168,170,172,173,175,177,179,181,183,185,187,189,197,199,205,206,208,209,211,217,219,221,224,226,228,229,232,235,258,266,302,306,308,309,359,364,368,384,396,408,513,529,567,583,592,615,],[120,131,169,196,234,312,339,353,355,356,357,358,360,361,363,365,366,367,169,375,169,379,380,381,383,385,389,390,391,392,393,394,395,398,400,426,432,169,471,472,473,510,515,353,531,541,353,579,585,339,610,612,339,]),'dimension':([2,6,30,138,145,320,322,343,344,350,485,487,498,574,575,600,607,620,627,629,643,648,],[13,37,137,324,13,13,483,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'returns_opt':([33,],[144,]),'elif_block':([159,],[349,]),'if_block':([7,],[50,]),'mapper_init':([2,145,320,343,344,350,485,487,498,574,575,600,607,620,627,629,643,648,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'assignment':([19,21,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,]),'args_opt':([2,],[33,]),'sort_head':([19,21,63,65,67,71,73,74,75,76,77,81,82,84,87,89,90,91,94,95,99,100,101,105,107,108,109,112,122,124,126,129,151,152,162,168,170,172,173,175,177,179,181,183,185,187,189,191,197,199,204,205,206,208,209,211,217,219,221,224,226,228,229,231,232,235,238,239,240,241,243,244,245,246,247,248,249,251,252,253,254,255,256,257,258,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,302,306,308,309,313,314,315,317,318,331,341,359,364,368,373,384,396,401,402,408,490,513,525,529,551,556,567,576,583,592,615,618,619,],[85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,]),}
+_lr_goto_items = {'file':([0,],[1,]),'code':([0,6,],[2,34,]),'statements':([0,6,36,134,146,148,156,159,333,334,494,496,580,581,600,620,621,640,653,],[3,3,147,323,330,332,341,350,492,493,569,570,611,612,618,635,636,646,654,]),'function':([3,],[4,]),'statement_type':([3,147,323,330,332,341,350,492,493,569,570,611,612,618,635,636,646,654,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'function_body':([3,],[6,]),'mapper_init':([3,147,323,330,332,341,350,492,493,569,570,611,612,618,635,636,646,654,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'block_header':([3,8,35,39,42,147,150,151,323,330,332,336,341,350,492,493,569,570,611,612,618,635,636,646,654,],[9,36,146,149,153,9,334,335,9,9,9,153,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'labels_line':([3,147,323,330,332,341,350,492,493,569,570,611,612,618,635,636,646,654,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'special_statement':([3,147,323,330,332,341,350,492,493,569,570,611,612,618,635,636,646,654,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'declare':([3,147,323,330,332,341,350,492,493,569,570,611,612,618,635,636,646,654,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'dimension':([3,13,16,124,147,323,329,330,332,341,350,492,493,569,570,611,612,618,635,636,646,654,],[15,123,131,317,15,15,489,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'function_header':([3,],[22,]),'args_opt':([3,],[29,]),'block':([9,],[37,]),'loop_head':([9,],[38,]),'reducer_init':([9,],[41,]),'if_block':([9,],[42,]),'for_each':([9,],[47,]),'list':([10,26,55,91,112,137,157,172,209,235,245,247,249,250,251,253,255,257,260,262,263,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,301,305,407,431,436,439,446,471,526,529,576,585,598,624,],[52,138,210,266,300,325,344,363,402,266,434,437,440,441,442,443,444,445,447,448,449,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,470,266,266,402,402,527,530,537,561,592,594,344,613,617,344,]),'multi_equals':([10,],[53,]),'expression':([10,26,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[54,54,211,233,234,242,243,244,246,248,252,254,256,258,261,264,54,269,271,273,275,277,279,281,283,285,287,293,295,297,54,211,343,354,355,357,358,359,360,361,54,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,391,392,393,394,395,396,397,398,399,400,401,211,406,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,54,433,435,438,54,54,211,211,211,211,211,54,211,450,54,211,211,211,211,211,211,211,211,211,211,54,54,54,54,211,211,211,472,54,54,498,499,516,211,521,522,524,54,54,54,211,577,584,586,54,54,597,602,54,211,211,637,638,54,]),'assignment':([10,26,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'arithmetic':([10,26,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'comparations':([10,26,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'regex':([10,26,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'binary':([10,26,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'logical':([10,26,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'value':([10,26,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'function_call':([10,26,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'var_access':([10,26,55,65,66,67,68,69,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,113,114,115,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,351,405,407,410,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,587,598,622,623,624,],[64,64,64,64,64,236,240,241,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,302,306,309,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,430,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,474,476,64,64,505,64,64,518,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,614,64,64,64,64,]),'sort_head':([10,26,55,65,66,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,]),'package':([10,26,55,65,66,67,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,113,114,137,157,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,347,348,349,405,407,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,598,622,623,624,],[110,110,110,110,110,238,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,304,308,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,304,308,238,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,]),'variable':([10,26,55,65,66,67,68,69,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,113,114,115,137,157,158,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,351,405,407,410,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,587,598,622,623,624,],[111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,346,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,]),'variable_my':([10,26,55,65,66,67,68,69,70,71,72,78,79,82,83,84,85,87,89,91,93,94,95,96,97,98,99,100,101,102,107,108,109,112,113,114,115,137,157,158,163,164,166,167,168,169,170,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,198,199,200,201,202,203,204,205,206,207,208,209,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,230,231,235,239,245,247,249,250,251,253,255,257,260,262,263,265,267,268,270,272,274,276,278,280,282,284,286,288,289,290,291,292,294,296,299,301,305,339,340,351,405,407,410,428,429,431,436,439,446,471,503,513,515,526,529,541,571,576,585,587,598,622,623,624,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'line_comment':([11,356,362,510,511,],[119,509,512,582,583,]),'returns_opt':([29,],[139,]),'size_opt':([30,31,32,128,129,130,],[141,143,144,318,319,320,]),'function_types':([33,140,],[145,327,]),'elif':([42,336,],[152,495,]),'change_init':([43,44,338,342,572,573,574,575,619,643,644,645,],[154,155,497,501,603,604,605,606,634,647,648,649,]),'for_type':([46,],[158,]),'post_block':([52,53,],[165,171,]),'elif_block':([153,],[336,]),'opt_list':([157,576,624,],[342,607,639,]),'for_variable':([158,],[345,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -26,277 +26,283 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> file","S'",1,None,None,None),
-  ('mapper_init -> MAPPER_CODE','mapper_init',1,'p_mapper_init','hadoop.py',53),
-  ('mapper_init -> MAPPER_CODE TYPE TYPE TYPE','mapper_init',4,'p_mapper_init','hadoop.py',54),
-  ('reducer_init -> REDUCER_CODE','reducer_init',1,'p_reducer_init','hadoop.py',69),
-  ('reducer_init -> REDUCER_CODE TYPE TYPE TYPE TYPE','reducer_init',5,'p_reducer_init','hadoop.py',70),
   ('function_call -> PRINT LPAREN list RPAREN','function_call',4,'p_function_print','functions.py',76),
   ('function_call -> PRINT expression','function_call',2,'p_function_print','functions.py',77),
   ('function_call -> SAY LPAREN list RPAREN','function_call',4,'p_function_print','functions.py',78),
   ('function_call -> SAY expression','function_call',2,'p_function_print','functions.py',79),
-  ('statement_type -> mapper_init LBRACE block_header statements RBRACE','statement_type',5,'p_mapper_code','hadoop.py',76),
-  ('loop_head -> MAPPER_LOOP WHILE LPAREN var_access EQUALS STDIN RPAREN','loop_head',7,'p_mapper_loop_head','hadoop.py',95),
-  ('file -> code','file',1,'p_file','parser.py',99),
   ('function_call -> PRINT expression LPAREN list RPAREN','function_call',5,'p_function_fprint','functions.py',100),
   ('function_call -> PRINT LPAREN expression LPAREN list RPAREN RPAREN','function_call',7,'p_function_fprint','functions.py',101),
   ('function_call -> SAY expression LPAREN list RPAREN','function_call',5,'p_function_fprint','functions.py',102),
   ('function_call -> SAY LPAREN expression LPAREN list RPAREN RPAREN','function_call',7,'p_function_fprint','functions.py',103),
-  ('code -> statements function','code',2,'p_code','parser.py',106),
-  ('block -> loop_head LBRACE statements RBRACE','block',4,'p_mapper_loop','hadoop.py',112),
-  ('function -> <empty>','function',0,'p_function_empty','parser.py',113),
-  ('function -> function_body code','function',2,'p_function','parser.py',117),
-  ('function_header -> args_opt returns_opt SUB ID','function_header',4,'p_function_header','parser.py',122),
-  ('function_call -> HADOOP_PRINT PRINT LPAREN list RPAREN','function_call',5,'p_hadoop_print','hadoop.py',124),
-  ('function_body -> function_header LBRACE statements RBRACE','function_body',4,'p_function_body','parser.py',128),
+  ('file -> code','file',1,'p_file','parser.py',127),
   ('function_call -> SPLIT LPAREN list RPAREN','function_call',4,'p_function_split','functions.py',131),
-  ('args_opt -> <empty>','args_opt',0,'p_args_opt_empty','parser.py',133),
-  ('args_opt -> ARGS function_types','args_opt',2,'p_args_opt','parser.py',137),
-  ('block -> REDUCER_OP block_header LBRACE statements RBRACE','block',5,'p_reducer_if','hadoop.py',141),
-  ('returns_opt -> <empty>','returns_opt',0,'p_returns_opt_empty','parser.py',142),
-  ('returns_opt -> RETURNS function_types','returns_opt',2,'p_returns_opt','parser.py',146),
+  ('code -> statements function','code',2,'p_code','parser.py',134),
+  ('function -> <empty>','function',0,'p_function_empty','parser.py',141),
+  ('function -> function_body code','function',2,'p_function','parser.py',145),
+  ('mapper_init -> MAPPER_CODE','mapper_init',1,'p_mapper_init','hadoop.py',146),
+  ('mapper_init -> MAPPER_CODE TYPE TYPE TYPE','mapper_init',4,'p_mapper_init','hadoop.py',147),
+  ('mapper_init -> MAPPER_CODE MAPPER_COMBINE','mapper_init',2,'p_mapper_init','hadoop.py',148),
+  ('mapper_init -> MAPPER_CODE TYPE TYPE TYPE MAPPER_COMBINE','mapper_init',5,'p_mapper_init','hadoop.py',149),
+  ('function_header -> args_opt returns_opt SUB ID','function_header',4,'p_function_header','parser.py',150),
   ('function_call -> JOIN LPAREN list RPAREN','function_call',4,'p_function_join','functions.py',151),
-  ('block -> REDUCER_CHANGE LBRACE block_header statements RBRACE','block',5,'p_reducer_change','hadoop.py',151),
-  ('function_types -> <empty>','function_types',0,'p_function_types_empty','parser.py',151),
-  ('function_types -> function_types TYPE','function_types',2,'p_function_types','parser.py',155),
-  ('function_types -> function_types REF dimension TYPE','function_types',4,'p_function_types_ref','parser.py',159),
-  ('statement_type -> labels_line list post_block SEMI REDUCER_KEY line_comment','statement_type',6,'p_reducer_key','hadoop.py',161),
-  ('statements -> <empty>','statements',0,'p_statements_empty','parser.py',164),
-  ('statements -> statements statement_type','statements',2,'p_statements','parser.py',168),
-  ('statement_type -> labels_line list post_block SEMI line_comment','statement_type',5,'p_statement_type_simple','parser.py',173),
+  ('function_body -> function_header LBRACE statements RBRACE','function_body',4,'p_function_body','parser.py',156),
+  ('args_opt -> <empty>','args_opt',0,'p_args_opt_empty','parser.py',161),
+  ('args_opt -> ARGS function_types','args_opt',2,'p_args_opt','parser.py',165),
+  ('reducer_init -> REDUCER_CODE','reducer_init',1,'p_reducer_init','hadoop.py',167),
+  ('reducer_init -> REDUCER_CODE TYPE TYPE TYPE TYPE','reducer_init',5,'p_reducer_init','hadoop.py',168),
+  ('reducer_init -> REDUCER_CODE COMBINER','reducer_init',2,'p_reducer_init','hadoop.py',169),
+  ('reducer_init -> REDUCER_CODE COMBINER MAPPER_COMBINE','reducer_init',3,'p_reducer_init','hadoop.py',170),
+  ('reducer_init -> REDUCER_CODE TYPE TYPE TYPE TYPE COMBINER','reducer_init',6,'p_reducer_init','hadoop.py',171),
+  ('reducer_init -> REDUCER_CODE TYPE TYPE TYPE TYPE COMBINER MAPPER_COMBINE','reducer_init',7,'p_reducer_init','hadoop.py',172),
+  ('returns_opt -> <empty>','returns_opt',0,'p_returns_opt_empty','parser.py',170),
+  ('returns_opt -> RETURNS function_types','returns_opt',2,'p_returns_opt','parser.py',174),
   ('function_call -> KEYS LPAREN list RPAREN','function_call',4,'p_function_keys_values','functions.py',175),
   ('function_call -> KEYS expression','function_call',2,'p_function_keys_values','functions.py',176),
   ('function_call -> VALUES LPAREN list RPAREN','function_call',4,'p_function_keys_values','functions.py',177),
   ('function_call -> VALUES expression','function_call',2,'p_function_keys_values','functions.py',178),
-  ('statement_type -> labels_line list post_block SEMI REDUCER_VALUE line_comment','statement_type',6,'p_reducer_value','hadoop.py',176),
-  ('statement_type -> labels_line multi_equals post_block SEMI line_comment','statement_type',5,'p_statement_type_multi_equals','parser.py',177),
-  ('statement_type -> special_statement SEMI','statement_type',2,'p_statement_type_special_statement','parser.py',181),
-  ('statement_type -> block_header block','statement_type',2,'p_statement_type_block','parser.py',187),
-  ('block -> reducer_init LBRACE block_header REDUCER_VAR statements REDUCER_VAR statements RBRACE','block',8,'p_reducer_code','hadoop.py',190),
-  ('statement_type -> LBRACE block_header statements RBRACE','statement_type',4,'p_statement_type_block_empty','parser.py',191),
-  ('statement_type -> declare TYPE','statement_type',2,'p_statement_advanced_declare','parser.py',195),
-  ('statement_type -> declare dimension TYPE','statement_type',3,'p_statement_advanced_declare_dim','parser.py',199),
-  ('statement_type -> declare REF dimension TYPE','statement_type',4,'p_statement_advanced_declare_ref','parser.py',203),
+  ('function_types -> <empty>','function_types',0,'p_function_types_empty','parser.py',179),
+  ('function_types -> function_types TYPE','function_types',2,'p_function_types','parser.py',183),
+  ('statement_type -> mapper_init LBRACE block_header statements RBRACE','statement_type',5,'p_mapper_code','hadoop.py',185),
+  ('function_types -> function_types REF dimension TYPE','function_types',4,'p_function_types_ref','parser.py',187),
+  ('statements -> <empty>','statements',0,'p_statements_empty','parser.py',192),
+  ('statements -> statements statement_type','statements',2,'p_statements','parser.py',196),
+  ('statement_type -> labels_line list post_block SEMI line_comment','statement_type',5,'p_statement_type_simple','parser.py',201),
+  ('statement_type -> labels_line multi_equals post_block SEMI line_comment','statement_type',5,'p_statement_type_multi_equals','parser.py',205),
   ('function_call -> CHOMP LPAREN list RPAREN','function_call',4,'p_function_chomp','functions.py',207),
   ('function_call -> CHOMP expression','function_call',2,'p_function_chomp','functions.py',208),
   ('function_call -> CHOP LPAREN list RPAREN','function_call',4,'p_function_chomp','functions.py',209),
   ('function_call -> CHOP expression','function_call',2,'p_function_chomp','functions.py',210),
-  ('statement_type -> COMMENT','statement_type',1,'p_statement_comment','parser.py',207),
-  ('statement_type -> SEMI line_comment','statement_type',2,'p_statement_line_comment','parser.py',211),
-  ('statement_type -> PACKAGE ID SEMI','statement_type',3,'p_statement_package','parser.py',215),
-  ('statement_type -> JAVA_LINE','statement_type',1,'p_statement_java_line','parser.py',220),
-  ('statement_type -> JAVA_IMPORT','statement_type',1,'p_statement_java_import','parser.py',224),
-  ('statement_type -> error SEMI','statement_type',2,'p_statement_error','parser.py',229),
-  ('special_statement -> LAST','special_statement',1,'p_special_statement_break','parser.py',234),
-  ('special_statement -> NEXT','special_statement',1,'p_special_statement_next','parser.py',239),
-  ('special_statement -> RETURN LPAREN list RPAREN','special_statement',4,'p_special_statement_return_paren','parser.py',244),
-  ('special_statement -> RETURN list','special_statement',2,'p_special_statement_return','parser.py',248),
+  ('statement_type -> special_statement SEMI','statement_type',2,'p_statement_type_special_statement','parser.py',209),
+  ('loop_head -> MAPPER_LOOP WHILE LPAREN var_access EQUALS STDIN RPAREN','loop_head',7,'p_mapper_loop_head','hadoop.py',212),
+  ('statement_type -> block_header block','statement_type',2,'p_statement_type_block','parser.py',215),
+  ('statement_type -> LBRACE block_header statements RBRACE','statement_type',4,'p_statement_type_block_empty','parser.py',219),
+  ('statement_type -> declare TYPE','statement_type',2,'p_statement_advanced_declare','parser.py',223),
+  ('block -> loop_head LBRACE statements RBRACE','block',4,'p_mapper_loop','hadoop.py',226),
+  ('statement_type -> declare dimension TYPE','statement_type',3,'p_statement_advanced_declare_dim','parser.py',227),
+  ('statement_type -> declare REF dimension TYPE','statement_type',4,'p_statement_advanced_declare_ref','parser.py',231),
+  ('statement_type -> COMMENT','statement_type',1,'p_statement_comment','parser.py',235),
+  ('function_call -> HADOOP_PRINT PRINT LPAREN list RPAREN','function_call',5,'p_hadoop_print','hadoop.py',238),
+  ('statement_type -> SEMI line_comment','statement_type',2,'p_statement_line_comment','parser.py',239),
+  ('statement_type -> PACKAGE ID SEMI','statement_type',3,'p_statement_package','parser.py',243),
+  ('statement_type -> JAVA_LINE','statement_type',1,'p_statement_java_line','parser.py',248),
   ('function_call -> LPAREN list RPAREN EQUALS EACH var_access','function_call',6,'p_function_each','functions.py',250),
-  ('special_statement -> RETURN','special_statement',1,'p_special_statement_return_empty','parser.py',252),
-  ('line_comment -> <empty>','line_comment',0,'p_line_comment_empthy','parser.py',258),
-  ('line_comment -> COMMENT_LINE','line_comment',1,'p_line_comment','parser.py',262),
-  ('labels_line -> <empty>','labels_line',0,'p_labels_line_empthy','parser.py',267),
-  ('labels_line -> TYPE','labels_line',1,'p_labels_type_type','parser.py',271),
-  ('labels_line -> dimension TYPE','labels_line',2,'p_labels_type_dim','parser.py',275),
-  ('labels_line -> REF dimension TYPE','labels_line',3,'p_labels_type_ref','parser.py',279),
-  ('labels_line -> declare','labels_line',1,'p_labels_declare','parser.py',283),
-  ('dimension -> L_HASH size_opt','dimension',2,'p_dimension_hash','parser.py',288),
-  ('dimension -> L_ARRAY size_opt','dimension',2,'p_dimension_array','parser.py',293),
-  ('function_call -> DEFINED LPAREN list RPAREN','function_call',4,'p_function_defined','functions.py',297),
-  ('function_call -> DEFINED expression','function_call',2,'p_function_defined','functions.py',298),
-  ('dimension -> L_LIST size_opt','dimension',2,'p_dimension_list','parser.py',297),
-  ('dimension -> dimension L_HASH size_opt','dimension',3,'p_dimension_hash_more','parser.py',302),
-  ('dimension -> dimension L_ARRAY size_opt','dimension',3,'p_dimension_array_more','parser.py',307),
-  ('dimension -> dimension L_LIST size_opt','dimension',3,'p_dimension_list_more','parser.py',311),
-  ('size_opt -> <empty>','size_opt',0,'p_size_opt_emtpy','parser.py',317),
-  ('function_call -> OPEN LPAREN list RPAREN','function_call',4,'p_function_open','functions.py',320),
-  ('size_opt -> SIZE','size_opt',1,'p_size_opt','parser.py',321),
-  ('declare -> VAR','declare',1,'p_declare_var','parser.py',326),
-  ('declare -> SIZE','declare',1,'p_declare_size','parser.py',330),
-  ('declare -> declare VAR','declare',2,'p_declare_more_var','parser.py',334),
-  ('declare -> declare SIZE','declare',2,'p_declare_more_size','parser.py',339),
-  ('function_call -> CLOSE LPAREN list RPAREN','function_call',4,'p_function_close','functions.py',344),
-  ('function_call -> CLOSE expression','function_call',2,'p_function_close','functions.py',345),
-  ('change_init -> <empty>','change_init',0,'p_change_init','parser.py',345),
-  ('block_header -> <empty>','block_header',0,'p_block_header','parser.py',350),
-  ('block -> if_block elif','block',2,'p_block_if','parser.py',355),
-  ('block -> WHILE change_init LPAREN expression RPAREN change_init LBRACE statements RBRACE','block',9,'p_block_while','parser.py',359),
-  ('block -> UNTIL change_init LPAREN expression RPAREN change_init LBRACE statements RBRACE','block',9,'p_block_until','parser.py',363),
-  ('block -> DO LBRACE statements RBRACE WHILE change_init LPAREN expression RPAREN change_init SEMI','block',11,'p_block_do_while','parser.py',367),
-  ('sort_head -> SORT','sort_head',1,'p_function_sort_custom_head','functions.py',368),
-  ('block -> DO LBRACE statements RBRACE UNTIL change_init LPAREN expression RPAREN change_init SEMI','block',11,'p_block_do_until','parser.py',371),
-  ('block -> FOR LPAREN opt_list change_init SEMI opt_list SEMI opt_list RPAREN change_init LBRACE statements RBRACE','block',13,'p_block_for','parser.py',375),
-  ('block -> for_each LBRACE statements RBRACE','block',4,'p_block_foreach','parser.py',379),
-  ('for_type -> <empty>','for_type',0,'p_for_type','parser.py',384),
-  ('function_call -> sort_head LBRACE expression RBRACE LPAREN list RPAREN','function_call',7,'p_function_sort_custom','functions.py',387),
-  ('function_call -> sort_head LBRACE expression RBRACE expression','function_call',5,'p_function_sort_custom','functions.py',388),
-  ('for_variable -> variable','for_variable',1,'p_for_variable','parser.py',389),
-  ('opt_list -> <empty>','opt_list',0,'p_opt_list_empty','parser.py',394),
-  ('opt_list -> list','opt_list',1,'p_opt_list','parser.py',398),
-  ('for_each -> FOR for_type for_variable LPAREN expression RPAREN','for_each',6,'p_foreach_var','parser.py',403),
-  ('for_each -> FOR LPAREN expression RPAREN','for_each',4,'p_foreach','parser.py',407),
-  ('if_block -> IF LPAREN expression RPAREN LBRACE statements RBRACE','if_block',7,'p_if_block_if','parser.py',412),
-  ('if_block -> UNLESS LPAREN expression RPAREN LBRACE statements RBRACE','if_block',7,'p_if_block_unless','parser.py',416),
-  ('elif -> <empty>','elif',0,'p_elif_empty','parser.py',421),
-  ('elif -> block_header elif_block elif','elif',3,'p_elif_elif','parser.py',425),
-  ('function_call -> SORT LPAREN list RPAREN','function_call',4,'p_function_sort','functions.py',429),
-  ('elif -> block_header ELSE LBRACE statements RBRACE','elif',5,'p_elif_else','parser.py',429),
-  ('elif_block -> ELSIF change_init LPAREN expression RPAREN change_init LBRACE statements RBRACE','elif_block',9,'p_elif_block','parser.py',434),
-  ('post_block -> <empty>','post_block',0,'p_post_block_empty','parser.py',439),
-  ('post_block -> IF expression','post_block',2,'p_post_block_if','parser.py',443),
-  ('post_block -> UNLESS expression','post_block',2,'p_post_block_unless','parser.py',447),
-  ('function_call -> LC LPAREN list RPAREN','function_call',4,'p_function_upper_lower','functions.py',450),
-  ('function_call -> LC expression','function_call',2,'p_function_upper_lower','functions.py',451),
-  ('function_call -> LCFIRST LPAREN list RPAREN','function_call',4,'p_function_upper_lower','functions.py',452),
-  ('function_call -> LCFIRST expression','function_call',2,'p_function_upper_lower','functions.py',453),
-  ('function_call -> UC LPAREN list RPAREN','function_call',4,'p_function_upper_lower','functions.py',454),
-  ('function_call -> UC expression','function_call',2,'p_function_upper_lower','functions.py',455),
-  ('function_call -> UCFIRST LPAREN list RPAREN','function_call',4,'p_function_upper_lower','functions.py',456),
-  ('function_call -> UCFIRST expression','function_call',2,'p_function_upper_lower','functions.py',457),
-  ('post_block -> WHILE expression','post_block',2,'p_post_block_while','parser.py',451),
-  ('post_block -> UNTIL expression','post_block',2,'p_post_block_until','parser.py',455),
-  ('post_block -> FOR expression','post_block',2,'p_post_block_for','parser.py',459),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_paren','parser.py',464),
-  ('expression -> assignment','expression',1,'p_expression_assignment','parser.py',472),
-  ('expression -> arithmetic','expression',1,'p_expression_arithmetic','parser.py',476),
-  ('function_call -> DIE LPAREN list RPAREN','function_call',4,'p_function_die','functions.py',477),
-  ('function_call -> DIE expression','function_call',2,'p_function_die','functions.py',478),
-  ('expression -> comparations','expression',1,'p_expression_comparations','parser.py',480),
-  ('expression -> regex','expression',1,'p_expression_regex','parser.py',484),
-  ('expression -> binary','expression',1,'p_expression_binary','parser.py',488),
-  ('expression -> logical','expression',1,'p_expression_logical','parser.py',492),
-  ('expression -> value','expression',1,'p_expression_value','parser.py',496),
-  ('function_call -> DELETE LPAREN list RPAREN','function_call',4,'p_function_delete','functions.py',498),
-  ('function_call -> DELETE expression','function_call',2,'p_function_delete','functions.py',499),
-  ('expression -> function_call','expression',1,'p_expression_function','parser.py',500),
-  ('expression -> var_access','expression',1,'p_expression_variable','parser.py',504),
-  ('list -> expression COMMA list','list',3,'p_list_comma','parser.py',509),
-  ('list -> expression','list',1,'p_list_expression','parser.py',513),
-  ('list -> expression COMMA','list',2,'p_list_expression_comma','parser.py',517),
-  ('assignment -> var_access EQUALS expression','assignment',3,'p_assignment_equals','parser.py',522),
-  ('function_call -> EXISTS LPAREN list RPAREN','function_call',4,'p_function_exists','functions.py',525),
-  ('function_call -> EXISTS expression','function_call',2,'p_function_exists','functions.py',526),
-  ('assignment -> var_access EQUALS LPAREN RPAREN','assignment',4,'p_assignment_declare_colection','parser.py',526),
-  ('assignment -> var_access EQUALS UNDEF','assignment',3,'p_assignment_declare_var','parser.py',530),
-  ('assignment -> var_access EQUALS STDIN','assignment',3,'p_assignment_input','parser.py',534),
-  ('assignment -> var_access EQUALS NUM_LT var_access NUM_GT','assignment',5,'p_assignment_read','parser.py',538),
-  ('assignment -> var_access PLUSEQUAL expression','assignment',3,'p_assignment_plusequal','parser.py',542),
-  ('function_call -> EXIT LPAREN list RPAREN','function_call',4,'p_function_exit','functions.py',546),
-  ('function_call -> EXIT expression','function_call',2,'p_function_exit','functions.py',547),
-  ('assignment -> var_access MINUSEQUAL expression','assignment',3,'p_assignment_minusequal','parser.py',546),
-  ('assignment -> var_access TIMESEQUAL expression','assignment',3,'p_assignment_timesequal','parser.py',550),
-  ('assignment -> var_access DIVEQUAL expression','assignment',3,'p_assignment_divequal','parser.py',554),
-  ('assignment -> var_access MODEQUAL expression','assignment',3,'p_assignment_modequal','parser.py',558),
-  ('assignment -> var_access POWEQUAL expression','assignment',3,'p_assignment_powequal','parser.py',562),
-  ('assignment -> var_access ANDEQUAL expression','assignment',3,'p_assignment_andequal','parser.py',566),
-  ('function_call -> LENGTH LPAREN list RPAREN','function_call',4,'p_function_length_system','functions.py',567),
-  ('function_call -> LENGTH expression','function_call',2,'p_function_length_system','functions.py',568),
-  ('function_call -> SYSTEM LPAREN list RPAREN','function_call',4,'p_function_length_system','functions.py',569),
-  ('function_call -> SYSTEM expression','function_call',2,'p_function_length_system','functions.py',570),
-  ('assignment -> var_access OREQUAL expression','assignment',3,'p_assignment_orequal','parser.py',570),
-  ('assignment -> var_access XOREQUAL expression','assignment',3,'p_assignment_xorequal','parser.py',574),
-  ('assignment -> var_access LSHIFTEQUAL expression','assignment',3,'p_assignment_lshiftequal','parser.py',578),
-  ('assignment -> var_access RSHIFTEQUAL expression','assignment',3,'p_assignment_rshiftequal','parser.py',582),
-  ('assignment -> var_access LANDEQUAL expression','assignment',3,'p_assignment_landequal','parser.py',586),
-  ('function_call -> SUBSTR LPAREN list RPAREN','function_call',4,'p_function_substr','functions.py',590),
-  ('assignment -> var_access LOREQUAL expression','assignment',3,'p_assignment_lorequal','parser.py',590),
-  ('assignment -> var_access XEQUAL expression','assignment',3,'p_assignment_xequal','parser.py',594),
-  ('assignment -> var_access PERIODEQUAL expression','assignment',3,'p_assignment_periodequal','parser.py',598),
-  ('multi_equals -> LPAREN list RPAREN EQUALS expression','multi_equals',5,'p_multi_equals_single','parser.py',603),
-  ('multi_equals -> LPAREN list RPAREN EQUALS LPAREN list RPAREN','multi_equals',7,'p_multi_equals_multi','parser.py',607),
-  ('arithmetic -> expression PLUS expression','arithmetic',3,'p_arithmetic_plus','parser.py',612),
-  ('arithmetic -> expression MINUS expression','arithmetic',3,'p_arithmetic_minus','parser.py',616),
-  ('arithmetic -> expression TIMES expression','arithmetic',3,'p_arithmetic_times','parser.py',620),
-  ('arithmetic -> expression DIVIDE expression','arithmetic',3,'p_arithmetic_divide','parser.py',624),
-  ('arithmetic -> expression POW expression','arithmetic',3,'p_arithmetic_pow','parser.py',628),
-  ('arithmetic -> expression X expression','arithmetic',3,'p_arithmetic_x','parser.py',632),
-  ('function_call -> SPLICE LPAREN list RPAREN','function_call',4,'p_function_splice','functions.py',636),
-  ('arithmetic -> PLUS expression','arithmetic',2,'p_arithmetic_plus_unitary','parser.py',636),
-  ('arithmetic -> MINUS expression','arithmetic',2,'p_arithmetic_minus_unitary','parser.py',640),
-  ('arithmetic -> expression PERCENTAGE expression','arithmetic',3,'p_arithmetic_mod','parser.py',644),
-  ('arithmetic -> PLUSPLUS var_access','arithmetic',2,'p_arithmetic_plusplus_var','parser.py',648),
-  ('arithmetic -> MINUSMINUS var_access','arithmetic',2,'p_arithmetic_minusminus_var','parser.py',652),
-  ('arithmetic -> var_access PLUSPLUS','arithmetic',2,'p_arithmetic_var_plusplus','parser.py',656),
-  ('arithmetic -> var_access MINUSMINUS','arithmetic',2,'p_arithmetic_var_minusminus','parser.py',660),
-  ('arithmetic -> expression PERIOD expression','arithmetic',3,'p_arithmetic_period','parser.py',664),
-  ('comparations -> expression NUM_EQ expression','comparations',3,'p_expression_num_eq','parser.py',669),
-  ('comparations -> expression NUM_NE expression','comparations',3,'p_expression_num_ne','parser.py',673),
-  ('comparations -> expression NUM_LT expression','comparations',3,'p_expression_num_lt','parser.py',677),
-  ('comparations -> expression NUM_LE expression','comparations',3,'p_expression_num_le','parser.py',681),
-  ('comparations -> expression NUM_GT expression','comparations',3,'p_expression_num_gt','parser.py',685),
-  ('function_call -> PUSH LPAREN list RPAREN','function_call',4,'p_function_push_unshift','functions.py',689),
-  ('function_call -> UNSHIFT LPAREN list RPAREN','function_call',4,'p_function_push_unshift','functions.py',690),
-  ('comparations -> expression NUM_GE expression','comparations',3,'p_expression_num_ge','parser.py',689),
-  ('comparations -> expression CMP_NUM expression','comparations',3,'p_expression_cmp_num','parser.py',693),
-  ('comparations -> expression STR_EQ expression','comparations',3,'p_expression_str_eq','parser.py',697),
-  ('comparations -> expression STR_NE expression','comparations',3,'p_expression_str_ne','parser.py',701),
-  ('comparations -> expression STR_LT expression','comparations',3,'p_expression_str_lt','parser.py',705),
-  ('comparations -> expression STR_LE expression','comparations',3,'p_expression_str_le','parser.py',709),
-  ('comparations -> expression STR_GT expression','comparations',3,'p_expression_str_gt','parser.py',713),
-  ('comparations -> expression STR_GE expression','comparations',3,'p_expression_str_ge','parser.py',717),
-  ('comparations -> expression CMP expression','comparations',3,'p_expression_cmp_str','parser.py',721),
-  ('comparations -> expression SMART_EQ expression','comparations',3,'p_expression_smart','parser.py',725),
-  ('regex -> expression STR_NO_REX M_REGEX','regex',3,'p_not_m_regex','parser.py',730),
-  ('regex -> expression STR_REX M_REGEX','regex',3,'p_m_regex','parser.py',734),
-  ('function_call -> POP LPAREN list RPAREN','function_call',4,'p_function_pop_shirft','functions.py',738),
-  ('function_call -> POP expression','function_call',2,'p_function_pop_shirft','functions.py',739),
-  ('function_call -> SHIFT LPAREN list RPAREN','function_call',4,'p_function_pop_shirft','functions.py',740),
-  ('function_call -> SHIFT expression','function_call',2,'p_function_pop_shirft','functions.py',741),
-  ('regex -> expression STR_REX S_REGEX','regex',3,'p_s_regex','parser.py',738),
-  ('regex -> expression STR_REX Y_REGEX','regex',3,'p_y_regex','parser.py',742),
-  ('binary -> expression OR expression','binary',3,'p_binary_or','parser.py',747),
-  ('binary -> expression AND expression','binary',3,'p_binary_and','parser.py',751),
-  ('binary -> NOT expression','binary',2,'p_binary_not','parser.py',755),
-  ('binary -> expression XOR expression','binary',3,'p_binary_xor','parser.py',759),
-  ('binary -> expression LSHIFT expression','binary',3,'p_binary_lshift','parser.py',763),
-  ('binary -> expression RSHIFT expression','binary',3,'p_binary_rshift','parser.py',767),
-  ('logical -> expression LOR expression','logical',3,'p_logical_lor','parser.py',772),
-  ('logical -> expression LAND expression','logical',3,'p_logical_land','parser.py',776),
-  ('logical -> LNOT expression','logical',2,'p_logical_lnot','parser.py',780),
-  ('logical -> expression LLOR expression','logical',3,'p_logical_llor','parser.py',784),
-  ('logical -> expression LLAND expression','logical',3,'p_logical_lland','parser.py',788),
-  ('logical -> LLNOT expression','logical',2,'p_logical_llnot','parser.py',792),
-  ('logical -> expression LLXOR expression','logical',3,'p_logical_llxor','parser.py',796),
-  ('logical -> expression QUEST_CLOSE expression COLON expression','logical',5,'p_logical_equals','parser.py',800),
-  ('function_call -> ID LPAREN RPAREN','function_call',3,'p_function_call_empty_paren','parser.py',805),
-  ('function_call -> ID LPAREN list RPAREN','function_call',4,'p_function_call_list','parser.py',809),
-  ('function_call -> ID expression','function_call',2,'p_function_call_exp','parser.py',813),
-  ('function_call -> ID','function_call',1,'p_function_call_empty','parser.py',817),
-  ('function_call -> package ID LPAREN RPAREN','function_call',4,'p_function_call_pack_empty_paren','parser.py',821),
-  ('function_call -> package ID LPAREN list RPAREN','function_call',5,'p_function_call_pack_list','parser.py',825),
-  ('function_call -> package ID expression','function_call',3,'p_function_call_pack_exp','parser.py',829),
-  ('function_call -> package ID','function_call',2,'p_function_call_pack_empty','parser.py',833),
-  ('package -> ID TWO_COLON','package',2,'p_package','parser.py',838),
-  ('var_access -> variable','var_access',1,'p_var_access','parser.py',843),
-  ('var_access -> LBRACKET list RBRACKET','var_access',3,'p_var_array','parser.py',848),
-  ('var_access -> LBRACE list RBRACE','var_access',3,'p_var_hash','parser.py',852),
-  ('var_access -> LPAREN expression TWO_PERIOD expression RPAREN','var_access',5,'p_var_array_range','parser.py',856),
-  ('var_access -> var_access LBRACKET expression RBRACKET','var_access',4,'p_var_access_array','parser.py',860),
-  ('var_access -> var_access LBRACE expression RBRACE','var_access',4,'p_var_access_hash','parser.py',864),
-  ('var_access -> var_access POINTED LBRACKET expression RBRACKET','var_access',5,'p_var_access_array_pointed','parser.py',868),
-  ('var_access -> var_access POINTED LBRACE expression RBRACE','var_access',5,'p_var_access_hash_pointed','parser.py',872),
-  ('var_access -> DOLLAR LBRACE var_access RBRACE','var_access',4,'p_var_access_pointed_scalarB','parser.py',876),
-  ('var_access -> AT LBRACE var_access RBRACE','var_access',4,'p_var_access_pointed_arrayB','parser.py',880),
-  ('var_access -> PERCENTAGE LBRACE var_access RBRACE','var_access',4,'p_var_access_pointed_hashB','parser.py',884),
-  ('var_access -> DOLLAR var_access','var_access',2,'p_var_access_pointed_scalar','parser.py',888),
-  ('var_access -> AT var_access','var_access',2,'p_var_access_pointed_array','parser.py',892),
-  ('var_access -> PERCENTAGE var_access','var_access',2,'p_var_access_pointed_hash','parser.py',896),
-  ('var_access -> BACKSLASH var_access','var_access',2,'p_var_access_variable_ref','parser.py',900),
-  ('variable -> DOLLAR ID','variable',2,'p_variable_scalar','parser.py',905),
-  ('variable -> AT ID','variable',2,'p_variable_array','parser.py',909),
-  ('variable -> PERCENTAGE ID','variable',2,'p_variable_hash','parser.py',913),
-  ('variable -> DOLLAR package ID','variable',3,'p_variable_pack_scalar','parser.py',917),
-  ('variable -> AT package ID','variable',3,'p_variable_pack_array','parser.py',921),
-  ('variable -> PERCENTAGE package ID','variable',3,'p_variable_pack_hash','parser.py',925),
-  ('variable -> variable_my','variable',1,'p_variable_variable_new','parser.py',929),
-  ('variable_my -> MY DOLLAR ID','variable_my',3,'p_variable_my_scalar','parser.py',934),
-  ('variable_my -> MY AT ID','variable_my',3,'p_variable_my_array','parser.py',938),
-  ('variable_my -> MY PERCENTAGE ID','variable_my',3,'p_variable_my_hash','parser.py',942),
-  ('variable_my -> OUR DOLLAR ID','variable_my',3,'p_variable_our_scalar','parser.py',946),
-  ('variable_my -> OUR AT ID','variable_my',3,'p_variable_our_array','parser.py',950),
-  ('variable_my -> OUR PERCENTAGE ID','variable_my',3,'p_variable_our_hash','parser.py',954),
-  ('value -> INT_NUMBER','value',1,'p_value_int','parser.py',959),
-  ('value -> FLOAT_NUMBER','value',1,'p_value_float','parser.py',963),
-  ('value -> STRING_QUOTE','value',1,'p_value_string_quote','parser.py',967),
-  ('value -> STRING_DOUBLE_QUOTE','value',1,'p_value_string_double_quote','parser.py',971),
-  ('value -> CMD','value',1,'p_value_cmd','parser.py',975),
+  ('statement_type -> JAVA_IMPORT','statement_type',1,'p_statement_java_import','parser.py',252),
+  ('block -> REDUCER_OP block_header LBRACE statements RBRACE','block',5,'p_reducer_if','hadoop.py',257),
+  ('statement_type -> error SEMI','statement_type',2,'p_statement_error','parser.py',257),
+  ('special_statement -> LAST','special_statement',1,'p_special_statement_break','parser.py',262),
+  ('block -> REDUCER_CHANGE LBRACE block_header statements RBRACE','block',5,'p_reducer_change','hadoop.py',267),
+  ('special_statement -> NEXT','special_statement',1,'p_special_statement_next','parser.py',267),
+  ('special_statement -> RETURN LPAREN list RPAREN','special_statement',4,'p_special_statement_return_paren','parser.py',272),
+  ('special_statement -> RETURN list','special_statement',2,'p_special_statement_return','parser.py',276),
+  ('statement_type -> labels_line list post_block SEMI REDUCER_KEY line_comment','statement_type',6,'p_reducer_key','hadoop.py',277),
+  ('special_statement -> RETURN','special_statement',1,'p_special_statement_return_empty','parser.py',280),
+  ('line_comment -> <empty>','line_comment',0,'p_line_comment_empthy','parser.py',286),
+  ('line_comment -> COMMENT_LINE','line_comment',1,'p_line_comment','parser.py',290),
+  ('statement_type -> labels_line list post_block SEMI REDUCER_VALUE line_comment','statement_type',6,'p_reducer_value','hadoop.py',294),
+  ('labels_line -> <empty>','labels_line',0,'p_labels_line_empthy','parser.py',295),
+  ('labels_line -> TYPE','labels_line',1,'p_labels_type_type','parser.py',299),
+  ('function_call -> DEFINED LPAREN list RPAREN','function_call',4,'p_function_defined','functions.py',300),
+  ('function_call -> DEFINED expression','function_call',2,'p_function_defined','functions.py',301),
+  ('labels_line -> dimension TYPE','labels_line',2,'p_labels_type_dim','parser.py',303),
+  ('labels_line -> REF dimension TYPE','labels_line',3,'p_labels_type_ref','parser.py',307),
+  ('block -> reducer_init LBRACE block_header REDUCER_VAR statements REDUCER_VAR statements RBRACE','block',8,'p_reducer_code','hadoop.py',310),
+  ('labels_line -> declare','labels_line',1,'p_labels_declare','parser.py',311),
+  ('dimension -> L_HASH size_opt','dimension',2,'p_dimension_hash','parser.py',316),
+  ('dimension -> L_ARRAY size_opt','dimension',2,'p_dimension_array','parser.py',321),
+  ('function_call -> OPEN LPAREN list RPAREN','function_call',4,'p_function_open','functions.py',323),
+  ('dimension -> L_LIST size_opt','dimension',2,'p_dimension_list','parser.py',325),
+  ('dimension -> dimension L_HASH size_opt','dimension',3,'p_dimension_hash_more','parser.py',330),
+  ('dimension -> dimension L_ARRAY size_opt','dimension',3,'p_dimension_array_more','parser.py',335),
+  ('dimension -> dimension L_LIST size_opt','dimension',3,'p_dimension_list_more','parser.py',339),
+  ('size_opt -> <empty>','size_opt',0,'p_size_opt_emtpy','parser.py',345),
+  ('function_call -> CLOSE LPAREN list RPAREN','function_call',4,'p_function_close','functions.py',347),
+  ('function_call -> CLOSE expression','function_call',2,'p_function_close','functions.py',348),
+  ('size_opt -> SIZE','size_opt',1,'p_size_opt','parser.py',349),
+  ('declare -> VAR','declare',1,'p_declare_var','parser.py',354),
+  ('declare -> SIZE','declare',1,'p_declare_size','parser.py',358),
+  ('declare -> declare VAR','declare',2,'p_declare_more_var','parser.py',362),
+  ('declare -> declare SIZE','declare',2,'p_declare_more_size','parser.py',367),
+  ('sort_head -> SORT','sort_head',1,'p_function_sort_custom_head','functions.py',371),
+  ('change_init -> <empty>','change_init',0,'p_change_init','parser.py',373),
+  ('block_header -> <empty>','block_header',0,'p_block_header','parser.py',378),
+  ('block -> if_block elif','block',2,'p_block_if','parser.py',383),
+  ('block -> WHILE change_init LPAREN expression RPAREN change_init LBRACE statements RBRACE','block',9,'p_block_while','parser.py',387),
+  ('function_call -> sort_head LBRACE expression RBRACE LPAREN list RPAREN','function_call',7,'p_function_sort_custom','functions.py',390),
+  ('function_call -> sort_head LBRACE expression RBRACE expression','function_call',5,'p_function_sort_custom','functions.py',391),
+  ('block -> UNTIL change_init LPAREN expression RPAREN change_init LBRACE statements RBRACE','block',9,'p_block_until','parser.py',391),
+  ('block -> DO LBRACE statements RBRACE WHILE change_init LPAREN expression RPAREN change_init SEMI','block',11,'p_block_do_while','parser.py',395),
+  ('block -> DO LBRACE statements RBRACE UNTIL change_init LPAREN expression RPAREN change_init SEMI','block',11,'p_block_do_until','parser.py',399),
+  ('block -> FOR LPAREN opt_list change_init SEMI opt_list SEMI opt_list RPAREN change_init LBRACE statements RBRACE','block',13,'p_block_for','parser.py',403),
+  ('block -> for_each LBRACE statements RBRACE','block',4,'p_block_foreach','parser.py',407),
+  ('for_type -> <empty>','for_type',0,'p_for_type','parser.py',412),
+  ('for_variable -> variable','for_variable',1,'p_for_variable','parser.py',417),
+  ('opt_list -> <empty>','opt_list',0,'p_opt_list_empty','parser.py',422),
+  ('opt_list -> list','opt_list',1,'p_opt_list','parser.py',426),
+  ('for_each -> FOR for_type for_variable LPAREN expression RPAREN','for_each',6,'p_foreach_var','parser.py',431),
+  ('function_call -> SORT LPAREN list RPAREN','function_call',4,'p_function_sort','functions.py',432),
+  ('for_each -> FOR LPAREN expression RPAREN','for_each',4,'p_foreach','parser.py',435),
+  ('if_block -> IF LPAREN expression RPAREN LBRACE statements RBRACE','if_block',7,'p_if_block_if','parser.py',440),
+  ('if_block -> UNLESS LPAREN expression RPAREN LBRACE statements RBRACE','if_block',7,'p_if_block_unless','parser.py',444),
+  ('elif -> <empty>','elif',0,'p_elif_empty','parser.py',449),
+  ('function_call -> LC LPAREN list RPAREN','function_call',4,'p_function_upper_lower','functions.py',453),
+  ('function_call -> LC expression','function_call',2,'p_function_upper_lower','functions.py',454),
+  ('function_call -> LCFIRST LPAREN list RPAREN','function_call',4,'p_function_upper_lower','functions.py',455),
+  ('function_call -> LCFIRST expression','function_call',2,'p_function_upper_lower','functions.py',456),
+  ('function_call -> UC LPAREN list RPAREN','function_call',4,'p_function_upper_lower','functions.py',457),
+  ('function_call -> UC expression','function_call',2,'p_function_upper_lower','functions.py',458),
+  ('function_call -> UCFIRST LPAREN list RPAREN','function_call',4,'p_function_upper_lower','functions.py',459),
+  ('function_call -> UCFIRST expression','function_call',2,'p_function_upper_lower','functions.py',460),
+  ('elif -> block_header elif_block elif','elif',3,'p_elif_elif','parser.py',453),
+  ('elif -> block_header ELSE LBRACE statements RBRACE','elif',5,'p_elif_else','parser.py',457),
+  ('elif_block -> ELSIF change_init LPAREN expression RPAREN change_init LBRACE statements RBRACE','elif_block',9,'p_elif_block','parser.py',462),
+  ('post_block -> <empty>','post_block',0,'p_post_block_empty','parser.py',467),
+  ('post_block -> IF expression','post_block',2,'p_post_block_if','parser.py',471),
+  ('post_block -> UNLESS expression','post_block',2,'p_post_block_unless','parser.py',475),
+  ('post_block -> WHILE expression','post_block',2,'p_post_block_while','parser.py',479),
+  ('function_call -> DIE LPAREN list RPAREN','function_call',4,'p_function_die','functions.py',480),
+  ('function_call -> DIE expression','function_call',2,'p_function_die','functions.py',481),
+  ('post_block -> UNTIL expression','post_block',2,'p_post_block_until','parser.py',483),
+  ('post_block -> FOR expression','post_block',2,'p_post_block_for','parser.py',487),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_paren','parser.py',492),
+  ('function_call -> DELETE LPAREN list RPAREN','function_call',4,'p_function_delete','functions.py',501),
+  ('function_call -> DELETE expression','function_call',2,'p_function_delete','functions.py',502),
+  ('expression -> assignment','expression',1,'p_expression_assignment','parser.py',507),
+  ('expression -> arithmetic','expression',1,'p_expression_arithmetic','parser.py',511),
+  ('expression -> comparations','expression',1,'p_expression_comparations','parser.py',515),
+  ('expression -> regex','expression',1,'p_expression_regex','parser.py',519),
+  ('expression -> binary','expression',1,'p_expression_binary','parser.py',523),
+  ('expression -> logical','expression',1,'p_expression_logical','parser.py',527),
+  ('function_call -> EXISTS LPAREN list RPAREN','function_call',4,'p_function_exists','functions.py',528),
+  ('function_call -> EXISTS expression','function_call',2,'p_function_exists','functions.py',529),
+  ('expression -> value','expression',1,'p_expression_value','parser.py',531),
+  ('expression -> function_call','expression',1,'p_expression_function','parser.py',535),
+  ('expression -> var_access','expression',1,'p_expression_variable','parser.py',539),
+  ('list -> expression COMMA list','list',3,'p_list_comma','parser.py',544),
+  ('list -> expression','list',1,'p_list_expression','parser.py',548),
+  ('function_call -> EXIT LPAREN list RPAREN','function_call',4,'p_function_exit','functions.py',549),
+  ('function_call -> EXIT expression','function_call',2,'p_function_exit','functions.py',550),
+  ('list -> expression COMMA','list',2,'p_list_expression_comma','parser.py',552),
+  ('assignment -> var_access EQUALS expression','assignment',3,'p_assignment_equals','parser.py',557),
+  ('assignment -> var_access EQUALS LPAREN RPAREN','assignment',4,'p_assignment_declare_colection','parser.py',561),
+  ('assignment -> var_access EQUALS UNDEF','assignment',3,'p_assignment_declare_var','parser.py',565),
+  ('assignment -> var_access EQUALS STDIN','assignment',3,'p_assignment_input','parser.py',569),
+  ('function_call -> LENGTH LPAREN list RPAREN','function_call',4,'p_function_length_system','functions.py',570),
+  ('function_call -> LENGTH expression','function_call',2,'p_function_length_system','functions.py',571),
+  ('function_call -> SYSTEM LPAREN list RPAREN','function_call',4,'p_function_length_system','functions.py',572),
+  ('function_call -> SYSTEM expression','function_call',2,'p_function_length_system','functions.py',573),
+  ('assignment -> var_access EQUALS NUM_LT var_access NUM_GT','assignment',5,'p_assignment_read','parser.py',573),
+  ('assignment -> var_access PLUSEQUAL expression','assignment',3,'p_assignment_plusequal','parser.py',577),
+  ('assignment -> var_access MINUSEQUAL expression','assignment',3,'p_assignment_minusequal','parser.py',581),
+  ('assignment -> var_access TIMESEQUAL expression','assignment',3,'p_assignment_timesequal','parser.py',585),
+  ('assignment -> var_access DIVEQUAL expression','assignment',3,'p_assignment_divequal','parser.py',589),
+  ('function_call -> SUBSTR LPAREN list RPAREN','function_call',4,'p_function_substr','functions.py',593),
+  ('assignment -> var_access MODEQUAL expression','assignment',3,'p_assignment_modequal','parser.py',593),
+  ('assignment -> var_access POWEQUAL expression','assignment',3,'p_assignment_powequal','parser.py',597),
+  ('assignment -> var_access ANDEQUAL expression','assignment',3,'p_assignment_andequal','parser.py',601),
+  ('assignment -> var_access OREQUAL expression','assignment',3,'p_assignment_orequal','parser.py',605),
+  ('assignment -> var_access XOREQUAL expression','assignment',3,'p_assignment_xorequal','parser.py',609),
+  ('assignment -> var_access LSHIFTEQUAL expression','assignment',3,'p_assignment_lshiftequal','parser.py',613),
+  ('assignment -> var_access RSHIFTEQUAL expression','assignment',3,'p_assignment_rshiftequal','parser.py',617),
+  ('assignment -> var_access LANDEQUAL expression','assignment',3,'p_assignment_landequal','parser.py',621),
+  ('assignment -> var_access LOREQUAL expression','assignment',3,'p_assignment_lorequal','parser.py',625),
+  ('assignment -> var_access XEQUAL expression','assignment',3,'p_assignment_xequal','parser.py',629),
+  ('assignment -> var_access PERIODEQUAL expression','assignment',3,'p_assignment_periodequal','parser.py',633),
+  ('multi_equals -> LPAREN list RPAREN EQUALS expression','multi_equals',5,'p_multi_equals_single','parser.py',638),
+  ('function_call -> SPLICE LPAREN list RPAREN','function_call',4,'p_function_splice','functions.py',639),
+  ('multi_equals -> LPAREN list RPAREN EQUALS LPAREN list RPAREN','multi_equals',7,'p_multi_equals_multi','parser.py',642),
+  ('arithmetic -> expression PLUS expression','arithmetic',3,'p_arithmetic_plus','parser.py',647),
+  ('arithmetic -> expression MINUS expression','arithmetic',3,'p_arithmetic_minus','parser.py',651),
+  ('arithmetic -> expression TIMES expression','arithmetic',3,'p_arithmetic_times','parser.py',655),
+  ('arithmetic -> expression DIVIDE expression','arithmetic',3,'p_arithmetic_divide','parser.py',659),
+  ('arithmetic -> expression POW expression','arithmetic',3,'p_arithmetic_pow','parser.py',663),
+  ('arithmetic -> expression X expression','arithmetic',3,'p_arithmetic_x','parser.py',667),
+  ('arithmetic -> PLUS expression','arithmetic',2,'p_arithmetic_plus_unitary','parser.py',671),
+  ('arithmetic -> MINUS expression','arithmetic',2,'p_arithmetic_minus_unitary','parser.py',675),
+  ('arithmetic -> expression PERCENTAGE expression','arithmetic',3,'p_arithmetic_mod','parser.py',679),
+  ('arithmetic -> PLUSPLUS var_access','arithmetic',2,'p_arithmetic_plusplus_var','parser.py',683),
+  ('arithmetic -> MINUSMINUS var_access','arithmetic',2,'p_arithmetic_minusminus_var','parser.py',687),
+  ('arithmetic -> var_access PLUSPLUS','arithmetic',2,'p_arithmetic_var_plusplus','parser.py',691),
+  ('function_call -> PUSH LPAREN list RPAREN','function_call',4,'p_function_push_unshift','functions.py',692),
+  ('function_call -> UNSHIFT LPAREN list RPAREN','function_call',4,'p_function_push_unshift','functions.py',693),
+  ('arithmetic -> var_access MINUSMINUS','arithmetic',2,'p_arithmetic_var_minusminus','parser.py',695),
+  ('arithmetic -> expression PERIOD expression','arithmetic',3,'p_arithmetic_period','parser.py',699),
+  ('comparations -> expression NUM_EQ expression','comparations',3,'p_expression_num_eq','parser.py',704),
+  ('comparations -> expression NUM_NE expression','comparations',3,'p_expression_num_ne','parser.py',708),
+  ('comparations -> expression NUM_LT expression','comparations',3,'p_expression_num_lt','parser.py',712),
+  ('comparations -> expression NUM_LE expression','comparations',3,'p_expression_num_le','parser.py',716),
+  ('comparations -> expression NUM_GT expression','comparations',3,'p_expression_num_gt','parser.py',720),
+  ('comparations -> expression NUM_GE expression','comparations',3,'p_expression_num_ge','parser.py',724),
+  ('comparations -> expression CMP_NUM expression','comparations',3,'p_expression_cmp_num','parser.py',728),
+  ('comparations -> expression STR_EQ expression','comparations',3,'p_expression_str_eq','parser.py',732),
+  ('comparations -> expression STR_NE expression','comparations',3,'p_expression_str_ne','parser.py',736),
+  ('comparations -> expression STR_LT expression','comparations',3,'p_expression_str_lt','parser.py',740),
+  ('function_call -> POP LPAREN list RPAREN','function_call',4,'p_function_pop_shirft','functions.py',741),
+  ('function_call -> POP expression','function_call',2,'p_function_pop_shirft','functions.py',742),
+  ('function_call -> SHIFT LPAREN list RPAREN','function_call',4,'p_function_pop_shirft','functions.py',743),
+  ('function_call -> SHIFT expression','function_call',2,'p_function_pop_shirft','functions.py',744),
+  ('comparations -> expression STR_LE expression','comparations',3,'p_expression_str_le','parser.py',744),
+  ('comparations -> expression STR_GT expression','comparations',3,'p_expression_str_gt','parser.py',748),
+  ('comparations -> expression STR_GE expression','comparations',3,'p_expression_str_ge','parser.py',752),
+  ('comparations -> expression CMP expression','comparations',3,'p_expression_cmp_str','parser.py',756),
+  ('comparations -> expression SMART_EQ expression','comparations',3,'p_expression_smart','parser.py',760),
+  ('regex -> expression STR_NO_REX M_REGEX','regex',3,'p_not_m_regex','parser.py',765),
+  ('regex -> expression STR_REX M_REGEX','regex',3,'p_m_regex','parser.py',769),
+  ('regex -> expression STR_REX S_REGEX','regex',3,'p_s_regex','parser.py',773),
+  ('regex -> expression STR_REX Y_REGEX','regex',3,'p_y_regex','parser.py',777),
+  ('binary -> expression OR expression','binary',3,'p_binary_or','parser.py',782),
+  ('binary -> expression AND expression','binary',3,'p_binary_and','parser.py',786),
+  ('binary -> NOT expression','binary',2,'p_binary_not','parser.py',790),
+  ('binary -> expression XOR expression','binary',3,'p_binary_xor','parser.py',794),
+  ('binary -> expression LSHIFT expression','binary',3,'p_binary_lshift','parser.py',798),
+  ('binary -> expression RSHIFT expression','binary',3,'p_binary_rshift','parser.py',802),
+  ('logical -> expression LOR expression','logical',3,'p_logical_lor','parser.py',807),
+  ('logical -> expression LAND expression','logical',3,'p_logical_land','parser.py',811),
+  ('logical -> LNOT expression','logical',2,'p_logical_lnot','parser.py',815),
+  ('logical -> expression LLOR expression','logical',3,'p_logical_llor','parser.py',819),
+  ('logical -> expression LLAND expression','logical',3,'p_logical_lland','parser.py',823),
+  ('logical -> LLNOT expression','logical',2,'p_logical_llnot','parser.py',827),
+  ('logical -> expression LLXOR expression','logical',3,'p_logical_llxor','parser.py',831),
+  ('logical -> expression QUEST_CLOSE expression COLON expression','logical',5,'p_logical_equals','parser.py',835),
+  ('function_call -> ID LPAREN RPAREN','function_call',3,'p_function_call_empty_paren','parser.py',840),
+  ('function_call -> ID LPAREN list RPAREN','function_call',4,'p_function_call_list','parser.py',844),
+  ('function_call -> ID expression','function_call',2,'p_function_call_exp','parser.py',848),
+  ('function_call -> ID','function_call',1,'p_function_call_empty','parser.py',852),
+  ('function_call -> package ID LPAREN RPAREN','function_call',4,'p_function_call_pack_empty_paren','parser.py',856),
+  ('function_call -> package ID LPAREN list RPAREN','function_call',5,'p_function_call_pack_list','parser.py',860),
+  ('function_call -> package ID expression','function_call',3,'p_function_call_pack_exp','parser.py',864),
+  ('function_call -> package ID','function_call',2,'p_function_call_pack_empty','parser.py',868),
+  ('package -> ID TWO_COLON','package',2,'p_package','parser.py',873),
+  ('var_access -> variable','var_access',1,'p_var_access','parser.py',878),
+  ('var_access -> LBRACKET list RBRACKET','var_access',3,'p_var_array','parser.py',883),
+  ('var_access -> LBRACE list RBRACE','var_access',3,'p_var_hash','parser.py',887),
+  ('var_access -> LPAREN expression TWO_PERIOD expression RPAREN','var_access',5,'p_var_array_range','parser.py',891),
+  ('var_access -> var_access LBRACKET expression RBRACKET','var_access',4,'p_var_access_array','parser.py',895),
+  ('var_access -> var_access LBRACE expression RBRACE','var_access',4,'p_var_access_hash','parser.py',899),
+  ('var_access -> var_access POINTED LBRACKET expression RBRACKET','var_access',5,'p_var_access_array_pointed','parser.py',903),
+  ('var_access -> var_access POINTED LBRACE expression RBRACE','var_access',5,'p_var_access_hash_pointed','parser.py',907),
+  ('var_access -> DOLLAR LBRACE var_access RBRACE','var_access',4,'p_var_access_pointed_scalarB','parser.py',911),
+  ('var_access -> AT LBRACE var_access RBRACE','var_access',4,'p_var_access_pointed_arrayB','parser.py',915),
+  ('var_access -> PERCENTAGE LBRACE var_access RBRACE','var_access',4,'p_var_access_pointed_hashB','parser.py',919),
+  ('var_access -> DOLLAR var_access','var_access',2,'p_var_access_pointed_scalar','parser.py',923),
+  ('var_access -> AT var_access','var_access',2,'p_var_access_pointed_array','parser.py',927),
+  ('var_access -> PERCENTAGE var_access','var_access',2,'p_var_access_pointed_hash','parser.py',931),
+  ('var_access -> BACKSLASH var_access','var_access',2,'p_var_access_variable_ref','parser.py',935),
+  ('variable -> DOLLAR ID','variable',2,'p_variable_scalar','parser.py',940),
+  ('variable -> AT ID','variable',2,'p_variable_array','parser.py',944),
+  ('variable -> PERCENTAGE ID','variable',2,'p_variable_hash','parser.py',948),
+  ('variable -> DOLLAR package ID','variable',3,'p_variable_pack_scalar','parser.py',952),
+  ('variable -> AT package ID','variable',3,'p_variable_pack_array','parser.py',956),
+  ('variable -> PERCENTAGE package ID','variable',3,'p_variable_pack_hash','parser.py',960),
+  ('variable -> variable_my','variable',1,'p_variable_variable_new','parser.py',964),
+  ('variable_my -> MY DOLLAR ID','variable_my',3,'p_variable_my_scalar','parser.py',969),
+  ('variable_my -> MY AT ID','variable_my',3,'p_variable_my_array','parser.py',973),
+  ('variable_my -> MY PERCENTAGE ID','variable_my',3,'p_variable_my_hash','parser.py',977),
+  ('variable_my -> OUR DOLLAR ID','variable_my',3,'p_variable_our_scalar','parser.py',981),
+  ('variable_my -> OUR AT ID','variable_my',3,'p_variable_our_array','parser.py',985),
+  ('variable_my -> OUR PERCENTAGE ID','variable_my',3,'p_variable_our_hash','parser.py',989),
+  ('value -> INT_NUMBER','value',1,'p_value_int','parser.py',994),
+  ('value -> FLOAT_NUMBER','value',1,'p_value_float','parser.py',998),
+  ('value -> STRING_QUOTE','value',1,'p_value_string_quote','parser.py',1002),
+  ('value -> STRING_DOUBLE_QUOTE','value',1,'p_value_string_double_quote','parser.py',1006),
+  ('value -> CMD','value',1,'p_value_cmd','parser.py',1010),
 ]
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+#Copyright 2016 César Pomar <cesarpomar18@gmail.com>
+#
+#This file is part of Perldoop.
+#
+#Perldoop is free software: you can redistribute it and/or modify
+#it under the terms of the GNU General Public License as published by
+#the Free Software Foundation, either version 3 of the License, or
+#(at your option) any later version.
+#
+#Perldoop is distributed in the hope that it will be useful,
+#but WITHOUT ANY WARRANTY; without even the implied warranty of
+#MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#GNU General Public License for more details.
+#
+#You should have received a copy of the GNU General Public License
+#along with Perldoop.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+import contextlib
+from libs import Auxiliary
+from libs import Blocks
+from libs import Casting
+from libs import Collection
+from libs import Messages
+from libs import Operations
+from libs import Statements
+from libs import Variables
+
+# Mide el tiempo de cada fase, regla y clase auxiliar durante la traduccion
+class Profiler():
+
+	active = None  # Perfilador en uso, el codigo instrumentado solo mide si hay uno
+	installed = False  # Las clases auxiliares ya estan instrumentadas
+
+	# Clases auxiliares medidas por metodo
+	helpers = (Auxiliary, Blocks, Casting, Collection, Messages, Operations, Statements, Variables)
+
+	# Marcos que forman una fase propia en lugar de la de su clase
+	phases = {
+	'file':'setup',
+	'read':'read',
+	'lex':'lex',
+	'parse':'lalr',
+	'write':'write',
+	'Auxiliary.check_unreachable':'check_unreachable',
+	'Auxiliary.identer':'identer',
+	}
+
+	def __init__(self):
+		self.clock = time.perf_counter
+		self.stats = {}  # Llamadas, tiempo total y propio de cada marco
+		self.files = []  # Resultado de cada fichero
+		self.frames = {}  # Indice de cada marco para speedscope
+		self.stack = []  # Marcos abiertos: nombre, inicio y tiempo de los hijos
+		self.running = {}  # Veces que un marco esta abierto, para no contar dos veces las recursiones
+		self.file = None  # Fichero en curso
+
+	# Activa el perfilador, instrumentando las clases auxiliares la primera vez
+	@classmethod
+	def start(Profiler, profiler):
+		if not Profiler.installed:
+			for helper in Profiler.helpers:
+				for name, value in list(vars(helper).items()):
+					if isinstance(value, classmethod):
+						setattr(helper, name, staticmethod(Profiler.helper(getattr(helper, name), helper.__name__ + '.' + name)))
+			Profiler.installed = True
+		Profiler.active = profiler
+
+	@classmethod
+	def stop(Profiler):
+		Profiler.active = None
+
+	# Metodo auxiliar que solo mide con un perfilador activo
+	@classmethod
+	def helper(Profiler, function, name):
+		def wrapper(*args, **kwargs):
+			profiler = Profiler.active
+			if profiler is None:
+				return function(*args, **kwargs)
+			profiler.enter(name)
+			try:
+				return function(*args, **kwargs)
+			finally:
+				profiler.exit()
+		return wrapper
+
+	# Mide un bloque de codigo si hay un perfilador activo
+	@classmethod
+	@contextlib.contextmanager
+	def phase(Profiler, name):
+		profiler = Profiler.active
+		if profiler is None:
+			yield
+			return
+		profiler.enter(name)
+		try:
+			yield
+		finally:
+			profiler.exit()
+
+	# Funcion que mide cada llamada
+	def wrap(self, function, name):
+		def wrapper(*args, **kwargs):
+			self.enter(name)
+			try:
+				return function(*args, **kwargs)
+			finally:
+				self.exit()
+		return wrapper
+
+	# Instrumenta el analizador lexico y las reglas de un analizador
+	def instrument(self, parser):
+		parser.lexer.token = self.wrap(parser.lexer.token, 'lex')
+		for production in parser.parser.productions:
+			if production.callable:
+				production.callable = self.wrap(production.callable, 'rule:' + production.func)
+
+	def enter(self, name):
+		now = self.clock()
+		self.stack.append([name, now, 0.0])
+		self.running[name] = self.running.get(name, 0) + 1
+		if self.file:
+			if name not in self.frames:
+				self.frames[name] = len(self.frames)
+			self.file['events'].append({'type': 'O', 'frame': self.frames[name], 'at': now - self.file['start']})
+
+	def exit(self):
+		now = self.clock()
+		name, start, child = self.stack.pop()
+		elapsed = now - start
+		self.running[name] -= 1
+		stat = self.stats.get(name)
+		if stat is None:
+			stat = self.stats[name] = [0, 0.0, 0.0]
+		stat[0] += 1
+		# En las recursiones solo cuenta la llamada mas externa
+		if not self.running[name]:
+			stat[1] += elapsed
+		stat[2] += elapsed - child
+		if self.stack:
+			self.stack[-1][2] += elapsed
+		if self.file:
+			self.file['events'].append({'type': 'C', 'frame': self.frames[name], 'at': now - self.file['start']})
+
+	# Empieza a medir un fichero
+	def begin(self, file):
+		self.file = {'file': file, 'start': self.clock(), 'events': [], 'stats': self.stats}
+		# Cada fichero acumula sus propios marcos
+		self.stats = {}
+		self.enter('file')
+
+	def end(self):
+		# Cerramos los marcos que haya dejado abiertos un error
+		while self.stack:
+			self.exit()
+		file = self.file
+		stats = self.stats
+		self.stats = file.pop('stats')
+		# Sumamos el fichero al total
+		for name, (calls, total, own) in stats.items():
+			stat = self.stats.setdefault(name, [0, 0.0, 0.0])
+			stat[0] += calls
+			stat[1] += total
+			stat[2] += own
+		file['seconds'] = stats['file'][1]
+		file['phases'] = self.group(stats)
+		del file['start']
+		self.files.append(file)
+		self.file = None
+
+	# Reparte el tiempo propio de los marcos en fases
+	def group(self, stats):
+		phases = {}
+		for name, (calls, total, own) in stats.items():
+			if name in self.phases:
+				phase = self.phases[name]
+			elif name.startswith('rule:'):
+				phase = 'rules'
+			else:
+				phase = name.split('.')[0]
+			phases[phase] = phases.get(phase, 0.0) + own
+		return phases
+
+	# Tabla de marcos ordenada
+	def table(self, prefix, sort='self'):
+		column = {'calls': 0, 'total': 1, 'self': 2}[sort]
+		rows = [(name, stat) for name, stat in self.stats.items() if name.startswith(prefix)]
+		rows.sort(key=lambda row: row[1][column], reverse=True)
+		return [{'name': name, 'calls': calls, 'total': total, 'self': own} for name, (calls, total, own) in rows]
+
+	# Resultado completo
+	def report(self, sort='self'):
+		helpers = {}
+		for row in self.table('', sort):
+			if '.' in row['name']:
+				name = row['name'].split('.')[0]
+				helpers[name] = helpers.get(name, 0.0) + row['self']
+		return {
+		'files': [{'file': file['file'], 'seconds': file['seconds'], 'phases': file['phases']} for file in self.files],
+		'phases': self.group(self.stats),
+		'rules': self.table('rule:', sort),
+		'helpers': sorted(({'name': name, 'self': own} for name, own in helpers.items()), key=lambda row: row['self'], reverse=True),
+		'methods': [row for row in self.table('', sort) if '.' in row['name']],
+		}
+
+	# Perfil en formato speedscope, un perfil por fichero
+	def speedscope(self):
+		frames = sorted(self.frames, key=self.frames.get)
+		profiles = []
+		for file in self.files:
+			end = file['events'][-1]['at'] if file['events'] else 0.0
+			profiles.append({'type': 'evented', 'name': file['file'], 'unit': 'seconds', 'startValue': 0.0, 'endValue': end, 'events': file['events']})
+		return {
+		'$schema': 'https://www.speedscope.app/file-format-schema.json',
+		'shared': {'frames': [{'name': name} for name in frames]},
+		'profiles': profiles,
+		'name': 'perldoop',
+		'exporter': 'perldoop --profile',
+		}
+
+	# Informe legible
+	def text(self, sort='self', limit=20):
+		report = self.report(sort)
+		lines = []
+		phases = sorted(report['phases'], key=report['phases'].get, reverse=True)
+		lines.append('%-40s %10s  %s' % ('file', 'ms', '  '.join(phases)))
+		for file in report['files']:
+			lines.append('%-40s %10.2f  %s' % (file['file'][-40:], file['seconds'] * 1000, '  '.join('%s=%.2f' % (phase, file['phases'].get(phase, 0.0) * 1000) for phase in phases)))
+		total = sum(report['phases'].values())
+		lines.append('')
+		for phase in phases:
+			lines.append('%-40s %10.2f ms %6.1f%%' % (phase, report['phases'][phase] * 1000, 100 * report['phases'][phase] / total if total else 0.0))
+		for title, rows in (('rule', report['rules']), ('method', report['methods'])):
+			lines.append('')
+			lines.append('%-40s %10s %10s %10s' % (title, 'calls', 'total ms', 'self ms'))
+			for row in rows[:limit]:
+				lines.append('%-40s %10d %10.2f %10.2f' % (row['name'][-40:], row['calls'], row['total'] * 1000, row['self'] * 1000))
+		lines.append('')
+		for row in report['helpers']:
+			lines.append('%-40s %10.2f ms' % (row['name'], row['self'] * 1000))
+		return '\n'.join(lines) + '\n'
+
+# Contadores ligeros de reducciones y tiempo por produccion, sin pila ni eventos
+class RuleStats():
+
+	active = None  # Contadores en uso
+
+	def __init__(self):
+		self.stats = {}  # Reducciones, tiempo acumulado y funcion de cada produccion
+
+	# Instrumenta las reglas de un analizador
+	def instrument(self, parser):
+		for production in parser.parser.productions:
+			if production.callable:
+				stat = self.stats.get(production.str)
+				if stat is None:
+					stat = self.stats[production.str] = [0, 0.0, production.func]
+				production.callable = self.counter(production.callable, stat)
+
+	# Regla que cuenta sus reducciones y su tiempo
+	def counter(self, function, stat):
+		clock = time.perf_counter
+		def wrapper(p):
+			start = clock()
+			try:
+				function(p)
+			finally:
+				stat[0] += 1
+				stat[1] += clock() - start
+		return wrapper
+
+	# Producciones mas costosas
+	def top(self, limit, sort='time'):
+		column = 0 if sort == 'calls' else 1
+		rows = sorted(self.stats.items(), key=lambda row: row[1][column], reverse=True)
+		return [{'rule': rule, 'function': func, 'reductions': count, 'seconds': seconds} for rule, (count, seconds, func) in rows[:limit] if count]
+
+	# Informe legible
+	def text(self, limit, sort='time'):
+		reductions = sum(stat[0] for stat in self.stats.values())
+		seconds = sum(stat[1] for stat in self.stats.values())
+		lines = ['%d reductions, %.2f ms in semantic actions' % (reductions, seconds * 1000)]
+		lines.append('%10s %10s %8s %10s  %s' % ('reductions', 'ms', '%', 'us/red', 'rule'))
+		for row in self.top(limit, sort):
+			lines.append('%10d %10.2f %8.1f %10.2f  %s  (%s)' % (row['reductions'], row['seconds'] * 1000, 100 * row['seconds'] / seconds if seconds else 0.0,
+				row['seconds'] * 1e6 / row['reductions'], row['rule'], row['function']))
+		return '\n'.join(lines) + '\n'
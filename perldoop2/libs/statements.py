@@ -45,14 +45,14 @@ class Statements:
         # Recorremos todas las sentencias
         for st in list:
             # Copiamos las flags
-            code.flags.update(st.flags)
+            code.update_flags(st.flags)
             l = len(st.declares) - 1
             # Nos movemos en las declaraciones
             for i, var in enumerate(st.declares):
                 # Creamos la sentencia de declaracion
                 if var.type:
                     # Si tiene tipo lo usamos
-                    declare = Cst.create_type(var.type) + ' ' + var.value + ';'
+                    declare = Cst.declare_type(var) + ' ' + var.value + ';'
                 else:
                     # Si no asumimos que ya forma parte de la codena
                     declare = var.value + ';'
@@ -60,23 +60,23 @@ class Statements:
                 if Var.is_reserver(parser, var.value):
                     # Se escriben siempre en el codigo y si es la ultima se mira si al final la funcion la usa
                     if l != i or (l == i and not st.ref_var):
-                        code.value += Cst.create_type(var.type) + ' ' + var.value + ';\n'
+                        code.append(Cst.create_type(var.type) + ' ' + var.value + ';\n')
                 # Si es una variable normal
                 else:
                     # Si estamos en el contexto global
                     if len(parser.variables) == 1:
                         # Añadimos la declaracion como atributo
-                        parser.atributes += 'private static ' + declare + comment + '\n'
+                        parser.atributes.append('private static ' + declare + comment + '\n')
                     else:
                         # Añadimos la variable al codigo
-                        code.value += declare + comment + '\n'
+                        code.append(declare + comment + '\n')
                     comment = ''
             # Si el codigo almacena una sentencia la escribimos en el codigo
             if st.st_value:
-                code.value += st.st_value + ';\n' 
+                code.append(st.st_value + ';\n')
             # Si la expresion contiene sentencias, forzamos su ejecucion
             elif Dtp.STATEMENT in st.flags:
-                code.value += 'Pd.eval(' + st.value + ');\n' 
+                code.append('Pd.eval(' + st.value + ');\n')
         # Si la linea tiene un bloque de control metemos el codigo en su interior
         if control:
             code.value = control.value + comment + '\n' + code.value + '}\n'
@@ -101,9 +101,9 @@ class Statements:
     def statements_concat(Sts, parser, sts, st):
         if st:
             # Añadimos la nueva sentencia
-            sts.value += st.value
+            sts.append(st.value)
             # Actualizamos las flags
-            sts.flags.update(st.flags)
+            sts.update_flags(st.flags)
             # Comprobamos codigo inalcanzable si esta activado
             if parser.unreachable_code:
                 Aux.check_unreachable(parser, sts)
@@ -142,6 +142,11 @@ class Statements:
             if not parser.foreach_flag:
                 Msg.error(parser, 'VAR_NOT_TYPE', pos, var=var)
             entry.type = [Dtp.NONE]  # Tipo por defecto para poder continuar el analisis
+        # En modo unboxed los escalares locales basicos son candidatos a tipo primitivo
+        if parser.unboxed and not shared and len(parser.variables) > 1 and len(entry.type) == 1 and entry.type[0] in Cst.primitive_types:
+            entry.unboxed = len(parser.unboxed_vars)
+            entry.sources = []
+            parser.unboxed_vars.append(entry)
         # Le damos el tipo al codigo
         code.type = entry.type[:]
         context_var[var] = entry    
@@ -150,10 +155,10 @@ class Statements:
         # Si la variable no es compartida
         if not shared:
             # Guardamos el codigo para luego declararlo
-            code.declares.append(code)    
+            code.add_declare(code)    
         else:
             # Añadimos directamente como atributo
-            parser.atributes += 'public static ' + Cst.create_type(code.type) + ' ' + code.value + ';\n'
+            parser.atributes.append('public static ' + Cst.create_type(code.type) + ' ' + code.value + ';\n')
         return code
     
     # Accedemos a una variable que debio ser declarada    
@@ -208,12 +213,12 @@ class Statements:
         # Ajustamos las dimensiones
         if exp.type[0] == Dtp.REF and var.ref:
             exp = Coll.create_value_var(Sts.access_pointed(parser, Access(exp), exp.pos))
-        # Si estan activadas aplicamos las optimizaciones
-        if parser.optimize_code:
-            exp.value = Aux.opt_get(exp.value)
+        # En modo unboxed se comprueba si la variable puede quedar a null
+        if parser.unboxed and len(var.var.type) == 1:
+            Var.assign_unboxed(var.var.variable, exp)
         # Si se requiere se añade un cast al tipo
         if casting:
-            exp.value = '((' + Cst.create_type(exp.type) + ')' + exp.value + ')'
+            Aux.cast(parser, exp, Cst.create_type(exp.type))
         # Creamos el codigo usando los anteriores
         code = var.var + exp
         # Marcamos la variable como asignada en el contexto actual
@@ -223,6 +228,9 @@ class Statements:
         code.declares += var.declares
         # Preparamos el valor
         value = Cst.to_type(parser, code, exp)    
+        # Al igualar directamente un constructor se usa la notacion diamante
+        if var.store_value == ' = ' and not var.end_value:
+            value = Aux.opt_eq(exp, value)
         # Si no es una variable o es un tipo basico
         if not exp.variable or var.type[0] not in (Dtp.HASH, Dtp.LIST, Dtp.ARRAY) or exp.value != exp.variable.name or var.ref:
             code.value = var.value + var.store_value + value + var.end_value
@@ -242,7 +250,7 @@ class Statements:
             # El codigo ya es una sentencia
             code.st_value = code.value
             # El codigo contiene una sentencia
-            code.flags[Dtp.STATEMENT] = True
+            code.set_flag(Dtp.STATEMENT)
         return code
     
     @classmethod
@@ -288,8 +296,12 @@ class Statements:
         # Si estammos inicializando un array es obligatorio que al menos se tenga un tamaño
         if not sizes and exp.type[0] == Dtp.ARRAY:
             Msg.error(parser, 'SIZE_REQUIRED', var.pos, var=var.value)
-        # Creamos la inicializacion
-        exp.value = Cst.creare_inicialize(exp.type, sizes)
+        # Creamos la inicializacion, las colecciones genericas se crean con su constructor
+        generic = Cst.create_generic(exp.type)
+        if generic:
+            Aux.new(parser, exp, generic[0], generic[1], sizes[0] if sizes and sizes[0] else '')
+        else:
+            exp.value = Cst.creare_inicialize(exp.type, sizes)
         return Sts.equals(parser, var, exp)
     
     @classmethod
@@ -498,7 +510,7 @@ class Statements:
             # Si no retorna parametros o retorna multiples tipos,marcamos el codigo como void 
             code.type = [Dtp.VOID]
             code.multi_type = head.returns 
-        code.flags[Dtp.STATEMENT] = True    
+        code.set_flag(Dtp.STATEMENT)    
         return code
     
     @classmethod
@@ -530,7 +542,7 @@ class Statements:
         else:
             code.value = 'return ' + code.value
         # Usamos la bandera return
-        code.flags[Dtp.RETURN] = True
+        code.set_flag(Dtp.RETURN)
         return code    
     
     # Coge el valor de una llamada al sistema
@@ -87,6 +87,9 @@ class Variables:
     'pd_key':0,
     'pd_value':0,
     'pd_context':0,
+    'pd_out_key':0,
+    'pd_out_value':0,
+    'pd_write':0,
     }
     
     # Paquetes disponibles
@@ -116,10 +119,7 @@ class Variables:
     @classmethod
     def is_assign(Var, parser, var, atribute=False):
         if len(parser.assigns) > 1 or atribute:
-            for level in parser.assigns:
-                if var in level:
-                    return True
-            return False
+            return parser.assigns.bound(var)
         else:
             return True
     
@@ -128,31 +128,29 @@ class Variables:
     def is_reserver(Var, parser, var):
         return var in Var.reserved_var or var in parser.reserved_var or var[:4] == 'pd_i' or var[:4] == 'pd_f'
     
-    # Retorno la siguiente variable disponible para loops
+    # Retorno la siguiente variable disponible para loops, queda libre al cerrar el bloque del bucle
     @classmethod
     def get_loop_var(Var, parser):
-        return Var.calculate_var(parser, 'pd_i')
+        return Var.calculate_var(parser, 'pd_i', True)
     
     # Retorno la siguiente variable disponible para funciones
     @classmethod
     def get_function_var(Var, parser):
         return Var.calculate_var(parser, 'pd_f')
     
-    # Calcula una variable reservada para loops o funciones 
+    # Calcula una variable reservada para loops o funciones, la primera es la raiz y las siguientes llevan numero
     @classmethod
-    def calculate_var(Var, parser, var):
-        # Si la raiz no esta cogida la usamos
-        if var not in parser.reserved_var:
-            parser.reserved_var[var] = 0
-            return var
-        n = 0;
-        # Si no vamos añadiendo numeros hasta encontrar una libre
-        while(True):
-            n += 1
-            var_n = var + str(n)
-            if var_n not in parser.reserved_var:
-                parser.reserved_var[var_n] = 0
-                return var_n    
+    def calculate_var(Var, parser, var, scoped=False):
+        # Las variables de bloque reutilizan las de bloques ya cerrados
+        n = parser.variables.reuse(var) if scoped else None
+        if n is None:
+            n = parser.temp_vars.get(var, 0)
+            parser.temp_vars[var] = n + 1
+        if scoped:
+            parser.variables.hold(var, n)
+        var_n = var + str(n) if n else var
+        parser.reserved_var[var_n] = 0
+        return var_n
     
     # Inicializa los argumentos de las funciones   
     @classmethod
@@ -160,14 +158,31 @@ class Variables:
         parser.variables[-1]['_'] = Variable(type=[Dtp.VOID], name='pd_argv', pos=function.pos, multi_type=function.args[:])
         parser.assigns[-1]['pd_argv'] = True
         parser.reserved_var = {}
+        parser.temp_vars = {}
+        parser.variables.free = {}
         
     
+    # En modo unboxed marca la variable del codigo como posible null, se declarara con su tipo objeto
+    @classmethod
+    def escape(Var, code):
+        if code.variable:
+            code.variable.boxed = True
+    
+    # Registra en modo unboxed una asignacion a la variable, solo los numeros, operaciones y variables primitivas no son null
+    @classmethod
+    def assign_unboxed(Var, variable, exp):
+        if variable.unboxed is None or variable.boxed or exp.not_null:
+            return
+        # Si se asigna otra variable depende de ella
+        if exp.variable and exp.value == exp.variable.name:
+            variable.sources.append(exp.variable)
+        else:
+            variable.boxed = True
+    
     # Obtiene la entrada de una variable si existe
     @classmethod
     def get_var(Var, parser, name):
-        for level in range(1, len(parser.variables) + 1):
-            if name in parser.variables[-level]:
-                return parser.variables[-level][name]
+        return parser.variables.lookup(name)
     
     # Verifica si una variable existe en el contexto actual (global o local)
     @classmethod
@@ -175,7 +190,5 @@ class Variables:
         if len(parser.variables) == 1:
             return name in parser.variables[0]
         else:
-            for level in range(1, len(parser.variables)):
-                if name in parser.variables[-level]:
-                    return True
-        return False
+            # Las globales no cuentan dentro de un bloque
+            return parser.variables.level(name) > 0
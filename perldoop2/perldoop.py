@@ -22,76 +22,580 @@ import argparse
 import sys
 import os.path
 import re
+import io
+import contextlib
+import concurrent.futures
+import json
+import pickle
+import hashlib
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import traceback
 from libs import Parser
 from libs import Auxiliary as Aux
 from libs import Messages as Msg
+from libs import Variables as Var
+from libs import Hadoop
+from libs import Driver
+from libs import Cache
+from libs import Bench
+from libs import Profiler
+from libs import RuleStats
+
+# Lee un fichero perl comprobando que existe y tenemos acceso
+def read_source(file):
+	# Comprobamos si existe
+	if not os.path.exists(file):
+		Msg.error(error='FILE_NOT_FOUND', file=file)
+		quit()
+	
+	# Comprobamos si tenemos acceso a el
+	if not os.access(file, os.R_OK):
+		Msg.error(error='FILE_NOT_ACCESS', file=file)
+		quit()
+	
+	input = open(file, 'r', encoding='utf8')
+	perl = input.read()
+	input.close()
+	return perl
+
+# Traduce el codigo perl de un fichero, retorna la clase y los fragmentos del codigo java sin identar o None si hay errores
+def translate_source(perl, file_name, args, main=False):
+	# Creamosel parses
+	parser = Parser()
+	
+	# Opciones basicas del parser
+	parser.main_class = main
+	parser.file_name = file_name
+	parser.class_name = re.sub(r'(.*)\..*$', r'\1', parser.file_name)
+	
+	# Argumentos
+	if args.read_comments:
+		parser.read_comments = True
+	if args.emulate_parens:
+		parser.emulate_parens = True
+	if args.optimize_code:
+		parser.optimize_code = True
+	if args.unreachable_code:
+		parser.unreachable_code = True
+	if args.jregex:
+		parser.jregex = True
+	if args.index_loops:
+		parser.index_loops = True
+	if args.unboxed:
+		parser.unboxed = True
+	if args.combiner:
+		parser.combiner = True
+	if args.error_abort:
+		parser.error_abort = True
+	if args.debug_lexer:
+		parser.lexer_debug = True
+	if args.debug_parser:
+		parser.parser_debug = True
+		# Solo si se tienen permisos de escritura
+		if args.debug_file and os.access(args.debug_file, os.W_OK):
+			if args.debug_details:
+				parser.parser_debug_details = True
+		if args.debug_size:
+			# Solo si es un numero positivo
+			if args.debug_size > 0:
+				parser.parser_debug_len = args.debug_size
+	# Ejecucion
+	java = parser.parse(perl)
+	# Si hay errores no se genera codigo
+	if parser.code_error:
+		return parser.class_name, None
+	return parser.class_name, java
+
+# Opciones que cambian el codigo generado y forman parte de la clave de la cache
+cache_options = ('read_comments', 'emulate_parens', 'optimize_code', 'unreachable_code', 'jregex', 'error_abort', 'index_loops', 'unboxed', 'combiner')
+
+# Cache de traducciones de la ejecucion, None si esta desactivada
+def open_cache(args):
+	if args.no_cache:
+		return None
+	try:
+		return Cache(args.cache_dir, args.cache_size * 1024 * 1024)
+	except OSError:
+		return None
+
+# Traduce el codigo perl reutilizando la traduccion guardada si nada de lo que influye ha cambiado
+def cached_source(perl, file_name, args, main=False):
+	cache = open_cache(args)
+	# La depuracion y el perfilador necesitan ejecutar el analisis
+	if cache is None or args.debug_lexer or args.debug_parser or Profiler.active or RuleStats.active:
+		return translate_source(perl, file_name, args, main)
+	declared, used = source_scan(perl)
+	options = [getattr(args, option) for option in cache_options] + [main]
+	key = cache.key(perl, file_name, options, used)
+	entry = cache.get(key)
+	if entry is None:
+		# Los mensajes se guardan junto al codigo
+		stdout = io.StringIO()
+		try:
+			with contextlib.redirect_stdout(stdout):
+				class_name, java = translate_source(perl, file_name, args, main)
+		finally:
+			sys.stdout.write(stdout.getvalue())
+		# Paquete declarado por el codigo, para registrarlo en los aciertos
+		package = Var.packages.get(class_name) if declared == class_name else None
+		# Y el mapper o reducer traducido para el driver
+		job = Hadoop.jobs.get(class_name) if java is not None else None
+		entry = {'class_name': class_name, 'java': java, 'output': stdout.getvalue(), 'package': package, 'job': job}
+		cache.put(key, entry)
+	else:
+		sys.stdout.write(entry['output'])
+		if entry['package']:
+			Var.packages[entry['class_name']] = entry['package']
+		if entry['job']:
+			Hadoop.jobs[entry['class_name']] = entry['job']
+	return entry['class_name'], entry['java']
+
+# Escribe el codigo java de una clase en el directorio de salida
+def write_java(class_name, java, output):
+	path = os.path.join(output, class_name + '.java')
+	# Se escribe en un temporal para no dejar nunca un fichero a medias
+	temp = os.path.join(output, '.' + class_name + '.java.' + str(os.getpid()) + '.tmp')
+	try:
+		file = open(temp, 'w', encoding='utf8')
+		with file:
+			# Identamos el codigo directamente en el fichero
+			Aux.identer(java, file)
+		os.replace(temp, path)
+	except BaseException:
+		if os.path.exists(temp):
+			os.unlink(temp)
+		raise
+
+# Traduce un fichero perl a java
+def translate(file, args, output, main=False):
+	with Profiler.phase('read'):
+		perl = read_source(file)
+	class_name, java = cached_source(perl, os.path.basename(file), args, main)
+	# Si no hay errores escribimos el codigo
+	if java is not None:
+		with Profiler.phase('write'):
+			write_java(class_name, java, output)
 
 def analyzer(files, args, output, main=False):
 	# Para cada fichero
 	for file in files:
-		# Comprobamos si existe
-		if not os.path.exists(file):
-			Msg.error(error='FILE_NOT_FOUND', file=file)
-			quit()
-		
-		# Comprobamos si tenemos acceso a el
-		if not os.access(file, os.R_OK):
-			Msg.error(error='FILE_NOT_ACCESS', file=file)
-			quit()
-		
-		# Creamosel parses
-		parser = Parser()
-		
-		# Opciones basicas del parser
-		parser.main_class = main
-		parser.file_name = os.path.basename(file)
-		parser.class_name = re.sub(r'(.*)\..*$', r'\1', parser.file_name)
-		
-		# Argumentos
-		if args.read_comments:
-			parser.read_comments = True
-		if args.emulate_parens:
-			parser.emulate_parens = True
-		if args.optimize_code:
-			parser.optimize_code = True
-		if args.unreachable_code:
-			parser.unreachable_code = True
-		if args.jregex:
-			parser.jregex = True
-		if args.error_abort:
-			parser.error_abort = True
-		if args.debug_lexer:
-			parser.lexer_debug = True
-		if args.debug_parser:
-			parser.parser_debug = True
-			# Solo si se tienen permisos de escritura
-			if args.debug_file and os.access(args.debug_file, os.W_OK):
-				if args.debug_details:
-					parser.parser_debug_details = True
-			if args.debug_size:
-				# Solo si es un numero positivo
-				if args.debug_size > 0:
-					parser.parser_debug_len = args.debug_size
-		# Ejecucion
+		translate(file, args, output, main)
+
+# Traduce los ficheros midiendo cada fase, regla y clase auxiliar
+def profile_analyzer(files, args, output, main=False):
+	profiler = Profiler()
+	Profiler.start(profiler)
+	try:
+		for index, file in enumerate(files):
+			profiler.begin(file)
+			try:
+				translate(file, args, output, main and index == len(files) - 1)
+			finally:
+				profiler.end()
+	finally:
+		# Aunque se aborte mostramos lo medido
+		Profiler.stop()
+		sys.stdout.write(profiler.text(args.profile_sort))
+		output = open(args.profile, 'w', encoding='utf8')
+		json.dump(profiler.report(args.profile_sort), output, indent=1)
+		output.close()
+		if args.speedscope:
+			output = open(args.speedscope, 'w', encoding='utf8')
+			json.dump(profiler.speedscope(), output)
+			output.close()
+
+# Traduce los ficheros contando las reducciones de cada produccion
+def rule_stats_analyzer(files, args, output, main=False):
+	RuleStats.active = RuleStats()
+	try:
+		analyzer(files[:-1], args, output)
+		analyzer(files[-1:], args, output, main)
+	finally:
+		# Aunque se aborte mostramos lo contado
+		sys.stdout.write(RuleStats.active.text(args.rule_stats, 'calls' if args.profile_sort == 'calls' else 'time'))
+		RuleStats.active = None
+
+# Busca los paquetes que declara y usa un fichero
+def package_scan(file):
+	try:
 		input = open(file, 'r', encoding='utf8')
 		perl = input.read()
 		input.close()
-			
-		java = parser.parse(perl)
-		# Si no hay errores
-		if not parser.code_error:
-			# Identamos el codigo
-			java = Aux.identer(java)
-			# Escribimos el codigo
-			file = open(os.path.join(output, parser.class_name + '.java'), 'w', encoding='utf8')
-			file.write(java)
-			file.close()
+	except (OSError, UnicodeDecodeError):
+		# El error se mostrara al traducirlo
+		return None, set()
+	return source_scan(perl)
+
+# Busca los paquetes que declara y usa un codigo perl
+def source_scan(perl):
+	declared = None  # Paquete declarado por el codigo
+	used = set()  # Paquetes a los que se accede
+	for line in perl.splitlines():
+		# Quitamos los comentarios
+		line = line.split('#', 1)[0]
+		match = re.match(r'^\s*package\s+([A-Za-z_]\w*)\s*;', line)
+		if match:
+			declared = match.group(1)
+		used.update(re.findall(r'([A-Za-z_]\w*)::', line))
+	return declared, used
+
+# Agrupa los ficheros por niveles, cada nivel solo depende de paquetes de niveles anteriores
+def schedule(files):
+	providers = {}  # Fichero que declara cada paquete
+	depends = []  # Paquetes del lote de los que depende cada fichero
+	scans = [package_scan(file) for file in files]
+	for index, (declared, used) in enumerate(scans):
+		if declared:
+			providers[declared] = index
+	for index, (declared, used) in enumerate(scans):
+		depends.append({providers[pack] for pack in used if pack in providers and providers[pack] != index})
+	levels = []
+	done = set()
+	pending = list(range(len(files)))
+	while pending:
+		# Ficheros con todas sus dependencias ya traducidas
+		level = [index for index in pending if depends[index] <= done]
+		# Si hay un ciclo, traducimos el resto igualmente y daran error como en modo secuencial
+		if not level:
+			level = pending
+		levels.append(level)
+		done.update(level)
+		pending = [index for index in pending if index not in done]
+	return levels
+
+# Traduce un fichero dentro de un proceso, capturando su salida, el codigo lo escribe el proceso principal
+def translate_job(file, args, main, packages):
+	# Paquetes traducidos en los niveles anteriores
+	Var.packages.clear()
+	Var.packages.update(packages)
+	Hadoop.jobs.clear()
+	stdout = io.StringIO()
+	abort = False
+	class_name, java = None, None
+	with contextlib.redirect_stdout(stdout):
+		try:
+			perl = read_source(file)
+			class_name, java = cached_source(perl, os.path.basename(file), args, main)
+		except SystemExit:
+			abort = True
+	# Devolvemos solo los paquetes nuevos
+	declared = {name: pack for name, pack in Var.packages.items() if name not in packages}
+	return stdout.getvalue(), abort, class_name, java, declared, dict(Hadoop.jobs)
+
+def parallel_analyzer(files, args, output, jobs, main=False):
+	# Resultados en el orden de entrada
+	results = [None] * len(files)
+	packages = {}
+	# Primer fichero que aborta, los posteriores no se traducen como en modo secuencial
+	failed = len(files)
+	with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+		for level in schedule(files):
+			futures = {}
+			for index in level:
+				if index < failed:
+					is_main = main and index == len(files) - 1
+					futures[executor.submit(translate_job, files[index], args, is_main, dict(packages))] = index
+			for future in concurrent.futures.as_completed(futures):
+				if future.cancelled():
+					continue
+				index = futures[future]
+				results[index] = future.result()
+				if results[index][1] and index < failed:
+					failed = index
+					# Cancelamos los ficheros posteriores que aun no han empezado
+					for pending, other in futures.items():
+						if other > failed:
+							pending.cancel()
+			for index in level:
+				if index < failed:
+					packages.update(results[index][4])
+	# Mostramos los mensajes y escribimos el codigo en el orden de los ficheros
+	for text, abort, class_name, java, declared, jobs in results[:failed + 1]:
+		sys.stdout.write(text)
+		if abort:
+			quit()
+		if java is not None:
+			write_java(class_name, java, output)
+		Hadoop.jobs.update(jobs)
+	Var.packages.update(packages)
+
+
+# Fichero con el grafo de dependencias de la ultima traduccion incremental
+def state_file(output):
+	return os.path.join(output, '.perldoop.state')
+
+# Carga el grafo guardado, vacio si no existe o se genero con otro traductor u opciones
+def load_state(output, options):
+	try:
+		input = open(state_file(output), 'rb')
+		state = pickle.load(input)
+		input.close()
+	except (OSError, pickle.PickleError, EOFError, AttributeError):
+		return {}
+	if state['options'] != options:
+		return {}
+	return state['files']
+
+def save_state(output, options, files):
+	try:
+		output = open(state_file(output), 'wb')
+		pickle.dump({'options': options, 'files': files}, output, pickle.HIGHEST_PROTOCOL)
+		output.close()
+	except OSError:
+		pass
+
+# Traduce solo los ficheros cambiados y los que usan paquetes cuya interfaz ha cambiado
+def incremental_analyzer(files, args, output, main=False):
+	options = [Cache.translator_version()] + [getattr(args, option) for option in cache_options]
+	state = load_state(output, options)
+	try:
+		# Los proveedores de paquetes se comprueban antes que sus consumidores
+		for level in schedule(files):
+			for index in level:
+				file = os.path.abspath(files[index])
+				is_main = main and index == len(files) - 1
+				perl = read_source(files[index])
+				declared, used = source_scan(perl)
+				digest = hashlib.sha256(perl.encode('utf8')).hexdigest()
+				# Firma de los paquetes usados tal y como estan ahora
+				signatures = {name: Cache.package_signature(name) for name in used}
+				entry = state.get(file)
+				if entry and entry['hash'] == digest and entry['main'] == is_main and entry['used'] == signatures and entry['class_name'] \
+				and os.path.exists(os.path.join(output, entry['class_name'] + '.java')):
+					# Sin cambios, solo registramos su paquete para los consumidores
+					if entry['package']:
+						Var.packages[entry['class_name']] = entry['package']
+					if entry['job']:
+						Hadoop.jobs[entry['class_name']] = entry['job']
+					continue
+				state.pop(file, None)
+				class_name, java = cached_source(perl, os.path.basename(file), args, is_main)
+				if java is not None:
+					write_java(class_name, java, output)
+				else:
+					# Los ficheros con errores se vuelven a traducir para mostrarlos
+					class_name = None
+				package = Var.packages.get(declared) if declared == class_name else None
+				job = Hadoop.jobs.get(class_name)
+				state[file] = {'hash': digest, 'main': is_main, 'declared': declared, 'used': signatures, 'class_name': class_name, 'package': package, 'job': job}
+	finally:
+		# Aunque se aborte, lo traducido queda registrado
+		save_state(output, options, state)
+
+# Ruta por defecto del socket del demonio, en un directorio que solo puede usar el usuario
+def default_socket():
+	folder = os.environ.get('XDG_RUNTIME_DIR')
+	if not folder:
+		folder = os.path.join(tempfile.gettempdir(), 'perldoop-' + str(os.getuid()))
+	return os.path.join(folder, 'perldoop.sock')
+
+# Comprueba que el directorio del socket es del usuario y no pueden entrar otros usuarios
+def private_folder(path):
+	try:
+		info = os.stat(os.path.dirname(os.path.abspath(path)))
+	except OSError:
+		return False
+	return info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+# Comprueba que el proceso al otro lado del socket es del usuario, si el sistema lo permite
+def same_user(connection):
+	if not hasattr(socket, 'SO_PEERCRED'):
+		return True
+	credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+	pid, uid, gid = struct.unpack('3i', credentials)
+	return uid == os.getuid()
+
+# Nombre de clase java valido, el codigo del demonio solo se escribe si lo es
+def valid_class(name):
+	return isinstance(name, str) and re.match(r'^[A-Za-z_$][A-Za-z0-9_$]*$', name) is not None
+
+# Atiende una peticion de traduccion del demonio
+def serve_request(request):
+	args = argparse.Namespace(**request['args'])
+	# Cada peticion empieza sin paquetes, como una ejecucion nueva
+	Var.packages.clear()
+	Hadoop.jobs.clear()
+	classes = []  # Clases traducidas sin errores
+	stdout = io.StringIO()
+	abort = False
+	with contextlib.redirect_stdout(stdout):
+		try:
+			for entry in request['files']:
+				# Errores de lectura detectados por el cliente
+				if entry['error']:
+					Msg.error(error=entry['error'], file=entry['file'])
+					quit()
+				class_name, java = cached_source(entry['source'], os.path.basename(entry['file']), args, entry['main'])
+				if java is not None:
+					classes.append([class_name, java])
+		except SystemExit:
+			abort = True
+		except Exception:
+			# Un fallo del traductor no puede tumbar el demonio
+			sys.stdout.write(traceback.format_exc())
+			abort = True
+	cache = open_cache(args)
+	if cache:
+		cache.evict()
+	return {'classes': classes, 'output': stdout.getvalue(), 'abort': abort, 'jobs': Hadoop.jobs}
+
+class ServeHandler(socketserver.StreamRequestHandler):
 	
+	def handle(self):
+		# Solo se atiende a procesos del mismo usuario
+		if not same_user(self.connection):
+			return
+		line = self.rfile.readline()
+		# Conexiones sin peticion, como la comprobacion de otro demonio
+		if not line:
+			return
+		request = json.loads(line.decode('utf8'))
+		response = serve_request(request)
+		self.wfile.write(json.dumps(response).encode('utf8'))
+
+# Demonio que mantiene el traductor cargado y atiende peticiones por un socket unix
+def serve(path):
+	folder = os.path.dirname(os.path.abspath(path))
+	if not os.path.exists(folder):
+		os.makedirs(folder, 0o700)
+	# Otro usuario podria sustituir el socket o conectarse a el
+	if not private_folder(path):
+		Msg.error(error='SOCKET_INSECURE', socket=path)
+		quit()
+	if os.path.exists(path):
+		# Si otro demonio esta escuchando no lo pisamos
+		if connect(path):
+			Msg.error(error='SERVE_RUNNING', socket=path)
+			quit()
+		os.unlink(path)
+	# Cargamos las tablas y el analizador lexico antes de la primera peticion
+	Parser()
+	server = socketserver.UnixStreamServer(path, ServeHandler)
+	# Al terminar el demonio se borra el socket
+	signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit())
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+		os.unlink(path)
+
+# Conecta con el demonio, None si no hay ninguno escuchando
+def connect(path):
+	client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+	try:
+		client.connect(path)
+	except OSError:
+		client.close()
+		return None
+	return client
+
+# Comprueba que el socket es del usuario antes de enviarle nada
+def own_socket(path):
+	try:
+		info = os.stat(path)
+	except OSError:
+		return False
+	return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+# Envia la traduccion al demonio, retorna False si no hay demonio
+def client(files, args, output, path, main=False):
+	if not os.path.exists(path):
+		return False
+	if not own_socket(path):
+		Msg.error(error='SOCKET_INSECURE', socket=path)
+		quit()
+	connection = connect(path)
+	if connection is None:
+		return False
+	if not same_user(connection):
+		connection.close()
+		Msg.error(error='SOCKET_INSECURE', socket=path)
+		quit()
+	request = {'args': vars(args), 'files': []}
+	for index, file in enumerate(files):
+		entry = {'file': file, 'main': main and index == len(files) - 1, 'source': None, 'error': None}
+		# Las comprobaciones del fichero se hacen en el cliente
+		if not os.path.exists(file):
+			entry['error'] = 'FILE_NOT_FOUND'
+		elif not os.access(file, os.R_OK):
+			entry['error'] = 'FILE_NOT_ACCESS'
+		else:
+			input = open(file, 'r', encoding='utf8')
+			entry['source'] = input.read()
+			input.close()
+		request['files'].append(entry)
+		# El demonio para en el primer fichero erroneo
+		if entry['error']:
+			break
+	with connection:
+		connection.sendall(json.dumps(request).encode('utf8') + b'\n')
+		connection.shutdown(socket.SHUT_WR)
+		response = json.loads(connection.makefile('rb').read().decode('utf8'))
+	# Los nombres de clase forman la ruta de los ficheros y el codigo del driver
+	for class_name in [entry[0] for entry in response['classes']] + list(response['jobs']):
+		if not valid_class(class_name):
+			Msg.error(error='SERVE_CLASS', name=repr(class_name))
+			quit()
+	for class_name, java in response['classes']:
+		write_java(class_name, java, output)
+	Hadoop.jobs.update(response['jobs'])
+	sys.stdout.write(response['output'])
+	if response['abort']:
+		quit()
+	return True
+
+# Genera el driver del trabajo con los mappers y reducers traducidos
+def driver(args, output):
+	java = Driver.create(args.driver, args.reducers, args.compress)
+	if java is not None:
+		write_java(args.driver, java, output)
+
+# Subcomando de medidas de rendimiento
+def bench(argv):
+	argp = argparse.ArgumentParser(prog='perldoop.py bench', description=Msg.get_message('HELP_BENCH'))
+	commands = argp.add_subparsers(dest='command', metavar='command')
+	commands.required = True
+	lex = commands.add_parser('lex', help=Msg.get_message('HELP_BENCH_LEX'))
+	lex.add_argument('paths', nargs='+', metavar='path', help=Msg.get_message('HELP_BENCH_CORPUS'))
+	lex.add_argument('--scale', action='store', type=int, dest='scale', default=1, metavar='n', help=Msg.get_message('HELP_BENCH_SCALE'))
+	lex.add_argument('--repeat', action='store', type=int, dest='repeat', default=3, metavar='n', help=Msg.get_message('HELP_BENCH_REPEAT'))
+	lex.add_argument('-ep', '--emulate-parens', action='store_true', dest='emulate_parens', help=Msg.get_message('HELP_EMULATE_PAREN'))
+	lex.add_argument('-c', '--comments', action='store_true', dest='read_comments', help=Msg.get_message('HELP_COMMENTS'))
+	lex.add_argument('--json', action='store', dest='json', metavar='file', help=Msg.get_message('HELP_BENCH_JSON'))
+	mem = commands.add_parser('mem', help=Msg.get_message('HELP_BENCH_MEM'))
+	mem.add_argument('paths', nargs='+', metavar='path', help=Msg.get_message('HELP_BENCH_CORPUS'))
+	mem.add_argument('--scale', action='store', type=int, dest='scale', default=1, metavar='n', help=Msg.get_message('HELP_BENCH_SCALE'))
+	mem.add_argument('--json', action='store', dest='json', metavar='file', help=Msg.get_message('HELP_BENCH_JSON'))
+	args = argp.parse_args(argv)
+	if args.command == 'lex':
+		report = Bench.lex(args.paths, max(args.scale, 1), max(args.repeat, 1), args.emulate_parens, args.read_comments)
+		sys.stdout.write(Bench.lex_text(report))
+	elif args.command == 'mem':
+		report = Bench.memory(args.paths, max(args.scale, 1))
+		sys.stdout.write(Bench.memory_text(report))
+	# Informe para comparar entre versiones
+	if args.json:
+		output = open(args.json, 'w', encoding='utf8')
+		json.dump(report, output, indent=1)
+		output.close()
+
 
 if __name__ == '__main__':
+	# Medidas de rendimiento
+	if sys.argv[1:2] == ['bench']:
+		bench(sys.argv[2:])
+		quit()
+	
 	# Opciones del analizador
 	argp = argparse.ArgumentParser(description=Msg.get_message('HELP_TOOL_DESCRIPTION'))
-	argp.add_argument('files', nargs='+', action='store', metavar='infile'  , help=Msg.get_message('HELP_FILES'))
+	argp.add_argument('files', nargs='*', action='store', metavar='infile'  , help=Msg.get_message('HELP_FILES'))
 	argp.add_argument('-m', '--main', action='store_true', dest='main', help=Msg.get_message('HELP_MAIN'))
 	argp.add_argument('-out', action='store', dest='out', default=os.getcwd(), metavar='dir', help=Msg.get_message('HELP_OUT'))
 	argp.add_argument('-c', '--comments', action='store_true', dest='read_comments', help=Msg.get_message('HELP_COMMENTS'))
@@ -99,7 +603,27 @@ if __name__ == '__main__':
 	argp.add_argument('-oc', '--optimize-code', action='store_true', dest='optimize_code', help=Msg.get_message('HELP_OPTIMIZE_CODE'))
 	argp.add_argument('-jr', '--jregex', action='store_true', dest='jregex', help=Msg.get_message('HELP_JREGEX'))
 	argp.add_argument('-uc', '--unreachable-code', action='store_true', dest='unreachable_code', help=Msg.get_message('HELP_UNRECHEABLE_CODE'))
+	argp.add_argument('--index-loops', action='store_true', dest='index_loops', help=Msg.get_message('HELP_INDEX_LOOPS'))
+	argp.add_argument('--unboxed', action='store_true', dest='unboxed', help=Msg.get_message('HELP_UNBOXED'))
+	argp.add_argument('--combiner', action='store_true', dest='combiner', help=Msg.get_message('HELP_COMBINER'))
+	argp.add_argument('--driver', action='store', dest='driver', metavar='class', help=Msg.get_message('HELP_DRIVER'))
+	argp.add_argument('--reducers', action='store', type=int, dest='reducers', metavar='n', help=Msg.get_message('HELP_REDUCERS'))
+	argp.add_argument('--compress', action='store', dest='compress', choices=sorted(Driver.codecs), help=Msg.get_message('HELP_COMPRESS'))
 	argp.add_argument('-ea', '--error-abort', action='store_true', dest='error_abort', help=Msg.get_message('HELP_ERROR_ABORT'))
+	argp.add_argument('-j', '--jobs', action='store', type=int, dest='jobs', default=1, metavar='n', help=Msg.get_message('HELP_JOBS'))
+	argp.add_argument('--incremental', action='store_true', dest='incremental', help=Msg.get_message('HELP_INCREMENTAL'))
+	argp.add_argument('--serve', action='store_true', dest='serve', help=Msg.get_message('HELP_SERVE'))
+	argp.add_argument('--daemon', action='store_true', dest='daemon', help=Msg.get_message('HELP_DAEMON'))
+	argp.add_argument('--socket', action='store', dest='socket', default=default_socket(), metavar='path', help=Msg.get_message('HELP_SOCKET'))
+	argp.add_argument('--no-cache', action='store_true', dest='no_cache', help=Msg.get_message('HELP_NO_CACHE'))
+	argp.add_argument('--cache-dir', action='store', dest='cache_dir', default=os.path.join(os.path.expanduser('~'), '.cache', 'perldoop'), metavar='dir', help=Msg.get_message('HELP_CACHE_DIR'))
+	argp.add_argument('--cache-size', action='store', type=int, dest='cache_size', default=64, metavar='MB', help=Msg.get_message('HELP_CACHE_SIZE'))
+	# Opciones del perfilador
+	profile = argp.add_argument_group('profiler arguments', Msg.get_message('HELP_PROFILER'))
+	profile.add_argument('--profile', action='store', dest='profile', metavar='file', help=Msg.get_message('HELP_PROFILE'))
+	profile.add_argument('--profile-sort', action='store', dest='profile_sort', default='self', choices=('self', 'total', 'calls'), help=Msg.get_message('HELP_PROFILE_SORT'))
+	profile.add_argument('--rule-stats', action='store', type=int, dest='rule_stats', metavar='n', help=Msg.get_message('HELP_RULE_STATS'))
+	profile.add_argument('--speedscope', action='store', dest='speedscope', metavar='file', help=Msg.get_message('HELP_SPEEDSCOPE'))
 	# Opciondes de depuracion
 	debug = argp.add_argument_group('debugger arguments', Msg.get_message('HELP_DEBUGGER'))
 	debug.add_argument('-dl', '--debug-lexer', action='store_true', dest='debug_lexer', help=Msg.get_message('HELP_DEBUGGER_LEXER'))
@@ -110,6 +634,14 @@ if __name__ == '__main__':
 	
 	args = argp.parse_args()
 	
+	# Modo demonio
+	if args.serve:
+		serve(args.socket)
+		quit()
+	
+	if not args.files:
+		argp.error(Msg.get_message('FILES_REQUIRED'))
+	
 	# Comprobamos si existe el directorio de salida
 	if not os.path.exists(args.out):
 		Msg.error(error='OUT_NOT_FOUND')
@@ -119,10 +651,33 @@ if __name__ == '__main__':
 	if not os.access(args.out, os.W_OK):
 		Msg.error(error='OUT_NOT_ACCESS')
 		quit()
+	# Si se pide y hay un demonio escuchando le pasamos la traduccion, la depuracion siempre es local
+	if args.daemon and args.jobs == 1 and not args.incremental and not args.profile and not args.rule_stats and not args.debug_lexer and not args.debug_parser and client(args.files, args, args.out, args.socket, args.main):
+		if args.driver:
+			driver(args, args.out)
+		quit()
+	# Traduccion midiendo el rendimiento
+	if args.profile:
+		profile_analyzer(args.files, args, args.out, args.main)
+	# Traduccion contando las reducciones
+	elif args.rule_stats:
+		rule_stats_analyzer(args.files, args, args.out, args.main)
+	# Traduccion incremental
+	elif args.incremental:
+		incremental_analyzer(args.files, args, args.out, args.main)
+	# Traduccion en paralelo
+	elif args.jobs > 1:
+		parallel_analyzer(args.files, args, args.out, args.jobs, args.main)
 	# Si necesita main
-	if args.main:
+	elif args.main:
 		analyzer(args.files[:-1], args, args.out)
 		analyzer(args.files[-1:], args, args.out, True)
 	else:
 		analyzer(args.files, args, args.out)
-
+	# Driver del trabajo traducido
+	if args.driver:
+		driver(args, args.out)
+	# Liberamos las entradas antiguas de la cache
+	cache = open_cache(args)
+	if cache:
+		cache.evict()